@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import functools
 import itertools
@@ -470,6 +471,51 @@ def type_infer(ctx: Context, node: Inferable) -> typed.Type:
     return apply_subst(s, t)
 
 
+class ProgramInference:
+    """infers the top level of a program one node at a time"""
+
+    def __init__(self, ctx: Context) -> None:
+        self.ctx = ctx
+        self.t_ctx = ctx.copy()
+        self.subst: Substitution = {}
+        self.ty: typed.Type = typed.TUnit
+        self.vars = set[str]()
+        self.types = set[str]()
+
+    def add(self, node: terms.EExpr) -> None:
+        self.subst, self.ty = infer(self.subst, self.t_ctx, node)
+
+        match node.expr:
+            case terms.ELet(id) | terms.EDef(id) | terms.EBinaryOpDef(id):
+                self.vars.add(id)
+            case terms.EEnumDeclaration(id, variants=variants):
+                self.types.add(id)
+                for variant in variants:
+                    self.types |= {variant.id, "$" + variant.id}
+
+    def result(self) -> tuple[typed.Type, Context]:
+        """the type of the last node and the schemes the top level binds"""
+        t_ctx, ctx = self.t_ctx, self.ctx
+        vars = {name for name in t_ctx.vars.keys() - ctx.vars.keys() if name != "$"}
+        types = set(t_ctx.types.keys() - ctx.types.keys())
+        vars |= self.vars
+        types |= self.types
+
+        bound = Context(
+            {name: t_ctx.vars[name] for name in vars},
+            {name: t_ctx.types[name] for name in types},
+        )
+        return apply_subst(self.subst, self.ty), apply_subst_ctx(self.subst, bound)
+
+
+def infer_program(ctx: Context, program: terms.EProgram) -> tuple[typed.Type, Context]:
+    """infers program like type_infer, also returning the schemes its top level binds"""
+    inference = ProgramInference(ctx)
+    for node in program.body:
+        inference.add(node)
+    return inference.result()
+
+
 # def scheme_from_type(subst: Substitution, ctx: Context, ty: typed.Type):
 # ftv = ftv = free_type_vars(apply_subst(
 #     subst, ty)).difference(free_type_vars_ctx(apply_subst_ctx(subst, ctx)))
@@ -481,6 +527,25 @@ class NonExhaustiveMatchException(Exception):
     pass
 
 
+# set by warn_non_exhaustive, a non-exhaustive match is added here instead of
+# raising NonExhaustiveMatchException
+non_exhaustive_warnings: list[str] | None = None
+
+
+@contextlib.contextmanager
+def warn_non_exhaustive() -> typing.Iterator[list[str]]:
+    """
+    infers non-exhaustive matches as if they were exhaustive, so what the
+    program binds still comes out, and yields the warnings for them
+    """
+    global non_exhaustive_warnings
+    outer, non_exhaustive_warnings = non_exhaustive_warnings, []
+    try:
+        yield non_exhaustive_warnings
+    finally:
+        non_exhaustive_warnings = outer
+
+
 A = typing.TypeVar("A")
 B = typing.TypeVar("B")
 C = typing.TypeVar("C")
@@ -511,7 +576,13 @@ def infer_case_tree(
     match tree:
         case case_tree.MissingLeaf():
             if any(alts.values()):
-                raise NonExhaustiveMatchException()
+                missing = ", ".join(alt for names in alts.values() for alt in names)
+                e = NonExhaustiveMatchException(
+                    f"Non-exhaustive case, missing {missing}"
+                )
+                if non_exhaustive_warnings is None:
+                    raise e
+                non_exhaustive_warnings.append(str(e))
             return subst, fresh_ty_var()
         case case_tree.Node(var, pattern_name, vars, yes, no):
 
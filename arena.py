@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import itertools
+import mmap
+import typing
+from array import array
+from parser import CHUNK_TOKENS, UwuParser, UwuScanner
+
+import compile as codegen
+import terms
+import typed
+from algorithm_j import Context, ProgramInference
+from pratt import PrattParser
+from prelude import builtins_for
+
+# a node kind is the index of its class here
+CLASSES = sorted(terms.NODE_CLASSES, key=lambda cls: cls.__name__)
+PLANS = [terms.field_plan(cls) for cls in CLASSES]
+
+# the slot of a node field that holds None
+NONE = -1
+
+
+def specialize(
+    kind: int,
+) -> tuple[typing.Callable[..., int], typing.Callable[..., typing.Any]]:
+    """
+    the functions that add a node of kind to an arena and build it again,
+    written out for the fields of its class like the folds in terms
+    """
+    add = ["def add(arena, node):"]
+    slots = list[str]()
+    fields = list[str]()
+    for i, (name, field_kind) in enumerate(PLANS[kind]):
+        slot = f"arena.slots[first + {i}]"
+        if field_kind == "list":
+            add.append(f"    s{i} = arena.add_list(node.{name})")
+            fields.append(f"{name}=arena.node_list({slot})")
+        elif field_kind == "node":
+            add.append(f"    s{i} = node.{name}")
+            add.append(f"    s{i} = NONE if s{i} is None else arena.add(s{i})")
+            fields.append(f"{name}=None if {slot} == NONE else arena.node({slot})")
+        else:
+            add.append(f"    s{i} = arena.payload(node.{name})")
+            fields.append(f"{name}=arena.payloads[{slot}]")
+        slots.append(f"s{i}")
+
+    add.append(f"    arena.kinds.append({kind})")
+    add.append("    arena.firsts.append(len(arena.slots))")
+    if slots:
+        add.append(f"    arena.slots.extend(({', '.join(slots)},))")
+    add.append("    return len(arena.kinds) - 1")
+    build = ["def build(arena, node, first):", f"    return cls({', '.join(fields)})"]
+
+    namespace = {"cls": CLASSES[kind], "NONE": NONE}
+    exec("\n".join(add) + "\n" + "\n".join(build), namespace)
+    return namespace["add"], namespace["build"]
+
+
+def field_slot(cls: type, name: str) -> int:
+    """the slot of field name among the slots of a node of cls"""
+    return [field for field, _ in PLANS[CLASSES.index(cls)]].index(name)
+
+
+# the kinds holding the names IdGetter collects, and the slot of the name
+ID_SLOTS = {
+    CLASSES.index(terms.EIdentifier): field_slot(terms.EIdentifier, "name"),
+    CLASSES.index(terms.EBinaryExpr): field_slot(terms.EBinaryExpr, "op"),
+}
+# the kinds of the names an import brings in
+NAME_SLOTS = {
+    CLASSES.index(terms.EIdentifier): field_slot(terms.EIdentifier, "name"),
+    CLASSES.index(terms.ETypeIdentifier): field_slot(terms.ETypeIdentifier, "name"),
+}
+
+
+ADDERS = dict[type, typing.Callable[..., int]]()
+BUILDERS = list[typing.Callable[..., typing.Any]]()
+for kind, cls in enumerate(CLASSES):
+    adder, builder = specialize(kind)
+    ADDERS[cls] = adder
+    BUILDERS.append(builder)
+
+
+class Arena:
+    """
+    an ast kept in flat arrays instead of objects, a node is the index of
+    its kind in kinds and its fields are the slots from firsts[node] on,
+    in the order of the fields of its class
+
+    a slot holds a node, a payload for a scalar, or for a list of nodes
+    where in lists its length is followed by its nodes, payloads that are
+    equal are kept once
+
+    nodes only ever refer to nodes added before them, and the imports,
+    body and exports of the program are the nodes in those arrays
+    """
+
+    def __init__(self) -> None:
+        self.kinds = array("B")
+        self.firsts = array("I")
+        self.slots = array("i")
+        self.lists = array("i")
+        self.payloads = list[typing.Any]()
+        self.payload_ids = dict[tuple[type, typing.Any], int]()
+        self.imports = array("i")
+        self.body = array("i")
+        self.exports = array("i")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def nbytes(self) -> int:
+        """the bytes held by the arrays, not counting the payloads"""
+        arrays = [self.kinds, self.firsts, self.slots, self.lists]
+        arrays += [self.imports, self.body, self.exports]
+        return sum(len(a) * a.itemsize for a in arrays)
+
+    def payload(self, value: typing.Any) -> int:
+        # 1 == 1.0 == True, so a payload is told apart by its type too
+        key = (value.__class__, value)
+        found = self.payload_ids.get(key)
+        if found is None:
+            found = self.payload_ids[key] = len(self.payloads)
+            self.payloads.append(value)
+        return found
+
+    def add(self, node: terms.Node) -> int:
+        """adds node and everything under it, returning the node it now is"""
+        return ADDERS[node.__class__](self, node)
+
+    def add_list(self, nodes: list[typing.Any]) -> int:
+        items = [ADDERS[node.__class__](self, node) for node in nodes]
+        self.lists.append(len(items))
+        self.lists.extend(items)
+        return len(self.lists) - len(items) - 1
+
+    def add_program(self, program: terms.EProgram) -> None:
+        """adds the imports, body and exports of program after the ones added before"""
+        self.imports.extend(self.add(node) for node in program.imports)
+        self.body.extend(self.add(node) for node in program.body)
+        self.exports.extend(self.add(node) for node in program.exports)
+
+    def node(self, node: int) -> typing.Any:
+        """the terms node that node was added from, built again"""
+        return BUILDERS[self.kinds[node]](self, node, self.firsts[node])
+
+    def node_list(self, slot: int) -> list[typing.Any]:
+        end = slot + 1 + self.lists[slot]
+        return [self.node(item) for item in self.lists[slot + 1 : end]]
+
+    def program(self) -> terms.EProgram:
+        """the whole program as terms nodes"""
+        return terms.EProgram(
+            [self.node(node) for node in self.body],
+            [self.node(node) for node in self.imports],
+            [self.node(node) for node in self.exports],
+        )
+
+    def walk(self, roots: typing.Iterable[int]) -> typing.Iterator[int]:
+        """roots and every node under them, found from the slots alone"""
+        kinds, firsts, slots, lists = self.kinds, self.firsts, self.slots, self.lists
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            yield node
+            first = firsts[node]
+            for i, (_, field_kind) in enumerate(PLANS[kinds[node]]):
+                slot = slots[first + i]
+                if field_kind == "list":
+                    stack.extend(lists[slot + 1 : slot + 1 + lists[slot]])
+                elif field_kind == "node" and slot != NONE:
+                    stack.append(slot)
+
+    def names(
+        self, kinds: dict[int, int], roots: typing.Iterable[int] | None = None
+    ) -> set[str]:
+        """
+        the names held by the nodes of kinds among roots and the nodes under
+        them, kinds maps a kind to the slot of its name, every node is looked
+        at when roots is None, they all belong to the program
+        """
+        nodes = range(len(self.kinds)) if roots is None else self.walk(roots)
+        return {
+            self.payloads[self.slots[self.firsts[node] + kinds[self.kinds[node]]]]
+            for node in nodes
+            if self.kinds[node] in kinds
+        }
+
+    def ids(self, roots: typing.Iterable[int] | None = None) -> set[str]:
+        """what IdGetter collects from roots, or the program, without building it"""
+        return self.names(ID_SLOTS, roots)
+
+    def visit(self, v: terms.Visitor) -> None:
+        """folds every node of the program with v, one top level node at a time"""
+        for roots in (self.imports, self.body, self.exports):
+            for node in roots:
+                self.node(node).fold_with(v)
+
+
+def parse(
+    buffer: bytes | mmap.mmap,
+    scanner: UwuScanner | None = None,
+    parser: UwuParser | PrattParser | None = None,
+    chunk_size: int = CHUNK_TOKENS,
+) -> Arena | None:
+    """
+    parses utf-8 source from buffer into an arena a chunk of top level items
+    at a time, None when it does not parse
+
+    the parser still builds the terms nodes of a chunk, which are moved into
+    the arena and dropped, so only those of one chunk are alive at once
+
+    raises sly.lex.LexError when it does not lex
+    """
+    scanner = scanner or UwuScanner()
+    parser = parser or UwuParser()
+    arena = Arena()
+    chunks = scanner.scan_chunks(buffer, chunk_size)
+    try:
+        for tokens in chunks:
+            chunk = parser.parse(iter(tokens))
+            if not isinstance(chunk, terms.EProgram):
+                return None
+            arena.add_program(chunk)
+    finally:
+        chunks.close()
+    return arena
+
+
+def prelude_for(arena: Arena) -> list[terms.EExpr]:
+    """the builtin definitions the program in arena refers to, like prelude.prelude_for"""
+    return builtins_for(arena.ids(), arena.names(NAME_SLOTS, arena.imports))
+
+
+def infer(ctx: Context, arena: Arena) -> tuple[typed.Type, Context]:
+    """
+    infers the body of arena like infer_program, building the terms nodes of
+    one top level node at a time, as algorithm_j only infers terms nodes
+    """
+    inference = ProgramInference(ctx)
+    for node in arena.body:
+        inference.add(arena.node(node))
+    return inference.result()
+
+
+def compile(arena: Arena, prelude: list[terms.EExpr] = []) -> str:
+    """
+    the js of the program in arena with prelude before its body, the same as
+    compiling it hoisted and cleaned
+
+    hoisting, cleaning and codegen work on terms nodes, so each top level
+    node of the body is built, hoisted and cleaned once, and what that gives
+    is kept until the names the program uses are known and the top level
+    definitions nothing uses can be dropped
+    """
+    # imports and exports hold no definitions, cleaning leaves their names alone
+    ids = arena.ids(itertools.chain(arena.imports, arena.exports))
+    getter = codegen.IdGetter()
+    body = list[terms.EExpr]()
+    for expr in itertools.chain(prelude, map(arena.node, arena.body)):
+        hoisted = codegen.filter_identifiers(codegen.Hoister().hoist_expr_list([expr]))
+        for node in hoisted:
+            cleaned = node.fold_with(codegen.BlockCleaner())
+            cleaned.fold_with(getter)
+            body.append(cleaned)
+    ids |= getter.ids
+
+    js = [codegen.compile(arena.node(node)) for node in arena.imports]
+    js += [codegen.compile(node) for node in body if not codegen.is_free(node, ids)]
+    exports = [arena.node(node) for node in arena.exports]
+    tail = codegen.compile(terms.EProgram(exports=exports))
+    return ";".join(js + [tail] if tail else js)
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import time
+import tracemalloc
+import typing
+
+import case_tree
+import compile
+import main
+import profiling
+import terms
+from algorithm_j import infer_program
+from prelude import DEFAULT_CTX, prelude_for
+
+# generators of synthetic programs, every one of them type checks and the size
+# parameter is what the benchmark doubles
+
+
+def gen_defs(n: int) -> str:
+    """n top level defs, each calling the previous one"""
+    lines = ["def f0(a, b) do a + b end"]
+    lines += [f"def f{i}(a, b) do f{i - 1}(a, b) * {i} end" for i in range(1, n)]
+    lines.append(f"`console.log`(f{n - 1}(1, 2))")
+    return "\n".join(lines) + "\n"
+
+
+def gen_block(n: int) -> str:
+    """a do block of n statements"""
+    lines = [f"x{i} = {i} + 1" for i in range(n)]
+    return f"y = do\n" + "\n".join(lines) + f"\nx{n - 1}\nend\n`console.log`(y)\n"
+
+
+def gen_nested(n: int) -> str:
+    """do blocks and if expressions nested n deep"""
+
+    def nest(i: int) -> str:
+        if i == 0:
+            return "1"
+        if i % 2:
+            return f"if {i} > 0 then\n{nest(i - 1)}\nelse 0 end"
+        return f"do\nx{i} = {i}\n{nest(i - 1)}\nend"
+
+    return f"x = {nest(n)}\n`console.log`(x)\n"
+
+
+def gen_elif(n: int) -> str:
+    """an if with a chain of n elif branches"""
+    branches = "\n".join(f"elif x == {i} then {i}" for i in range(1, n))
+    return f"x = 3\ny = if x == 0 then 0\n{branches}\nelse -1 end\n`console.log`(y)\n"
+
+
+def gen_enum(n: int) -> str:
+    """an enum with n variants and a case matching every one of them"""
+    variants = " ".join(f"V{i}" for i in range(n))
+    cases = "\n".join(f"V{i}() do {i} end" for i in range(n))
+    return (
+        f"enum Big {{{variants}}}\n"
+        f"def name(v) do case v of\n{cases}\nend end\n"
+        f"`console.log`(name(V{n // 2}()))\n"
+    )
+
+
+def gen_case(n: int) -> str:
+    """case expressions nested n deep, each matching a field and a nested Option"""
+
+    def nest(i: int) -> str:
+        if i == 0:
+            return "1"
+        return (
+            f"case Some(Some({i})) of\n"
+            f"Some(Some(x{i})) do x{i} + {nest(i - 1)} end\n"
+            f"Some(None()) do 0 end\n"
+            f"None() do 0 end\n"
+            f"end"
+        )
+
+    return f"y = {nest(n)}\n`console.log`(y)\n"
+
+
+GENERATORS: dict[str, typing.Callable[[int], str]] = {
+    "defs": gen_defs,
+    "block": gen_block,
+    "nested": gen_nested,
+    "elif": gen_elif,
+    "enum": gen_enum,
+    "case": gen_case,
+}
+
+# sizes start here and double, nesting is bounded by the recursion of infer
+START = {"defs": 64, "block": 256, "nested": 16, "elif": 16, "enum": 16, "case": 8}
+
+
+class CaseGetter(terms.VisitAll):
+    def __init__(self) -> None:
+        self.cases = list[terms.ECaseOf]()
+        super().__init__()
+
+    def ECaseOf(self, n: terms.ECaseOf) -> terms.ECaseOf:
+        self.cases.append(n)
+        n.visit_children_with(self)
+        return n
+
+
+Measurement: typing.TypeAlias = dict[str, dict[str, float]]
+
+
+def run_phases(source: str, memory: bool = False) -> Measurement:
+    """
+    runs every phase of the pipeline once, returning the seconds spent in each
+    and, with memory, the peak bytes allocated while it ran
+    """
+    main.init_worker()
+    assert main.lexer is not None and main.parser is not None
+    lexer, parser = main.lexer, main.parser
+    phases = dict[str, profiling.PhaseStats]()
+    memory_stats = dict[str, profiling.MemoryStats]()
+
+    def phase(name: str, fn: typing.Callable[..., typing.Any], *args) -> typing.Any:
+        with profiling.measure(phases, {}, name, memory_stats):
+            return fn(*args)
+
+    enabled, profiling.memory_enabled = profiling.memory_enabled, memory
+    try:
+        compile.reset_hash_ids()
+        tokens = phase("lex", lexer.scan, source)
+        ast = phase("parse", parser.parse, iter(tokens))
+        phase("infer", infer_program, DEFAULT_CTX, ast)
+
+        getter = CaseGetter()
+        ast.fold_with(getter)
+        phase("case_tree", lambda: [case_tree.gen_match(n.cases) for n in getter.cases])
+
+        program = terms.EProgram([*prelude_for(ast), *ast.body])
+        program = phase("hoist", program.fold_with, compile.Hoister())
+        program = phase("clean", program.fold_with, compile.DefCleaner())
+        phase("codegen", compile.compile, program)
+    finally:
+        profiling.memory_enabled = enabled
+        if memory and not enabled:
+            tracemalloc.stop()
+
+    results = Measurement()
+    for name, stats in phases.items():
+        results[name] = {"time": stats.wall}
+        if name in memory_stats:
+            results[name]["peak"] = memory_stats[name].peak
+    return results
+
+
+def node_bytes(ast: terms.EProgram) -> tuple[int, float]:
+    """
+    the distinct nodes of ast and the bytes each takes on average, found by
+    allocating a copy of every node, the lists and scalars they hold are
+    shared with the originals and so not counted
+    """
+    nodes = dict[int, typing.Any]()
+    stack: list[typing.Any] = [ast]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, list):
+            stack += n
+        elif isinstance(n, terms.Node) and id(n) not in nodes:
+            nodes[id(n)] = n
+            stack += [
+                getattr(n, field.name)
+                for field in dataclasses.fields(n)  # type: ignore[arg-type]
+            ]
+
+    fields = [
+        (n.__class__, {f.name: getattr(n, f.name) for f in dataclasses.fields(n)})
+        for n in nodes.values()
+    ]
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    copies: list[typing.Any] = [None] * len(fields)
+    gc.collect()
+    # fills the free lists of dicts, or the ones the calls below take for
+    # their keyword arguments would count as allocated
+    [{"a": i} for i in range(256)]
+    before = tracemalloc.get_traced_memory()[0]
+    for i, (cls, kwargs) in enumerate(fields):
+        copies[i] = cls(**kwargs)
+    size = tracemalloc.get_traced_memory()[0] - before
+    if not tracing:
+        tracemalloc.stop()
+    return len(nodes), size / max(len(nodes), 1)
+
+
+def bench(
+    shape: str, start: int, steps: int, memory: bool = True
+) -> list[dict[str, typing.Any]]:
+    rows = list[dict[str, typing.Any]]()
+    size = start
+
+    for _ in range(steps):
+        source = GENERATORS[shape](size)
+        timings = run_phases(source)
+        row: dict[str, typing.Any] = {
+            "shape": shape,
+            "size": size,
+            "bytes": len(source),
+            "phases": {name: {"time": m["time"]} for name, m in timings.items()},
+        }
+        if memory:
+            for name, m in run_phases(source, memory=True).items():
+                row["phases"][name]["peak"] = m["peak"]
+            assert main.lexer is not None and main.parser is not None
+            ast = main.parser.parse(iter(main.lexer.scan(source)))
+            assert isinstance(ast, terms.EProgram)
+            row["nodes"], row["node_bytes"] = node_bytes(ast)
+
+        rows.append(row)
+        size *= 2
+
+    return rows
+
+
+def total_time(row: dict[str, typing.Any]) -> float:
+    return sum(phase["time"] for phase in row["phases"].values())
+
+
+def print_rows(rows: list[dict[str, typing.Any]], baseline: dict[str, float]) -> None:
+    """
+    prints ms (and peak KiB) per phase, the growth of the total from the
+    previous size, about 2.0 per doubling is linear and 4.0 quadratic, the
+    bytes per ast node, and the ratio to the baseline when one was given
+    """
+    phases = list(rows[0]["phases"])
+    header = ["shape", "size", *phases, "total", "growth", "B/node"]
+    if baseline:
+        header.append("vs base")
+    print("  ".join(f"{h:>16}" for h in header))
+
+    previous: dict[str, float] = {}
+    for row in rows:
+        cells = [row["shape"], str(row["size"])]
+        for name in phases:
+            m = row["phases"][name]
+            cell = f"{m['time'] * 1000:.1f}"
+            if "peak" in m:
+                cell += f"/{m['peak'] / 1024:.0f}K"
+            cells.append(cell)
+
+        total = total_time(row)
+        cells.append(f"{total * 1000:.1f}")
+        prev = previous.get(row["shape"])
+        cells.append(f"{total / prev:.2f}" if prev else "-")
+        previous[row["shape"]] = total
+        cells.append(f"{row['node_bytes']:.1f}" if "node_bytes" in row else "-")
+
+        if baseline:
+            base = baseline.get(f"{row['shape']}:{row['size']}")
+            cells.append(f"{total / base:.2f}" if base else "-")
+
+        print("  ".join(f"{c:>16}" for c in cells))
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        prog="bench.py",
+        description="times every compiler phase on generated programs of doubling size",
+    )
+    arg_parser.add_argument(
+        "shapes", nargs="*", help=f"any of {', '.join(GENERATORS)}, all by default"
+    )
+    arg_parser.add_argument("--steps", type=int, default=4)
+    arg_parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies the starting sizes"
+    )
+    arg_parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc runs"
+    )
+    arg_parser.add_argument("--lexer", choices=list(main.LEXERS), default="sly")
+    arg_parser.add_argument("--parser", choices=list(main.PARSERS), default="lalr")
+    arg_parser.add_argument("--json", help="write the measurements to this file")
+    arg_parser.add_argument(
+        "--compare", help="a file written by --json to compare the totals with"
+    )
+    args = arg_parser.parse_args(argv)
+    for shape in args.shapes:
+        if shape not in GENERATORS:
+            arg_parser.error(f"unknown shape {shape!r}")
+    args.shapes = args.shapes or list(GENERATORS)
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    sys.setrecursionlimit(100_000)
+    main.lexer_backend = args.lexer
+    main.parser_backend = args.parser
+
+    baseline = dict[str, float]()
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {
+                f"{row['shape']}:{row['size']}": total_time(row) for row in json.load(f)
+            }
+
+    rows = list[dict[str, typing.Any]]()
+    for shape in args.shapes:
+        start = max(1, int(START[shape] * args.scale))
+        rows += bench(shape, start, args.steps, memory=not args.no_memory)
+
+    print_rows(rows, baseline)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
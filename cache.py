@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import typing
+
+import modules
+
+COMPILER_MODULES = [
+    "parser",
+    "pratt",
+    "terms",
+    "typed",
+    "algorithm_j",
+    "case_tree",
+    "compile",
+    "main",
+    "prelude",
+    "modules",
+    "arena",
+]
+
+
+@functools.cache
+def compiler_version() -> str:
+    """hash of the compiler sources, so any change to the compiler invalidates the cache"""
+    h = hashlib.sha256()
+    for name in COMPILER_MODULES:
+        spec = importlib.util.find_spec(name)
+        assert spec is not None and spec.origin is not None
+        with open(spec.origin, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def source_key(data: bytes, options: str = "") -> str:
+    h = hashlib.sha256(compiler_version().encode() + b"\0" + options.encode())
+    h.update(b"\0" + data)
+    return h.hexdigest()
+
+
+def stat_of(path: str) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def write_if_changed(path: str, data: str | bytes) -> bool:
+    """writes data to path unless the file already holds exactly these bytes"""
+    encoded = data.encode() if isinstance(data, str) else data
+    try:
+        with open(path, "rb") as f:
+            if f.read() == encoded:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "wb") as f:
+        f.write(encoded)
+    return True
+
+
+class BuildCache:
+    """
+    maps a source file to the output compiled from it
+
+    entries are keyed by the hash of the source and the compiler version,
+    the stat of the source is remembered so unchanged files are not rehashed
+
+    an entry also remembers the hash of every interface the source imported,
+    it only stays valid while those interfaces are unchanged
+
+    options are the flags that change the output, like the runtime of a bundle,
+    sources built with other options miss
+
+    with runtime_path the output imports the runtime relative to the source,
+    so the directory of a source is one of its options
+    """
+
+    def __init__(
+        self,
+        path: str = ".uwu_cache",
+        options: str = "",
+        runtime_path: str | None = None,
+    ) -> None:
+        self.path = path
+        self.options = options
+        self.runtime_path = runtime_path
+        self.index_path = os.path.join(path, "index.json")
+        self.entries: dict[str, dict[str, typing.Any]] = {}
+        self.keys: dict[str, str] = {}
+
+        try:
+            with open(self.index_path, "r") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def blob_path(self, key: str, suffix: str = ".js") -> str:
+        return os.path.join(self.path, key + suffix)
+
+    def options_of(self, src_path: str) -> str:
+        if self.runtime_path is None:
+            return self.options
+        directory = os.path.dirname(os.path.abspath(src_path))
+        return f"{self.options}\0dir={directory}"
+
+    def key(self, src_path: str) -> str:
+        entry = self.entries.get(src_path)
+        src_stat = stat_of(src_path)
+        options = self.options_of(src_path)
+
+        if (
+            entry is not None
+            and entry["src"] == src_stat
+            and entry.get("version") == compiler_version()
+            and entry.get("options", "") == options
+        ):
+            key = entry["key"]
+        else:
+            with open(src_path, "rb") as f:
+                key = source_key(f.read(), options)
+
+        self.keys[src_path] = key
+        return key
+
+    def restore(self, src_path: str, out_path: str) -> bool:
+        """brings out_path up to date from the cache, returns False on a miss"""
+        entry = self.entries.get(src_path)
+        key = self.key(src_path)
+
+        if entry is None or entry["key"] != key:
+            return False
+
+        for path, interface_hash in entry.get("deps", {}).items():
+            if modules.interface_hash(modules.interface_path(path)) != interface_hash:
+                return False
+
+        outputs = {"out": (out_path, ".js")}
+        if entry.get("iface") is not None:
+            outputs["iface"] = (modules.interface_path(src_path), ".iface")
+        blob = entry.get("blob", key)
+
+        for name, (path, suffix) in outputs.items():
+            if entry[name] is not None and entry[name] == stat_of(path):
+                continue
+
+            try:
+                with open(self.blob_path(blob, suffix), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return False
+
+            write_if_changed(path, data)
+            entry[name] = stat_of(path)
+
+        entry["src"] = stat_of(src_path)
+        return True
+
+    def store(
+        self,
+        src_path: str,
+        out_path: str,
+        js: str,
+        interface: bytes = b"",
+        deps: dict[str, str] | None = None,
+    ) -> None:
+        key = self.keys.get(src_path) or self.key(src_path)
+        deps = deps or {}
+        # the output depends on the imported interfaces as well as the source
+        blob = hashlib.sha256(
+            (key + json.dumps(deps, sort_keys=True)).encode()
+        ).hexdigest()
+
+        os.makedirs(self.path, exist_ok=True)
+        write_if_changed(self.blob_path(blob), js)
+        if interface:
+            write_if_changed(self.blob_path(blob, ".iface"), interface)
+
+        self.entries[src_path] = {
+            "key": key,
+            "blob": blob,
+            "version": compiler_version(),
+            "options": self.options_of(src_path),
+            "deps": deps,
+            "src": stat_of(src_path),
+            "out": stat_of(out_path),
+            "iface": stat_of(modules.interface_path(src_path)) if interface else None,
+        }
+
+    def save(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.index_path)
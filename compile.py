@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import functools
 import itertools
+import typing
 from dataclasses import dataclass
 
 import case_tree
@@ -10,7 +11,7 @@ import terms
 import typed
 
 
-class IdGetter(terms.FoldAll):
+class IdGetter(terms.VisitAll):
     def __init__(self) -> None:
         self.ids = set[str]()
         super().__init__()
@@ -21,7 +22,8 @@ class IdGetter(terms.FoldAll):
 
     def EBinaryExpr(self, n: terms.EBinaryExpr) -> terms.EBinaryExpr:
         self.ids.add(n.op)
-        return n.fold_children_with(self)
+        n.visit_children_with(self)
+        return n
 
 
 def is_free(expr: terms.EExpr, ids: set[str]) -> bool:
@@ -36,15 +38,26 @@ class DefCleaner(terms.FoldAll):
         getter = IdGetter()
         n = n.fold_children_with(self).fold_with(getter)
         next_body = [expr for expr in n.body if not is_free(expr, getter.ids)]
-        return terms.EProgram(next_body)
+        if len(next_body) == len(n.body):
+            return n
+        return dataclasses.replace(n, body=next_body)
 
     def EBlock(self, n: terms.EBlock) -> terms.EBlock:
         getter = IdGetter()
         n = n.fold_children_with(self).fold_with(getter)
         next_body = [expr for expr in n.body[:-1:] if not is_free(expr, getter.ids)]
+        if len(next_body) == len(n.body[:-1:]):
+            return n
         return terms.EBlock(next_body + n.body[-1::])
 
 
+class BlockCleaner(DefCleaner):
+    """cleans blocks only, for a part of a program whose later parts are unknown"""
+
+    def EProgram(self, n: terms.EProgram) -> terms.EProgram:
+        return n.fold_children_with(self)
+
+
 class Hoister(terms.FoldAll):
     def __init__(self) -> None:
         super().__init__()
@@ -62,8 +75,10 @@ class Hoister(terms.FoldAll):
 
     def EProgram(self, n: terms.EProgram) -> terms.EProgram:
 
-        body2 = self.hoist_expr_list(n.body)
-        return terms.EProgram(filter_identifiers(body2))
+        body2 = filter_identifiers(self.hoist_expr_list(n.body))
+        if same_items(body2, n.body):
+            return n
+        return dataclasses.replace(n, body=body2)
 
     def hoist_expr_list(self, body: list[terms.EExpr]) -> list[terms.EExpr]:
         body2 = list[terms.EExpr]()
@@ -78,7 +93,14 @@ class Hoister(terms.FoldAll):
 
     def EBlock(self, n: terms.EBlock) -> terms.EBlock:
         body2 = self.hoist_expr_list(n.body)
-        return terms.EBlock(filter_identifiers(body2[:-1:]) + body2[-1::])
+        body2 = filter_identifiers(body2[:-1:]) + body2[-1::]
+        if same_items(body2, n.body):
+            return n
+        return terms.EBlock(body2)
+
+
+def same_items(a: list[terms.EExpr], b: list[terms.EExpr]) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
 
 
 def filter_identifiers(body: list[terms.EExpr]) -> list[terms.EExpr]:
@@ -99,10 +121,75 @@ def hash_id(_: str) -> str:
     return "op" + str(i)
 
 
+def reset_hash_ids() -> None:
+    """restarts operator numbering so output does not depend on previously compiled files"""
+    global i
+    i = 0
+    hash_id.cache_clear()
+
+
+# spelling of operator characters in stable names, none of them is a prefix
+# of and/or so no two operators share a name
+OP_CHARS = {
+    "+": "plus",
+    "-": "minus",
+    "*": "star",
+    "/": "slash",
+    "%": "percent",
+    "<": "lt",
+    ">": "gt",
+    "=": "eq",
+    "!": "bang",
+    "&": "amp",
+    "|": "bar",
+    "^": "caret",
+    "~": "tilde",
+    ".": "dot",
+    ":": "colon",
+    "?": "question",
+    "@": "at",
+    "$": "dollar",
+}
+
+# set by bundles, which share one runtime and so need names that do not depend
+# on the order operators were met in
+stable_ops = False
+
+
+def stable_op_id(op: str) -> str:
+    """a name for op that is the same in every file, op_plus for +"""
+    if op.isidentifier():
+        return "op_" + op
+    return "op_" + "_".join(OP_CHARS.get(c, f"u{ord(c):x}") for c in op)
+
+
+def op_id(op: str) -> str:
+    return stable_op_id(op) if stable_ops else hash_id(op)
+
+
+def js_name(name: terms.EIdentifier) -> str:
+    """the property a value is exported as, operators are exported by their symbol"""
+    if name.name.isidentifier() and name.name not in typing.get_args(terms.BinaryOp):
+        return name.name
+    return f'"{name.name}":{op_id(name.name)}'
+
+
+def require_path(path: str) -> str:
+    """the js file an import refers to, paths to js files are kept as they are"""
+    if path.endswith(".js"):
+        return path if path.startswith(".") else "./" + path
+    if not path.endswith(".uwu"):
+        path += ".uwu"
+    if not path.startswith("."):
+        path = "./" + path
+    return path + ".js"
+
+
 def compile(
     exp: terms.EIdentifier
     | terms.EExpr
     | terms.EProgram
+    | terms.EImport
     | terms.EParam
     | terms.EUnaryExpr
     | terms.MaybeOrElse
@@ -143,9 +230,25 @@ def compile(
             return ";".join(js_body)
         case terms.EDo(block):
             return "(()=>{" + compile(block) + "})()"
-        case terms.EProgram(body):
-            js_body = [compile(expr) for expr in body]
+        case terms.EProgram(body, imports, exports):
+            js_body = [compile(node) for node in imports]
+            js_body += [compile(expr) for expr in body]
+            js_exports = [
+                js_name(name) for name in exports if isinstance(name, terms.EIdentifier)
+            ]
+            if js_exports:
+                js_body.append(f"module.exports={{{','.join(js_exports)}}}")
             return ";".join(js_body)
+        case terms.EImport():
+            js_names = [
+                js_name(name)
+                for name in exp.names
+                if isinstance(name, terms.EIdentifier)
+            ]
+            js_require = f'require("{require_path(exp.path)}")'
+            if not js_names:
+                return js_require
+            return f"const {{{','.join(js_names)}}}={js_require}"
         case terms.MaybeOrElseNothing():
             return f"return"
         case terms.EIf(test, then, or_else):
@@ -182,11 +285,11 @@ def compile(
 
             return f"const {id}={js_args}{{{compile(block)}}}"
         case terms.EBinaryOpDef(id, args, do):
-            return compile(terms.EDef(f"/* {id} */" + hash_id(id), args, do))
+            return compile(terms.EDef(f"/* {id} */" + op_id(id), args, do))
         case terms.EBinaryExpr(op, left, right):
             js_left = compile(left)
             js_right = compile(right)
-            return f"{hash_id(op)}({js_left})/* {op} */({js_right})"
+            return f"{op_id(op)}({js_left})/* {op} */({js_right})"
         case terms.EIdentifier(id):
             return id
         case terms.EEnumDeclaration():
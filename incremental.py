@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import bisect
+import dataclasses
+from array import array
+from parser import CLOSING, OPENING, TokenStream, UwuLexer, UwuParser, UwuScanner
+
+import sly  # type: ignore[import]
+
+import terms
+from pratt import PrattParser
+
+
+@dataclasses.dataclass
+class Item:
+    """
+    a top level import or expression with the newline after it, its tokens
+    have offsets into text and the line numbers they had when last lexed
+    """
+
+    text: str
+    tokens: TokenStream
+    program: terms.EProgram | None
+
+
+class Document:
+    """
+    a source kept parsed as it is edited, an edit lexes and parses again only
+    the top level items it touches and keeps the nodes of all the others
+
+    an edit still shifts the offsets of the items after it and puts the
+    program back together from the items, both are a step per item and not
+    per token
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        lexer: UwuLexer | UwuScanner | None = None,
+        parser: UwuParser | PrattParser | None = None,
+    ) -> None:
+        self.lexer = lexer or UwuScanner()
+        self.parser = parser or UwuParser()
+        self.items = list[Item]()
+        self.starts = list[int]()
+        self.lines = list[int]()
+        # what every item holds, spliced along with the items so finding where
+        # their nodes go in the program is a count over bytes
+        self.kinds = bytearray()
+        self.imports = list[terms.EImport]()
+        self.body = list[terms.EExpr]()
+        self.exports = list[terms.EIdentifier | terms.ETypeIdentifier]()
+        self.program: terms.EProgram | None = None
+        self.edit(0, 0, text)
+
+    @property
+    def text(self) -> str:
+        return "".join(item.text for item in self.items)
+
+    def tokens(self) -> TokenStream:
+        """the tokens of the whole text, as the lexer would give them"""
+        stream = TokenStream(self.text)
+        for item, start, line in zip(self.items, self.starts, self.lines):
+            first = item.tokens.lines[0] if len(item.tokens) else line
+            for kind, begin, end, lineno in zip(
+                item.tokens.kinds,
+                item.tokens.starts,
+                item.tokens.ends,
+                item.tokens.lines,
+            ):
+                stream.kinds.append(kind)
+                stream.starts.append(start + begin)
+                stream.ends.append(start + end)
+                stream.lines.append(line + lineno - first)
+        return stream
+
+    def edit(self, start: int, end: int, text: str) -> terms.EProgram | None:
+        """
+        replaces the characters from start to end with text, returning the
+        new program or None when the source no longer parses
+        """
+        # an edit right at the start of an item could join the newline before it
+        first = max(bisect.bisect_right(self.starts, start) - 1, 0)
+        if first and start == self.starts[first]:
+            first -= 1
+        last = max(bisect.bisect_right(self.starts, end) - 1, first)
+
+        old_start = self.starts[first] if self.items else 0
+        old_text = "".join(item.text for item in self.items[first : last + 1])
+        source = old_text[: start - old_start] + text + old_text[end - old_start :]
+        line = self.lines[first] if self.items else 1
+
+        # the region grows until it ends where an item does
+        while True:
+            items = self.split(source, line, last + 1 >= len(self.items))
+            if items is not None:
+                break
+            last += 1
+            source += self.items[last].text
+
+        delta = len(source) - sum(
+            len(item.text) for item in self.items[first : last + 1]
+        )
+        line_delta = source.count("\n") - sum(
+            item.text.count("\n") for item in self.items[first : last + 1]
+        )
+        starts, lines = list[int](), list[int]()
+        offset = old_start
+        for item in items:
+            starts.append(offset)
+            lines.append(line)
+            offset += len(item.text)
+            line += item.text.count("\n")
+
+        self.splice(first, last + 1, items)
+        tail = slice(last + 1, len(self.items))
+        self.items[first : last + 1] = items
+        self.starts[first:] = starts + [s + delta for s in self.starts[tail]]
+        self.lines[first:] = lines + [n + line_delta for n in self.lines[tail]]
+
+        self.program = self.join()
+        return self.program
+
+    def splice(self, first: int, last: int, items: list[Item]) -> None:
+        """replaces the nodes of the items from first up to last with those of items"""
+        kinds = self.kinds
+        imports = kinds.count(IMPORT, 0, first)
+        body = kinds.count(BODY, 0, first) + kinds.count(EXPORT, 0, first)
+        exports = kinds.count(EXPORT, 0, first)
+        old = [item.program for item in self.items[first:last] if item.program]
+
+        new_kinds = bytearray()
+        new_imports = list[terms.EImport]()
+        new_body = list[terms.EExpr]()
+        new_exports = list[terms.EIdentifier | terms.ETypeIdentifier]()
+        for item in items:
+            new_kinds += kind_of(item.program)
+            if item.program is not None:
+                new_imports += item.program.imports
+                new_body += item.program.body
+                new_exports += item.program.exports
+
+        kinds[first:last] = new_kinds
+        self.imports[imports : imports + sum(len(p.imports) for p in old)] = new_imports
+        self.body[body : body + sum(len(p.body) for p in old)] = new_body
+        self.exports[exports : exports + sum(len(p.exports) for p in old)] = new_exports
+
+    def split(self, source: str, line: int, at_end: bool) -> list[Item] | None:
+        """
+        lexes source and parses every item in it, None when source is not
+        at_end and its last item goes on past it
+
+        source that does not lex, or is left open at the end, is one item
+        that does not parse
+        """
+        try:
+            stream = self.lexer.scan(source)
+        except sly.lex.LexError:
+            return [Item(source, TokenStream(source), None)]
+        stream.lines = array("I", [line + lineno - 1 for lineno in stream.lines])
+
+        codes = TokenStream.CODES
+        newline = codes["NEWLINE"]
+        opening = {codes[kind] for kind in OPENING}
+        closing = {codes[kind] for kind in CLOSING}
+
+        items = list[Item]()
+        item_start = 0
+        tokens = TokenStream("")
+        depth = 0
+
+        for kind, start, end, lineno in zip(
+            stream.kinds, stream.starts, stream.ends, stream.lines
+        ):
+            tokens.kinds.append(kind)
+            tokens.starts.append(start - item_start)
+            tokens.ends.append(end - item_start)
+            tokens.lines.append(lineno)
+
+            if kind in opening:
+                depth += 1
+            elif kind in closing:
+                depth -= 1
+            elif kind == newline and depth <= 0:
+                tokens.text = source[item_start:end]
+                items.append(Item(tokens.text, tokens, self.parse(tokens)))
+                item_start = end
+                tokens = TokenStream("")
+
+        if item_start < len(source) and not at_end:
+            return None
+        if depth > 0:
+            return [Item(source, stream, None)]
+        if item_start < len(source) or not items:
+            tokens.text = source[item_start:]
+            items.append(Item(tokens.text, tokens, self.parse(tokens)))
+        return items
+
+    def parse(self, tokens: TokenStream) -> terms.EProgram | None:
+        if not len(tokens):
+            return terms.EProgram()
+        program = self.parser.parse(iter(tokens))
+        return program if isinstance(program, terms.EProgram) else None
+
+    def join(self) -> terms.EProgram | None:
+        """the program of the whole text, imports can only come before the body"""
+        if BROKEN in self.kinds or IMPORT in self.kinds.lstrip(BLANK + IMPORT):
+            return None
+        return terms.EProgram(list(self.body), list(self.imports), list(self.exports))
+
+
+BLANK, IMPORT, BODY, EXPORT, BROKEN = b" ", b"i", b"b", b"e", b"x"
+
+
+def kind_of(program: terms.EProgram | None) -> bytes:
+    """an item parses to at most one import or top level expression"""
+    if program is None:
+        return BROKEN
+    if program.imports:
+        return IMPORT
+    if program.exports:
+        return EXPORT
+    return BODY if program.body else BLANK
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+import argparse
 import builtins
+import concurrent.futures
+import contextlib
 import dataclasses
 import glob
 import json
 import logging
+import mmap
+import os
+import shutil
 import sys
-from parser import UwuLexer, UwuParser
+import tempfile
+import time
+import typing
+from parser import CHUNK_TOKENS, UwuLexer, UwuParser, UwuScanner
+
+import sly  # type: ignore[import]
 
 import algorithm_j
 import compile
+import modules
+import profiling
 import terms
 import typed
-from algorithm_j import (
-    Context,
-    NonExhaustiveMatchException,
-    Scheme,
-    fresh_ty_var,
-    type_infer,
+from algorithm_j import ProgramInference, infer_program, warn_non_exhaustive
+from cache import BuildCache, stat_of, write_if_changed
+from pratt import PrattParser
+from prelude import (
+    BUILTINS,
+    DEFAULT_CTX,
+    builtins_for,
+    prelude_for,
+    runtime,
+    runtime_import,
+    save_unsaved,
 )
 
 
@@ -32,161 +50,6 @@ class AstEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
-def SimpleBinaryOpDef(
-    op: terms.BinaryOp, ext: str, a: str, b: str, ret: str, generics: list[str] = []
-):
-    return BinaryOpDef(
-        op, ext, terms.EHint(a), terms.EHint(b), terms.EHint(ret), generics=generics
-    )
-
-
-def BinaryOpDef(
-    op: terms.BinaryOp,
-    ext: str,
-    a: terms.EHint,
-    b: terms.EHint,
-    ret: terms.EHint,
-    generics: list[str] = [],
-):
-    return terms.EExpr(
-        terms.EBinaryOpDef(
-            op,
-            [
-                terms.EParam("a", hint=terms.MaybeEHint((a))),
-                terms.EParam("b", hint=terms.MaybeEHint((b))),
-            ],
-            terms.EDo(terms.EBlock([terms.EExpr(terms.EExternal(ext))])),
-            terms.MaybeEHint((ret)),
-            generics=list(map(terms.EIdentifier, generics)),
-        )
-    )
-
-
-BUILTINS: list[terms.EExpr] = [
-    terms.EExpr
-    ** terms.EDef(
-        "id",
-        [terms.EParam("x")],
-        terms.EDo ** terms.EBlock([terms.EExpr ** terms.EIdentifier("x")]),
-    ),
-    terms.EExpr
-    ** terms.ELet(
-        "unit",
-        terms.EExpr ** terms.EExternal("undefined"),
-        terms.MaybeEHint ** terms.EHint("Unit"),
-    ),
-    # int
-    SimpleBinaryOpDef("+", "a+b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
-    SimpleBinaryOpDef(
-        "/", "Math.floor(a/b)", typed.TNum.id, typed.TNum.id, typed.TNum.id
-    ),
-    SimpleBinaryOpDef("*", "a*b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
-    SimpleBinaryOpDef("**", "a**b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
-    SimpleBinaryOpDef("-", "a-b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
-    # int eq
-    SimpleBinaryOpDef("<", "a<b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
-    SimpleBinaryOpDef(">", "a>b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
-    SimpleBinaryOpDef(">=", "a>=b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
-    SimpleBinaryOpDef("<=", "a<=b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
-    # float
-    SimpleBinaryOpDef("+.", "a+b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
-    SimpleBinaryOpDef("/.", "a/b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
-    SimpleBinaryOpDef("*.", "a*b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
-    SimpleBinaryOpDef("**.", "a**b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
-    SimpleBinaryOpDef("-.", "a-b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
-    # float eq
-    SimpleBinaryOpDef("<.", "a<b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
-    SimpleBinaryOpDef(">.", "a>b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
-    SimpleBinaryOpDef(">=.", "a>=b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
-    SimpleBinaryOpDef("<=.", "a<=b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
-    # str
-    SimpleBinaryOpDef("<>", "a+b", typed.TStr.id, typed.TStr.id, typed.TStr.id),
-    SimpleBinaryOpDef(
-        "=~", "b.test(a)", typed.TStr.id, typed.TRegex.id, typed.TBool.id
-    ),
-    # eq
-    SimpleBinaryOpDef(
-        "==",
-        "Object.is(a,b)",
-        ("A"),
-        ("A"),
-        (typed.TBool.id),
-        generics=[("A")],
-    ),
-    SimpleBinaryOpDef(
-        "!=",
-        "!Object.is(a,b)",
-        ("A"),
-        ("A"),
-        (typed.TBool.id),
-        generics=[("A")],
-    ),
-    # array
-    BinaryOpDef(
-        "++",
-        "a.concat(b)",
-        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
-        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
-        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
-        generics=[("A")],
-    ),
-    # bool
-    SimpleBinaryOpDef(
-        "&&",
-        "a&&b",
-        generics=["A"],
-        a="A",
-        b="A",
-        ret="A",
-    ),
-    SimpleBinaryOpDef("and", "a&&b", typed.TBool.id, typed.TBool.id, typed.TBool.id),
-    SimpleBinaryOpDef(
-        "||",
-        "a||b",
-        generics=["A"],
-        a="A",
-        b="A",
-        ret="A",
-    ),
-    SimpleBinaryOpDef("or", "a||b", typed.TBool.id, typed.TBool.id, typed.TBool.id),
-]
-
-v = fresh_ty_var()
-
-
-DEFAULT_CTX = Context(
-    {},
-    {
-        typed.TStr.id: Scheme([], typed.TStr),
-        typed.TNum.id: Scheme([], typed.TNum),
-        "Int": Scheme([], typed.TNum),
-        typed.TFloat.id: Scheme([], typed.TFloat),
-        typed.TUnit.id: Scheme([], typed.TUnit),
-        typed.TRegex.id: Scheme([], typed.TRegex),
-        typed.TCallableCon.id: Scheme([], typed.TCallableCon),
-        typed.TArrayCon.id: Scheme([], typed.TArrayCon),
-        # Bool
-        typed.TBool.id: Scheme([], typed.TBool),
-        f"${typed.TrueCon.id}": Scheme([], typed.TrueCon),
-        f"${typed.FalseCon.id}": Scheme([], typed.FalseCon),
-        f"{typed.TrueCon.id}": Scheme([], typed.TDef(typed.TrueCon, typed.TBool)),
-        f"{typed.FalseCon.id}": Scheme([], typed.TDef(typed.FalseCon, typed.TBool)),
-        # Option
-        typed.TOptionCon.id: Scheme([], typed.TOptionCon),
-        f"${typed.SomeCon.id}": Scheme([], typed.SomeCon),
-        f"${typed.NoneCon.id}": Scheme([], typed.NoneCon),
-        typed.SomeCon.id: Scheme(
-            [v.id], typed.TDef(typed.TAp(typed.SomeCon, v), typed.TOption(v))
-        ),
-        typed.NoneCon.id: Scheme([v.id], typed.TDef(typed.NoneCon, typed.TOption(v))),
-    },
-)
-
-
-for builitin in BUILTINS:
-    type_infer(DEFAULT_CTX, builitin)
-
-
 def green(text: str) -> str:
     return "\033[92m{}\033[00m".format(text)
 
@@ -199,57 +62,756 @@ def print(s: str, end: str = ""):
     builtins.print(f"\r{s}", end=end, flush=True)
 
 
-def main():
-
-    lexer = UwuLexer()
-    parser = UwuParser()
-
-    match sys.argv:
-        case [_, arg]:
-            pattern = arg
-        case _:
-            pattern = "**/*.uwu"
-
-    for src_path in glob.glob(pattern):
+@dataclasses.dataclass
+class Diagnostic:
+    phase: str
+    kind: str
+    message: str
+
+
+@dataclasses.dataclass
+class FileResult:
+    src_path: str
+    ok: bool = False
+    js: str = ""
+    out_path: str = ""
+    type: str = ""
+    bindings: dict[str, str] = dataclasses.field(default_factory=dict)
+    error: Diagnostic | None = None
+    warnings: list[str] = dataclasses.field(default_factory=list)
+    messages: list[tuple[str, str]] = dataclasses.field(default_factory=list)
+    phases: dict[str, profiling.PhaseStats] = dataclasses.field(default_factory=dict)
+    raw_stats: dict[str, profiling.RawStats] = dataclasses.field(default_factory=dict)
+    memory: dict[str, profiling.MemoryStats] = dataclasses.field(default_factory=dict)
+    interface: bytes = b""
+    deps: dict[str, str] = dataclasses.field(default_factory=dict)
+    streamed: bool = False
+
+    def log(self, s: str, end: str = "") -> None:
+        self.messages.append((s, end))
+
+    def fail(self, phase: str, e: Exception) -> FileResult:
+        self.error = Diagnostic(phase, type(e).__name__, str(e))
+        self.log(str(e))
+        return self
+
+    def phase(self, name: str) -> typing.ContextManager[None]:
+        return profiling.measure(self.phases, self.raw_stats, name, self.memory)
+
+
+class ParseError(Exception):
+    pass
+
+
+LEXERS: dict[str, typing.Callable[[], UwuLexer | UwuScanner]] = {
+    "sly": UwuLexer,
+    "scanner": UwuScanner,
+}
+
+PARSERS: dict[str, typing.Callable[[], UwuParser | PrattParser]] = {
+    "lalr": UwuParser,
+    "pratt": PrattParser,
+}
+
+lexer_backend = "sly"
+parser_backend = "lalr"
+lexer: UwuLexer | UwuScanner | None = None
+parser: UwuParser | PrattParser | None = None
+# set by --intern, every ast parsed in this process and the types bound by
+# it then share their structurally equal nodes
+intern_nodes = False
+interner: terms.Interner | None = None
+type_interner: typed.TypeInterner | None = None
+
+
+def init_worker(
+    cprofile: bool | None = None,
+    memory: bool | None = None,
+    backend: str | None = None,
+    parser_name: str | None = None,
+    interning: bool | None = None,
+) -> None:
+    global lexer, parser, lexer_backend, parser_backend
+    global intern_nodes, interner, type_interner
+
+    if cprofile is not None:
+        profiling.cprofile_enabled = cprofile
+    if memory is not None:
+        profiling.memory_enabled = memory
+    if backend is not None:
+        lexer_backend = backend
+    if parser_name is not None:
+        parser_backend = parser_name
+    if interning is not None:
+        intern_nodes = interning
+    lexer = LEXERS[lexer_backend]()
+    parser = PARSERS[parser_backend]()
+    interner = terms.Interner() if intern_nodes else None
+    type_interner = typed.TypeInterner() if intern_nodes else None
+
+
+def compile_source(
+    data: str,
+    src_path: str = "<source>",
+    codegen: bool = True,
+    interfaces: typing.Mapping[str, bytes] = {},
+    runtime_path: str | None = None,
+) -> FileResult:
+    """
+    runs the pipeline on data without touching the filesystem, except to read
+    the interfaces of imported modules missing from interfaces
+
+    with runtime_path the builtins are imported from the shared runtime module
+    there instead of being defined in the output
+    """
+    if lexer is None or parser is None:
+        init_worker()
+    assert lexer is not None and parser is not None
+
+    result = FileResult(src_path)
+
+    result.log(f"{yellow('Parsing')} {src_path}")
+
+    try:
+        with result.phase("lex"):
+            tokens = lexer.scan(data)
+    except sly.lex.LexError as e:
+        return result.fail("lex", e)
+
+    with result.phase("parse"):
+        ast = parser.parse(iter(tokens))
+
+    if not isinstance(ast, terms.EProgram):
+        return result.fail("parse", ParseError(f"Failed parse"))
+    if interner is not None:
+        ast = ast.fold_with(interner)
+
+    result.log(f"{green('Parsed')} {src_path}")
+
+    try:
+        with result.phase("imports"):
+            ctx, ast = modules.link(ast, src_path, result.deps, interfaces)
+    except (modules.ModuleError, OSError) as e:
+        return result.fail("imports", e)
+
+    try:
+        with result.phase("infer"), warn_non_exhaustive() as warnings:
+            ty, bound = infer_program(ctx, ast)
+            if type_interner is not None:
+                for name, scheme in bound.vars.items():
+                    bound.vars[name] = algorithm_j.Scheme(
+                        scheme.vars, type_interner(scheme.ty)
+                    )
+            interface = modules.interface_of(src_path, ast, bound)
+            result.interface = modules.dump_interface(interface)
+        result.type = repr(ty)
+        result.bindings = {
+            name: repr(scheme.ty) for name, scheme in sorted(bound.vars.items())
+        }
+    except Exception as e:
+        return result.fail("infer", e)
+
+    # a non-exhaustive match is only a warning, the module can still be imported
+    for warning in dict.fromkeys(warnings):
+        result.warnings.append(warning)
+        result.log(warning)
+
+    result.log(f"{green('Inferred')} {src_path}")
+
+    if codegen:
+        compile.reset_hash_ids()
+        if runtime_path is None:
+            ast = dataclasses.replace(ast, body=[*prelude_for(ast), *ast.body])
+        else:
+            path = relative_to(src_path, runtime_path)
+            node = runtime_import(prelude_for(ast), path)
+            if node.names:
+                ast = dataclasses.replace(ast, imports=[node, *ast.imports])
+
+        stable_ops, compile.stable_ops = compile.stable_ops, runtime_path is not None
+        try:
+            with result.phase("hoist"):
+                ast = ast.fold_with(compile.Hoister())
+            with result.phase("clean"):
+                ast = ast.fold_with(compile.DefCleaner())
+            with result.phase("codegen"):
+                result.js = compile.compile(ast)
+        finally:
+            compile.stable_ops = stable_ops
+
+        result.log(f"{green('Compiled')} {src_path}")
+
+    result.ok = True
+    return result
+
+
+def relative_to(src_path: str, path: str) -> str:
+    """path as a module written in src_path would import it"""
+    directory = os.path.dirname(os.path.abspath(src_path))
+    return os.path.relpath(os.path.abspath(path), directory).replace(os.sep, "/")
+
+
+# sources at least this large are compiled with compile_stream
+STREAM_SIZE = 16 * 1024 * 1024
+
+
+def compile_stream(
+    src_path: str,
+    interfaces: typing.Mapping[str, bytes] = {},
+    runtime_path: str | None = None,
+    chunk_size: int = CHUNK_TOKENS,
+) -> FileResult:
+    """
+    compiles src_path to src_path.js one chunk of top level items at a time,
+    lexing straight from a memory map of the file, so neither the source,
+    its tokens nor its ast are ever held whole
+
+    the js of each chunk goes to a temporary file and the imports, prelude
+    and exports are written around it at the end, unused top level defs are
+    kept since a later chunk could use them
+    """
+    if lexer is None or parser is None:
+        init_worker()
+    assert lexer is not None and parser is not None
+    scanner = lexer if isinstance(lexer, UwuScanner) else UwuScanner()
+
+    result = FileResult(src_path, streamed=True)
+    result.log(f"{yellow('Streaming')} {src_path}")
+
+    ctx: algorithm_j.Context | None = None
+    inference: ProgramInference | None = None
+    imports = list[terms.EImport]()
+    exports = list[terms.EIdentifier | terms.ETypeIdentifier]()
+    enums = list[terms.EExpr]()
+    getter = compile.IdGetter()
+
+    def link() -> FileResult | None:
+        nonlocal ctx, imports, inference
+        try:
+            with result.phase("imports"):
+                program = terms.EProgram(imports=imports)
+                ctx, program = modules.link(program, src_path, result.deps, interfaces)
+        except (modules.ModuleError, OSError) as e:
+            return result.fail("imports", e)
+        imports = program.imports
+        inference = ProgramInference(ctx)
+        return None
+
+    compile.reset_hash_ids()
+    stable_ops, compile.stable_ops = compile.stable_ops, runtime_path is not None
+    try:
+        with open(src_path, "rb") as f, tempfile.TemporaryFile("w+") as body:
+            size = os.fstat(f.fileno()).st_size
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            chunks = scanner.scan_chunks(buffer, chunk_size)
+            try:
+                while True:
+                    try:
+                        with result.phase("lex"):
+                            tokens = next(chunks, None)
+                    except sly.lex.LexError as e:
+                        return result.fail("lex", e)
+                    if tokens is None:
+                        break
+
+                    with result.phase("parse"):
+                        chunk = parser.parse(iter(tokens))
+                    if not isinstance(chunk, terms.EProgram):
+                        return result.fail("parse", ParseError(f"Failed parse"))
+                    if chunk.imports and ctx is not None:
+                        error = ParseError("Imports must come before everything else")
+                        return result.fail("parse", error)
+
+                    # imports can span chunks, they are linked once the body starts
+                    imports += chunk.imports
+                    if ctx is None and chunk.body:
+                        if failed := link():
+                            return failed
+
+                    exports += chunk.exports
+                    enums += [
+                        node
+                        for node in chunk.body
+                        if isinstance(node.expr, terms.EEnumDeclaration)
+                    ]
+                    chunk.fold_with(getter)
+
+                    try:
+                        with result.phase("infer"), warn_non_exhaustive() as warnings:
+                            if inference is not None:
+                                for node in chunk.body:
+                                    inference.add(node)
+                    except Exception as e:
+                        return result.fail("infer", e)
+                    for warning in dict.fromkeys(warnings):
+                        result.warnings.append(warning)
+                        result.log(warning)
+
+                    with result.phase("hoist"):
+                        chunk = chunk.fold_with(compile.Hoister())
+                    with result.phase("clean"):
+                        chunk = chunk.fold_with(compile.BlockCleaner())
+                    with result.phase("codegen"):
+                        js = compile.compile(terms.EProgram(chunk.body))
+                    if js:
+                        body.write(js + ";")
+            finally:
+                # the scanner holds on to the map until it is closed
+                chunks.close()
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+
+            if ctx is None and (failed := link()):
+                return failed
+
+            result.log(f"{green('Parsed')} {src_path}")
+            if inference is not None:
+                ty, bound = inference.result()
+                program = terms.EProgram(enums, imports, exports)
+                interface = modules.interface_of(src_path, program, bound)
+                result.interface = modules.dump_interface(interface)
+                result.type = repr(ty)
+                result.bindings = {
+                    name: repr(scheme.ty) for name, scheme in sorted(bound.vars.items())
+                }
+                result.log(f"{green('Inferred')} {src_path}")
+
+            imported = {name.name for node in imports for name in node.names}
+            prelude = builtins_for(getter.ids, imported)
+            if runtime_path is not None:
+                path = relative_to(src_path, runtime_path)
+                shared = runtime_import(prelude, path)
+                if shared.names:
+                    imports = [shared, *imports]
+                prelude = []
+
+            with result.phase("codegen"):
+                program = terms.EProgram(prelude, imports)
+                head = compile.compile(program.fold_with(compile.Hoister()))
+                tail = compile.compile(terms.EProgram(exports=exports))
+
+            out_path = src_path + ".js"
+            with open(out_path + ".tmp", "w") as out:
+                if head:
+                    out.write(head + ";")
+                body.seek(0)
+                shutil.copyfileobj(body, out)
+                out.write(tail)
+            os.replace(out_path + ".tmp", out_path)
+    finally:
+        compile.stable_ops = stable_ops
+
+    if result.interface:
+        modules.write_interface(modules.interface_path(src_path), result.interface)
+
+    result.log(f"{green('Compiled')} {src_path} to {out_path}", end="\n")
+    result.out_path = out_path
+    result.ok = True
+    return result
+
+
+def compile_file(
+    src_path: str,
+    interfaces: typing.Mapping[str, bytes] = {},
+    runtime_path: str | None = None,
+    stream: bool = False,
+) -> FileResult:
+    """
+    compiles src_path to src_path.js, streaming it when asked or when it is large
+
+    what goes wrong with one file is its diagnostic, so a build or watch of
+    many keeps going
+    """
+    try:
+        if stream or os.path.getsize(src_path) >= STREAM_SIZE:
+            return compile_stream(src_path, interfaces, runtime_path)
 
         with open(src_path, "r") as f:
             data = f.read()
 
-        print(f"{yellow('Parsing')} {src_path}")
-
-        ast = parser.parse(lexer.tokenize(data))
-
-        if not isinstance(ast, terms.EProgram):
-            print(f"Failed parse")
-            return
-
-        ast = terms.EProgram([*BUILTINS, *ast.body])
-
-        print(f"{green('Parsed')} {src_path}")
-
-        try:
-            type_infer(
-                DEFAULT_CTX,
-                ast,
+        result = compile_source(
+            data, src_path, interfaces=interfaces, runtime_path=runtime_path
+        )
+    except Exception as e:
+        # like a program nested too deep for the recursive passes
+        result = FileResult(src_path)
+        result.log(f"{yellow('Failed')} {src_path} ")
+        return result.fail("compile", e)
+    if not result.ok:
+        return result
+
+    path = src_path + ".js"
+    write_if_changed(path, result.js)
+    if result.interface:
+        modules.write_interface(modules.interface_path(src_path), result.interface)
+
+    result.log(f"{green('Compiled')} {src_path} to {(path)}", end="\n")
+    result.out_path = path
+    return result
+
+
+def compile_many(
+    sources: typing.Mapping[str, str] | typing.Iterable[tuple[str, str]],
+    codegen: bool = True,
+    executor: concurrent.futures.Executor | None = None,
+) -> list[FileResult]:
+    """
+    compiles (path, source) pairs held in memory, returning the js, type of
+    every top level binding and diagnostics of each one in order
+
+    the lexer, parser and DEFAULT_CTX of this process are reused between
+    calls, pass an executor to spread the sources over its workers instead
+    """
+    items = list(sources.items() if isinstance(sources, typing.Mapping) else sources)
+    paths = [path for path, _ in items]
+    data = [source for _, source in items]
+    codegens = [codegen] * len(items)
+
+    if executor is None:
+        return list(map(compile_source, data, paths, codegens))
+    return list(executor.map(compile_source, data, paths, codegens))
+
+
+def build(
+    src_paths: list[str],
+    jobs: int,
+    build_cache: BuildCache | None,
+    executor: concurrent.futures.Executor | None = None,
+    report: profiling.Report | None = None,
+    runtime_path: str | None = None,
+    stream: bool = False,
+) -> bool:
+    """
+    compiles src_paths and the modules they import, with runtime_path the
+    shared runtime is written there and every module imports its builtins from
+    it, with stream every module is compiled with compile_stream
+
+    a module is started as soon as every module it imports is done and gets
+    their interfaces passed along, so independent modules compile in parallel
+    and a wide import graph takes about as long as its longest import chain
+    """
+    try:
+        graph, order = modules.build_order(src_paths)
+    except modules.ModuleError as e:
+        print(str(e), end="\n")
+        return False
+
+    if runtime_path is not None:
+        os.makedirs(os.path.dirname(runtime_path) or ".", exist_ok=True)
+        write_if_changed(runtime_path, runtime())
+
+    importers = {path: list[str]() for path in graph}
+    for path, deps in graph.items():
+        for dep in deps:
+            importers[dep].append(path)
+
+    # modules with the longest chain of importers waiting on them go first
+    position = {path: i for i, path in enumerate(order)}
+    depth = dict[str, int]()
+    for path in reversed(order):
+        depth[path] = 1 + max((depth[i] for i in importers[path]), default=0)
+
+    waiting = {path: len(deps) for path, deps in graph.items()}
+    ready = [path for path in order if not waiting[path]]
+    interfaces = dict[str, bytes]()
+
+    def finish(path: str) -> None:
+        for importer in importers[path]:
+            waiting[importer] -= 1
+            if not waiting[importer]:
+                ready.append(importer)
+
+    # results are shown in the order of the modules, whatever order they
+    # finish in, a cached module has None
+    finished = dict[str, FileResult | None]()
+    shown = 0
+
+    def show(rest: bool = False) -> None:
+        nonlocal shown
+        while shown < len(order) and (rest or order[shown] in finished):
+            path = order[shown]
+            shown += 1
+            if path not in finished:
+                continue
+            result = finished.pop(path)
+            if result is None:
+                print(f"{green('Cached')} {path}", end="\n")
+                continue
+            for s, end in result.messages:
+                print(s, end=end)
+            if report:
+                report.add(path, result.phases, result.raw_stats, result.memory)
+
+    def handle(result: FileResult) -> bool:
+        finished[result.src_path] = result
+        show()
+        if not result.ok:
+            return False
+        # a module that was not inferred has no interface to pass along
+        if result.interface:
+            interfaces[result.src_path] = result.interface
+        if build_cache and not result.warnings and not result.streamed:
+            build_cache.store(
+                result.src_path,
+                result.out_path,
+                result.js,
+                result.interface,
+                result.deps,
             )
-        except NonExhaustiveMatchException as e:
-            print(e)
-        except Exception as e:
-            print(e)
-            return
-
-        print(f"{green('Inferred')} {src_path}")
-
-        ast = ast.fold_with(compile.Hoister()).fold_with(compile.DefCleaner())
-        js = compile.compile(ast)
-
-        print(f"{green('Compiled')} {src_path}")
+        finish(result.src_path)
+        return True
+
+    owned = executor is None and jobs > 1 and len(graph) > 1
+    if owned:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            jobs,
+            initializer=init_worker,
+            initargs=(
+                profiling.cprofile_enabled,
+                profiling.memory_enabled,
+                lexer_backend,
+                parser_backend,
+                intern_nodes,
+            ),
+        )
+    running = dict[concurrent.futures.Future[FileResult], str]()
+    ok = True
+
+    try:
+        while ok and (ready or running):
+            ready.sort(key=lambda path: (depth[path], -position[path]))
+            while ok and ready:
+                path = ready.pop()
+                if build_cache and build_cache.restore(path, path + ".js"):
+                    finished[path] = None
+                    show()
+                    finish(path)
+                    continue
+
+                dep_interfaces = {
+                    dep: interfaces[dep] for dep in graph[path] if dep in interfaces
+                }
+                if executor is None:
+                    ok = handle(
+                        compile_file(path, dep_interfaces, runtime_path, stream)
+                    )
+                else:
+                    future = executor.submit(
+                        compile_file, path, dep_interfaces, runtime_path, stream
+                    )
+                    running[future] = path
+
+            if running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    path = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # the worker itself failed, like when it was killed
+                        result = FileResult(path).fail("compile", e)
+                    ok = handle(result) and ok
+    finally:
+        show(rest=True)
+        if owned and executor:
+            executor.shutdown(cancel_futures=True)
+        if build_cache:
+            build_cache.save()
+
+    return ok
+
+
+def watch(
+    pattern: str,
+    jobs: int,
+    build_cache: BuildCache | None,
+    interval: float,
+    runtime_path: str | None = None,
+    stream: bool = False,
+) -> None:
+    """polls the sources matching pattern and recompiles the ones that changed"""
+    init_worker()
+    executor = (
+        concurrent.futures.ProcessPoolExecutor(
+            jobs,
+            initializer=init_worker,
+            initargs=(None, None, lexer_backend, parser_backend, intern_nodes),
+        )
+        if jobs > 1
+        else None
+    )
+    stats = dict[str, list[int] | None]()
+
+    try:
+        while True:
+            changed = list[str]()
+            src_paths = glob.glob(pattern)
+
+            for src_path in src_paths:
+                st = stat_of(src_path)
+                if stats.get(src_path) != st:
+                    stats[src_path] = st
+                    changed.append(src_path)
+
+            for src_path in stats.keys() - set(src_paths):
+                del stats[src_path]
+
+            if changed:
+                build(
+                    modules.with_dependents(changed, src_paths),
+                    jobs,
+                    build_cache,
+                    executor,
+                    runtime_path=runtime_path,
+                    stream=stream,
+                )
+
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(prog="main.py")
+    arg_parser.add_argument("pattern", nargs="?", default="**/*.uwu")
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes, 0 uses every core",
+    )
+    arg_parser.add_argument(
+        "--project",
+        metavar="DIR",
+        help="build every source under DIR, in subdirectories too, instead of pattern",
+    )
+    arg_parser.add_argument(
+        "--bundle",
+        metavar="RUNTIME",
+        help="write the builtins once to the js module RUNTIME and import them"
+        " from there instead of defining them in every output",
+    )
+    arg_parser.add_argument(
+        "--lexer",
+        choices=list(LEXERS),
+        default="sly",
+        help="scanner matches the same tokens in linear time, faster on large sources",
+    )
+    arg_parser.add_argument(
+        "--parser",
+        choices=list(PARSERS),
+        default="lalr",
+        help="pratt climbs operators by precedence from a smaller automaton,"
+        " faster on operator heavy sources",
+    )
+    arg_parser.add_argument(
+        "--intern",
+        action="store_true",
+        help="share one node between structurally equal parts of the asts and"
+        " types of every source a process compiles, the table is never emptied",
+    )
+    arg_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="compile every source a chunk of top level items at a time from a"
+        f" memory map, sources of {STREAM_SIZE // 1024 // 1024} MiB or more always are",
+    )
+    arg_parser.add_argument("--cache-dir", default=".uwu_cache")
+    arg_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recompile every file and leave the cache untouched",
+    )
+    arg_parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="keep running and recompile sources as they change",
+    )
+    arg_parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="seconds between polls in watch mode",
+    )
+    arg_parser.add_argument(
+        "--profile",
+        metavar="REPORT",
+        help="write the wall time, cpu time and runs of every phase as json,"
+        " and its function calls with --pstats",
+    )
+    arg_parser.add_argument(
+        "--pstats",
+        metavar="DIR",
+        help="run every phase under cProfile and write DIR/<phase>.pstats",
+    )
+    arg_parser.add_argument(
+        "--memory",
+        metavar="REPORT",
+        help="trace allocations and write the peak, retained bytes and top"
+        " allocation sites of every phase as json, slows the build down",
+    )
+    return arg_parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    init_worker(backend=args.lexer, parser_name=args.parser, interning=args.intern)
+    # before any worker starts, so they load the prelude instead of inferring it
+    save_unsaved()
+    # the lexer and parser are meant to give the same output, but a cached
+    # output is only reused from a build that used the same ones
+    options = f"bundle={args.bundle or ''}\0lexer={args.lexer}\0parser={args.parser}"
+    build_cache = (
+        None
+        if args.no_cache
+        else BuildCache(args.cache_dir, options=options, runtime_path=args.bundle)
+    )
 
-        path = src_path + ".js"
-        with open(path, "w") as f:
-            f.write(js)
+    if args.watch:
+        watch(args.pattern, jobs, build_cache, args.interval, args.bundle, args.stream)
+        return
+
+    report = profiling.Report() if args.profile or args.pstats or args.memory else None
+    profiling.cprofile_enabled = bool(args.pstats)
+    profiling.memory_enabled = bool(args.memory)
+
+    if args.project:
+        pattern = os.path.join(args.project, "**", "*.uwu")
+        src_paths = glob.glob(pattern, recursive=True)
+    else:
+        src_paths = glob.glob(args.pattern)
+    build(
+        src_paths,
+        jobs,
+        build_cache,
+        report=report,
+        runtime_path=args.bundle,
+        stream=args.stream,
+    )
 
-        print(f"{green('Compiled')} {src_path} to {(path)}", end="\n")
+    if report and args.profile:
+        report.write(args.profile)
+        print(f"{green('Profiled')} to {args.profile}", end="\n")
+    if report and args.pstats:
+        for path in report.dump_pstats(args.pstats):
+            print(f"{green('Profiled')} to {path}", end="\n")
+    if report and args.memory:
+        report.write_memory(args.memory)
+        for name, stats in report.memory_total.items():
+            print(
+                f"{name}: peak {stats.peak // 1024} KiB,"
+                f" retained {stats.retained // 1024} KiB",
+                end="\n",
+            )
+        print(f"{green('Profiled')} memory to {args.memory}", end="\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import io
+import os
+import pickle
+import re
+import typing
+
+import terms
+import typed
+from algorithm_j import Context, Scheme
+from prelude import DEFAULT_CTX, TypePickler, TypeUnpickler
+
+INTERFACE_SUFFIX = ".iface"
+
+
+class ModuleError(Exception):
+    pass
+
+
+def resolve(importer: str, path: str) -> str:
+    """the source file an import written in importer refers to"""
+    if not path.endswith(".uwu"):
+        path += ".uwu"
+    return os.path.normpath(os.path.join(os.path.dirname(importer), path))
+
+
+def interface_path(src_path: str) -> str:
+    return src_path + INTERFACE_SUFFIX
+
+
+@dataclasses.dataclass
+class Interface:
+    """the generalized schemes a module exports, all that importers need of it"""
+
+    path: str
+    vars: dict[str, Scheme] = dataclasses.field(default_factory=dict)
+    types: dict[str, Scheme] = dataclasses.field(default_factory=dict)
+    enums: dict[str, list[str]] = dataclasses.field(default_factory=dict)
+    hash: str = ""
+
+    def names(self) -> list[terms.EIdentifier | terms.ETypeIdentifier]:
+        names = list[terms.EIdentifier | terms.ETypeIdentifier]()
+        names += map(terms.EIdentifier, self.vars)
+        names += map(terms.ETypeIdentifier, self.enums)
+        return names
+
+    def select(
+        self, names: list[terms.EIdentifier | terms.ETypeIdentifier], ctx: Context
+    ) -> None:
+        """adds the imported names to ctx, an enum brings its variants along"""
+        for name in names:
+            match name:
+                case terms.EIdentifier(id) if id in self.vars:
+                    ctx.vars[id] = self.vars[id]
+                case terms.ETypeIdentifier(id) if id in self.enums:
+                    ctx.types[id] = self.types[id]
+                    for variant in self.enums[id]:
+                        ctx.types[variant] = self.types[variant]
+                        ctx.types["$" + variant] = self.types["$" + variant]
+                case _:
+                    raise ModuleError(f"{self.path} does not export {name.name}")
+
+
+def canonical(scheme: Scheme) -> Scheme:
+    """
+    renumbers the type variables of scheme from 1 and quantifies all of them,
+    so an unchanged module always gets the same interface
+    """
+    ids = dict[int, int]()
+
+    def rename(ty: typed.Type) -> typed.Type:
+        match ty:
+            case typed.TVar(id, kind):
+                return typed.TVar(ids.setdefault(id, len(ids) + 1), kind)
+            case typed.TAp(con, arg):
+                return typed.TAp(rename(con), rename(arg))
+        return ty
+
+    ty = rename(scheme.ty)
+    return Scheme(list(ids.values()), ty)
+
+
+def interface_of(src_path: str, program: terms.EProgram, bound: Context) -> Interface:
+    enums = {
+        expr.expr.id: expr.expr
+        for expr in program.body
+        if isinstance(expr.expr, terms.EEnumDeclaration)
+    }
+    interface = Interface(src_path)
+
+    for name in program.exports:
+        match name:
+            case terms.EIdentifier(id):
+                interface.vars[id] = canonical(bound.vars[id])
+            case terms.ETypeIdentifier(id):
+                variants = [variant.id for variant in enums[id].variants]
+                interface.enums[id] = variants
+                for type_id in [id, *variants, *("$" + v for v in variants)]:
+                    interface.types[type_id] = canonical(bound.types[type_id])
+
+    h = hashlib.sha256()
+    for kind, schemes in [("var", interface.vars), ("type", interface.types)]:
+        for id, scheme in sorted(schemes.items()):
+            h.update(f"{kind} {id} {scheme.vars} {scheme.ty!r}\n".encode())
+    for id, variants in sorted(interface.enums.items()):
+        h.update(f"enum {id} {variants}\n".encode())
+    interface.hash = h.hexdigest()
+
+    return interface
+
+
+# enum and variant constructors are compared with is by unify, so every
+# interface loaded into a process shares the constructors of the module that
+# declared them
+ConstructorKey: typing.TypeAlias = tuple[str, str, tuple[str, ...], str]
+CONSTRUCTORS = dict[ConstructorKey, typed.TCon]()
+ORIGINS = dict[int, ConstructorKey]()
+
+
+def register(key: ConstructorKey, con: typed.TCon) -> ConstructorKey:
+    old = CONSTRUCTORS.get(key)
+    if old is not None:
+        ORIGINS.pop(id(old), None)
+    CONSTRUCTORS[key] = con
+    ORIGINS[id(con)] = key
+    return key
+
+
+class InterfacePickler(TypePickler):
+    def __init__(self, file: typing.IO[bytes], src_path: str) -> None:
+        super().__init__(file)
+        self.module = os.path.abspath(src_path)
+
+    def persistent_id(self, obj: typing.Any) -> typing.Any:
+        pid = super().persistent_id(obj)
+        if pid is not None or not isinstance(obj, typed.TCon):
+            return pid
+
+        key = ORIGINS.get(id(obj)) or register(
+            (self.module, obj.id, tuple(obj.alts), repr(obj.kind)), obj
+        )
+        return ("constructor", key, obj.kind)
+
+
+class InterfaceUnpickler(TypeUnpickler):
+    def persistent_load(self, pid: typing.Any) -> typed.TCon:
+        match pid:
+            case ("constructor", key, kind):
+                con = CONSTRUCTORS.get(key)
+                if con is None:
+                    con = typed.TCon(key[1], kind, list(key[2]))
+                    register(key, con)
+                return con
+        return super().persistent_load(pid)
+
+
+def dump_interface(interface: Interface) -> bytes:
+    """the hash on the first line lets importers check for changes without unpickling"""
+    f = io.BytesIO()
+    f.write(interface.hash.encode() + b"\n")
+    InterfacePickler(f, interface.path).dump(interface)
+    return f.getvalue()
+
+
+def load_interface(path: str) -> Interface:
+    with open(path, "rb") as f:
+        f.readline()
+        return InterfaceUnpickler(f).load()
+
+
+def loads_interface(data: bytes) -> Interface:
+    f = io.BytesIO(data)
+    f.readline()
+    return InterfaceUnpickler(f).load()
+
+
+def interface_hash(path: str) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return f.readline().rstrip(b"\n").decode()
+    except FileNotFoundError:
+        return None
+
+
+def write_interface(path: str, data: bytes) -> bool:
+    """writes the interface unless the file already has the same hash"""
+    if interface_hash(path) == data[: data.index(b"\n")].decode():
+        return False
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def link(
+    program: terms.EProgram,
+    src_path: str,
+    deps: dict[str, str],
+    interfaces: typing.Mapping[str, bytes] = {},
+) -> tuple[Context, terms.EProgram]:
+    """
+    the context program is inferred in, with the interfaces of its imports,
+    and program with every import listing the names it brings in
+
+    interfaces are taken from the mapping of module paths to dumped
+    interfaces when given, otherwise read from the interface files,
+    deps gets the hash of every interface that was used
+    """
+    if not program.imports:
+        return DEFAULT_CTX, program
+
+    ctx = DEFAULT_CTX.copy()
+    imports = list[terms.EImport]()
+
+    for node in program.imports:
+        path = resolve(src_path, node.path)
+        try:
+            if path in interfaces:
+                interface = loads_interface(interfaces[path])
+            else:
+                interface = load_interface(interface_path(path))
+        except FileNotFoundError:
+            if not os.path.exists(path):
+                raise ModuleError(f"Cannot find module {node.path!r} ({path})")
+            raise ModuleError(f"{path} has not been compiled")
+        except (EOFError, pickle.UnpicklingError) as e:
+            raise ModuleError(f"Cannot read the interface of {path}: {e}")
+
+        names = node.names or interface.names()
+        interface.select(names, ctx)
+        deps[path] = interface.hash
+        imports.append(terms.EImport(node.path, names))
+
+    return ctx, dataclasses.replace(program, imports=imports)
+
+
+IMPORT_RE = re.compile(r"^import\s+'([^']*)'", re.MULTILINE)
+
+
+def scan_imports(src_path: str) -> list[str]:
+    """the modules src_path imports, found without parsing it"""
+    try:
+        with open(src_path, "r") as f:
+            data = f.read()
+    except OSError:
+        return []
+    return [resolve(src_path, path) for path in IMPORT_RE.findall(data)]
+
+
+def import_graph(src_paths: list[str]) -> dict[str, list[str]]:
+    """maps src_paths and every module they import to the modules it imports"""
+    graph = dict[str, list[str]]()
+    todo = [os.path.normpath(src_path) for src_path in src_paths]
+    while todo:
+        path = todo.pop()
+        if path in graph:
+            continue
+        deps = dict.fromkeys(dep for dep in scan_imports(path) if os.path.exists(dep))
+        graph[path] = list(deps)
+        todo.extend(graph[path])
+    return graph
+
+
+def components(graph: dict[str, list[str]]) -> list[list[str]]:
+    """
+    the strongly connected components of graph found with tarjan's algorithm,
+    every component comes after the components it imports
+    """
+    index = dict[str, int]()
+    low = dict[str, int]()
+    stack = list[str]()
+    on_stack = set[str]()
+    result = list[list[str]]()
+
+    # the paths being visited with how many of their imports were looked at,
+    # instead of recursing, so a long chain of imports fits
+    visiting = list[tuple[str, int]]()
+
+    def enter(path: str) -> None:
+        index[path] = low[path] = len(index)
+        stack.append(path)
+        on_stack.add(path)
+        visiting.append((path, 0))
+
+    for root in graph:
+        if root in index:
+            continue
+        enter(root)
+        while visiting:
+            path, i = visiting[-1]
+            deps = graph[path]
+            if i < len(deps):
+                visiting[-1] = path, i + 1
+                dep = deps[i]
+                if dep not in index:
+                    enter(dep)
+                elif dep in on_stack:
+                    low[path] = min(low[path], index[dep])
+                continue
+
+            visiting.pop()
+            if visiting:
+                parent = visiting[-1][0]
+                low[parent] = min(low[parent], low[path])
+            if low[path] == index[path]:
+                component = list[str]()
+                while not component or component[-1] != path:
+                    component.append(stack.pop())
+                    on_stack.remove(component[-1])
+                result.append(component[::-1])
+    return result
+
+
+def build_order(src_paths: list[str]) -> tuple[dict[str, list[str]], list[str]]:
+    """the import graph and its modules in an order where imports come first"""
+    graph = import_graph(src_paths)
+    order = list[str]()
+
+    for component in components(graph):
+        if len(component) > 1 or component[0] in graph[component[0]]:
+            cycle = component + component[:1]
+            raise ModuleError(f"Import cycle: {' -> '.join(cycle)}")
+        order.extend(component)
+
+    return graph, order
+
+
+def with_dependents(changed: list[str], src_paths: list[str]) -> list[str]:
+    """changed and the sources among src_paths that import them, directly or not"""
+    importers = dict[str, list[str]]()
+    for src_path in src_paths:
+        for dep in scan_imports(src_path):
+            importers.setdefault(dep, []).append(os.path.normpath(src_path))
+
+    result = dict.fromkeys(os.path.normpath(path) for path in changed)
+    todo = list(result)
+    while todo:
+        for importer in importers.get(todo.pop(), []):
+            if importer not in result:
+                result[importer] = None
+                todo.append(importer)
+    return list(result)
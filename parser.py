@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import argparse
 import dataclasses
 import functools
+import hashlib
+import importlib
 import json
+import mmap
 import operator
+import os
 import random
+import re
 import sys
 
 # from watchdog.events import FileSystemEventHandler
 # from watchdog.observers import Observer
 import time
+import typing
+from array import array
 from functools import partial, reduce, wraps
 from itertools import product
 from typing import Any, Callable, Generic, Protocol, TypeAlias, TypeVar, Union, overload
@@ -49,6 +57,8 @@ class UwuLexer(Lexer):
         "THEN",
         "TYPE_IDENTIFIER",
         "EXTERNAL",
+        "IMPORT",
+        "EXPORT",
         "FLOAT_SUM",
         "FLOAT_SUB",
         "FLOAT_DIV",
@@ -154,6 +164,8 @@ class UwuLexer(Lexer):
     IDENTIFIER["or"] = "STRICT_OR"  # type: ignore[index]
     IDENTIFIER["and"] = "STRICT_AND"  # type: ignore[index]
     IDENTIFIER["not"] = "STRICT_NOT"  # type: ignore[index]
+    IDENTIFIER["import"] = "IMPORT"  # type: ignore[index]
+    IDENTIFIER["export"] = "EXPORT"  # type: ignore[index]
 
     EXTERNAL = r"`[^`]*`"
 
@@ -165,6 +177,293 @@ class UwuLexer(Lexer):
         self.lineno += t.value.count("\n")
         return t
 
+    def scan(self, text: str) -> TokenStream:
+        stream = TokenStream(text)
+        for tok in self.tokenize(text):
+            stream.append(tok.type, tok.index, tok.index + len(tok.value), tok.lineno)
+        return stream
+
+
+class StreamToken:
+    """a token of a TokenStream as the parser sees it"""
+
+    __slots__ = ("type", "lineno", "index", "end", "text")
+
+    type: str
+    lineno: int
+    index: int
+    end: int
+    # the source the stream was scanned from, always a str for this class
+    text: str | bytes | mmap.mmap
+
+    @property
+    def value(self) -> str:
+        return typing.cast(str, self.text)[self.index : self.end]
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamToken(type={self.type!r}, value={self.value!r},"
+            f" lineno={self.lineno}, index={self.index})"
+        )
+
+
+class BytesStreamToken(StreamToken):
+    """a token of a stream over utf-8 bytes, like a memory mapped file"""
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return typing.cast(bytes, self.text)[self.index : self.end].decode()
+
+
+class TokenStream:
+    """
+    tokens as parallel arrays of kind codes, offsets into the source and line
+    numbers, about 13 bytes a token, values are only sliced from the source
+    when the parser asks for them
+    """
+
+    KINDS = sorted(UwuLexer.tokens) + sorted(UwuLexer.literals)
+    CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+    def __init__(self, text: str | bytes | mmap.mmap) -> None:
+        self.text = text
+        self.token = StreamToken if isinstance(text, str) else BytesStreamToken
+        self.kinds = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.lines = array("I")
+
+    def append(self, kind: str, start: int, end: int, lineno: int) -> None:
+        self.kinds.append(self.CODES[kind])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(lineno)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, i: int) -> StreamToken:
+        tok = self.token()
+        tok.type = self.KINDS[self.kinds[i]]
+        tok.lineno = self.lines[i]
+        tok.index = self.starts[i]
+        tok.end = self.ends[i]
+        tok.text = self.text
+        return tok
+
+    def __iter__(self) -> typing.Iterator[StreamToken]:
+        kinds, text, token = self.KINDS, self.text, self.token
+        for kind, start, end, lineno in zip(
+            self.kinds, self.starts, self.ends, self.lines
+        ):
+            tok = token()
+            tok.type = kinds[kind]
+            tok.lineno = lineno
+            tok.index = start
+            tok.end = end
+            tok.text = text
+            yield tok
+
+    def nbytes(self) -> int:
+        """the size of the arrays, the source is shared with the caller"""
+        return sum(
+            len(a) * a.itemsize
+            for a in [self.kinds, self.starts, self.ends, self.lines]
+        )
+
+
+# tokens a stream from scan_chunks holds before it is handed on
+CHUNK_TOKENS = 4096
+
+# a newline only separates top level items outside of these, so a source can be
+# cut into items from its tokens alone
+OPENING = ["DO", "IF", "CASE", "(", "[", "{"]
+CLOSING = ["END", ")", "]", "}"]
+
+
+class UwuScanner:
+    """
+    produces the same tokens as UwuLexer from one master pattern built from
+    its rules, in their order, so the first rule that matches still wins
+
+    blanks are matched along with the token after them instead of being
+    skipped a character at a time, and newlines use an equivalent pattern
+    that cannot backtrack, so scanning is linear in the size of the source
+    """
+
+    NEWLINE = r"\n\s*(?:\#.*\s*)*"
+
+    def __init__(self, lexer: type[Lexer] = UwuLexer) -> None:
+        # the empty group closing every rule names it, with nothing before the
+        # first character re can skip rules that cannot start at a position
+        rules = list[str]()
+        for name, rule in lexer._rules:
+            pattern = (
+                self.NEWLINE if name == "NEWLINE" else getattr(rule, "pattern", rule)
+            )
+            rules.append(f"(?:{pattern})(?P<{name}>)")
+        literals = "".join(re.escape(c) for c in sorted(lexer.literals))
+        rules.append(f"[{literals}](?P<literal>)")
+
+        # the empty group after the blanks marks where the token starts
+        self.ignore = lexer.ignore
+        pattern = f"[{re.escape(self.ignore)}]*(?P<start>)(?:{'|'.join(rules)})"
+        self.master = re.compile(pattern, lexer.reflags)
+        # bytes patterns only know ascii word characters, the bytes of a utf-8
+        # encoded letter count as word characters instead
+        self.master_bytes = re.compile(
+            pattern.replace(r"\w", r"\w\x80-\xff").encode(), lexer.reflags
+        )
+        self.ignored = {name for name, _ in lexer._rules if name.startswith("ignore")}
+        self.remapping = lexer._remapping
+        self.lineno = 1
+        self.index = 0
+
+    def tokenize(
+        self, text: str, lineno: int = 1, index: int = 0
+    ) -> typing.Iterator[sly.lex.Token]:
+        ignored, remapping = self.ignored, self.remapping
+        Token = sly.lex.Token
+        end = index
+
+        try:
+            for m in self.master.finditer(text, index):
+                if m.start() != end:
+                    break
+                end = m.end()
+                kind = m.lastgroup
+                if kind in ignored:
+                    continue
+
+                start = m.start(1)
+                value = text[start:end]
+                tok = Token()
+                tok.lineno = lineno
+                tok.index = start
+                tok.value = value
+                if kind == "NEWLINE":
+                    lineno += value.count("\n")
+                elif kind == "literal":
+                    kind = value
+                elif kind in remapping:
+                    kind = remapping[kind].get(value, kind)
+                tok.type = kind
+                yield tok
+
+            self.check_rest(text, end)
+        finally:
+            self.lineno = lineno
+            self.index = end
+
+    def scan(self, text: str) -> TokenStream:
+        """the tokens of text without a Token object or value string for each"""
+        stream = TokenStream(text)
+        kinds, starts = stream.kinds.append, stream.starts.append
+        ends, lines = stream.ends.append, stream.lines.append
+        codes, ignored, remapping = TokenStream.CODES, self.ignored, self.remapping
+        newline = codes["NEWLINE"]
+        lineno = 1
+        end = 0
+
+        for m in self.master.finditer(text):
+            if m.start() != end:
+                break
+            end = m.end()
+            kind = typing.cast(str, m.lastgroup)
+            if kind in ignored:
+                continue
+
+            start = m.start(1)
+            if kind == "NEWLINE":
+                kinds(newline)
+                lines(lineno)
+                lineno += text.count("\n", start, end)
+            else:
+                if kind == "literal":
+                    kind = text[start]
+                elif kind in remapping:
+                    kind = remapping[kind].get(text[start:end], kind)
+                kinds(codes[kind])
+                lines(lineno)
+            starts(start)
+            ends(end)
+
+        self.check_rest(text, end)
+        return stream
+
+    def scan_chunks(
+        self, buffer: bytes | mmap.mmap, size: int = CHUNK_TOKENS
+    ) -> typing.Generator[TokenStream, None, None]:
+        """
+        scans utf-8 source from buffer, yielding a stream as soon as it holds
+        size tokens and its last top level item is complete, so each one
+        parses on its own and only one is held at a time
+
+        offsets are in bytes, they match the character offsets of ascii source
+        """
+        codes, ignored, remapping = TokenStream.CODES, self.ignored, self.remapping
+        newline = codes["NEWLINE"]
+        opening = {codes[kind] for kind in OPENING}
+        closing = {codes[kind] for kind in CLOSING}
+        stream = TokenStream(buffer)
+        depth = 0
+        lineno = 1
+        end = 0
+
+        for m in self.master_bytes.finditer(buffer):
+            if m.start() != end:
+                break
+            end = m.end()
+            kind = typing.cast(str, m.lastgroup)
+            if kind in ignored:
+                continue
+
+            start = m.start(1)
+            if kind == "NEWLINE":
+                stream.kinds.append(newline)
+                stream.lines.append(lineno)
+                lineno += m[0].count(b"\n")
+                code = newline
+            else:
+                if kind == "literal":
+                    kind = chr(buffer[start])
+                elif kind in remapping:
+                    kind = remapping[kind].get(buffer[start:end].decode(), kind)
+                code = codes[kind]
+                stream.kinds.append(code)
+                stream.lines.append(lineno)
+            stream.starts.append(start)
+            stream.ends.append(end)
+
+            if code in opening:
+                depth += 1
+            elif code in closing:
+                depth -= 1
+            elif code == newline and depth <= 0 and len(stream) >= size:
+                yield stream
+                stream = TokenStream(buffer)
+
+        blanks = re.compile(f"[{re.escape(self.ignore)}]*".encode())
+        index = blanks.match(buffer, end).end()  # type: ignore[union-attr]
+        if index < len(buffer):
+            rest = bytes(buffer[index : index + 80]).decode(errors="replace")
+            raise sly.lex.LexError(
+                f"Illegal character {rest[0]!r} at index {index}", rest, index
+            )
+        if len(stream):
+            yield stream
+
+    def check_rest(self, text: str, end: int) -> None:
+        """raises the error UwuLexer would if text has more than blanks after end"""
+        rest = text[end:].lstrip(self.ignore)
+        if rest:
+            index = len(text) - len(rest)
+            raise sly.lex.LexError(
+                f"Illegal character {rest[0]!r} at index {index}", rest, index
+            )
+
 
 def concat(v: A | None, l1: list[A] | None) -> list[A]:
     l0 = [] if v is None else [v]
@@ -172,19 +471,275 @@ def concat(v: A | None, l1: list[A] | None) -> list[A]:
     return l0 + l2
 
 
+def make_program(
+    imports: list[terms.EImport],
+    top_exprs: list[
+        tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]
+    ],
+) -> terms.EProgram:
+    return terms.EProgram(
+        [expr for expr, _ in top_exprs],
+        imports,
+        [export for _, export in top_exprs if export is not None],
+    )
+
+
+PARSETAB = "parsetab"
+
+
+def parsetab_path(name: str) -> str:
+    return os.path.join(os.path.dirname(__file__), name + ".py")
+
+
+PARSETAB_PATH = parsetab_path(PARSETAB)
+
+
+@dataclasses.dataclass
+class LRTables:
+    """the parts of sly.yacc.LRTable that Parser.parse reads"""
+
+    lr_action: dict[int, dict[str, int]]
+    lr_goto: dict[int, dict[str, int]]
+    defaulted_states: dict[int, int]
+
+
+def grammar_checksum(grammar: sly.yacc.Grammar) -> str:
+    h = hashlib.sha256(sly.__version__.encode())
+    for production in grammar.Productions:
+        h.update(repr((production.name, production.prod, production.prec)).encode())
+    h.update(repr(sorted(grammar.Precedence.items())).encode())
+    return h.hexdigest()
+
+
+def load_tables(checksum: str, name: str = PARSETAB) -> LRTables | None:
+    try:
+        parsetab = importlib.import_module(name)
+    except ImportError:
+        return None
+
+    if getattr(parsetab, "checksum", None) != checksum:
+        return None
+
+    return LRTables(parsetab.lr_action, parsetab.lr_goto, parsetab.defaulted_states)
+
+
+def save_tables(
+    checksum: str,
+    tables: sly.yacc.LRTable | LRTables,
+    path: str = PARSETAB_PATH,
+    grammar: str = "UwuParser",
+) -> None:
+    lines = [
+        f"# generated by parser.py from the {grammar} grammar, do not edit",
+        f"checksum = {checksum!r}",
+    ]
+    for name in ["lr_action", "lr_goto", "defaulted_states"]:
+        lines.append(f"{name} = {{")
+        lines.extend(f"    {k!r}: {v!r}," for k, v in getattr(tables, name).items())
+        lines.append("}")
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+# the private methods of sly.yacc.Parser that UwuParser._build stands in for
+SLY_PRIVATES = [
+    "_Parser__collect_rules",
+    "_Parser__validate_specification",
+    "_Parser__build_grammar",
+    "_Parser__build_lrtables",
+]
+
+
+def missing_sly_privates() -> list[str]:
+    """the SLY_PRIVATES the installed sly does not have"""
+    return [
+        name
+        for name in SLY_PRIVATES
+        if not callable(getattr(sly.yacc.Parser, name, None))
+    ]
+
+
 class UwuParser(Parser):
     tokens = UwuLexer.tokens
-    debugfile = "parser.out"
-
-    @_("[ NEWLINE ] [ do_exprs ]")
+    debugfile: str | None = None
+    # the module next to this file the LALR tables are saved in, spelled out
+    # as the class body reads an upper case name it does not define as a token
+    parsetab = "parsetab"
+
+    @classmethod
+    def _build(cls, definitions):
+        """
+        builds the grammar like sly does, but loads the LALR tables from the
+        parsetab module when they were generated from the same grammar
+
+        this calls the name mangled privates of sly.yacc.Parser in SLY_PRIVATES,
+        which is why sly is pinned to one version
+        """
+        missing = missing_sly_privates()
+        if missing:
+            raise sly.yacc.YaccError(
+                f"sly {sly.__version__} lacks {', '.join(missing)},"
+                " install the version pinned in requirements.txt"
+            )
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise sly.yacc.YaccError("Invalid parser specification")
+        cls._Parser__build_grammar(rules)
+
+        checksum = grammar_checksum(cls._grammar)
+        tables = load_tables(checksum, cls.parsetab)
+        if tables is not None:
+            cls._lrtable = tables
+            return
+
+        cls.build_tables(checksum)
+
+    @classmethod
+    def build_tables(cls, checksum: str | None = None) -> None:
+        # the lr items of a grammar can only be computed once, a subclass
+        # has a grammar of its own
+        if not isinstance(vars(cls).get("_lrtable"), sly.yacc.LRTable):
+            cls._Parser__build_lrtables()
+        try:
+            save_tables(
+                checksum or grammar_checksum(cls._grammar),
+                cls._lrtable,
+                parsetab_path(cls.parsetab),
+                cls.__name__,
+            )
+        except OSError:
+            pass
+
+        if cls.debugfile:
+            cls.write_debug(cls.debugfile)
+
+    @classmethod
+    def write_debug(cls, path: str) -> None:
+        lrtable = cls._lrtable
+        if not isinstance(lrtable, sly.yacc.LRTable):
+            lrtable = sly.yacc.LRTable(cls._grammar)
+
+        with open(path, "w") as f:
+            f.write(str(cls._grammar))
+            f.write("\n")
+            f.write(str(lrtable))
+
+    @_("[ NEWLINE ] module")
     def program(self, p: sly.yacc.YaccProduction) -> terms.EProgram:
-        return terms.EProgram(p.do_exprs or [])
+        return p.module
+
+    @_("[ top_items ]")
+    def module(self, p: sly.yacc.YaccProduction) -> terms.EProgram:
+        return make_program([], p.top_items or [])
+
+    @_("imports [ NEWLINE ]")  # type: ignore[no-redef]
+    def module(self, p: sly.yacc.YaccProduction) -> terms.EProgram:
+        return make_program(p.imports, [])
+
+    @_("imports NEWLINE top_items")  # type: ignore[no-redef]
+    def module(self, p: sly.yacc.YaccProduction) -> terms.EProgram:
+        return make_program(p.imports, p.top_items)
+
+    @_("imports NEWLINE import_")
+    def imports(self, p: sly.yacc.YaccProduction) -> list[terms.EImport]:
+        p.imports.append(p.import_)
+        return p.imports
+
+    @_("import_")  # type: ignore[no-redef]
+    def imports(self, p: sly.yacc.YaccProduction) -> list[terms.EImport]:
+        return [p.import_]
+
+    @_("IMPORT STRING")
+    def import_(self, p: sly.yacc.YaccProduction) -> terms.EImport:
+        return terms.EImport(p.STRING[1:-1])
+
+    @_("IMPORT STRING '(' [ NEWLINE ] import_names ')'")  # type: ignore[no-redef]
+    def import_(self, p: sly.yacc.YaccProduction) -> terms.EImport:
+        return terms.EImport(p.STRING[1:-1], p.import_names)
+
+    @_("import_names ',' [ NEWLINE ] import_name [ NEWLINE ]")
+    def import_names(
+        self, p: sly.yacc.YaccProduction
+    ) -> list[terms.EIdentifier | terms.ETypeIdentifier]:
+        p.import_names.append(p.import_name)
+        return p.import_names
+
+    @_("import_name [ NEWLINE ]")  # type: ignore[no-redef]
+    def import_names(
+        self, p: sly.yacc.YaccProduction
+    ) -> list[terms.EIdentifier | terms.ETypeIdentifier]:
+        return [p.import_name]
+
+    @_("identifier")
+    def import_name(
+        self, p: sly.yacc.YaccProduction
+    ) -> terms.EIdentifier | terms.ETypeIdentifier:
+        return p.identifier
+
+    @_("TYPE_IDENTIFIER")  # type: ignore[no-redef]
+    def import_name(
+        self, p: sly.yacc.YaccProduction
+    ) -> terms.EIdentifier | terms.ETypeIdentifier:
+        return terms.ETypeIdentifier(p.TYPE_IDENTIFIER)
 
-    @_("expr NEWLINE do_exprs")
+    @_("top_exprs [ NEWLINE ]")
+    def top_items(
+        self, p: sly.yacc.YaccProduction
+    ) -> list[tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]]:
+        return p.top_exprs
+
+    # sequences are left recursive and appended to in place, so a long one
+    # takes linear time and a constant depth of the parser stack
+    @_("top_exprs NEWLINE top_expr")
+    def top_exprs(
+        self, p: sly.yacc.YaccProduction
+    ) -> list[tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]]:
+        p.top_exprs.append(p.top_expr)
+        return p.top_exprs
+
+    @_("top_expr")  # type: ignore[no-redef]
+    def top_exprs(
+        self, p: sly.yacc.YaccProduction
+    ) -> list[tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]]:
+        return [p.top_expr]
+
+    @_("expr")
+    def top_expr(
+        self, p: sly.yacc.YaccProduction
+    ) -> tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]:
+        return p.expr, None
+
+    @_("EXPORT def_expr", "EXPORT binary_op_def")  # type: ignore[no-redef]
+    def top_expr(
+        self, p: sly.yacc.YaccProduction
+    ) -> tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]:
+        return terms.EExpr(p[1]), terms.EIdentifier(p[1].identifier)
+
+    @_("EXPORT let")  # type: ignore[no-redef]
+    def top_expr(
+        self, p: sly.yacc.YaccProduction
+    ) -> tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]:
+        return terms.EExpr(p.let), terms.EIdentifier(p.let.id)
+
+    @_("EXPORT enum")  # type: ignore[no-redef]
+    def top_expr(
+        self, p: sly.yacc.YaccProduction
+    ) -> tuple[terms.EExpr, terms.EIdentifier | terms.ETypeIdentifier | None]:
+        return terms.EExpr(p.enum), terms.ETypeIdentifier(p.enum.id)
+
+    @_("do_exprs [ NEWLINE ]")
+    def block_exprs(self, p: sly.yacc.YaccProduction) -> list[terms.EExpr]:
+        return p.do_exprs
+
+    @_("do_exprs NEWLINE expr")
     def do_exprs(self, p: sly.yacc.YaccProduction) -> list[terms.EExpr]:
-        return [p.expr] + p.do_exprs
+        p.do_exprs.append(p.expr)
+        return p.do_exprs
 
-    @_("expr [ NEWLINE ]")  # type: ignore[no-redef]
+    @_("expr")  # type: ignore[no-redef]
     def do_exprs(self, p: sly.yacc.YaccProduction) -> list[terms.EExpr]:
         return [p.expr]
 
@@ -382,10 +937,10 @@ class UwuParser(Parser):
         )
 
     @_(
-        "[ NEWLINE ] [ do_exprs ]",
+        "[ NEWLINE ] [ block_exprs ]",
     )
     def block_statement(self, p: sly.yacc.YaccProduction):
-        return terms.EBlock(p.do_exprs or [])
+        return terms.EBlock(p.block_exprs or [])
 
     @_(
         "DEF identifier '<' type_identifier { ',' type_identifier } '>' '(' [ NEWLINE ] [ params ] ')' [ ':' type ] do"
@@ -410,7 +965,8 @@ class UwuParser(Parser):
 
     @_("params ',' [ NEWLINE ] param [ NEWLINE ]")
     def params(self, p: sly.yacc.YaccProduction):
-        return p.params + [p.param]
+        p.params.append(p.param)
+        return p.params
 
     @_("param [ NEWLINE ]")  # type: ignore[no-redef]
     def params(self, p: sly.yacc.YaccProduction):
@@ -436,7 +992,8 @@ class UwuParser(Parser):
 
     @_("variants variant [ NEWLINE ]")
     def variants(self, p: sly.yacc.YaccProduction):
-        return p.variants + [p.variant]
+        p.variants.append(p.variant)
+        return p.variants
 
     @_("variant [ NEWLINE ]")  # type: ignore[no-redef]
     def variants(self, p: sly.yacc.YaccProduction):
@@ -533,7 +1090,8 @@ class UwuParser(Parser):
 
     @_("patterns ',' [ NEWLINE ] pattern [ NEWLINE ]")
     def patterns(self, p: sly.yacc.YaccProduction):
-        return p.patterns + [p.pattern]
+        p.patterns.append(p.pattern)
+        return p.patterns
 
     @_("pattern [ NEWLINE ]")  # type: ignore[no-redef]
     def patterns(self, p: sly.yacc.YaccProduction):
@@ -557,7 +1115,8 @@ class UwuParser(Parser):
 
     @_("exprs ',' [ NEWLINE ] expr [ NEWLINE ]")
     def exprs(self, p: sly.yacc.YaccProduction):
-        return p.exprs + [p.expr]
+        p.exprs.append(p.expr)
+        return p.exprs
 
     @_("expr [ NEWLINE ]")  # type: ignore[no-redef]
     def exprs(self, p: sly.yacc.YaccProduction):
@@ -604,3 +1163,19 @@ class UwuParser(Parser):
     @_("STRING")
     def str_literal(self, p: sly.yacc.YaccProduction) -> terms.EStrLiteral:
         return terms.EStrLiteral(p.STRING[1:-1])
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(
+        description="regenerates parsetab.py from the UwuParser grammar"
+    )
+    arg_parser.add_argument(
+        "--debug",
+        nargs="?",
+        const="parser.out",
+        help="also write the grammar and automaton report",
+    )
+    args = arg_parser.parse_args()
+
+    UwuParser.debugfile = args.debug
+    UwuParser.build_tables()
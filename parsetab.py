@@ -0,0 +1,908 @@
+# generated by parser.py from the UwuParser grammar, do not edit
+checksum = 'b0751d3084d2ba2594e4b087ce93cbfdc667afd8312c8138e0afadce62f8f486'
+lr_action = {
+    0: {'NEWLINE': 3, 'IMPORT': -3, 'EXPORT': -3, '(': -3, 'DEF': -3, '+': -3, '!': -3, 'STRICT_NOT': -3, '-': -3, 'STRING': -3, 'FLOAT': -3, 'INT': -3, '[': -3, 'TYPE_IDENTIFIER': -3, 'IDENTIFIER': -3, 'CASE': -3, 'IF': -3, 'DO': -3, 'EXTERNAL': -3, 'ENUM': -3, '$end': -3},
+    1: {'$end': 0},
+    2: {'$end': -10, 'IMPORT': 9, 'EXPORT': 14, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    3: {'IMPORT': -2, 'EXPORT': -2, '(': -2, 'DEF': -2, '+': -2, '!': -2, 'STRICT_NOT': -2, '-': -2, 'STRING': -2, 'FLOAT': -2, 'INT': -2, '[': -2, 'TYPE_IDENTIFIER': -2, 'IDENTIFIER': -2, 'CASE': -2, 'IF': -2, 'DO': -2, 'EXTERNAL': -2, 'ENUM': -2, '$end': -2},
+    4: {'$end': -1},
+    5: {'NEWLINE': 48, '$end': -7},
+    6: {'$end': -9},
+    7: {'$end': -8},
+    8: {'NEWLINE': -11, '$end': -11},
+    9: {'STRING': 50},
+    10: {'(': -311, 'FLOAT_MORE': -311, 'FLOAT_MORE_OR_EQ': -311, 'FLOAT_LESS': -311, 'FLOAT_LESS_OR_EQ': -311, 'SOME_SUB': -311, 'SOME_CONCAT': -311, 'ARROW_BOTH': -311, 'ARROW_RIGHT': -311, 'ARROW_LEFT': -311, 'DOUBLE_ARROW_RIGHT': -311, 'DOUBLE_ARROW_LEFT': -311, 'BIT_SHIFT_LEFT': -311, 'BIT_AND': -311, 'BIT_OR': -311, 'FLOAT_POW': -311, 'POW': -311, 'ARRAY_SUB': -311, 'ARRAY_CONCAT': -311, 'MORE_OR_EQ': -311, 'LESS_OR_EQ': -311, 'TEXT_MATCH': -311, 'STRICT_AND': -311, 'AND': -311, 'STRICT_OR': -311, 'OR': -311, 'EQUAL': -311, 'NOT_EQUAL': -311, '>': -311, 'FLOAT_MUL': -311, 'FLOAT_DIV': -311, 'FLOAT_SUB': -311, 'FLOAT_SUM': -311, '<': -311, '*': -311, '/': -311, '-': -311, '+': -311, 'CONCAT': -311, 'NEWLINE': -311, '$end': -311, ')': -311, 'OF': -311, 'THEN': -311, ',': -311, ']': -311, 'END': -311, 'ELIF': -311, 'ELSE': -311},
+    11: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    12: {'NEWLINE': 53, '$end': -29},
+    13: {'NEWLINE': -30, '$end': -30},
+    14: {'ENUM': 47, 'DEF': 33, 'IDENTIFIER': 42},
+    15: {'(': -59, 'FLOAT_MORE': -59, 'FLOAT_MORE_OR_EQ': -59, 'FLOAT_LESS': -59, 'FLOAT_LESS_OR_EQ': -59, 'SOME_SUB': -59, 'SOME_CONCAT': -59, 'ARROW_BOTH': -59, 'ARROW_RIGHT': -59, 'ARROW_LEFT': -59, 'DOUBLE_ARROW_RIGHT': -59, 'DOUBLE_ARROW_LEFT': -59, 'BIT_SHIFT_LEFT': -59, 'BIT_AND': -59, 'BIT_OR': -59, 'FLOAT_POW': -59, 'POW': -59, 'ARRAY_SUB': -59, 'ARRAY_CONCAT': -59, 'MORE_OR_EQ': -59, 'LESS_OR_EQ': -59, 'TEXT_MATCH': -59, 'STRICT_AND': -59, 'AND': -59, 'STRICT_OR': -59, 'OR': -59, 'EQUAL': -59, 'NOT_EQUAL': -59, '>': -59, 'FLOAT_MUL': -59, 'FLOAT_DIV': -59, 'FLOAT_SUB': -59, 'FLOAT_SUM': -59, '<': -59, '*': -59, '/': -59, '-': -59, '+': -59, 'CONCAT': -59, 'NEWLINE': -59, '$end': -59, ')': -59, 'OF': -59, 'THEN': -59, ',': -59, ']': -59, 'END': -59, 'ELIF': -59, 'ELSE': -59},
+    16: {'(': -51, 'FLOAT_MORE': -51, 'FLOAT_MORE_OR_EQ': -51, 'FLOAT_LESS': -51, 'FLOAT_LESS_OR_EQ': -51, 'SOME_SUB': -51, 'SOME_CONCAT': -51, 'ARROW_BOTH': -51, 'ARROW_RIGHT': -51, 'ARROW_LEFT': -51, 'DOUBLE_ARROW_RIGHT': -51, 'DOUBLE_ARROW_LEFT': -51, 'BIT_SHIFT_LEFT': -51, 'BIT_AND': -51, 'BIT_OR': -51, 'FLOAT_POW': -51, 'POW': -51, 'ARRAY_SUB': -51, 'ARRAY_CONCAT': -51, 'MORE_OR_EQ': -51, 'LESS_OR_EQ': -51, 'TEXT_MATCH': -51, 'STRICT_AND': -51, 'AND': -51, 'STRICT_OR': -51, 'OR': -51, 'EQUAL': -51, 'NOT_EQUAL': -51, '>': -51, 'FLOAT_MUL': -51, 'FLOAT_DIV': -51, 'FLOAT_SUB': -51, 'FLOAT_SUM': -51, '<': -51, '*': -51, '/': -51, '-': -51, '+': -51, 'CONCAT': -51, 'NEWLINE': -51, '$end': -51, ')': -51, 'OF': -51, 'THEN': -51, ',': -51, ']': -51, 'END': -51, 'ELIF': -51, 'ELSE': -51},
+    17: {'(': -43, 'FLOAT_MORE': -43, 'FLOAT_MORE_OR_EQ': -43, 'FLOAT_LESS': -43, 'FLOAT_LESS_OR_EQ': -43, 'SOME_SUB': -43, 'SOME_CONCAT': -43, 'ARROW_BOTH': -43, 'ARROW_RIGHT': -43, 'ARROW_LEFT': -43, 'DOUBLE_ARROW_RIGHT': -43, 'DOUBLE_ARROW_LEFT': -43, 'BIT_SHIFT_LEFT': -43, 'BIT_AND': -43, 'BIT_OR': -43, 'FLOAT_POW': -43, 'POW': -43, 'ARRAY_SUB': -43, 'ARRAY_CONCAT': -43, 'MORE_OR_EQ': -43, 'LESS_OR_EQ': -43, 'TEXT_MATCH': -43, 'STRICT_AND': -43, 'AND': -43, 'STRICT_OR': -43, 'OR': -43, 'EQUAL': -43, 'NOT_EQUAL': -43, '>': -43, 'FLOAT_MUL': -43, 'FLOAT_DIV': -43, 'FLOAT_SUB': -43, 'FLOAT_SUM': -43, '<': -43, '*': -43, '/': -43, '-': -43, '+': -43, 'CONCAT': -43, 'NEWLINE': -43, '$end': -43, ')': -43, 'OF': -43, 'THEN': -43, ',': -43, ']': -43, 'END': -43, 'ELIF': -43, 'ELSE': -43},
+    18: {'(': -56, 'FLOAT_MORE': -56, 'FLOAT_MORE_OR_EQ': -56, 'FLOAT_LESS': -56, 'FLOAT_LESS_OR_EQ': -56, 'SOME_SUB': -56, 'SOME_CONCAT': -56, 'ARROW_BOTH': -56, 'ARROW_RIGHT': -56, 'ARROW_LEFT': -56, 'DOUBLE_ARROW_RIGHT': -56, 'DOUBLE_ARROW_LEFT': -56, 'BIT_SHIFT_LEFT': -56, 'BIT_AND': -56, 'BIT_OR': -56, 'FLOAT_POW': -56, 'POW': -56, 'ARRAY_SUB': -56, 'ARRAY_CONCAT': -56, 'MORE_OR_EQ': -56, 'LESS_OR_EQ': -56, 'TEXT_MATCH': -56, 'STRICT_AND': -56, 'AND': -56, 'STRICT_OR': -56, 'OR': -56, 'EQUAL': -56, 'NOT_EQUAL': -56, '>': -56, 'FLOAT_MUL': -56, 'FLOAT_DIV': -56, 'FLOAT_SUB': -56, 'FLOAT_SUM': -56, '<': -56, '*': -56, '/': -56, '-': -56, '+': -56, 'CONCAT': -56, 'NEWLINE': -56, '$end': -56, ')': -56, 'OF': -56, 'THEN': -56, ',': -56, ']': -56, 'END': -56, 'ELIF': -56, 'ELSE': -56},
+    19: {'NEWLINE': -36, '$end': -36, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    20: {'(': -44, 'FLOAT_MORE': -44, 'FLOAT_MORE_OR_EQ': -44, 'FLOAT_LESS': -44, 'FLOAT_LESS_OR_EQ': -44, 'SOME_SUB': -44, 'SOME_CONCAT': -44, 'ARROW_BOTH': -44, 'ARROW_RIGHT': -44, 'ARROW_LEFT': -44, 'DOUBLE_ARROW_RIGHT': -44, 'DOUBLE_ARROW_LEFT': -44, 'BIT_SHIFT_LEFT': -44, 'BIT_AND': -44, 'BIT_OR': -44, 'FLOAT_POW': -44, 'POW': -44, 'ARRAY_SUB': -44, 'ARRAY_CONCAT': -44, 'MORE_OR_EQ': -44, 'LESS_OR_EQ': -44, 'TEXT_MATCH': -44, 'STRICT_AND': -44, 'AND': -44, 'STRICT_OR': -44, 'OR': -44, 'EQUAL': -44, 'NOT_EQUAL': -44, '>': -44, 'FLOAT_MUL': -44, 'FLOAT_DIV': -44, 'FLOAT_SUB': -44, 'FLOAT_SUM': -44, '<': -44, '*': -44, '/': -44, '-': -44, '+': -44, 'CONCAT': -44, 'NEWLINE': -44, '$end': -44, ')': -44, 'OF': -44, 'THEN': -44, ',': -44, ']': -44, 'END': -44, 'ELIF': -44, 'ELSE': -44},
+    21: {'(': -45, 'FLOAT_MORE': -45, 'FLOAT_MORE_OR_EQ': -45, 'FLOAT_LESS': -45, 'FLOAT_LESS_OR_EQ': -45, 'SOME_SUB': -45, 'SOME_CONCAT': -45, 'ARROW_BOTH': -45, 'ARROW_RIGHT': -45, 'ARROW_LEFT': -45, 'DOUBLE_ARROW_RIGHT': -45, 'DOUBLE_ARROW_LEFT': -45, 'BIT_SHIFT_LEFT': -45, 'BIT_AND': -45, 'BIT_OR': -45, 'FLOAT_POW': -45, 'POW': -45, 'ARRAY_SUB': -45, 'ARRAY_CONCAT': -45, 'MORE_OR_EQ': -45, 'LESS_OR_EQ': -45, 'TEXT_MATCH': -45, 'STRICT_AND': -45, 'AND': -45, 'STRICT_OR': -45, 'OR': -45, 'EQUAL': -45, 'NOT_EQUAL': -45, '>': -45, 'FLOAT_MUL': -45, 'FLOAT_DIV': -45, 'FLOAT_SUB': -45, 'FLOAT_SUM': -45, '<': -45, '*': -45, '/': -45, '-': -45, '+': -45, 'CONCAT': -45, 'NEWLINE': -45, '$end': -45, ')': -45, 'OF': -45, 'THEN': -45, ',': -45, ']': -45, 'END': -45, 'ELIF': -45, 'ELSE': -45},
+    22: {'(': -46, 'FLOAT_MORE': -46, 'FLOAT_MORE_OR_EQ': -46, 'FLOAT_LESS': -46, 'FLOAT_LESS_OR_EQ': -46, 'SOME_SUB': -46, 'SOME_CONCAT': -46, 'ARROW_BOTH': -46, 'ARROW_RIGHT': -46, 'ARROW_LEFT': -46, 'DOUBLE_ARROW_RIGHT': -46, 'DOUBLE_ARROW_LEFT': -46, 'BIT_SHIFT_LEFT': -46, 'BIT_AND': -46, 'BIT_OR': -46, 'FLOAT_POW': -46, 'POW': -46, 'ARRAY_SUB': -46, 'ARRAY_CONCAT': -46, 'MORE_OR_EQ': -46, 'LESS_OR_EQ': -46, 'TEXT_MATCH': -46, 'STRICT_AND': -46, 'AND': -46, 'STRICT_OR': -46, 'OR': -46, 'EQUAL': -46, 'NOT_EQUAL': -46, '>': -46, 'FLOAT_MUL': -46, 'FLOAT_DIV': -46, 'FLOAT_SUB': -46, 'FLOAT_SUM': -46, '<': -46, '*': -46, '/': -46, '-': -46, '+': -46, 'CONCAT': -46, 'NEWLINE': -46, '$end': -46, ')': -46, 'OF': -46, 'THEN': -46, ',': -46, ']': -46, 'END': -46, 'ELIF': -46, 'ELSE': -46},
+    23: {'(': -47, 'FLOAT_MORE': -47, 'FLOAT_MORE_OR_EQ': -47, 'FLOAT_LESS': -47, 'FLOAT_LESS_OR_EQ': -47, 'SOME_SUB': -47, 'SOME_CONCAT': -47, 'ARROW_BOTH': -47, 'ARROW_RIGHT': -47, 'ARROW_LEFT': -47, 'DOUBLE_ARROW_RIGHT': -47, 'DOUBLE_ARROW_LEFT': -47, 'BIT_SHIFT_LEFT': -47, 'BIT_AND': -47, 'BIT_OR': -47, 'FLOAT_POW': -47, 'POW': -47, 'ARRAY_SUB': -47, 'ARRAY_CONCAT': -47, 'MORE_OR_EQ': -47, 'LESS_OR_EQ': -47, 'TEXT_MATCH': -47, 'STRICT_AND': -47, 'AND': -47, 'STRICT_OR': -47, 'OR': -47, 'EQUAL': -47, 'NOT_EQUAL': -47, '>': -47, 'FLOAT_MUL': -47, 'FLOAT_DIV': -47, 'FLOAT_SUB': -47, 'FLOAT_SUM': -47, '<': -47, '*': -47, '/': -47, '-': -47, '+': -47, 'CONCAT': -47, 'NEWLINE': -47, '$end': -47, ')': -47, 'OF': -47, 'THEN': -47, ',': -47, ']': -47, 'END': -47, 'ELIF': -47, 'ELSE': -47},
+    24: {'(': -48, 'FLOAT_MORE': -48, 'FLOAT_MORE_OR_EQ': -48, 'FLOAT_LESS': -48, 'FLOAT_LESS_OR_EQ': -48, 'SOME_SUB': -48, 'SOME_CONCAT': -48, 'ARROW_BOTH': -48, 'ARROW_RIGHT': -48, 'ARROW_LEFT': -48, 'DOUBLE_ARROW_RIGHT': -48, 'DOUBLE_ARROW_LEFT': -48, 'BIT_SHIFT_LEFT': -48, 'BIT_AND': -48, 'BIT_OR': -48, 'FLOAT_POW': -48, 'POW': -48, 'ARRAY_SUB': -48, 'ARRAY_CONCAT': -48, 'MORE_OR_EQ': -48, 'LESS_OR_EQ': -48, 'TEXT_MATCH': -48, 'STRICT_AND': -48, 'AND': -48, 'STRICT_OR': -48, 'OR': -48, 'EQUAL': -48, 'NOT_EQUAL': -48, '>': -48, 'FLOAT_MUL': -48, 'FLOAT_DIV': -48, 'FLOAT_SUB': -48, 'FLOAT_SUM': -48, '<': -48, '*': -48, '/': -48, '-': -48, '+': -48, 'CONCAT': -48, 'NEWLINE': -48, '$end': -48, ')': -48, 'OF': -48, 'THEN': -48, ',': -48, ']': -48, 'END': -48, 'ELIF': -48, 'ELSE': -48},
+    25: {'(': -49, 'FLOAT_MORE': -49, 'FLOAT_MORE_OR_EQ': -49, 'FLOAT_LESS': -49, 'FLOAT_LESS_OR_EQ': -49, 'SOME_SUB': -49, 'SOME_CONCAT': -49, 'ARROW_BOTH': -49, 'ARROW_RIGHT': -49, 'ARROW_LEFT': -49, 'DOUBLE_ARROW_RIGHT': -49, 'DOUBLE_ARROW_LEFT': -49, 'BIT_SHIFT_LEFT': -49, 'BIT_AND': -49, 'BIT_OR': -49, 'FLOAT_POW': -49, 'POW': -49, 'ARRAY_SUB': -49, 'ARRAY_CONCAT': -49, 'MORE_OR_EQ': -49, 'LESS_OR_EQ': -49, 'TEXT_MATCH': -49, 'STRICT_AND': -49, 'AND': -49, 'STRICT_OR': -49, 'OR': -49, 'EQUAL': -49, 'NOT_EQUAL': -49, '>': -49, 'FLOAT_MUL': -49, 'FLOAT_DIV': -49, 'FLOAT_SUB': -49, 'FLOAT_SUM': -49, '<': -49, '*': -49, '/': -49, '-': -49, '+': -49, 'CONCAT': -49, 'NEWLINE': -49, '$end': -49, ')': -49, 'OF': -49, 'THEN': -49, ',': -49, ']': -49, 'END': -49, 'ELIF': -49, 'ELSE': -49},
+    26: {'(': -50, 'FLOAT_MORE': -50, 'FLOAT_MORE_OR_EQ': -50, 'FLOAT_LESS': -50, 'FLOAT_LESS_OR_EQ': -50, 'SOME_SUB': -50, 'SOME_CONCAT': -50, 'ARROW_BOTH': -50, 'ARROW_RIGHT': -50, 'ARROW_LEFT': -50, 'DOUBLE_ARROW_RIGHT': -50, 'DOUBLE_ARROW_LEFT': -50, 'BIT_SHIFT_LEFT': -50, 'BIT_AND': -50, 'BIT_OR': -50, 'FLOAT_POW': -50, 'POW': -50, 'ARRAY_SUB': -50, 'ARRAY_CONCAT': -50, 'MORE_OR_EQ': -50, 'LESS_OR_EQ': -50, 'TEXT_MATCH': -50, 'STRICT_AND': -50, 'AND': -50, 'STRICT_OR': -50, 'OR': -50, 'EQUAL': -50, 'NOT_EQUAL': -50, '>': -50, 'FLOAT_MUL': -50, 'FLOAT_DIV': -50, 'FLOAT_SUB': -50, 'FLOAT_SUM': -50, '<': -50, '*': -50, '/': -50, '-': -50, '+': -50, 'CONCAT': -50, 'NEWLINE': -50, '$end': -50, ')': -50, 'OF': -50, 'THEN': -50, ',': -50, ']': -50, 'END': -50, 'ELIF': -50, 'ELSE': -50, ':': 98, '=': -308},
+    27: {'(': -52, 'FLOAT_MORE': -52, 'FLOAT_MORE_OR_EQ': -52, 'FLOAT_LESS': -52, 'FLOAT_LESS_OR_EQ': -52, 'SOME_SUB': -52, 'SOME_CONCAT': -52, 'ARROW_BOTH': -52, 'ARROW_RIGHT': -52, 'ARROW_LEFT': -52, 'DOUBLE_ARROW_RIGHT': -52, 'DOUBLE_ARROW_LEFT': -52, 'BIT_SHIFT_LEFT': -52, 'BIT_AND': -52, 'BIT_OR': -52, 'FLOAT_POW': -52, 'POW': -52, 'ARRAY_SUB': -52, 'ARRAY_CONCAT': -52, 'MORE_OR_EQ': -52, 'LESS_OR_EQ': -52, 'TEXT_MATCH': -52, 'STRICT_AND': -52, 'AND': -52, 'STRICT_OR': -52, 'OR': -52, 'EQUAL': -52, 'NOT_EQUAL': -52, '>': -52, 'FLOAT_MUL': -52, 'FLOAT_DIV': -52, 'FLOAT_SUB': -52, 'FLOAT_SUM': -52, '<': -52, '*': -52, '/': -52, '-': -52, '+': -52, 'CONCAT': -52, 'NEWLINE': -52, '$end': -52, ')': -52, 'OF': -52, 'THEN': -52, ',': -52, ']': -52, 'END': -52, 'ELIF': -52, 'ELSE': -52},
+    28: {'(': -53, 'FLOAT_MORE': -53, 'FLOAT_MORE_OR_EQ': -53, 'FLOAT_LESS': -53, 'FLOAT_LESS_OR_EQ': -53, 'SOME_SUB': -53, 'SOME_CONCAT': -53, 'ARROW_BOTH': -53, 'ARROW_RIGHT': -53, 'ARROW_LEFT': -53, 'DOUBLE_ARROW_RIGHT': -53, 'DOUBLE_ARROW_LEFT': -53, 'BIT_SHIFT_LEFT': -53, 'BIT_AND': -53, 'BIT_OR': -53, 'FLOAT_POW': -53, 'POW': -53, 'ARRAY_SUB': -53, 'ARRAY_CONCAT': -53, 'MORE_OR_EQ': -53, 'LESS_OR_EQ': -53, 'TEXT_MATCH': -53, 'STRICT_AND': -53, 'AND': -53, 'STRICT_OR': -53, 'OR': -53, 'EQUAL': -53, 'NOT_EQUAL': -53, '>': -53, 'FLOAT_MUL': -53, 'FLOAT_DIV': -53, 'FLOAT_SUB': -53, 'FLOAT_SUM': -53, '<': -53, '*': -53, '/': -53, '-': -53, '+': -53, 'CONCAT': -53, 'NEWLINE': -53, '$end': -53, ')': -53, 'OF': -53, 'THEN': -53, ',': -53, ']': -53, 'END': -53, 'ELIF': -53, 'ELSE': -53},
+    29: {'(': -54, 'FLOAT_MORE': -54, 'FLOAT_MORE_OR_EQ': -54, 'FLOAT_LESS': -54, 'FLOAT_LESS_OR_EQ': -54, 'SOME_SUB': -54, 'SOME_CONCAT': -54, 'ARROW_BOTH': -54, 'ARROW_RIGHT': -54, 'ARROW_LEFT': -54, 'DOUBLE_ARROW_RIGHT': -54, 'DOUBLE_ARROW_LEFT': -54, 'BIT_SHIFT_LEFT': -54, 'BIT_AND': -54, 'BIT_OR': -54, 'FLOAT_POW': -54, 'POW': -54, 'ARRAY_SUB': -54, 'ARRAY_CONCAT': -54, 'MORE_OR_EQ': -54, 'LESS_OR_EQ': -54, 'TEXT_MATCH': -54, 'STRICT_AND': -54, 'AND': -54, 'STRICT_OR': -54, 'OR': -54, 'EQUAL': -54, 'NOT_EQUAL': -54, '>': -54, 'FLOAT_MUL': -54, 'FLOAT_DIV': -54, 'FLOAT_SUB': -54, 'FLOAT_SUM': -54, '<': -54, '*': -54, '/': -54, '-': -54, '+': -54, 'CONCAT': -54, 'NEWLINE': -54, '$end': -54, ')': -54, 'OF': -54, 'THEN': -54, ',': -54, ']': -54, 'END': -54, 'ELIF': -54, 'ELSE': -54},
+    30: {'(': -55, 'FLOAT_MORE': -55, 'FLOAT_MORE_OR_EQ': -55, 'FLOAT_LESS': -55, 'FLOAT_LESS_OR_EQ': -55, 'SOME_SUB': -55, 'SOME_CONCAT': -55, 'ARROW_BOTH': -55, 'ARROW_RIGHT': -55, 'ARROW_LEFT': -55, 'DOUBLE_ARROW_RIGHT': -55, 'DOUBLE_ARROW_LEFT': -55, 'BIT_SHIFT_LEFT': -55, 'BIT_AND': -55, 'BIT_OR': -55, 'FLOAT_POW': -55, 'POW': -55, 'ARRAY_SUB': -55, 'ARRAY_CONCAT': -55, 'MORE_OR_EQ': -55, 'LESS_OR_EQ': -55, 'TEXT_MATCH': -55, 'STRICT_AND': -55, 'AND': -55, 'STRICT_OR': -55, 'OR': -55, 'EQUAL': -55, 'NOT_EQUAL': -55, '>': -55, 'FLOAT_MUL': -55, 'FLOAT_DIV': -55, 'FLOAT_SUB': -55, 'FLOAT_SUM': -55, '<': -55, '*': -55, '/': -55, '-': -55, '+': -55, 'CONCAT': -55, 'NEWLINE': -55, '$end': -55, ')': -55, 'OF': -55, 'THEN': -55, ',': -55, ']': -55, 'END': -55, 'ELIF': -55, 'ELSE': -55},
+    31: {'(': -57, 'FLOAT_MORE': -57, 'FLOAT_MORE_OR_EQ': -57, 'FLOAT_LESS': -57, 'FLOAT_LESS_OR_EQ': -57, 'SOME_SUB': -57, 'SOME_CONCAT': -57, 'ARROW_BOTH': -57, 'ARROW_RIGHT': -57, 'ARROW_LEFT': -57, 'DOUBLE_ARROW_RIGHT': -57, 'DOUBLE_ARROW_LEFT': -57, 'BIT_SHIFT_LEFT': -57, 'BIT_AND': -57, 'BIT_OR': -57, 'FLOAT_POW': -57, 'POW': -57, 'ARRAY_SUB': -57, 'ARRAY_CONCAT': -57, 'MORE_OR_EQ': -57, 'LESS_OR_EQ': -57, 'TEXT_MATCH': -57, 'STRICT_AND': -57, 'AND': -57, 'STRICT_OR': -57, 'OR': -57, 'EQUAL': -57, 'NOT_EQUAL': -57, '>': -57, 'FLOAT_MUL': -57, 'FLOAT_DIV': -57, 'FLOAT_SUB': -57, 'FLOAT_SUM': -57, '<': -57, '*': -57, '/': -57, '-': -57, '+': -57, 'CONCAT': -57, 'NEWLINE': -57, '$end': -57, ')': -57, 'OF': -57, 'THEN': -57, ',': -57, ']': -57, 'END': -57, 'ELIF': -57, 'ELSE': -57},
+    32: {'(': -58, 'FLOAT_MORE': -58, 'FLOAT_MORE_OR_EQ': -58, 'FLOAT_LESS': -58, 'FLOAT_LESS_OR_EQ': -58, 'SOME_SUB': -58, 'SOME_CONCAT': -58, 'ARROW_BOTH': -58, 'ARROW_RIGHT': -58, 'ARROW_LEFT': -58, 'DOUBLE_ARROW_RIGHT': -58, 'DOUBLE_ARROW_LEFT': -58, 'BIT_SHIFT_LEFT': -58, 'BIT_AND': -58, 'BIT_OR': -58, 'FLOAT_POW': -58, 'POW': -58, 'ARRAY_SUB': -58, 'ARRAY_CONCAT': -58, 'MORE_OR_EQ': -58, 'LESS_OR_EQ': -58, 'TEXT_MATCH': -58, 'STRICT_AND': -58, 'AND': -58, 'STRICT_OR': -58, 'OR': -58, 'EQUAL': -58, 'NOT_EQUAL': -58, '>': -58, 'FLOAT_MUL': -58, 'FLOAT_DIV': -58, 'FLOAT_SUB': -58, 'FLOAT_SUM': -58, '<': -58, '*': -58, '/': -58, '-': -58, '+': -58, 'CONCAT': -58, 'NEWLINE': -58, '$end': -58, ')': -58, 'OF': -58, 'THEN': -58, ',': -58, ']': -58, 'END': -58, 'ELIF': -58, 'ELSE': -58},
+    33: {'FLOAT_MORE': 104, 'FLOAT_MORE_OR_EQ': 105, 'FLOAT_LESS': 106, 'FLOAT_LESS_OR_EQ': 107, 'SOME_SUB': 108, 'SOME_CONCAT': 109, 'ARROW_BOTH': 110, 'ARROW_RIGHT': 111, 'ARROW_LEFT': 112, 'DOUBLE_ARROW_RIGHT': 113, 'DOUBLE_ARROW_LEFT': 114, 'BIT_SHIFT_LEFT': 115, 'BIT_AND': 116, 'BIT_OR': 117, 'FLOAT_POW': 118, 'POW': 119, 'ARRAY_SUB': 120, 'ARRAY_CONCAT': 121, 'MORE_OR_EQ': 122, 'LESS_OR_EQ': 123, 'TEXT_MATCH': 124, 'STRICT_AND': 125, 'AND': 126, 'STRICT_OR': 127, 'OR': 128, 'EQUAL': 129, 'NOT_EQUAL': 130, '>': 102, 'FLOAT_MUL': 131, 'FLOAT_DIV': 132, 'FLOAT_SUB': 133, 'FLOAT_SUM': 134, '<': 101, '*': 135, '/': 136, '-': 137, '+': 138, 'CONCAT': 139, 'IDENTIFIER': 42},
+    34: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    35: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    36: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    37: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    38: {'(': -310, 'FLOAT_MORE': -310, 'FLOAT_MORE_OR_EQ': -310, 'FLOAT_LESS': -310, 'FLOAT_LESS_OR_EQ': -310, 'SOME_SUB': -310, 'SOME_CONCAT': -310, 'ARROW_BOTH': -310, 'ARROW_RIGHT': -310, 'ARROW_LEFT': -310, 'DOUBLE_ARROW_RIGHT': -310, 'DOUBLE_ARROW_LEFT': -310, 'BIT_SHIFT_LEFT': -310, 'BIT_AND': -310, 'BIT_OR': -310, 'FLOAT_POW': -310, 'POW': -310, 'ARRAY_SUB': -310, 'ARRAY_CONCAT': -310, 'MORE_OR_EQ': -310, 'LESS_OR_EQ': -310, 'TEXT_MATCH': -310, 'STRICT_AND': -310, 'AND': -310, 'STRICT_OR': -310, 'OR': -310, 'EQUAL': -310, 'NOT_EQUAL': -310, '>': -310, 'FLOAT_MUL': -310, 'FLOAT_DIV': -310, 'FLOAT_SUB': -310, 'FLOAT_SUM': -310, '<': -310, '*': -310, '/': -310, '-': -310, '+': -310, 'CONCAT': -310, 'NEWLINE': -310, '$end': -310, ')': -310, 'OF': -310, 'THEN': -310, ',': -310, ']': -310, 'END': -310, 'ELIF': -310, 'ELSE': -310},
+    39: {'(': -309, 'FLOAT_MORE': -309, 'FLOAT_MORE_OR_EQ': -309, 'FLOAT_LESS': -309, 'FLOAT_LESS_OR_EQ': -309, 'SOME_SUB': -309, 'SOME_CONCAT': -309, 'ARROW_BOTH': -309, 'ARROW_RIGHT': -309, 'ARROW_LEFT': -309, 'DOUBLE_ARROW_RIGHT': -309, 'DOUBLE_ARROW_LEFT': -309, 'BIT_SHIFT_LEFT': -309, 'BIT_AND': -309, 'BIT_OR': -309, 'FLOAT_POW': -309, 'POW': -309, 'ARRAY_SUB': -309, 'ARRAY_CONCAT': -309, 'MORE_OR_EQ': -309, 'LESS_OR_EQ': -309, 'TEXT_MATCH': -309, 'STRICT_AND': -309, 'AND': -309, 'STRICT_OR': -309, 'OR': -309, 'EQUAL': -309, 'NOT_EQUAL': -309, '>': -309, 'FLOAT_MUL': -309, 'FLOAT_DIV': -309, 'FLOAT_SUB': -309, 'FLOAT_SUM': -309, '<': -309, '*': -309, '/': -309, '-': -309, '+': -309, 'CONCAT': -309, 'NEWLINE': -309, '$end': -309, ')': -309, 'OF': -309, 'THEN': -309, ',': -309, ']': -309, 'END': -309, 'ELIF': -309, 'ELSE': -309},
+    40: {'NEWLINE': 145, '(': -276, 'DEF': -276, '+': -276, '!': -276, 'STRICT_NOT': -276, '-': -276, 'STRING': -276, 'FLOAT': -276, 'INT': -276, '[': -276, 'TYPE_IDENTIFIER': -276, 'IDENTIFIER': -276, 'CASE': -276, 'IF': -276, 'DO': -276, 'EXTERNAL': -276, 'ENUM': -276, ']': -276},
+    41: {'(': 146},
+    42: {':': -297, '=': -297, '(': -297, 'FLOAT_MORE': -297, 'FLOAT_MORE_OR_EQ': -297, 'FLOAT_LESS': -297, 'FLOAT_LESS_OR_EQ': -297, 'SOME_SUB': -297, 'SOME_CONCAT': -297, 'ARROW_BOTH': -297, 'ARROW_RIGHT': -297, 'ARROW_LEFT': -297, 'DOUBLE_ARROW_RIGHT': -297, 'DOUBLE_ARROW_LEFT': -297, 'BIT_SHIFT_LEFT': -297, 'BIT_AND': -297, 'BIT_OR': -297, 'FLOAT_POW': -297, 'POW': -297, 'ARRAY_SUB': -297, 'ARRAY_CONCAT': -297, 'MORE_OR_EQ': -297, 'LESS_OR_EQ': -297, 'TEXT_MATCH': -297, 'STRICT_AND': -297, 'AND': -297, 'STRICT_OR': -297, 'OR': -297, 'EQUAL': -297, 'NOT_EQUAL': -297, '>': -297, 'FLOAT_MUL': -297, 'FLOAT_DIV': -297, 'FLOAT_SUB': -297, 'FLOAT_SUM': -297, '<': -297, '*': -297, '/': -297, '-': -297, '+': -297, 'CONCAT': -297, 'NEWLINE': -297, '$end': -297, ')': -297, 'OF': -297, 'THEN': -297, ',': -297, ']': -297, 'END': -297, 'ELIF': -297, 'ELSE': -297, 'DO': -297},
+    43: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    44: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    45: {':': 150, 'NEWLINE': -166, 'END': -166, '(': -166, 'DEF': -166, '+': -166, '!': -166, 'STRICT_NOT': -166, '-': -166, 'STRING': -166, 'FLOAT': -166, 'INT': -166, '[': -166, 'TYPE_IDENTIFIER': -166, 'IDENTIFIER': -166, 'CASE': -166, 'IF': -166, 'DO': -166, 'EXTERNAL': -166, 'ENUM': -166},
+    46: {'(': -64, 'FLOAT_MORE': -64, 'FLOAT_MORE_OR_EQ': -64, 'FLOAT_LESS': -64, 'FLOAT_LESS_OR_EQ': -64, 'SOME_SUB': -64, 'SOME_CONCAT': -64, 'ARROW_BOTH': -64, 'ARROW_RIGHT': -64, 'ARROW_LEFT': -64, 'DOUBLE_ARROW_RIGHT': -64, 'DOUBLE_ARROW_LEFT': -64, 'BIT_SHIFT_LEFT': -64, 'BIT_AND': -64, 'BIT_OR': -64, 'FLOAT_POW': -64, 'POW': -64, 'ARRAY_SUB': -64, 'ARRAY_CONCAT': -64, 'MORE_OR_EQ': -64, 'LESS_OR_EQ': -64, 'TEXT_MATCH': -64, 'STRICT_AND': -64, 'AND': -64, 'STRICT_OR': -64, 'OR': -64, 'EQUAL': -64, 'NOT_EQUAL': -64, '>': -64, 'FLOAT_MUL': -64, 'FLOAT_DIV': -64, 'FLOAT_SUB': -64, 'FLOAT_SUM': -64, '<': -64, '*': -64, '/': -64, '-': -64, '+': -64, 'CONCAT': -64, 'NEWLINE': -64, '$end': -64, ')': -64, 'OF': -64, 'THEN': -64, ',': -64, ']': -64, 'END': -64, 'ELIF': -64, 'ELSE': -64},
+    47: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    48: {'$end': -6, 'IMPORT': 9, 'EXPORT': 14, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    49: {'$end': -5},
+    50: {'(': 156, 'NEWLINE': -16, '$end': -16},
+    51: {')': 157, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    52: {'$end': -27},
+    53: {'$end': -28, 'EXPORT': 14, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    54: {'NEWLINE': -32, '$end': -32},
+    55: {'NEWLINE': -33, '$end': -33},
+    56: {'NEWLINE': -34, '$end': -34},
+    57: {'NEWLINE': -35, '$end': -35},
+    58: {':': 98, '=': -308},
+    59: {'NEWLINE': 160, '(': -281, 'DEF': -281, '+': -281, '!': -281, 'STRICT_NOT': -281, '-': -281, 'STRING': -281, 'FLOAT': -281, 'INT': -281, '[': -281, 'TYPE_IDENTIFIER': -281, 'IDENTIFIER': -281, 'CASE': -281, 'IF': -281, 'DO': -281, 'EXTERNAL': -281, 'ENUM': -281, ')': -281},
+    60: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    61: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    62: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    63: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    64: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    65: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    66: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    67: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    68: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    69: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    70: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    71: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    72: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    73: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    74: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    75: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    76: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    77: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    78: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    79: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    80: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    81: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    82: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    83: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    84: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    85: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    86: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    87: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    88: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    89: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    90: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    91: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    92: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    93: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    94: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    95: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    96: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    97: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    98: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    99: {'=': 201},
+    100: {'(': 202, '<': 203},
+    101: {'(': -135, '<': -135},
+    102: {'(': -130, '<': -130},
+    103: {'(': 204, '<': 205},
+    104: {'(': -103, '<': -103},
+    105: {'(': -104, '<': -104},
+    106: {'(': -105, '<': -105},
+    107: {'(': -106, '<': -106},
+    108: {'(': -107, '<': -107},
+    109: {'(': -108, '<': -108},
+    110: {'(': -109, '<': -109},
+    111: {'(': -110, '<': -110},
+    112: {'(': -111, '<': -111},
+    113: {'(': -112, '<': -112},
+    114: {'(': -113, '<': -113},
+    115: {'(': -114, '<': -114},
+    116: {'(': -115, '<': -115},
+    117: {'(': -116, '<': -116},
+    118: {'(': -117, '<': -117},
+    119: {'(': -118, '<': -118},
+    120: {'(': -119, '<': -119},
+    121: {'(': -120, '<': -120},
+    122: {'(': -121, '<': -121},
+    123: {'(': -122, '<': -122},
+    124: {'(': -123, '<': -123},
+    125: {'(': -124, '<': -124},
+    126: {'(': -125, '<': -125},
+    127: {'(': -126, '<': -126},
+    128: {'(': -127, '<': -127},
+    129: {'(': -128, '<': -128},
+    130: {'(': -129, '<': -129},
+    131: {'(': -131, '<': -131},
+    132: {'(': -132, '<': -132},
+    133: {'(': -133, '<': -133},
+    134: {'(': -134, '<': -134},
+    135: {'(': -136, '<': -136},
+    136: {'(': -137, '<': -137},
+    137: {'(': -138, '<': -138},
+    138: {'(': -139, '<': -139},
+    139: {'(': -140, '<': -140},
+    140: {'(': 59, 'FLOAT_MORE': -60, 'FLOAT_MORE_OR_EQ': -60, 'FLOAT_LESS': -60, 'FLOAT_LESS_OR_EQ': -60, 'SOME_SUB': -60, 'SOME_CONCAT': -60, 'ARROW_BOTH': -60, 'ARROW_RIGHT': -60, 'ARROW_LEFT': -60, 'DOUBLE_ARROW_RIGHT': -60, 'DOUBLE_ARROW_LEFT': -60, 'BIT_SHIFT_LEFT': -60, 'BIT_AND': -60, 'BIT_OR': -60, 'FLOAT_POW': -60, 'POW': -60, 'ARRAY_SUB': -60, 'ARRAY_CONCAT': -60, 'MORE_OR_EQ': -60, 'LESS_OR_EQ': -60, 'TEXT_MATCH': -60, 'STRICT_AND': -60, 'AND': -60, 'STRICT_OR': -60, 'OR': -60, 'EQUAL': -60, 'NOT_EQUAL': -60, '>': -60, 'FLOAT_MUL': -60, 'FLOAT_DIV': -60, 'FLOAT_SUB': -60, 'FLOAT_SUM': -60, '<': -60, '*': -60, '/': -60, '-': -60, '+': -60, 'CONCAT': -60, 'NEWLINE': -60, '$end': -60, ')': -60, 'OF': -60, 'THEN': -60, ',': -60, ']': -60, 'END': -60, 'ELIF': -60, 'ELSE': -60},
+    141: {'(': 59, 'FLOAT_MORE': -61, 'FLOAT_MORE_OR_EQ': -61, 'FLOAT_LESS': -61, 'FLOAT_LESS_OR_EQ': -61, 'SOME_SUB': -61, 'SOME_CONCAT': -61, 'ARROW_BOTH': -61, 'ARROW_RIGHT': -61, 'ARROW_LEFT': -61, 'DOUBLE_ARROW_RIGHT': -61, 'DOUBLE_ARROW_LEFT': -61, 'BIT_SHIFT_LEFT': -61, 'BIT_AND': -61, 'BIT_OR': -61, 'FLOAT_POW': -61, 'POW': -61, 'ARRAY_SUB': -61, 'ARRAY_CONCAT': -61, 'MORE_OR_EQ': -61, 'LESS_OR_EQ': -61, 'TEXT_MATCH': -61, 'STRICT_AND': -61, 'AND': -61, 'STRICT_OR': -61, 'OR': -61, 'EQUAL': -61, 'NOT_EQUAL': -61, '>': -61, 'FLOAT_MUL': -61, 'FLOAT_DIV': -61, 'FLOAT_SUB': -61, 'FLOAT_SUM': -61, '<': -61, '*': -61, '/': -61, '-': -61, '+': -61, 'CONCAT': -61, 'NEWLINE': -61, '$end': -61, ')': -61, 'OF': -61, 'THEN': -61, ',': -61, ']': -61, 'END': -61, 'ELIF': -61, 'ELSE': -61},
+    142: {'(': 59, 'FLOAT_MORE': -62, 'FLOAT_MORE_OR_EQ': -62, 'FLOAT_LESS': -62, 'FLOAT_LESS_OR_EQ': -62, 'SOME_SUB': -62, 'SOME_CONCAT': -62, 'ARROW_BOTH': -62, 'ARROW_RIGHT': -62, 'ARROW_LEFT': -62, 'DOUBLE_ARROW_RIGHT': -62, 'DOUBLE_ARROW_LEFT': -62, 'BIT_SHIFT_LEFT': -62, 'BIT_AND': -62, 'BIT_OR': -62, 'FLOAT_POW': -62, 'POW': -62, 'ARRAY_SUB': -62, 'ARRAY_CONCAT': -62, 'MORE_OR_EQ': -62, 'LESS_OR_EQ': -62, 'TEXT_MATCH': -62, 'STRICT_AND': -62, 'AND': -62, 'STRICT_OR': -62, 'OR': -62, 'EQUAL': -62, 'NOT_EQUAL': -62, '>': -62, 'FLOAT_MUL': -62, 'FLOAT_DIV': -62, 'FLOAT_SUB': -62, 'FLOAT_SUM': -62, '<': -62, '*': -62, '/': -62, '-': -62, '+': -62, 'CONCAT': -62, 'NEWLINE': -62, '$end': -62, ')': -62, 'OF': -62, 'THEN': -62, ',': -62, ']': -62, 'END': -62, 'ELIF': -62, 'ELSE': -62},
+    143: {'(': 59, 'FLOAT_MORE': -63, 'FLOAT_MORE_OR_EQ': -63, 'FLOAT_LESS': -63, 'FLOAT_LESS_OR_EQ': -63, 'SOME_SUB': -63, 'SOME_CONCAT': -63, 'ARROW_BOTH': -63, 'ARROW_RIGHT': -63, 'ARROW_LEFT': -63, 'DOUBLE_ARROW_RIGHT': -63, 'DOUBLE_ARROW_LEFT': -63, 'BIT_SHIFT_LEFT': -63, 'BIT_AND': -63, 'BIT_OR': -63, 'FLOAT_POW': -63, 'POW': -63, 'ARRAY_SUB': -63, 'ARRAY_CONCAT': -63, 'MORE_OR_EQ': -63, 'LESS_OR_EQ': -63, 'TEXT_MATCH': -63, 'STRICT_AND': -63, 'AND': -63, 'STRICT_OR': -63, 'OR': -63, 'EQUAL': -63, 'NOT_EQUAL': -63, '>': -63, 'FLOAT_MUL': -63, 'FLOAT_DIV': -63, 'FLOAT_SUB': -63, 'FLOAT_SUM': -63, '<': -63, '*': -63, '/': -63, '-': -63, '+': -63, 'CONCAT': -63, 'NEWLINE': -63, '$end': -63, ')': -63, 'OF': -63, 'THEN': -63, ',': -63, ']': -63, 'END': -63, 'ELIF': -63, 'ELSE': -63},
+    144: {']': -278, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    145: {'(': -275, 'DEF': -275, '+': -275, '!': -275, 'STRICT_NOT': -275, '-': -275, 'STRING': -275, 'FLOAT': -275, 'INT': -275, '[': -275, 'TYPE_IDENTIFIER': -275, 'IDENTIFIER': -275, 'CASE': -275, 'IF': -275, 'DO': -275, 'EXTERNAL': -275, 'ENUM': -275, ']': -275},
+    146: {'NEWLINE': 210, '(': -286, 'DEF': -286, '+': -286, '!': -286, 'STRICT_NOT': -286, '-': -286, 'STRING': -286, 'FLOAT': -286, 'INT': -286, '[': -286, 'TYPE_IDENTIFIER': -286, 'IDENTIFIER': -286, 'CASE': -286, 'IF': -286, 'DO': -286, 'EXTERNAL': -286, 'ENUM': -286, ')': -286},
+    147: {'OF': 211, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    148: {'THEN': 212, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    149: {'NEWLINE': 215, '(': -169, 'DEF': -169, '+': -169, '!': -169, 'STRICT_NOT': -169, '-': -169, 'STRING': -169, 'FLOAT': -169, 'INT': -169, '[': -169, 'TYPE_IDENTIFIER': -169, 'IDENTIFIER': -169, 'CASE': -169, 'IF': -169, 'DO': -169, 'EXTERNAL': -169, 'ENUM': -169, 'END': -169},
+    150: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    151: {'{': 218, '<': 219},
+    152: {'{': -298, '<': -298, '=': -298, 'NEWLINE': -298, 'END': -298, '(': -298, 'DEF': -298, '+': -298, '!': -298, 'STRICT_NOT': -298, '-': -298, 'STRING': -298, 'FLOAT': -298, 'INT': -298, '[': -298, 'TYPE_IDENTIFIER': -298, 'IDENTIFIER': -298, 'CASE': -298, 'IF': -298, 'DO': -298, 'EXTERNAL': -298, 'ENUM': -298, ',': -298, '>': -298, 'MORE_OR_EQ': -298, 'ELIF': -298, 'ELSE': -298, ')': -298},
+    153: {'{': -299, '<': -299, '=': -299, 'NEWLINE': -299, 'END': -299, '(': -299, 'DEF': -299, '+': -299, '!': -299, 'STRICT_NOT': -299, '-': -299, 'STRING': -299, 'FLOAT': -299, 'INT': -299, '[': -299, 'TYPE_IDENTIFIER': -299, 'IDENTIFIER': -299, 'CASE': -299, 'IF': -299, 'DO': -299, 'EXTERNAL': -299, 'ENUM': -299, ',': -299, '>': -299, 'MORE_OR_EQ': -299, 'ELIF': -299, 'ELSE': -299, ')': -299},
+    154: {'$end': -4},
+    155: {'NEWLINE': -12, '$end': -12},
+    156: {'NEWLINE': 221, 'TYPE_IDENTIFIER': -15, 'IDENTIFIER': -15},
+    157: {'(': -42, 'FLOAT_MORE': -42, 'FLOAT_MORE_OR_EQ': -42, 'FLOAT_LESS': -42, 'FLOAT_LESS_OR_EQ': -42, 'SOME_SUB': -42, 'SOME_CONCAT': -42, 'ARROW_BOTH': -42, 'ARROW_RIGHT': -42, 'ARROW_LEFT': -42, 'DOUBLE_ARROW_RIGHT': -42, 'DOUBLE_ARROW_LEFT': -42, 'BIT_SHIFT_LEFT': -42, 'BIT_AND': -42, 'BIT_OR': -42, 'FLOAT_POW': -42, 'POW': -42, 'ARRAY_SUB': -42, 'ARRAY_CONCAT': -42, 'MORE_OR_EQ': -42, 'LESS_OR_EQ': -42, 'TEXT_MATCH': -42, 'STRICT_AND': -42, 'AND': -42, 'STRICT_OR': -42, 'OR': -42, 'EQUAL': -42, 'NOT_EQUAL': -42, '>': -42, 'FLOAT_MUL': -42, 'FLOAT_DIV': -42, 'FLOAT_SUB': -42, 'FLOAT_SUM': -42, '<': -42, '*': -42, '/': -42, '-': -42, '+': -42, 'CONCAT': -42, 'NEWLINE': -42, '$end': -42, ')': -42, 'OF': -42, 'THEN': -42, ',': -42, ']': -42, 'END': -42, 'ELIF': -42, 'ELSE': -42},
+    158: {'NEWLINE': -31, '$end': -31},
+    159: {')': -283, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    160: {'(': -280, 'DEF': -280, '+': -280, '!': -280, 'STRICT_NOT': -280, '-': -280, 'STRING': -280, 'FLOAT': -280, 'INT': -280, '[': -280, 'TYPE_IDENTIFIER': -280, 'IDENTIFIER': -280, 'CASE': -280, 'IF': -280, 'DO': -280, 'EXTERNAL': -280, 'ENUM': -280, ')': -280},
+    161: {'(': 59, 'FLOAT_MORE': -65, 'FLOAT_MORE_OR_EQ': -65, 'FLOAT_LESS': -65, 'FLOAT_LESS_OR_EQ': -65, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -65, 'BIT_OR': -65, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -65, 'LESS_OR_EQ': -65, 'TEXT_MATCH': -65, 'STRICT_AND': -65, 'AND': -65, 'STRICT_OR': -65, 'OR': -65, 'EQUAL': -65, 'NOT_EQUAL': -65, '>': -65, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -65, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -65, '$end': -65, ')': -65, 'OF': -65, 'THEN': -65, ',': -65, ']': -65, 'END': -65, 'ELIF': -65, 'ELSE': -65},
+    162: {'(': 59, 'FLOAT_MORE': -66, 'FLOAT_MORE_OR_EQ': -66, 'FLOAT_LESS': -66, 'FLOAT_LESS_OR_EQ': -66, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -66, 'BIT_OR': -66, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -66, 'LESS_OR_EQ': -66, 'TEXT_MATCH': -66, 'STRICT_AND': -66, 'AND': -66, 'STRICT_OR': -66, 'OR': -66, 'EQUAL': -66, 'NOT_EQUAL': -66, '>': -66, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -66, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -66, '$end': -66, ')': -66, 'OF': -66, 'THEN': -66, ',': -66, ']': -66, 'END': -66, 'ELIF': -66, 'ELSE': -66},
+    163: {'(': 59, 'FLOAT_MORE': -67, 'FLOAT_MORE_OR_EQ': -67, 'FLOAT_LESS': -67, 'FLOAT_LESS_OR_EQ': -67, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -67, 'BIT_OR': -67, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -67, 'LESS_OR_EQ': -67, 'TEXT_MATCH': -67, 'STRICT_AND': -67, 'AND': -67, 'STRICT_OR': -67, 'OR': -67, 'EQUAL': -67, 'NOT_EQUAL': -67, '>': -67, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -67, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -67, '$end': -67, ')': -67, 'OF': -67, 'THEN': -67, ',': -67, ']': -67, 'END': -67, 'ELIF': -67, 'ELSE': -67},
+    164: {'(': 59, 'FLOAT_MORE': -68, 'FLOAT_MORE_OR_EQ': -68, 'FLOAT_LESS': -68, 'FLOAT_LESS_OR_EQ': -68, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -68, 'BIT_OR': -68, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -68, 'LESS_OR_EQ': -68, 'TEXT_MATCH': -68, 'STRICT_AND': -68, 'AND': -68, 'STRICT_OR': -68, 'OR': -68, 'EQUAL': -68, 'NOT_EQUAL': -68, '>': -68, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -68, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -68, '$end': -68, ')': -68, 'OF': -68, 'THEN': -68, ',': -68, ']': -68, 'END': -68, 'ELIF': -68, 'ELSE': -68},
+    165: {'(': 59, 'FLOAT_MORE': -69, 'FLOAT_MORE_OR_EQ': -69, 'FLOAT_LESS': -69, 'FLOAT_LESS_OR_EQ': -69, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -69, 'ARROW_RIGHT': -69, 'ARROW_LEFT': -69, 'DOUBLE_ARROW_RIGHT': -69, 'DOUBLE_ARROW_LEFT': -69, 'BIT_SHIFT_LEFT': -69, 'BIT_AND': -69, 'BIT_OR': -69, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -69, 'LESS_OR_EQ': -69, 'TEXT_MATCH': -69, 'STRICT_AND': -69, 'AND': -69, 'STRICT_OR': -69, 'OR': -69, 'EQUAL': -69, 'NOT_EQUAL': -69, '>': -69, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -69, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -69, '$end': -69, ')': -69, 'OF': -69, 'THEN': -69, ',': -69, ']': -69, 'END': -69, 'ELIF': -69, 'ELSE': -69},
+    166: {'(': 59, 'FLOAT_MORE': -70, 'FLOAT_MORE_OR_EQ': -70, 'FLOAT_LESS': -70, 'FLOAT_LESS_OR_EQ': -70, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -70, 'ARROW_RIGHT': -70, 'ARROW_LEFT': -70, 'DOUBLE_ARROW_RIGHT': -70, 'DOUBLE_ARROW_LEFT': -70, 'BIT_SHIFT_LEFT': -70, 'BIT_AND': -70, 'BIT_OR': -70, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -70, 'LESS_OR_EQ': -70, 'TEXT_MATCH': -70, 'STRICT_AND': -70, 'AND': -70, 'STRICT_OR': -70, 'OR': -70, 'EQUAL': -70, 'NOT_EQUAL': -70, '>': -70, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -70, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -70, '$end': -70, ')': -70, 'OF': -70, 'THEN': -70, ',': -70, ']': -70, 'END': -70, 'ELIF': -70, 'ELSE': -70},
+    167: {'(': 59, 'FLOAT_MORE': -71, 'FLOAT_MORE_OR_EQ': -71, 'FLOAT_LESS': -71, 'FLOAT_LESS_OR_EQ': -71, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -71, 'ARROW_RIGHT': -71, 'ARROW_LEFT': -71, 'DOUBLE_ARROW_RIGHT': -71, 'DOUBLE_ARROW_LEFT': -71, 'BIT_SHIFT_LEFT': -71, 'BIT_AND': -71, 'BIT_OR': -71, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -71, 'LESS_OR_EQ': -71, 'TEXT_MATCH': -71, 'STRICT_AND': -71, 'AND': -71, 'STRICT_OR': -71, 'OR': -71, 'EQUAL': -71, 'NOT_EQUAL': -71, '>': -71, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -71, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -71, '$end': -71, ')': -71, 'OF': -71, 'THEN': -71, ',': -71, ']': -71, 'END': -71, 'ELIF': -71, 'ELSE': -71},
+    168: {'(': 59, 'FLOAT_MORE': -72, 'FLOAT_MORE_OR_EQ': -72, 'FLOAT_LESS': -72, 'FLOAT_LESS_OR_EQ': -72, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -72, 'ARROW_RIGHT': -72, 'ARROW_LEFT': -72, 'DOUBLE_ARROW_RIGHT': -72, 'DOUBLE_ARROW_LEFT': -72, 'BIT_SHIFT_LEFT': -72, 'BIT_AND': -72, 'BIT_OR': -72, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -72, 'LESS_OR_EQ': -72, 'TEXT_MATCH': -72, 'STRICT_AND': -72, 'AND': -72, 'STRICT_OR': -72, 'OR': -72, 'EQUAL': -72, 'NOT_EQUAL': -72, '>': -72, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -72, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -72, '$end': -72, ')': -72, 'OF': -72, 'THEN': -72, ',': -72, ']': -72, 'END': -72, 'ELIF': -72, 'ELSE': -72},
+    169: {'(': 59, 'FLOAT_MORE': -73, 'FLOAT_MORE_OR_EQ': -73, 'FLOAT_LESS': -73, 'FLOAT_LESS_OR_EQ': -73, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -73, 'ARROW_RIGHT': -73, 'ARROW_LEFT': -73, 'DOUBLE_ARROW_RIGHT': -73, 'DOUBLE_ARROW_LEFT': -73, 'BIT_SHIFT_LEFT': -73, 'BIT_AND': -73, 'BIT_OR': -73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -73, 'LESS_OR_EQ': -73, 'TEXT_MATCH': -73, 'STRICT_AND': -73, 'AND': -73, 'STRICT_OR': -73, 'OR': -73, 'EQUAL': -73, 'NOT_EQUAL': -73, '>': -73, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -73, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -73, '$end': -73, ')': -73, 'OF': -73, 'THEN': -73, ',': -73, ']': -73, 'END': -73, 'ELIF': -73, 'ELSE': -73},
+    170: {'(': 59, 'FLOAT_MORE': -74, 'FLOAT_MORE_OR_EQ': -74, 'FLOAT_LESS': -74, 'FLOAT_LESS_OR_EQ': -74, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -74, 'ARROW_RIGHT': -74, 'ARROW_LEFT': -74, 'DOUBLE_ARROW_RIGHT': -74, 'DOUBLE_ARROW_LEFT': -74, 'BIT_SHIFT_LEFT': -74, 'BIT_AND': -74, 'BIT_OR': -74, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -74, 'LESS_OR_EQ': -74, 'TEXT_MATCH': -74, 'STRICT_AND': -74, 'AND': -74, 'STRICT_OR': -74, 'OR': -74, 'EQUAL': -74, 'NOT_EQUAL': -74, '>': -74, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -74, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -74, '$end': -74, ')': -74, 'OF': -74, 'THEN': -74, ',': -74, ']': -74, 'END': -74, 'ELIF': -74, 'ELSE': -74},
+    171: {'(': 59, 'FLOAT_MORE': -75, 'FLOAT_MORE_OR_EQ': -75, 'FLOAT_LESS': -75, 'FLOAT_LESS_OR_EQ': -75, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -75, 'ARROW_RIGHT': -75, 'ARROW_LEFT': -75, 'DOUBLE_ARROW_RIGHT': -75, 'DOUBLE_ARROW_LEFT': -75, 'BIT_SHIFT_LEFT': -75, 'BIT_AND': -75, 'BIT_OR': -75, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -75, 'LESS_OR_EQ': -75, 'TEXT_MATCH': -75, 'STRICT_AND': -75, 'AND': -75, 'STRICT_OR': -75, 'OR': -75, 'EQUAL': -75, 'NOT_EQUAL': -75, '>': -75, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -75, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -75, '$end': -75, ')': -75, 'OF': -75, 'THEN': -75, ',': -75, ']': -75, 'END': -75, 'ELIF': -75, 'ELSE': -75},
+    172: {'(': 59, 'FLOAT_MORE': -76, 'FLOAT_MORE_OR_EQ': -76, 'FLOAT_LESS': -76, 'FLOAT_LESS_OR_EQ': -76, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -76, 'ARROW_RIGHT': -76, 'ARROW_LEFT': -76, 'DOUBLE_ARROW_RIGHT': -76, 'DOUBLE_ARROW_LEFT': -76, 'BIT_SHIFT_LEFT': -76, 'BIT_AND': -76, 'BIT_OR': -76, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -76, 'LESS_OR_EQ': -76, 'TEXT_MATCH': -76, 'STRICT_AND': -76, 'AND': -76, 'STRICT_OR': -76, 'OR': -76, 'EQUAL': -76, 'NOT_EQUAL': -76, '>': -76, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -76, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -76, '$end': -76, ')': -76, 'OF': -76, 'THEN': -76, ',': -76, ']': -76, 'END': -76, 'ELIF': -76, 'ELSE': -76},
+    173: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -77, 'BIT_OR': -77, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': -77, 'AND': -77, 'STRICT_OR': -77, 'OR': -77, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -77, '$end': -77, ')': -77, 'OF': -77, 'THEN': -77, ',': -77, ']': -77, 'END': -77, 'ELIF': -77, 'ELSE': -77},
+    174: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': -78, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': -78, 'OR': -78, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -78, '$end': -78, ')': -78, 'OF': -78, 'THEN': -78, ',': -78, ']': -78, 'END': -78, 'ELIF': -78, 'ELSE': -78},
+    175: {'(': 59, 'FLOAT_MORE': -79, 'FLOAT_MORE_OR_EQ': -79, 'FLOAT_LESS': -79, 'FLOAT_LESS_OR_EQ': -79, 'SOME_SUB': -79, 'SOME_CONCAT': -79, 'ARROW_BOTH': -79, 'ARROW_RIGHT': -79, 'ARROW_LEFT': -79, 'DOUBLE_ARROW_RIGHT': -79, 'DOUBLE_ARROW_LEFT': -79, 'BIT_SHIFT_LEFT': -79, 'BIT_AND': -79, 'BIT_OR': -79, 'FLOAT_POW': -79, 'POW': -79, 'ARRAY_SUB': -79, 'ARRAY_CONCAT': -79, 'MORE_OR_EQ': -79, 'LESS_OR_EQ': -79, 'TEXT_MATCH': -79, 'STRICT_AND': -79, 'AND': -79, 'STRICT_OR': -79, 'OR': -79, 'EQUAL': -79, 'NOT_EQUAL': -79, '>': -79, 'FLOAT_MUL': -79, 'FLOAT_DIV': -79, 'FLOAT_SUB': -79, 'FLOAT_SUM': -79, '<': -79, '*': -79, '/': -79, '-': -79, '+': -79, 'CONCAT': -79, 'NEWLINE': -79, '$end': -79, ')': -79, 'OF': -79, 'THEN': -79, ',': -79, ']': -79, 'END': -79, 'ELIF': -79, 'ELSE': -79},
+    176: {'(': 59, 'FLOAT_MORE': -80, 'FLOAT_MORE_OR_EQ': -80, 'FLOAT_LESS': -80, 'FLOAT_LESS_OR_EQ': -80, 'SOME_SUB': -80, 'SOME_CONCAT': -80, 'ARROW_BOTH': -80, 'ARROW_RIGHT': -80, 'ARROW_LEFT': -80, 'DOUBLE_ARROW_RIGHT': -80, 'DOUBLE_ARROW_LEFT': -80, 'BIT_SHIFT_LEFT': -80, 'BIT_AND': -80, 'BIT_OR': -80, 'FLOAT_POW': -80, 'POW': -80, 'ARRAY_SUB': -80, 'ARRAY_CONCAT': -80, 'MORE_OR_EQ': -80, 'LESS_OR_EQ': -80, 'TEXT_MATCH': -80, 'STRICT_AND': -80, 'AND': -80, 'STRICT_OR': -80, 'OR': -80, 'EQUAL': -80, 'NOT_EQUAL': -80, '>': -80, 'FLOAT_MUL': -80, 'FLOAT_DIV': -80, 'FLOAT_SUB': -80, 'FLOAT_SUM': -80, '<': -80, '*': -80, '/': -80, '-': -80, '+': -80, 'CONCAT': -80, 'NEWLINE': -80, '$end': -80, ')': -80, 'OF': -80, 'THEN': -80, ',': -80, ']': -80, 'END': -80, 'ELIF': -80, 'ELSE': -80},
+    177: {'(': 59, 'FLOAT_MORE': -81, 'FLOAT_MORE_OR_EQ': -81, 'FLOAT_LESS': -81, 'FLOAT_LESS_OR_EQ': -81, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -81, 'ARROW_RIGHT': -81, 'ARROW_LEFT': -81, 'DOUBLE_ARROW_RIGHT': -81, 'DOUBLE_ARROW_LEFT': -81, 'BIT_SHIFT_LEFT': -81, 'BIT_AND': -81, 'BIT_OR': -81, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -81, 'LESS_OR_EQ': -81, 'TEXT_MATCH': -81, 'STRICT_AND': -81, 'AND': -81, 'STRICT_OR': -81, 'OR': -81, 'EQUAL': -81, 'NOT_EQUAL': -81, '>': -81, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -81, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -81, '$end': -81, ')': -81, 'OF': -81, 'THEN': -81, ',': -81, ']': -81, 'END': -81, 'ELIF': -81, 'ELSE': -81},
+    178: {'(': 59, 'FLOAT_MORE': -82, 'FLOAT_MORE_OR_EQ': -82, 'FLOAT_LESS': -82, 'FLOAT_LESS_OR_EQ': -82, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -82, 'ARROW_RIGHT': -82, 'ARROW_LEFT': -82, 'DOUBLE_ARROW_RIGHT': -82, 'DOUBLE_ARROW_LEFT': -82, 'BIT_SHIFT_LEFT': -82, 'BIT_AND': -82, 'BIT_OR': -82, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -82, 'LESS_OR_EQ': -82, 'TEXT_MATCH': -82, 'STRICT_AND': -82, 'AND': -82, 'STRICT_OR': -82, 'OR': -82, 'EQUAL': -82, 'NOT_EQUAL': -82, '>': -82, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -82, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -82, '$end': -82, ')': -82, 'OF': -82, 'THEN': -82, ',': -82, ']': -82, 'END': -82, 'ELIF': -82, 'ELSE': -82},
+    179: {'(': 59, 'FLOAT_MORE': -83, 'FLOAT_MORE_OR_EQ': -83, 'FLOAT_LESS': -83, 'FLOAT_LESS_OR_EQ': -83, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -83, 'BIT_OR': -83, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -83, 'LESS_OR_EQ': -83, 'TEXT_MATCH': -83, 'STRICT_AND': -83, 'AND': -83, 'STRICT_OR': -83, 'OR': -83, 'EQUAL': -83, 'NOT_EQUAL': -83, '>': -83, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -83, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -83, '$end': -83, ')': -83, 'OF': -83, 'THEN': -83, ',': -83, ']': -83, 'END': -83, 'ELIF': -83, 'ELSE': -83},
+    180: {'(': 59, 'FLOAT_MORE': -84, 'FLOAT_MORE_OR_EQ': -84, 'FLOAT_LESS': -84, 'FLOAT_LESS_OR_EQ': -84, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -84, 'BIT_OR': -84, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -84, 'LESS_OR_EQ': -84, 'TEXT_MATCH': -84, 'STRICT_AND': -84, 'AND': -84, 'STRICT_OR': -84, 'OR': -84, 'EQUAL': -84, 'NOT_EQUAL': -84, '>': -84, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -84, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -84, '$end': -84, ')': -84, 'OF': -84, 'THEN': -84, ',': -84, ']': -84, 'END': -84, 'ELIF': -84, 'ELSE': -84},
+    181: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -85, 'BIT_OR': -85, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': -85, 'STRICT_AND': -85, 'AND': -85, 'STRICT_OR': -85, 'OR': -85, 'EQUAL': -85, 'NOT_EQUAL': -85, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -85, '$end': -85, ')': -85, 'OF': -85, 'THEN': -85, ',': -85, ']': -85, 'END': -85, 'ELIF': -85, 'ELSE': -85},
+    182: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -86, 'BIT_OR': -86, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': -86, 'AND': -86, 'STRICT_OR': -86, 'OR': -86, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -86, '$end': -86, ')': -86, 'OF': -86, 'THEN': -86, ',': -86, ']': -86, 'END': -86, 'ELIF': -86, 'ELSE': -86},
+    183: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -87, 'BIT_OR': -87, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': -87, 'AND': -87, 'STRICT_OR': -87, 'OR': -87, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -87, '$end': -87, ')': -87, 'OF': -87, 'THEN': -87, ',': -87, ']': -87, 'END': -87, 'ELIF': -87, 'ELSE': -87},
+    184: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': -88, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': -88, 'OR': -88, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -88, '$end': -88, ')': -88, 'OF': -88, 'THEN': -88, ',': -88, ']': -88, 'END': -88, 'ELIF': -88, 'ELSE': -88},
+    185: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': -89, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': -89, 'OR': -89, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -89, '$end': -89, ')': -89, 'OF': -89, 'THEN': -89, ',': -89, ']': -89, 'END': -89, 'ELIF': -89, 'ELSE': -89},
+    186: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -90, 'BIT_OR': -90, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': -90, 'STRICT_AND': -90, 'AND': -90, 'STRICT_OR': -90, 'OR': -90, 'EQUAL': -90, 'NOT_EQUAL': -90, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -90, '$end': -90, ')': -90, 'OF': -90, 'THEN': -90, ',': -90, ']': -90, 'END': -90, 'ELIF': -90, 'ELSE': -90},
+    187: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -91, 'BIT_OR': -91, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': -91, 'STRICT_AND': -91, 'AND': -91, 'STRICT_OR': -91, 'OR': -91, 'EQUAL': -91, 'NOT_EQUAL': -91, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -91, '$end': -91, ')': -91, 'OF': -91, 'THEN': -91, ',': -91, ']': -91, 'END': -91, 'ELIF': -91, 'ELSE': -91},
+    188: {'(': 59, 'FLOAT_MORE': -92, 'FLOAT_MORE_OR_EQ': -92, 'FLOAT_LESS': -92, 'FLOAT_LESS_OR_EQ': -92, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -92, 'BIT_OR': -92, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -92, 'LESS_OR_EQ': -92, 'TEXT_MATCH': -92, 'STRICT_AND': -92, 'AND': -92, 'STRICT_OR': -92, 'OR': -92, 'EQUAL': -92, 'NOT_EQUAL': -92, '>': -92, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -92, '$end': -92, ')': -92, 'OF': -92, 'THEN': -92, ',': -92, ']': -92, 'END': -92, 'ELIF': -92, 'ELSE': -92},
+    189: {'(': 59, 'FLOAT_MORE': -93, 'FLOAT_MORE_OR_EQ': -93, 'FLOAT_LESS': -93, 'FLOAT_LESS_OR_EQ': -93, 'SOME_SUB': -93, 'SOME_CONCAT': -93, 'ARROW_BOTH': -93, 'ARROW_RIGHT': -93, 'ARROW_LEFT': -93, 'DOUBLE_ARROW_RIGHT': -93, 'DOUBLE_ARROW_LEFT': -93, 'BIT_SHIFT_LEFT': -93, 'BIT_AND': -93, 'BIT_OR': -93, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -93, 'ARRAY_CONCAT': -93, 'MORE_OR_EQ': -93, 'LESS_OR_EQ': -93, 'TEXT_MATCH': -93, 'STRICT_AND': -93, 'AND': -93, 'STRICT_OR': -93, 'OR': -93, 'EQUAL': -93, 'NOT_EQUAL': -93, '>': -93, 'FLOAT_MUL': -93, 'FLOAT_DIV': -93, 'FLOAT_SUB': -93, 'FLOAT_SUM': -93, '<': -93, '*': -93, '/': -93, '-': -93, '+': -93, 'CONCAT': -93, 'NEWLINE': -93, '$end': -93, ')': -93, 'OF': -93, 'THEN': -93, ',': -93, ']': -93, 'END': -93, 'ELIF': -93, 'ELSE': -93},
+    190: {'(': 59, 'FLOAT_MORE': -94, 'FLOAT_MORE_OR_EQ': -94, 'FLOAT_LESS': -94, 'FLOAT_LESS_OR_EQ': -94, 'SOME_SUB': -94, 'SOME_CONCAT': -94, 'ARROW_BOTH': -94, 'ARROW_RIGHT': -94, 'ARROW_LEFT': -94, 'DOUBLE_ARROW_RIGHT': -94, 'DOUBLE_ARROW_LEFT': -94, 'BIT_SHIFT_LEFT': -94, 'BIT_AND': -94, 'BIT_OR': -94, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -94, 'ARRAY_CONCAT': -94, 'MORE_OR_EQ': -94, 'LESS_OR_EQ': -94, 'TEXT_MATCH': -94, 'STRICT_AND': -94, 'AND': -94, 'STRICT_OR': -94, 'OR': -94, 'EQUAL': -94, 'NOT_EQUAL': -94, '>': -94, 'FLOAT_MUL': -94, 'FLOAT_DIV': -94, 'FLOAT_SUB': -94, 'FLOAT_SUM': -94, '<': -94, '*': -94, '/': -94, '-': -94, '+': -94, 'CONCAT': -94, 'NEWLINE': -94, '$end': -94, ')': -94, 'OF': -94, 'THEN': -94, ',': -94, ']': -94, 'END': -94, 'ELIF': -94, 'ELSE': -94},
+    191: {'(': 59, 'FLOAT_MORE': -95, 'FLOAT_MORE_OR_EQ': -95, 'FLOAT_LESS': -95, 'FLOAT_LESS_OR_EQ': -95, 'SOME_SUB': -95, 'SOME_CONCAT': -95, 'ARROW_BOTH': -95, 'ARROW_RIGHT': -95, 'ARROW_LEFT': -95, 'DOUBLE_ARROW_RIGHT': -95, 'DOUBLE_ARROW_LEFT': -95, 'BIT_SHIFT_LEFT': -95, 'BIT_AND': -95, 'BIT_OR': -95, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -95, 'ARRAY_CONCAT': -95, 'MORE_OR_EQ': -95, 'LESS_OR_EQ': -95, 'TEXT_MATCH': -95, 'STRICT_AND': -95, 'AND': -95, 'STRICT_OR': -95, 'OR': -95, 'EQUAL': -95, 'NOT_EQUAL': -95, '>': -95, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': -95, 'FLOAT_SUM': -95, '<': -95, '*': 93, '/': 94, '-': -95, '+': -95, 'CONCAT': -95, 'NEWLINE': -95, '$end': -95, ')': -95, 'OF': -95, 'THEN': -95, ',': -95, ']': -95, 'END': -95, 'ELIF': -95, 'ELSE': -95},
+    192: {'(': 59, 'FLOAT_MORE': -96, 'FLOAT_MORE_OR_EQ': -96, 'FLOAT_LESS': -96, 'FLOAT_LESS_OR_EQ': -96, 'SOME_SUB': -96, 'SOME_CONCAT': -96, 'ARROW_BOTH': -96, 'ARROW_RIGHT': -96, 'ARROW_LEFT': -96, 'DOUBLE_ARROW_RIGHT': -96, 'DOUBLE_ARROW_LEFT': -96, 'BIT_SHIFT_LEFT': -96, 'BIT_AND': -96, 'BIT_OR': -96, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -96, 'ARRAY_CONCAT': -96, 'MORE_OR_EQ': -96, 'LESS_OR_EQ': -96, 'TEXT_MATCH': -96, 'STRICT_AND': -96, 'AND': -96, 'STRICT_OR': -96, 'OR': -96, 'EQUAL': -96, 'NOT_EQUAL': -96, '>': -96, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': -96, 'FLOAT_SUM': -96, '<': -96, '*': 93, '/': 94, '-': -96, '+': -96, 'CONCAT': -96, 'NEWLINE': -96, '$end': -96, ')': -96, 'OF': -96, 'THEN': -96, ',': -96, ']': -96, 'END': -96, 'ELIF': -96, 'ELSE': -96},
+    193: {'(': 59, 'FLOAT_MORE': -97, 'FLOAT_MORE_OR_EQ': -97, 'FLOAT_LESS': -97, 'FLOAT_LESS_OR_EQ': -97, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -97, 'BIT_OR': -97, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -97, 'LESS_OR_EQ': -97, 'TEXT_MATCH': -97, 'STRICT_AND': -97, 'AND': -97, 'STRICT_OR': -97, 'OR': -97, 'EQUAL': -97, 'NOT_EQUAL': -97, '>': -97, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -97, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -97, '$end': -97, ')': -97, 'OF': -97, 'THEN': -97, ',': -97, ']': -97, 'END': -97, 'ELIF': -97, 'ELSE': -97},
+    194: {'(': 59, 'FLOAT_MORE': -98, 'FLOAT_MORE_OR_EQ': -98, 'FLOAT_LESS': -98, 'FLOAT_LESS_OR_EQ': -98, 'SOME_SUB': -98, 'SOME_CONCAT': -98, 'ARROW_BOTH': -98, 'ARROW_RIGHT': -98, 'ARROW_LEFT': -98, 'DOUBLE_ARROW_RIGHT': -98, 'DOUBLE_ARROW_LEFT': -98, 'BIT_SHIFT_LEFT': -98, 'BIT_AND': -98, 'BIT_OR': -98, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -98, 'ARRAY_CONCAT': -98, 'MORE_OR_EQ': -98, 'LESS_OR_EQ': -98, 'TEXT_MATCH': -98, 'STRICT_AND': -98, 'AND': -98, 'STRICT_OR': -98, 'OR': -98, 'EQUAL': -98, 'NOT_EQUAL': -98, '>': -98, 'FLOAT_MUL': -98, 'FLOAT_DIV': -98, 'FLOAT_SUB': -98, 'FLOAT_SUM': -98, '<': -98, '*': -98, '/': -98, '-': -98, '+': -98, 'CONCAT': -98, 'NEWLINE': -98, '$end': -98, ')': -98, 'OF': -98, 'THEN': -98, ',': -98, ']': -98, 'END': -98, 'ELIF': -98, 'ELSE': -98},
+    195: {'(': 59, 'FLOAT_MORE': -99, 'FLOAT_MORE_OR_EQ': -99, 'FLOAT_LESS': -99, 'FLOAT_LESS_OR_EQ': -99, 'SOME_SUB': -99, 'SOME_CONCAT': -99, 'ARROW_BOTH': -99, 'ARROW_RIGHT': -99, 'ARROW_LEFT': -99, 'DOUBLE_ARROW_RIGHT': -99, 'DOUBLE_ARROW_LEFT': -99, 'BIT_SHIFT_LEFT': -99, 'BIT_AND': -99, 'BIT_OR': -99, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -99, 'ARRAY_CONCAT': -99, 'MORE_OR_EQ': -99, 'LESS_OR_EQ': -99, 'TEXT_MATCH': -99, 'STRICT_AND': -99, 'AND': -99, 'STRICT_OR': -99, 'OR': -99, 'EQUAL': -99, 'NOT_EQUAL': -99, '>': -99, 'FLOAT_MUL': -99, 'FLOAT_DIV': -99, 'FLOAT_SUB': -99, 'FLOAT_SUM': -99, '<': -99, '*': -99, '/': -99, '-': -99, '+': -99, 'CONCAT': -99, 'NEWLINE': -99, '$end': -99, ')': -99, 'OF': -99, 'THEN': -99, ',': -99, ']': -99, 'END': -99, 'ELIF': -99, 'ELSE': -99},
+    196: {'(': 59, 'FLOAT_MORE': -100, 'FLOAT_MORE_OR_EQ': -100, 'FLOAT_LESS': -100, 'FLOAT_LESS_OR_EQ': -100, 'SOME_SUB': -100, 'SOME_CONCAT': -100, 'ARROW_BOTH': -100, 'ARROW_RIGHT': -100, 'ARROW_LEFT': -100, 'DOUBLE_ARROW_RIGHT': -100, 'DOUBLE_ARROW_LEFT': -100, 'BIT_SHIFT_LEFT': -100, 'BIT_AND': -100, 'BIT_OR': -100, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -100, 'ARRAY_CONCAT': -100, 'MORE_OR_EQ': -100, 'LESS_OR_EQ': -100, 'TEXT_MATCH': -100, 'STRICT_AND': -100, 'AND': -100, 'STRICT_OR': -100, 'OR': -100, 'EQUAL': -100, 'NOT_EQUAL': -100, '>': -100, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': -100, 'FLOAT_SUM': -100, '<': -100, '*': 93, '/': 94, '-': -100, '+': -100, 'CONCAT': -100, 'NEWLINE': -100, '$end': -100, ')': -100, 'OF': -100, 'THEN': -100, ',': -100, ']': -100, 'END': -100, 'ELIF': -100, 'ELSE': -100},
+    197: {'(': 59, 'FLOAT_MORE': -101, 'FLOAT_MORE_OR_EQ': -101, 'FLOAT_LESS': -101, 'FLOAT_LESS_OR_EQ': -101, 'SOME_SUB': -101, 'SOME_CONCAT': -101, 'ARROW_BOTH': -101, 'ARROW_RIGHT': -101, 'ARROW_LEFT': -101, 'DOUBLE_ARROW_RIGHT': -101, 'DOUBLE_ARROW_LEFT': -101, 'BIT_SHIFT_LEFT': -101, 'BIT_AND': -101, 'BIT_OR': -101, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': -101, 'ARRAY_CONCAT': -101, 'MORE_OR_EQ': -101, 'LESS_OR_EQ': -101, 'TEXT_MATCH': -101, 'STRICT_AND': -101, 'AND': -101, 'STRICT_OR': -101, 'OR': -101, 'EQUAL': -101, 'NOT_EQUAL': -101, '>': -101, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': -101, 'FLOAT_SUM': -101, '<': -101, '*': 93, '/': 94, '-': -101, '+': -101, 'CONCAT': -101, 'NEWLINE': -101, '$end': -101, ')': -101, 'OF': -101, 'THEN': -101, ',': -101, ']': -101, 'END': -101, 'ELIF': -101, 'ELSE': -101},
+    198: {'(': 59, 'FLOAT_MORE': -102, 'FLOAT_MORE_OR_EQ': -102, 'FLOAT_LESS': -102, 'FLOAT_LESS_OR_EQ': -102, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': -102, 'ARROW_RIGHT': -102, 'ARROW_LEFT': -102, 'DOUBLE_ARROW_RIGHT': -102, 'DOUBLE_ARROW_LEFT': -102, 'BIT_SHIFT_LEFT': -102, 'BIT_AND': -102, 'BIT_OR': -102, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -102, 'LESS_OR_EQ': -102, 'TEXT_MATCH': -102, 'STRICT_AND': -102, 'AND': -102, 'STRICT_OR': -102, 'OR': -102, 'EQUAL': -102, 'NOT_EQUAL': -102, '>': -102, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -102, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -102, '$end': -102, ')': -102, 'OF': -102, 'THEN': -102, ',': -102, ']': -102, 'END': -102, 'ELIF': -102, 'ELSE': -102},
+    199: {'<': 224, '=': -205},
+    200: {'=': -307},
+    201: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    202: {'NEWLINE': 227, 'IDENTIFIER': -143},
+    203: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    204: {'NEWLINE': 230, 'IDENTIFIER': -174, ')': -174},
+    205: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    206: {']': 232},
+    207: {']': -277, ',': 233},
+    208: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': 235, ',': -291, ']': -291, ')': -291},
+    209: {')': -288, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    210: {'(': -285, 'DEF': -285, '+': -285, '!': -285, 'STRICT_NOT': -285, '-': -285, 'STRING': -285, 'FLOAT': -285, 'INT': -285, '[': -285, 'TYPE_IDENTIFIER': -285, 'IDENTIFIER': -285, 'CASE': -285, 'IF': -285, 'DO': -285, 'EXTERNAL': -285, 'ENUM': -285, ')': -285},
+    211: {'NEWLINE': 239, 'TYPE_IDENTIFIER': -248, 'IDENTIFIER': -248, 'END': -248},
+    212: {':': 241, 'NEWLINE': -239, 'ELIF': -239, 'ELSE': -239, 'END': -239, '(': -239, 'DEF': -239, '+': -239, '!': -239, 'STRICT_NOT': -239, '-': -239, 'STRING': -239, 'FLOAT': -239, 'INT': -239, '[': -239, 'TYPE_IDENTIFIER': -239, 'IDENTIFIER': -239, 'CASE': -239, 'IF': -239, 'DO': -239, 'EXTERNAL': -239, 'ENUM': -239},
+    213: {'END': 242},
+    214: {'END': -171, 'ELIF': -171, 'ELSE': -171, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    215: {'(': -168, 'DEF': -168, '+': -168, '!': -168, 'STRICT_NOT': -168, '-': -168, 'STRING': -168, 'FLOAT': -168, 'INT': -168, '[': -168, 'TYPE_IDENTIFIER': -168, 'IDENTIFIER': -168, 'CASE': -168, 'IF': -168, 'DO': -168, 'EXTERNAL': -168, 'ENUM': -168, 'END': -168, 'ELIF': -168, 'ELSE': -168},
+    216: {'NEWLINE': -165, 'END': -165, '(': -165, 'DEF': -165, '+': -165, '!': -165, 'STRICT_NOT': -165, '-': -165, 'STRING': -165, 'FLOAT': -165, 'INT': -165, '[': -165, 'TYPE_IDENTIFIER': -165, 'IDENTIFIER': -165, 'CASE': -165, 'IF': -165, 'DO': -165, 'EXTERNAL': -165, 'ENUM': -165},
+    217: {'<': 247, 'NEWLINE': -205, 'END': -205, '(': -205, 'DEF': -205, '+': -205, '!': -205, 'STRICT_NOT': -205, '-': -205, 'STRING': -205, 'FLOAT': -205, 'INT': -205, '[': -205, 'TYPE_IDENTIFIER': -205, 'IDENTIFIER': -205, 'CASE': -205, 'IF': -205, 'DO': -205, 'EXTERNAL': -205, 'ENUM': -205, ',': -205, 'MORE_OR_EQ': -205, '>': -205, 'ELIF': -205, 'ELSE': -205, ')': -205},
+    218: {'NEWLINE': 249, 'TYPE_IDENTIFIER': -208, '}': -208},
+    219: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    220: {'TYPE_IDENTIFIER': 253, 'IDENTIFIER': 42},
+    221: {'TYPE_IDENTIFIER': -14, 'IDENTIFIER': -14},
+    222: {')': 255},
+    223: {')': -282, ',': 233},
+    224: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    225: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -306, '$end': -306, ')': -306, 'OF': -306, 'THEN': -306, ',': -306, ']': -306, 'END': -306, 'ELIF': -306, 'ELSE': -306},
+    226: {'IDENTIFIER': 42},
+    227: {'IDENTIFIER': -142},
+    228: {'>': -152, ',': 260},
+    229: {')': -176, 'IDENTIFIER': 42},
+    230: {'IDENTIFIER': -173, ')': -173},
+    231: {'>': -181, ',': 269},
+    232: {'(': -274, 'FLOAT_MORE': -274, 'FLOAT_MORE_OR_EQ': -274, 'FLOAT_LESS': -274, 'FLOAT_LESS_OR_EQ': -274, 'SOME_SUB': -274, 'SOME_CONCAT': -274, 'ARROW_BOTH': -274, 'ARROW_RIGHT': -274, 'ARROW_LEFT': -274, 'DOUBLE_ARROW_RIGHT': -274, 'DOUBLE_ARROW_LEFT': -274, 'BIT_SHIFT_LEFT': -274, 'BIT_AND': -274, 'BIT_OR': -274, 'FLOAT_POW': -274, 'POW': -274, 'ARRAY_SUB': -274, 'ARRAY_CONCAT': -274, 'MORE_OR_EQ': -274, 'LESS_OR_EQ': -274, 'TEXT_MATCH': -274, 'STRICT_AND': -274, 'AND': -274, 'STRICT_OR': -274, 'OR': -274, 'EQUAL': -274, 'NOT_EQUAL': -274, '>': -274, 'FLOAT_MUL': -274, 'FLOAT_DIV': -274, 'FLOAT_SUB': -274, 'FLOAT_SUM': -274, '<': -274, '*': -274, '/': -274, '-': -274, '+': -274, 'CONCAT': -274, 'NEWLINE': -274, '$end': -274, ')': -274, 'OF': -274, 'THEN': -274, ',': -274, ']': -274, 'END': -274, 'ELIF': -274, 'ELSE': -274},
+    233: {'NEWLINE': 271, '(': -294, 'DEF': -294, '+': -294, '!': -294, 'STRICT_NOT': -294, '-': -294, 'STRING': -294, 'FLOAT': -294, 'INT': -294, '[': -294, 'TYPE_IDENTIFIER': -294, 'IDENTIFIER': -294, 'CASE': -294, 'IF': -294, 'DO': -294, 'EXTERNAL': -294, 'ENUM': -294},
+    234: {',': -289, ']': -289, ')': -289},
+    235: {',': -290, ']': -290, ')': -290},
+    236: {')': 272},
+    237: {')': -287, ',': 233},
+    238: {'END': -250, 'TYPE_IDENTIFIER': 278, 'IDENTIFIER': 42},
+    239: {'TYPE_IDENTIFIER': -247, 'IDENTIFIER': -247, 'END': -247},
+    240: {'NEWLINE': 215, '(': -169, 'DEF': -169, '+': -169, '!': -169, 'STRICT_NOT': -169, '-': -169, 'STRING': -169, 'FLOAT': -169, 'INT': -169, '[': -169, 'TYPE_IDENTIFIER': -169, 'IDENTIFIER': -169, 'CASE': -169, 'IF': -169, 'DO': -169, 'EXTERNAL': -169, 'ENUM': -169, 'ELIF': -169, 'ELSE': -169, 'END': -169},
+    241: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    242: {'(': -164, 'FLOAT_MORE': -164, 'FLOAT_MORE_OR_EQ': -164, 'FLOAT_LESS': -164, 'FLOAT_LESS_OR_EQ': -164, 'SOME_SUB': -164, 'SOME_CONCAT': -164, 'ARROW_BOTH': -164, 'ARROW_RIGHT': -164, 'ARROW_LEFT': -164, 'DOUBLE_ARROW_RIGHT': -164, 'DOUBLE_ARROW_LEFT': -164, 'BIT_SHIFT_LEFT': -164, 'BIT_AND': -164, 'BIT_OR': -164, 'FLOAT_POW': -164, 'POW': -164, 'ARRAY_SUB': -164, 'ARRAY_CONCAT': -164, 'MORE_OR_EQ': -164, 'LESS_OR_EQ': -164, 'TEXT_MATCH': -164, 'STRICT_AND': -164, 'AND': -164, 'STRICT_OR': -164, 'OR': -164, 'EQUAL': -164, 'NOT_EQUAL': -164, '>': -164, 'FLOAT_MUL': -164, 'FLOAT_DIV': -164, 'FLOAT_SUB': -164, 'FLOAT_SUM': -164, '<': -164, '*': -164, '/': -164, '-': -164, '+': -164, 'CONCAT': -164, 'NEWLINE': -164, '$end': -164, ')': -164, 'OF': -164, 'THEN': -164, ',': -164, ']': -164, 'END': -164, 'ELIF': -164, 'ELSE': -164, 'TYPE_IDENTIFIER': -164, 'IDENTIFIER': -164},
+    243: {'END': -167, 'ELIF': -167, 'ELSE': -167},
+    244: {'END': -170, 'ELIF': -170, 'ELSE': -170},
+    245: {'NEWLINE': 283, 'END': -39, 'ELIF': -39, 'ELSE': -39},
+    246: {'NEWLINE': -40, 'END': -40, 'ELIF': -40, 'ELSE': -40, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    247: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    248: {'}': -210, 'TYPE_IDENTIFIER': 288},
+    249: {'TYPE_IDENTIFIER': -207, '}': -207},
+    250: {'>': -213, ',': 292},
+    251: {')': 293, ',': 294},
+    252: {'NEWLINE': 296, ')': -19, ',': -19},
+    253: {'NEWLINE': -25, ')': -25, ',': -25},
+    254: {'NEWLINE': -26, ')': -26, ',': -26},
+    255: {'(': -279, 'FLOAT_MORE': -279, 'FLOAT_MORE_OR_EQ': -279, 'FLOAT_LESS': -279, 'FLOAT_LESS_OR_EQ': -279, 'SOME_SUB': -279, 'SOME_CONCAT': -279, 'ARROW_BOTH': -279, 'ARROW_RIGHT': -279, 'ARROW_LEFT': -279, 'DOUBLE_ARROW_RIGHT': -279, 'DOUBLE_ARROW_LEFT': -279, 'BIT_SHIFT_LEFT': -279, 'BIT_AND': -279, 'BIT_OR': -279, 'FLOAT_POW': -279, 'POW': -279, 'ARRAY_SUB': -279, 'ARRAY_CONCAT': -279, 'MORE_OR_EQ': -279, 'LESS_OR_EQ': -279, 'TEXT_MATCH': -279, 'STRICT_AND': -279, 'AND': -279, 'STRICT_OR': -279, 'OR': -279, 'EQUAL': -279, 'NOT_EQUAL': -279, '>': -279, 'FLOAT_MUL': -279, 'FLOAT_DIV': -279, 'FLOAT_SUB': -279, 'FLOAT_SUM': -279, '<': -279, '*': -279, '/': -279, '-': -279, '+': -279, 'CONCAT': -279, 'NEWLINE': -279, '$end': -279, ')': -279, 'OF': -279, 'THEN': -279, ',': -279, ']': -279, 'END': -279, 'ELIF': -279, 'ELSE': -279},
+    256: {'MORE_OR_EQ': -302, '>': -201, ',': 303},
+    257: {',': 304},
+    258: {':': 306, ',': -236, 'NEWLINE': -236, ')': -236},
+    259: {'>': 307},
+    260: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    261: {'>': -151, ',': 260},
+    262: {',': -154, '>': -154},
+    263: {')': 310},
+    264: {')': -175, ',': 311},
+    265: {'NEWLINE': 313, ',': -193, ')': -193},
+    266: {'>': 314},
+    267: {'>': -180, ',': 269},
+    268: {',': -183, '>': -183},
+    269: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    270: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    271: {'(': -293, 'DEF': -293, '+': -293, '!': -293, 'STRICT_NOT': -293, '-': -293, 'STRING': -293, 'FLOAT': -293, 'INT': -293, '[': -293, 'TYPE_IDENTIFIER': -293, 'IDENTIFIER': -293, 'CASE': -293, 'IF': -293, 'DO': -293, 'EXTERNAL': -293, 'ENUM': -293},
+    272: {'(': -284, 'FLOAT_MORE': -284, 'FLOAT_MORE_OR_EQ': -284, 'FLOAT_LESS': -284, 'FLOAT_LESS_OR_EQ': -284, 'SOME_SUB': -284, 'SOME_CONCAT': -284, 'ARROW_BOTH': -284, 'ARROW_RIGHT': -284, 'ARROW_LEFT': -284, 'DOUBLE_ARROW_RIGHT': -284, 'DOUBLE_ARROW_LEFT': -284, 'BIT_SHIFT_LEFT': -284, 'BIT_AND': -284, 'BIT_OR': -284, 'FLOAT_POW': -284, 'POW': -284, 'ARRAY_SUB': -284, 'ARRAY_CONCAT': -284, 'MORE_OR_EQ': -284, 'LESS_OR_EQ': -284, 'TEXT_MATCH': -284, 'STRICT_AND': -284, 'AND': -284, 'STRICT_OR': -284, 'OR': -284, 'EQUAL': -284, 'NOT_EQUAL': -284, '>': -284, 'FLOAT_MUL': -284, 'FLOAT_DIV': -284, 'FLOAT_SUB': -284, 'FLOAT_SUM': -284, '<': -284, '*': -284, '/': -284, '-': -284, '+': -284, 'CONCAT': -284, 'NEWLINE': -284, '$end': -284, ')': -284, 'OF': -284, 'THEN': -284, ',': -284, ']': -284, 'END': -284, 'ELIF': -284, 'ELSE': -284},
+    273: {'END': 318},
+    274: {'END': -249, 'TYPE_IDENTIFIER': 278, 'IDENTIFIER': 42},
+    275: {'DO': 45},
+    276: {'DO': -257, 'NEWLINE': -257, ',': -257, ')': -257},
+    277: {'DO': -258, 'NEWLINE': -258, ',': -258, ')': -258},
+    278: {'DO': -260, 'NEWLINE': -260, ',': -260, ')': -260, '(': 321},
+    279: {'DO': -259, 'NEWLINE': -259, ',': -259, ')': -259},
+    280: {'END': -241, 'ELIF': 324, 'ELSE': 325},
+    281: {'NEWLINE': -238, 'ELIF': -238, 'ELSE': -238, 'END': -238, '(': -238, 'DEF': -238, '+': -238, '!': -238, 'STRICT_NOT': -238, '-': -238, 'STRING': -238, 'FLOAT': -238, 'INT': -238, '[': -238, 'TYPE_IDENTIFIER': -238, 'IDENTIFIER': -238, 'CASE': -238, 'IF': -238, 'DO': -238, 'EXTERNAL': -238, 'ENUM': -238},
+    282: {'END': -37, 'ELIF': -37, 'ELSE': -37},
+    283: {'END': -38, 'ELIF': -38, 'ELSE': -38, '(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    284: {'>': -201, ',': 327},
+    285: {'}': 328},
+    286: {'}': -209, 'TYPE_IDENTIFIER': 288},
+    287: {'NEWLINE': 331, 'TYPE_IDENTIFIER': -223, '}': -223},
+    288: {'NEWLINE': -227, 'TYPE_IDENTIFIER': -227, '}': -227, '(': 332},
+    289: {'>': 333},
+    290: {'>': -212, ',': 292},
+    291: {',': -215, '>': -215},
+    292: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    293: {'NEWLINE': -13, '$end': -13},
+    294: {'NEWLINE': 337, 'TYPE_IDENTIFIER': -22, 'IDENTIFIER': -22},
+    295: {')': -17, ',': -17},
+    296: {')': -18, ',': -18},
+    297: {'MORE_OR_EQ': 338},
+    298: {'>': 339},
+    299: {'MORE_OR_EQ': -301, ',': 341},
+    300: {'>': -200, ',': 327},
+    301: {',': -304, 'MORE_OR_EQ': -304},
+    302: {',': -203, '>': -203},
+    303: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    304: {'NEWLINE': 345, 'IDENTIFIER': -145},
+    305: {',': -234, 'NEWLINE': -234, ')': -234},
+    306: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    307: {'(': 347},
+    308: {',': -155, '>': -155},
+    309: {',': -153, '>': -153},
+    310: {':': 349, 'DO': -178},
+    311: {'NEWLINE': 351, 'IDENTIFIER': -196},
+    312: {',': -191, ')': -191},
+    313: {',': -192, ')': -192},
+    314: {'(': 352},
+    315: {',': -182, '>': -182},
+    316: {',': -184, '>': -184},
+    317: {'(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': 354, ',': -296, ']': -296, ')': -296},
+    318: {'(': -246, 'FLOAT_MORE': -246, 'FLOAT_MORE_OR_EQ': -246, 'FLOAT_LESS': -246, 'FLOAT_LESS_OR_EQ': -246, 'SOME_SUB': -246, 'SOME_CONCAT': -246, 'ARROW_BOTH': -246, 'ARROW_RIGHT': -246, 'ARROW_LEFT': -246, 'DOUBLE_ARROW_RIGHT': -246, 'DOUBLE_ARROW_LEFT': -246, 'BIT_SHIFT_LEFT': -246, 'BIT_AND': -246, 'BIT_OR': -246, 'FLOAT_POW': -246, 'POW': -246, 'ARRAY_SUB': -246, 'ARRAY_CONCAT': -246, 'MORE_OR_EQ': -246, 'LESS_OR_EQ': -246, 'TEXT_MATCH': -246, 'STRICT_AND': -246, 'AND': -246, 'STRICT_OR': -246, 'OR': -246, 'EQUAL': -246, 'NOT_EQUAL': -246, '>': -246, 'FLOAT_MUL': -246, 'FLOAT_DIV': -246, 'FLOAT_SUB': -246, 'FLOAT_SUM': -246, '<': -246, '*': -246, '/': -246, '-': -246, '+': -246, 'CONCAT': -246, 'NEWLINE': -246, '$end': -246, ')': -246, 'OF': -246, 'THEN': -246, ',': -246, ']': -246, 'END': -246, 'ELIF': -246, 'ELSE': -246},
+    319: {'DO': 45},
+    320: {'NEWLINE': 357, 'TYPE_IDENTIFIER': -253, 'IDENTIFIER': -253, 'END': -253},
+    321: {'NEWLINE': 359, 'TYPE_IDENTIFIER': -263, 'IDENTIFIER': -263, ')': -263},
+    322: {'END': 360},
+    323: {'END': -240},
+    324: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    325: {'NEWLINE': 215, '(': -169, 'DEF': -169, '+': -169, '!': -169, 'STRICT_NOT': -169, '-': -169, 'STRING': -169, 'FLOAT': -169, 'INT': -169, '[': -169, 'TYPE_IDENTIFIER': -169, 'IDENTIFIER': -169, 'CASE': -169, 'IF': -169, 'DO': -169, 'EXTERNAL': -169, 'ENUM': -169, 'END': -169},
+    326: {'NEWLINE': -41, 'END': -41, 'ELIF': -41, 'ELSE': -41, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    327: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    328: {'(': -206, 'FLOAT_MORE': -206, 'FLOAT_MORE_OR_EQ': -206, 'FLOAT_LESS': -206, 'FLOAT_LESS_OR_EQ': -206, 'SOME_SUB': -206, 'SOME_CONCAT': -206, 'ARROW_BOTH': -206, 'ARROW_RIGHT': -206, 'ARROW_LEFT': -206, 'DOUBLE_ARROW_RIGHT': -206, 'DOUBLE_ARROW_LEFT': -206, 'BIT_SHIFT_LEFT': -206, 'BIT_AND': -206, 'BIT_OR': -206, 'FLOAT_POW': -206, 'POW': -206, 'ARRAY_SUB': -206, 'ARRAY_CONCAT': -206, 'MORE_OR_EQ': -206, 'LESS_OR_EQ': -206, 'TEXT_MATCH': -206, 'STRICT_AND': -206, 'AND': -206, 'STRICT_OR': -206, 'OR': -206, 'EQUAL': -206, 'NOT_EQUAL': -206, '>': -206, 'FLOAT_MUL': -206, 'FLOAT_DIV': -206, 'FLOAT_SUB': -206, 'FLOAT_SUM': -206, '<': -206, '*': -206, '/': -206, '-': -206, '+': -206, 'CONCAT': -206, 'NEWLINE': -206, '$end': -206, ')': -206, 'OF': -206, 'THEN': -206, ',': -206, ']': -206, 'END': -206, 'ELIF': -206, 'ELSE': -206},
+    329: {'NEWLINE': 365, 'TYPE_IDENTIFIER': -226, '}': -226},
+    330: {'TYPE_IDENTIFIER': -221, '}': -221},
+    331: {'TYPE_IDENTIFIER': -222, '}': -222},
+    332: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    333: {'{': 367},
+    334: {',': -214, '>': -214},
+    335: {',': -216, '>': -216},
+    336: {'TYPE_IDENTIFIER': 253, 'IDENTIFIER': 42},
+    337: {'TYPE_IDENTIFIER': -21, 'IDENTIFIER': -21},
+    338: {'(': 11, 'DEF': 33, '+': 34, '!': 35, 'STRICT_NOT': 36, '-': 37, 'STRING': 10, 'FLOAT': 38, 'INT': 39, '[': 40, 'TYPE_IDENTIFIER': 41, 'IDENTIFIER': 42, 'CASE': 43, 'IF': 44, 'DO': 45, 'EXTERNAL': 46, 'ENUM': 47},
+    339: {'=': -199, 'NEWLINE': -199, 'END': -199, '(': -199, 'DEF': -199, '+': -199, '!': -199, 'STRICT_NOT': -199, '-': -199, 'STRING': -199, 'FLOAT': -199, 'INT': -199, '[': -199, 'TYPE_IDENTIFIER': -199, 'IDENTIFIER': -199, 'CASE': -199, 'IF': -199, 'DO': -199, 'EXTERNAL': -199, 'ENUM': -199, ',': -199, 'MORE_OR_EQ': -199, '>': -199, 'ELIF': -199, 'ELSE': -199, ')': -199},
+    340: {',': -303, 'MORE_OR_EQ': -303},
+    341: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    342: {',': -202, '>': -202},
+    343: {',': -305, 'MORE_OR_EQ': -305, '>': -204},
+    344: {'IDENTIFIER': 42},
+    345: {'IDENTIFIER': -144},
+    346: {',': -235, 'NEWLINE': -235, ')': -235},
+    347: {'NEWLINE': 373, 'IDENTIFIER': -157},
+    348: {'DO': 45},
+    349: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    350: {'IDENTIFIER': 42},
+    351: {'IDENTIFIER': -195},
+    352: {'NEWLINE': 378, 'IDENTIFIER': -186, ')': -186},
+    353: {',': -292, ']': -292, ')': -292},
+    354: {',': -295, ']': -295, ')': -295},
+    355: {'NEWLINE': 380, 'TYPE_IDENTIFIER': -256, 'IDENTIFIER': -256, 'END': -256},
+    356: {'TYPE_IDENTIFIER': -251, 'IDENTIFIER': -251, 'END': -251},
+    357: {'TYPE_IDENTIFIER': -252, 'IDENTIFIER': -252, 'END': -252},
+    358: {')': -265, 'TYPE_IDENTIFIER': 278, 'IDENTIFIER': 42},
+    359: {'TYPE_IDENTIFIER': -262, 'IDENTIFIER': -262, ')': -262},
+    360: {'(': -237, 'FLOAT_MORE': -237, 'FLOAT_MORE_OR_EQ': -237, 'FLOAT_LESS': -237, 'FLOAT_LESS_OR_EQ': -237, 'SOME_SUB': -237, 'SOME_CONCAT': -237, 'ARROW_BOTH': -237, 'ARROW_RIGHT': -237, 'ARROW_LEFT': -237, 'DOUBLE_ARROW_RIGHT': -237, 'DOUBLE_ARROW_LEFT': -237, 'BIT_SHIFT_LEFT': -237, 'BIT_AND': -237, 'BIT_OR': -237, 'FLOAT_POW': -237, 'POW': -237, 'ARRAY_SUB': -237, 'ARRAY_CONCAT': -237, 'MORE_OR_EQ': -237, 'LESS_OR_EQ': -237, 'TEXT_MATCH': -237, 'STRICT_AND': -237, 'AND': -237, 'STRICT_OR': -237, 'OR': -237, 'EQUAL': -237, 'NOT_EQUAL': -237, '>': -237, 'FLOAT_MUL': -237, 'FLOAT_DIV': -237, 'FLOAT_SUB': -237, 'FLOAT_SUM': -237, '<': -237, '*': -237, '/': -237, '-': -237, '+': -237, 'CONCAT': -237, 'NEWLINE': -237, '$end': -237, ')': -237, 'OF': -237, 'THEN': -237, ',': -237, ']': -237, 'END': -237, 'ELIF': -237, 'ELSE': -237},
+    361: {'THEN': 384, '(': 59, 'FLOAT_MORE': 60, 'FLOAT_MORE_OR_EQ': 61, 'FLOAT_LESS': 62, 'FLOAT_LESS_OR_EQ': 63, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': 72, 'BIT_OR': 73, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': 78, 'LESS_OR_EQ': 79, 'TEXT_MATCH': 80, 'STRICT_AND': 81, 'AND': 82, 'STRICT_OR': 83, 'OR': 84, 'EQUAL': 85, 'NOT_EQUAL': 86, '>': 87, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': 92, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97},
+    362: {'END': -245},
+    363: {',': -204, '>': -204},
+    364: {'TYPE_IDENTIFIER': -224, '}': -224},
+    365: {'TYPE_IDENTIFIER': -225, '}': -225},
+    366: {')': -230, ',': 388},
+    367: {'NEWLINE': 390, 'TYPE_IDENTIFIER': -218, '}': -218},
+    368: {'NEWLINE': 392, ')': -24, ',': -24},
+    369: {'(': 59, 'FLOAT_MORE': -300, 'FLOAT_MORE_OR_EQ': -300, 'FLOAT_LESS': -300, 'FLOAT_LESS_OR_EQ': -300, 'SOME_SUB': 64, 'SOME_CONCAT': 65, 'ARROW_BOTH': 66, 'ARROW_RIGHT': 67, 'ARROW_LEFT': 68, 'DOUBLE_ARROW_RIGHT': 69, 'DOUBLE_ARROW_LEFT': 70, 'BIT_SHIFT_LEFT': 71, 'BIT_AND': -300, 'BIT_OR': -300, 'FLOAT_POW': 74, 'POW': 75, 'ARRAY_SUB': 76, 'ARRAY_CONCAT': 77, 'MORE_OR_EQ': -300, 'LESS_OR_EQ': -300, 'TEXT_MATCH': -300, 'STRICT_AND': -300, 'AND': -300, 'STRICT_OR': -300, 'OR': -300, 'EQUAL': -300, 'NOT_EQUAL': -300, '>': -300, 'FLOAT_MUL': 88, 'FLOAT_DIV': 89, 'FLOAT_SUB': 90, 'FLOAT_SUM': 91, '<': -300, '*': 93, '/': 94, '-': 95, '+': 96, 'CONCAT': 97, 'NEWLINE': -300, '$end': -300, ')': -300, 'OF': -300, 'THEN': -300, ',': -300, ']': -300, 'END': -300, 'ELIF': -300, 'ELSE': -300},
+    370: {',': -305, 'MORE_OR_EQ': -305},
+    371: {'NEWLINE': 394, ')': -147},
+    372: {'IDENTIFIER': 42},
+    373: {'IDENTIFIER': -156},
+    374: {'(': -172, 'FLOAT_MORE': -172, 'FLOAT_MORE_OR_EQ': -172, 'FLOAT_LESS': -172, 'FLOAT_LESS_OR_EQ': -172, 'SOME_SUB': -172, 'SOME_CONCAT': -172, 'ARROW_BOTH': -172, 'ARROW_RIGHT': -172, 'ARROW_LEFT': -172, 'DOUBLE_ARROW_RIGHT': -172, 'DOUBLE_ARROW_LEFT': -172, 'BIT_SHIFT_LEFT': -172, 'BIT_AND': -172, 'BIT_OR': -172, 'FLOAT_POW': -172, 'POW': -172, 'ARRAY_SUB': -172, 'ARRAY_CONCAT': -172, 'MORE_OR_EQ': -172, 'LESS_OR_EQ': -172, 'TEXT_MATCH': -172, 'STRICT_AND': -172, 'AND': -172, 'STRICT_OR': -172, 'OR': -172, 'EQUAL': -172, 'NOT_EQUAL': -172, '>': -172, 'FLOAT_MUL': -172, 'FLOAT_DIV': -172, 'FLOAT_SUB': -172, 'FLOAT_SUM': -172, '<': -172, '*': -172, '/': -172, '-': -172, '+': -172, 'CONCAT': -172, 'NEWLINE': -172, '$end': -172, ')': -172, 'OF': -172, 'THEN': -172, ',': -172, ']': -172, 'END': -172, 'ELIF': -172, 'ELSE': -172},
+    375: {'DO': -177},
+    376: {'NEWLINE': 397, ',': -198, ')': -198},
+    377: {')': -188, 'IDENTIFIER': 42},
+    378: {'IDENTIFIER': -185, ')': -185},
+    379: {'TYPE_IDENTIFIER': -254, 'IDENTIFIER': -254, 'END': -254},
+    380: {'TYPE_IDENTIFIER': -255, 'IDENTIFIER': -255, 'END': -255},
+    381: {')': 400},
+    382: {')': -264, ',': 401},
+    383: {'NEWLINE': 403, ',': -268, ')': -268},
+    384: {'NEWLINE': 215, '(': -169, 'DEF': -169, '+': -169, '!': -169, 'STRICT_NOT': -169, '-': -169, 'STRING': -169, 'FLOAT': -169, 'INT': -169, '[': -169, 'TYPE_IDENTIFIER': -169, 'IDENTIFIER': -169, 'CASE': -169, 'IF': -169, 'DO': -169, 'EXTERNAL': -169, 'ENUM': -169, 'ELIF': -169, 'ELSE': -169, 'END': -169},
+    385: {')': 405},
+    386: {')': -229, ',': 388},
+    387: {',': -232, ')': -232},
+    388: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    389: {'}': -220, 'TYPE_IDENTIFIER': 288},
+    390: {'TYPE_IDENTIFIER': -217, '}': -217},
+    391: {')': -20, ',': -20},
+    392: {')': -23, ',': -23},
+    393: {')': 410},
+    394: {')': -146},
+    395: {',': 411},
+    396: {',': -194, ')': -194},
+    397: {',': -197, ')': -197},
+    398: {')': 412},
+    399: {')': -187, ',': 311},
+    400: {'DO': -261, 'NEWLINE': -261, ',': -261, ')': -261},
+    401: {'NEWLINE': 414, 'TYPE_IDENTIFIER': -271, 'IDENTIFIER': -271},
+    402: {',': -266, ')': -266},
+    403: {',': -267, ')': -267},
+    404: {'END': -244, 'ELIF': 324, 'ELSE': 325},
+    405: {'NEWLINE': -228, 'TYPE_IDENTIFIER': -228, '}': -228},
+    406: {',': -231, ')': -231},
+    407: {',': -233, ')': -233},
+    408: {'}': 417},
+    409: {'}': -219, 'TYPE_IDENTIFIER': 288},
+    410: {':': 419, 'DO': -149},
+    411: {'NEWLINE': 421, 'IDENTIFIER': -159},
+    412: {':': 423, 'DO': -190},
+    413: {'TYPE_IDENTIFIER': 278, 'IDENTIFIER': 42},
+    414: {'TYPE_IDENTIFIER': -270, 'IDENTIFIER': -270},
+    415: {'END': -242},
+    416: {'END': -243},
+    417: {'(': -211, 'FLOAT_MORE': -211, 'FLOAT_MORE_OR_EQ': -211, 'FLOAT_LESS': -211, 'FLOAT_LESS_OR_EQ': -211, 'SOME_SUB': -211, 'SOME_CONCAT': -211, 'ARROW_BOTH': -211, 'ARROW_RIGHT': -211, 'ARROW_LEFT': -211, 'DOUBLE_ARROW_RIGHT': -211, 'DOUBLE_ARROW_LEFT': -211, 'BIT_SHIFT_LEFT': -211, 'BIT_AND': -211, 'BIT_OR': -211, 'FLOAT_POW': -211, 'POW': -211, 'ARRAY_SUB': -211, 'ARRAY_CONCAT': -211, 'MORE_OR_EQ': -211, 'LESS_OR_EQ': -211, 'TEXT_MATCH': -211, 'STRICT_AND': -211, 'AND': -211, 'STRICT_OR': -211, 'OR': -211, 'EQUAL': -211, 'NOT_EQUAL': -211, '>': -211, 'FLOAT_MUL': -211, 'FLOAT_DIV': -211, 'FLOAT_SUB': -211, 'FLOAT_SUM': -211, '<': -211, '*': -211, '/': -211, '-': -211, '+': -211, 'CONCAT': -211, 'NEWLINE': -211, '$end': -211, ')': -211, 'OF': -211, 'THEN': -211, ',': -211, ']': -211, 'END': -211, 'ELIF': -211, 'ELSE': -211},
+    418: {'DO': 45},
+    419: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    420: {'IDENTIFIER': 42},
+    421: {'IDENTIFIER': -158},
+    422: {'DO': 45},
+    423: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    424: {'NEWLINE': 431, ',': -273, ')': -273},
+    425: {'(': -141, 'FLOAT_MORE': -141, 'FLOAT_MORE_OR_EQ': -141, 'FLOAT_LESS': -141, 'FLOAT_LESS_OR_EQ': -141, 'SOME_SUB': -141, 'SOME_CONCAT': -141, 'ARROW_BOTH': -141, 'ARROW_RIGHT': -141, 'ARROW_LEFT': -141, 'DOUBLE_ARROW_RIGHT': -141, 'DOUBLE_ARROW_LEFT': -141, 'BIT_SHIFT_LEFT': -141, 'BIT_AND': -141, 'BIT_OR': -141, 'FLOAT_POW': -141, 'POW': -141, 'ARRAY_SUB': -141, 'ARRAY_CONCAT': -141, 'MORE_OR_EQ': -141, 'LESS_OR_EQ': -141, 'TEXT_MATCH': -141, 'STRICT_AND': -141, 'AND': -141, 'STRICT_OR': -141, 'OR': -141, 'EQUAL': -141, 'NOT_EQUAL': -141, '>': -141, 'FLOAT_MUL': -141, 'FLOAT_DIV': -141, 'FLOAT_SUB': -141, 'FLOAT_SUM': -141, '<': -141, '*': -141, '/': -141, '-': -141, '+': -141, 'CONCAT': -141, 'NEWLINE': -141, '$end': -141, ')': -141, 'OF': -141, 'THEN': -141, ',': -141, ']': -141, 'END': -141, 'ELIF': -141, 'ELSE': -141},
+    426: {'DO': -148},
+    427: {'NEWLINE': 433, ')': -161},
+    428: {'(': -179, 'FLOAT_MORE': -179, 'FLOAT_MORE_OR_EQ': -179, 'FLOAT_LESS': -179, 'FLOAT_LESS_OR_EQ': -179, 'SOME_SUB': -179, 'SOME_CONCAT': -179, 'ARROW_BOTH': -179, 'ARROW_RIGHT': -179, 'ARROW_LEFT': -179, 'DOUBLE_ARROW_RIGHT': -179, 'DOUBLE_ARROW_LEFT': -179, 'BIT_SHIFT_LEFT': -179, 'BIT_AND': -179, 'BIT_OR': -179, 'FLOAT_POW': -179, 'POW': -179, 'ARRAY_SUB': -179, 'ARRAY_CONCAT': -179, 'MORE_OR_EQ': -179, 'LESS_OR_EQ': -179, 'TEXT_MATCH': -179, 'STRICT_AND': -179, 'AND': -179, 'STRICT_OR': -179, 'OR': -179, 'EQUAL': -179, 'NOT_EQUAL': -179, '>': -179, 'FLOAT_MUL': -179, 'FLOAT_DIV': -179, 'FLOAT_SUB': -179, 'FLOAT_SUM': -179, '<': -179, '*': -179, '/': -179, '-': -179, '+': -179, 'CONCAT': -179, 'NEWLINE': -179, '$end': -179, ')': -179, 'OF': -179, 'THEN': -179, ',': -179, ']': -179, 'END': -179, 'ELIF': -179, 'ELSE': -179},
+    429: {'DO': -189},
+    430: {',': -269, ')': -269},
+    431: {',': -272, ')': -272},
+    432: {')': 434},
+    433: {')': -160},
+    434: {':': 436, 'DO': -163},
+    435: {'DO': 45},
+    436: {'IDENTIFIER': 152, 'TYPE_IDENTIFIER': 153},
+    437: {'(': -150, 'FLOAT_MORE': -150, 'FLOAT_MORE_OR_EQ': -150, 'FLOAT_LESS': -150, 'FLOAT_LESS_OR_EQ': -150, 'SOME_SUB': -150, 'SOME_CONCAT': -150, 'ARROW_BOTH': -150, 'ARROW_RIGHT': -150, 'ARROW_LEFT': -150, 'DOUBLE_ARROW_RIGHT': -150, 'DOUBLE_ARROW_LEFT': -150, 'BIT_SHIFT_LEFT': -150, 'BIT_AND': -150, 'BIT_OR': -150, 'FLOAT_POW': -150, 'POW': -150, 'ARRAY_SUB': -150, 'ARRAY_CONCAT': -150, 'MORE_OR_EQ': -150, 'LESS_OR_EQ': -150, 'TEXT_MATCH': -150, 'STRICT_AND': -150, 'AND': -150, 'STRICT_OR': -150, 'OR': -150, 'EQUAL': -150, 'NOT_EQUAL': -150, '>': -150, 'FLOAT_MUL': -150, 'FLOAT_DIV': -150, 'FLOAT_SUB': -150, 'FLOAT_SUM': -150, '<': -150, '*': -150, '/': -150, '-': -150, '+': -150, 'CONCAT': -150, 'NEWLINE': -150, '$end': -150, ')': -150, 'OF': -150, 'THEN': -150, ',': -150, ']': -150, 'END': -150, 'ELIF': -150, 'ELSE': -150},
+    438: {'DO': -162},
+}
+lr_goto = {
+    0: {'program': 1, '_1_optional': 2},
+    1: {},
+    2: {'module': 4, 'imports': 5, 'top_items': 6, '_3_optional': 7, 'import_': 8, 'top_exprs': 12, 'top_expr': 13, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'do': 31, 'external': 32},
+    3: {},
+    4: {},
+    5: {'_2_optional': 49},
+    6: {},
+    7: {},
+    8: {},
+    9: {},
+    10: {},
+    11: {'expr': 51, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    12: {'_8_optional': 52},
+    13: {},
+    14: {'enum': 54, 'let': 55, 'binary_op_def': 56, 'def_expr': 57, 'identifier': 58},
+    15: {},
+    16: {},
+    17: {},
+    18: {},
+    19: {},
+    20: {},
+    21: {},
+    22: {},
+    23: {},
+    24: {},
+    25: {},
+    26: {'_64_optional': 99},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {},
+    32: {},
+    33: {'binary_op': 100, 'identifier': 103},
+    34: {'expr': 140, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    35: {'expr': 141, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    36: {'expr': 142, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    37: {'expr': 143, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    38: {},
+    39: {},
+    40: {'_54_optional': 144},
+    41: {},
+    42: {},
+    43: {'expr': 147, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    44: {'expr': 148, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    45: {'_19_optional': 149},
+    46: {},
+    47: {'type_identifier': 151},
+    48: {'top_items': 154, 'import_': 155, 'top_exprs': 12, 'top_expr': 13, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'do': 31, 'external': 32},
+    49: {},
+    50: {},
+    51: {},
+    52: {},
+    53: {'top_expr': 158, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'do': 31, 'external': 32},
+    54: {},
+    55: {},
+    56: {},
+    57: {},
+    58: {'_64_optional': 99},
+    59: {'_56_optional': 159},
+    60: {'expr': 161, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    61: {'expr': 162, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    62: {'expr': 163, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    63: {'expr': 164, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    64: {'expr': 165, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    65: {'expr': 166, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    66: {'expr': 167, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    67: {'expr': 168, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    68: {'expr': 169, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    69: {'expr': 170, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    70: {'expr': 171, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    71: {'expr': 172, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    72: {'expr': 173, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    73: {'expr': 174, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    74: {'expr': 175, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    75: {'expr': 176, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    76: {'expr': 177, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    77: {'expr': 178, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    78: {'expr': 179, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    79: {'expr': 180, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    80: {'expr': 181, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    81: {'expr': 182, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    82: {'expr': 183, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    83: {'expr': 184, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    84: {'expr': 185, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    85: {'expr': 186, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    86: {'expr': 187, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    87: {'expr': 188, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    88: {'expr': 189, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    89: {'expr': 190, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    90: {'expr': 191, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    91: {'expr': 192, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    92: {'expr': 193, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    93: {'expr': 194, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    94: {'expr': 195, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    95: {'expr': 196, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    96: {'expr': 197, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    97: {'expr': 198, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    98: {'type_identifier': 199, 'type': 200},
+    99: {},
+    100: {},
+    101: {},
+    102: {},
+    103: {},
+    104: {},
+    105: {},
+    106: {},
+    107: {},
+    108: {},
+    109: {},
+    110: {},
+    111: {},
+    112: {},
+    113: {},
+    114: {},
+    115: {},
+    116: {},
+    117: {},
+    118: {},
+    119: {},
+    120: {},
+    121: {},
+    122: {},
+    123: {},
+    124: {},
+    125: {},
+    126: {},
+    127: {},
+    128: {},
+    129: {},
+    130: {},
+    131: {},
+    132: {},
+    133: {},
+    134: {},
+    135: {},
+    136: {},
+    137: {},
+    138: {},
+    139: {},
+    140: {},
+    141: {},
+    142: {},
+    143: {},
+    144: {'_55_optional': 206, 'exprs': 207, 'expr': 208, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    145: {},
+    146: {'_58_optional': 209},
+    147: {},
+    148: {},
+    149: {'block_statement': 213, '_20_optional': 214},
+    150: {'type': 216, 'type_identifier': 217},
+    151: {},
+    152: {},
+    153: {},
+    154: {},
+    155: {},
+    156: {'_4_optional': 220},
+    157: {},
+    158: {},
+    159: {'expr': 208, '_57_optional': 222, 'exprs': 223, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    160: {},
+    161: {},
+    162: {},
+    163: {},
+    164: {},
+    165: {},
+    166: {},
+    167: {},
+    168: {},
+    169: {},
+    170: {},
+    171: {},
+    172: {},
+    173: {},
+    174: {},
+    175: {},
+    176: {},
+    177: {},
+    178: {},
+    179: {},
+    180: {},
+    181: {},
+    182: {},
+    183: {},
+    184: {},
+    185: {},
+    186: {},
+    187: {},
+    188: {},
+    189: {},
+    190: {},
+    191: {},
+    192: {},
+    193: {},
+    194: {},
+    195: {},
+    196: {},
+    197: {},
+    198: {},
+    199: {},
+    200: {},
+    201: {'identifier': 26, 'expr': 225, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    202: {'_10_optional': 226},
+    203: {'type_identifier': 228},
+    204: {'_22_optional': 229},
+    205: {'type_identifier': 231},
+    206: {},
+    207: {},
+    208: {'_60_optional': 234},
+    209: {'_59_optional': 236, 'exprs': 237, 'expr': 208, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    210: {},
+    211: {'_45_optional': 238},
+    212: {'_42_optional': 240},
+    213: {},
+    214: {'_21_optional': 243, 'block_exprs': 244, 'do_exprs': 245, 'expr': 246, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    215: {},
+    216: {},
+    217: {},
+    218: {'_33_optional': 248},
+    219: {'type_identifier': 250},
+    220: {'import_names': 251, 'import_name': 252, 'identifier': 254},
+    221: {},
+    222: {},
+    223: {},
+    224: {'type_identifier': 217, 'type': 256},
+    225: {},
+    226: {'param': 257, 'identifier': 258},
+    227: {},
+    228: {'_14_repeat': 259, '_14_items': 261, '_14_item': 262},
+    229: {'identifier': 258, '_23_optional': 263, 'params': 264, 'param': 265},
+    230: {},
+    231: {'_25_repeat': 266, '_25_items': 267, '_25_item': 268},
+    232: {},
+    233: {'_61_optional': 270},
+    234: {},
+    235: {},
+    236: {},
+    237: {},
+    238: {'_46_optional': 273, 'cases': 274, 'pattern': 275, 'match_variant': 276, 'match_as': 277, 'identifier': 279},
+    239: {},
+    240: {'block_statement': 280, '_20_optional': 214},
+    241: {'type': 281, 'type_identifier': 217},
+    242: {},
+    243: {},
+    244: {},
+    245: {'_9_optional': 282},
+    246: {},
+    247: {'type_identifier': 217, 'type': 284},
+    248: {'_34_optional': 285, 'variants': 286, 'variant': 287},
+    249: {},
+    250: {'_35_repeat': 289, '_35_items': 290, '_35_item': 291},
+    251: {},
+    252: {'_5_optional': 295},
+    253: {},
+    254: {},
+    255: {},
+    256: {'_63_repeat': 297, '_32_repeat': 298, '_63_items': 299, '_32_items': 300, '_63_item': 301, '_32_item': 302},
+    257: {},
+    258: {'_41_optional': 305},
+    259: {},
+    260: {'type_identifier': 308},
+    261: {'_14_item': 309},
+    262: {},
+    263: {},
+    264: {},
+    265: {'_29_optional': 312},
+    266: {},
+    267: {'_25_item': 315},
+    268: {},
+    269: {'type_identifier': 316},
+    270: {'expr': 317, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    271: {},
+    272: {},
+    273: {},
+    274: {'pattern': 319, 'match_variant': 276, 'match_as': 277, 'identifier': 279},
+    275: {'do': 320},
+    276: {},
+    277: {},
+    278: {},
+    279: {},
+    280: {'_43_optional': 322, 'or_else': 323},
+    281: {},
+    282: {},
+    283: {'expr': 326, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    284: {'_32_repeat': 298, '_32_items': 300, '_32_item': 302},
+    285: {},
+    286: {'variant': 329},
+    287: {'_38_optional': 330},
+    288: {},
+    289: {},
+    290: {'_35_item': 334},
+    291: {},
+    292: {'type_identifier': 335},
+    293: {},
+    294: {'_6_optional': 336},
+    295: {},
+    296: {},
+    297: {},
+    298: {},
+    299: {'_63_item': 340},
+    300: {'_32_item': 342},
+    301: {},
+    302: {},
+    303: {'type': 343, 'type_identifier': 217},
+    304: {'_11_optional': 344},
+    305: {},
+    306: {'type': 346, 'type_identifier': 217},
+    307: {},
+    308: {},
+    309: {},
+    310: {'_24_optional': 348},
+    311: {'_30_optional': 350},
+    312: {},
+    313: {},
+    314: {},
+    315: {},
+    316: {},
+    317: {'_62_optional': 353},
+    318: {},
+    319: {'do': 355},
+    320: {'_47_optional': 356},
+    321: {'_49_optional': 358},
+    322: {},
+    323: {},
+    324: {'expr': 361, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'identifier': 26, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    325: {'block_statement': 362, '_20_optional': 214},
+    326: {},
+    327: {'type': 363, 'type_identifier': 217},
+    328: {},
+    329: {'_39_optional': 364},
+    330: {},
+    331: {},
+    332: {'type': 366, 'type_identifier': 217},
+    333: {},
+    334: {},
+    335: {},
+    336: {'import_name': 368, 'identifier': 254},
+    337: {},
+    338: {'identifier': 26, 'expr': 369, 'binary_op_def': 17, 'unary_expr': 20, 'str_literal': 21, 'float_literal': 22, 'int_literal': 23, 'array': 24, 'variant_call': 25, 'let': 16, 'call': 27, 'case_of': 28, 'binary_expr': 29, 'if_expr': 30, 'def_expr': 18, 'do': 31, 'external': 32, 'enum': 15},
+    339: {},
+    340: {},
+    341: {'type': 370, 'type_identifier': 217},
+    342: {},
+    343: {},
+    344: {'param': 371, 'identifier': 258},
+    345: {},
+    346: {},
+    347: {'_15_optional': 372},
+    348: {'do': 374},
+    349: {'type': 375, 'type_identifier': 217},
+    350: {'param': 376, 'identifier': 258},
+    351: {},
+    352: {'_26_optional': 377},
+    353: {},
+    354: {},
+    355: {'_48_optional': 379},
+    356: {},
+    357: {},
+    358: {'_50_optional': 381, 'patterns': 382, 'pattern': 383, 'match_variant': 276, 'match_as': 277, 'identifier': 279},
+    359: {},
+    360: {},
+    361: {},
+    362: {},
+    363: {},
+    364: {},
+    365: {},
+    366: {'_40_repeat': 385, '_40_items': 386, '_40_item': 387},
+    367: {'_36_optional': 389},
+    368: {'_7_optional': 391},
+    369: {},
+    370: {},
+    371: {'_12_optional': 393},
+    372: {'param': 395, 'identifier': 258},
+    373: {},
+    374: {},
+    375: {},
+    376: {'_31_optional': 396},
+    377: {'identifier': 258, '_27_optional': 398, 'params': 399, 'param': 265},
+    378: {},
+    379: {},
+    380: {},
+    381: {},
+    382: {},
+    383: {'_51_optional': 402},
+    384: {'block_statement': 404, '_20_optional': 214},
+    385: {},
+    386: {'_40_item': 406},
+    387: {},
+    388: {'type': 407, 'type_identifier': 217},
+    389: {'_37_optional': 408, 'variants': 409, 'variant': 287},
+    390: {},
+    391: {},
+    392: {},
+    393: {},
+    394: {},
+    395: {},
+    396: {},
+    397: {},
+    398: {},
+    399: {},
+    400: {},
+    401: {'_52_optional': 413},
+    402: {},
+    403: {},
+    404: {'_44_optional': 415, 'or_else': 416},
+    405: {},
+    406: {},
+    407: {},
+    408: {},
+    409: {'variant': 329},
+    410: {'_13_optional': 418},
+    411: {'_16_optional': 420},
+    412: {'_28_optional': 422},
+    413: {'pattern': 424, 'match_variant': 276, 'match_as': 277, 'identifier': 279},
+    414: {},
+    415: {},
+    416: {},
+    417: {},
+    418: {'do': 425},
+    419: {'type': 426, 'type_identifier': 217},
+    420: {'param': 427, 'identifier': 258},
+    421: {},
+    422: {'do': 428},
+    423: {'type': 429, 'type_identifier': 217},
+    424: {'_53_optional': 430},
+    425: {},
+    426: {},
+    427: {'_17_optional': 432},
+    428: {},
+    429: {},
+    430: {},
+    431: {},
+    432: {},
+    433: {},
+    434: {'_18_optional': 435},
+    435: {'do': 437},
+    436: {'type': 438, 'type_identifier': 217},
+    437: {},
+    438: {},
+}
+defaulted_states = {
+    4: -1,
+    6: -9,
+    7: -8,
+    49: -5,
+    52: -27,
+    154: -4,
+    200: -307,
+    227: -142,
+    323: -240,
+    345: -144,
+    351: -195,
+    362: -245,
+    373: -156,
+    375: -177,
+    394: -146,
+    415: -242,
+    416: -243,
+    421: -158,
+    426: -148,
+    429: -189,
+    433: -160,
+    438: -162,
+}
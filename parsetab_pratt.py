@@ -0,0 +1,1062 @@
+# generated by parser.py from the PrattParser grammar, do not edit
+checksum = '32321f3895c2e9795707a07fe22dd532d0d2983bdf7ef6653809797c680c85dc'
+lr_action = {
+    0: {'NEWLINE': 3, 'IMPORT': -3, 'EXPORT': -3, '(': -3, 'IDENTIFIER': -3, 'DEF': -3, '+': -3, '!': -3, 'STRICT_NOT': -3, '-': -3, 'STRING': -3, 'FLOAT': -3, 'INT': -3, '[': -3, 'TYPE_IDENTIFIER': -3, 'CASE': -3, 'IF': -3, 'DO': -3, 'EXTERNAL': -3, 'ENUM': -3, '$end': -3},
+    1: {'$end': 0},
+    2: {'$end': -10, 'IMPORT': 9, 'EXPORT': 14, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    3: {'IMPORT': -2, 'EXPORT': -2, '(': -2, 'IDENTIFIER': -2, 'DEF': -2, '+': -2, '!': -2, 'STRICT_NOT': -2, '-': -2, 'STRING': -2, 'FLOAT': -2, 'INT': -2, '[': -2, 'TYPE_IDENTIFIER': -2, 'CASE': -2, 'IF': -2, 'DO': -2, 'EXTERNAL': -2, 'ENUM': -2, '$end': -2},
+    4: {'$end': -1},
+    5: {'NEWLINE': 49, '$end': -7},
+    6: {'$end': -9},
+    7: {'$end': -8},
+    8: {'NEWLINE': -11, '$end': -11},
+    9: {'STRING': 51},
+    10: {'CONCAT': -257, '+': -257, '-': -257, '/': -257, '*': -257, '<': -257, 'FLOAT_SUM': -257, 'FLOAT_SUB': -257, 'FLOAT_DIV': -257, 'FLOAT_MUL': -257, '>': -257, 'NOT_EQUAL': -257, 'EQUAL': -257, 'OR': -257, 'STRICT_OR': -257, 'AND': -257, 'STRICT_AND': -257, 'TEXT_MATCH': -257, 'LESS_OR_EQ': -257, 'MORE_OR_EQ': -257, 'ARRAY_CONCAT': -257, 'ARRAY_SUB': -257, 'POW': -257, 'FLOAT_POW': -257, 'BIT_OR': -257, 'BIT_AND': -257, 'BIT_SHIFT_LEFT': -257, 'DOUBLE_ARROW_LEFT': -257, 'DOUBLE_ARROW_RIGHT': -257, 'ARROW_LEFT': -257, 'ARROW_RIGHT': -257, 'ARROW_BOTH': -257, 'SOME_CONCAT': -257, 'SOME_SUB': -257, 'FLOAT_LESS_OR_EQ': -257, 'FLOAT_LESS': -257, 'FLOAT_MORE_OR_EQ': -257, 'FLOAT_MORE': -257, '(': -257, 'NEWLINE': -257, '$end': -257, ')': -257, 'OF': -257, 'THEN': -257, ',': -257, ']': -257, 'END': -257, 'ELIF': -257, 'ELSE': -257},
+    11: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    12: {'NEWLINE': 54, '$end': -29},
+    13: {'NEWLINE': -30, '$end': -30},
+    14: {'ENUM': 48, 'DEF': 36, 'IDENTIFIER': 59},
+    15: {'CONCAT': -350, '+': -350, '-': -350, '/': -350, '*': -350, '<': -350, 'FLOAT_SUM': -350, 'FLOAT_SUB': -350, 'FLOAT_DIV': -350, 'FLOAT_MUL': -350, '>': -350, 'NOT_EQUAL': -350, 'EQUAL': -350, 'OR': -350, 'STRICT_OR': -350, 'AND': -350, 'STRICT_AND': -350, 'TEXT_MATCH': -350, 'LESS_OR_EQ': -350, 'MORE_OR_EQ': -350, 'ARRAY_CONCAT': -350, 'ARRAY_SUB': -350, 'POW': -350, 'FLOAT_POW': -350, 'BIT_OR': -350, 'BIT_AND': -350, 'BIT_SHIFT_LEFT': -350, 'DOUBLE_ARROW_LEFT': -350, 'DOUBLE_ARROW_RIGHT': -350, 'ARROW_LEFT': -350, 'ARROW_RIGHT': -350, 'ARROW_BOTH': -350, 'SOME_CONCAT': -350, 'SOME_SUB': -350, 'FLOAT_LESS_OR_EQ': -350, 'FLOAT_LESS': -350, 'FLOAT_MORE_OR_EQ': -350, 'FLOAT_MORE': -350, '(': -350, 'NEWLINE': -350, '$end': -350, ')': -350, 'OF': -350, 'THEN': -350, ',': -350, ']': -350, 'END': -350, 'ELIF': -350, 'ELSE': -350},
+    16: {'CONCAT': -343, '+': -343, '-': -343, '/': -343, '*': -343, '<': -343, 'FLOAT_SUM': -343, 'FLOAT_SUB': -343, 'FLOAT_DIV': -343, 'FLOAT_MUL': -343, '>': -343, 'NOT_EQUAL': -343, 'EQUAL': -343, 'OR': -343, 'STRICT_OR': -343, 'AND': -343, 'STRICT_AND': -343, 'TEXT_MATCH': -343, 'LESS_OR_EQ': -343, 'MORE_OR_EQ': -343, 'ARRAY_CONCAT': -343, 'ARRAY_SUB': -343, 'POW': -343, 'FLOAT_POW': -343, 'BIT_OR': -343, 'BIT_AND': -343, 'BIT_SHIFT_LEFT': -343, 'DOUBLE_ARROW_LEFT': -343, 'DOUBLE_ARROW_RIGHT': -343, 'ARROW_LEFT': -343, 'ARROW_RIGHT': -343, 'ARROW_BOTH': -343, 'SOME_CONCAT': -343, 'SOME_SUB': -343, 'FLOAT_LESS_OR_EQ': -343, 'FLOAT_LESS': -343, 'FLOAT_MORE_OR_EQ': -343, 'FLOAT_MORE': -343, '(': -343, 'NEWLINE': -343, '$end': -343, ')': -343, 'OF': -343, 'THEN': -343, ',': -343, ']': -343, 'END': -343, 'ELIF': -343, 'ELSE': -343},
+    17: {'CONCAT': -336, '+': -336, '-': -336, '/': -336, '*': -336, '<': -336, 'FLOAT_SUM': -336, 'FLOAT_SUB': -336, 'FLOAT_DIV': -336, 'FLOAT_MUL': -336, '>': -336, 'NOT_EQUAL': -336, 'EQUAL': -336, 'OR': -336, 'STRICT_OR': -336, 'AND': -336, 'STRICT_AND': -336, 'TEXT_MATCH': -336, 'LESS_OR_EQ': -336, 'MORE_OR_EQ': -336, 'ARRAY_CONCAT': -336, 'ARRAY_SUB': -336, 'POW': -336, 'FLOAT_POW': -336, 'BIT_OR': -336, 'BIT_AND': -336, 'BIT_SHIFT_LEFT': -336, 'DOUBLE_ARROW_LEFT': -336, 'DOUBLE_ARROW_RIGHT': -336, 'ARROW_LEFT': -336, 'ARROW_RIGHT': -336, 'ARROW_BOTH': -336, 'SOME_CONCAT': -336, 'SOME_SUB': -336, 'FLOAT_LESS_OR_EQ': -336, 'FLOAT_LESS': -336, 'FLOAT_MORE_OR_EQ': -336, 'FLOAT_MORE': -336, '(': -336, 'NEWLINE': -336, '$end': -336, ')': -336, 'OF': -336, 'THEN': -336, ',': -336, ']': -336, 'END': -336, 'ELIF': -336, 'ELSE': -336},
+    18: {'CONCAT': -347, '+': -347, '-': -347, '/': -347, '*': -347, '<': -347, 'FLOAT_SUM': -347, 'FLOAT_SUB': -347, 'FLOAT_DIV': -347, 'FLOAT_MUL': -347, '>': -347, 'NOT_EQUAL': -347, 'EQUAL': -347, 'OR': -347, 'STRICT_OR': -347, 'AND': -347, 'STRICT_AND': -347, 'TEXT_MATCH': -347, 'LESS_OR_EQ': -347, 'MORE_OR_EQ': -347, 'ARRAY_CONCAT': -347, 'ARRAY_SUB': -347, 'POW': -347, 'FLOAT_POW': -347, 'BIT_OR': -347, 'BIT_AND': -347, 'BIT_SHIFT_LEFT': -347, 'DOUBLE_ARROW_LEFT': -347, 'DOUBLE_ARROW_RIGHT': -347, 'ARROW_LEFT': -347, 'ARROW_RIGHT': -347, 'ARROW_BOTH': -347, 'SOME_CONCAT': -347, 'SOME_SUB': -347, 'FLOAT_LESS_OR_EQ': -347, 'FLOAT_LESS': -347, 'FLOAT_MORE_OR_EQ': -347, 'FLOAT_MORE': -347, '(': -347, 'NEWLINE': -347, '$end': -347, ')': -347, 'OF': -347, 'THEN': -347, ',': -347, ']': -347, 'END': -347, 'ELIF': -347, 'ELSE': -347},
+    19: {'NEWLINE': -36, '$end': -36},
+    20: {'NEWLINE': -42, '$end': -42, ')': -42, 'OF': -42, 'THEN': -42, ',': -42, ']': -42, '(': -42, 'CONCAT': 60, '+': 61, '-': 62, '/': 63, '*': 64, '<': 65, 'FLOAT_SUM': 66, 'FLOAT_SUB': 67, 'FLOAT_DIV': 68, 'FLOAT_MUL': 69, '>': 70, 'NOT_EQUAL': 71, 'EQUAL': 72, 'OR': 73, 'STRICT_OR': 74, 'AND': 75, 'STRICT_AND': 76, 'TEXT_MATCH': 77, 'LESS_OR_EQ': 78, 'MORE_OR_EQ': 79, 'ARRAY_CONCAT': 80, 'ARRAY_SUB': 81, 'POW': 82, 'FLOAT_POW': 83, 'BIT_OR': 84, 'BIT_AND': 85, 'BIT_SHIFT_LEFT': 86, 'DOUBLE_ARROW_LEFT': 87, 'DOUBLE_ARROW_RIGHT': 88, 'ARROW_LEFT': 89, 'ARROW_RIGHT': 90, 'ARROW_BOTH': 91, 'SOME_CONCAT': 92, 'SOME_SUB': 93, 'FLOAT_LESS_OR_EQ': 94, 'FLOAT_LESS': 95, 'FLOAT_MORE_OR_EQ': 96, 'FLOAT_MORE': 97, 'END': -42, 'ELIF': -42, 'ELSE': -42},
+    21: {'NEWLINE': -43, '$end': -43, ')': -43, 'OF': -43, 'THEN': -43, ',': -43, ']': -43, '(': 136, 'CONCAT': 98, '+': 99, '-': 100, '/': 101, '*': 102, '<': 103, 'FLOAT_SUM': 104, 'FLOAT_SUB': 105, 'FLOAT_DIV': 106, 'FLOAT_MUL': 107, '>': 108, 'NOT_EQUAL': 109, 'EQUAL': 110, 'OR': 111, 'STRICT_OR': 112, 'AND': 113, 'STRICT_AND': 114, 'TEXT_MATCH': 115, 'LESS_OR_EQ': 116, 'MORE_OR_EQ': 117, 'ARRAY_CONCAT': 118, 'ARRAY_SUB': 119, 'POW': 120, 'FLOAT_POW': 121, 'BIT_OR': 122, 'BIT_AND': 123, 'BIT_SHIFT_LEFT': 124, 'DOUBLE_ARROW_LEFT': 125, 'DOUBLE_ARROW_RIGHT': 126, 'ARROW_LEFT': 127, 'ARROW_RIGHT': 128, 'ARROW_BOTH': 129, 'SOME_CONCAT': 130, 'SOME_SUB': 131, 'FLOAT_LESS_OR_EQ': 132, 'FLOAT_LESS': 133, 'FLOAT_MORE_OR_EQ': 134, 'FLOAT_MORE': 135, 'END': -43, 'ELIF': -43, 'ELSE': -43},
+    22: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    23: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    24: {'CONCAT': -335, '+': -335, '-': -335, '/': -335, '*': -335, '<': -335, 'FLOAT_SUM': -335, 'FLOAT_SUB': -335, 'FLOAT_DIV': -335, 'FLOAT_MUL': -335, '>': -335, 'NOT_EQUAL': -335, 'EQUAL': -335, 'OR': -335, 'STRICT_OR': -335, 'AND': -335, 'STRICT_AND': -335, 'TEXT_MATCH': -335, 'LESS_OR_EQ': -335, 'MORE_OR_EQ': -335, 'ARRAY_CONCAT': -335, 'ARRAY_SUB': -335, 'POW': -335, 'FLOAT_POW': -335, 'BIT_OR': -335, 'BIT_AND': -335, 'BIT_SHIFT_LEFT': -335, 'DOUBLE_ARROW_LEFT': -335, 'DOUBLE_ARROW_RIGHT': -335, 'ARROW_LEFT': -335, 'ARROW_RIGHT': -335, 'ARROW_BOTH': -335, 'SOME_CONCAT': -335, 'SOME_SUB': -335, 'FLOAT_LESS_OR_EQ': -335, 'FLOAT_LESS': -335, 'FLOAT_MORE_OR_EQ': -335, 'FLOAT_MORE': -335, '(': -335, 'NEWLINE': -335, '$end': -335, ')': -335, 'OF': -335, 'THEN': -335, ',': -335, ']': -335, 'END': -335, 'ELIF': -335, 'ELSE': -335, ':': -243, '=': -243},
+    25: {'CONCAT': -337, '+': -337, '-': -337, '/': -337, '*': -337, '<': -337, 'FLOAT_SUM': -337, 'FLOAT_SUB': -337, 'FLOAT_DIV': -337, 'FLOAT_MUL': -337, '>': -337, 'NOT_EQUAL': -337, 'EQUAL': -337, 'OR': -337, 'STRICT_OR': -337, 'AND': -337, 'STRICT_AND': -337, 'TEXT_MATCH': -337, 'LESS_OR_EQ': -337, 'MORE_OR_EQ': -337, 'ARRAY_CONCAT': -337, 'ARRAY_SUB': -337, 'POW': -337, 'FLOAT_POW': -337, 'BIT_OR': -337, 'BIT_AND': -337, 'BIT_SHIFT_LEFT': -337, 'DOUBLE_ARROW_LEFT': -337, 'DOUBLE_ARROW_RIGHT': -337, 'ARROW_LEFT': -337, 'ARROW_RIGHT': -337, 'ARROW_BOTH': -337, 'SOME_CONCAT': -337, 'SOME_SUB': -337, 'FLOAT_LESS_OR_EQ': -337, 'FLOAT_LESS': -337, 'FLOAT_MORE_OR_EQ': -337, 'FLOAT_MORE': -337, '(': -337, 'NEWLINE': -337, '$end': -337, ')': -337, 'OF': -337, 'THEN': -337, ',': -337, ']': -337, 'END': -337, 'ELIF': -337, 'ELSE': -337},
+    26: {'CONCAT': -338, '+': -338, '-': -338, '/': -338, '*': -338, '<': -338, 'FLOAT_SUM': -338, 'FLOAT_SUB': -338, 'FLOAT_DIV': -338, 'FLOAT_MUL': -338, '>': -338, 'NOT_EQUAL': -338, 'EQUAL': -338, 'OR': -338, 'STRICT_OR': -338, 'AND': -338, 'STRICT_AND': -338, 'TEXT_MATCH': -338, 'LESS_OR_EQ': -338, 'MORE_OR_EQ': -338, 'ARRAY_CONCAT': -338, 'ARRAY_SUB': -338, 'POW': -338, 'FLOAT_POW': -338, 'BIT_OR': -338, 'BIT_AND': -338, 'BIT_SHIFT_LEFT': -338, 'DOUBLE_ARROW_LEFT': -338, 'DOUBLE_ARROW_RIGHT': -338, 'ARROW_LEFT': -338, 'ARROW_RIGHT': -338, 'ARROW_BOTH': -338, 'SOME_CONCAT': -338, 'SOME_SUB': -338, 'FLOAT_LESS_OR_EQ': -338, 'FLOAT_LESS': -338, 'FLOAT_MORE_OR_EQ': -338, 'FLOAT_MORE': -338, '(': -338, 'NEWLINE': -338, '$end': -338, ')': -338, 'OF': -338, 'THEN': -338, ',': -338, ']': -338, 'END': -338, 'ELIF': -338, 'ELSE': -338},
+    27: {'CONCAT': -339, '+': -339, '-': -339, '/': -339, '*': -339, '<': -339, 'FLOAT_SUM': -339, 'FLOAT_SUB': -339, 'FLOAT_DIV': -339, 'FLOAT_MUL': -339, '>': -339, 'NOT_EQUAL': -339, 'EQUAL': -339, 'OR': -339, 'STRICT_OR': -339, 'AND': -339, 'STRICT_AND': -339, 'TEXT_MATCH': -339, 'LESS_OR_EQ': -339, 'MORE_OR_EQ': -339, 'ARRAY_CONCAT': -339, 'ARRAY_SUB': -339, 'POW': -339, 'FLOAT_POW': -339, 'BIT_OR': -339, 'BIT_AND': -339, 'BIT_SHIFT_LEFT': -339, 'DOUBLE_ARROW_LEFT': -339, 'DOUBLE_ARROW_RIGHT': -339, 'ARROW_LEFT': -339, 'ARROW_RIGHT': -339, 'ARROW_BOTH': -339, 'SOME_CONCAT': -339, 'SOME_SUB': -339, 'FLOAT_LESS_OR_EQ': -339, 'FLOAT_LESS': -339, 'FLOAT_MORE_OR_EQ': -339, 'FLOAT_MORE': -339, '(': -339, 'NEWLINE': -339, '$end': -339, ')': -339, 'OF': -339, 'THEN': -339, ',': -339, ']': -339, 'END': -339, 'ELIF': -339, 'ELSE': -339},
+    28: {'CONCAT': -340, '+': -340, '-': -340, '/': -340, '*': -340, '<': -340, 'FLOAT_SUM': -340, 'FLOAT_SUB': -340, 'FLOAT_DIV': -340, 'FLOAT_MUL': -340, '>': -340, 'NOT_EQUAL': -340, 'EQUAL': -340, 'OR': -340, 'STRICT_OR': -340, 'AND': -340, 'STRICT_AND': -340, 'TEXT_MATCH': -340, 'LESS_OR_EQ': -340, 'MORE_OR_EQ': -340, 'ARRAY_CONCAT': -340, 'ARRAY_SUB': -340, 'POW': -340, 'FLOAT_POW': -340, 'BIT_OR': -340, 'BIT_AND': -340, 'BIT_SHIFT_LEFT': -340, 'DOUBLE_ARROW_LEFT': -340, 'DOUBLE_ARROW_RIGHT': -340, 'ARROW_LEFT': -340, 'ARROW_RIGHT': -340, 'ARROW_BOTH': -340, 'SOME_CONCAT': -340, 'SOME_SUB': -340, 'FLOAT_LESS_OR_EQ': -340, 'FLOAT_LESS': -340, 'FLOAT_MORE_OR_EQ': -340, 'FLOAT_MORE': -340, '(': -340, 'NEWLINE': -340, '$end': -340, ')': -340, 'OF': -340, 'THEN': -340, ',': -340, ']': -340, 'END': -340, 'ELIF': -340, 'ELSE': -340},
+    29: {'CONCAT': -341, '+': -341, '-': -341, '/': -341, '*': -341, '<': -341, 'FLOAT_SUM': -341, 'FLOAT_SUB': -341, 'FLOAT_DIV': -341, 'FLOAT_MUL': -341, '>': -341, 'NOT_EQUAL': -341, 'EQUAL': -341, 'OR': -341, 'STRICT_OR': -341, 'AND': -341, 'STRICT_AND': -341, 'TEXT_MATCH': -341, 'LESS_OR_EQ': -341, 'MORE_OR_EQ': -341, 'ARRAY_CONCAT': -341, 'ARRAY_SUB': -341, 'POW': -341, 'FLOAT_POW': -341, 'BIT_OR': -341, 'BIT_AND': -341, 'BIT_SHIFT_LEFT': -341, 'DOUBLE_ARROW_LEFT': -341, 'DOUBLE_ARROW_RIGHT': -341, 'ARROW_LEFT': -341, 'ARROW_RIGHT': -341, 'ARROW_BOTH': -341, 'SOME_CONCAT': -341, 'SOME_SUB': -341, 'FLOAT_LESS_OR_EQ': -341, 'FLOAT_LESS': -341, 'FLOAT_MORE_OR_EQ': -341, 'FLOAT_MORE': -341, '(': -341, 'NEWLINE': -341, '$end': -341, ')': -341, 'OF': -341, 'THEN': -341, ',': -341, ']': -341, 'END': -341, 'ELIF': -341, 'ELSE': -341},
+    30: {'CONCAT': -342, '+': -342, '-': -342, '/': -342, '*': -342, '<': -342, 'FLOAT_SUM': -342, 'FLOAT_SUB': -342, 'FLOAT_DIV': -342, 'FLOAT_MUL': -342, '>': -342, 'NOT_EQUAL': -342, 'EQUAL': -342, 'OR': -342, 'STRICT_OR': -342, 'AND': -342, 'STRICT_AND': -342, 'TEXT_MATCH': -342, 'LESS_OR_EQ': -342, 'MORE_OR_EQ': -342, 'ARRAY_CONCAT': -342, 'ARRAY_SUB': -342, 'POW': -342, 'FLOAT_POW': -342, 'BIT_OR': -342, 'BIT_AND': -342, 'BIT_SHIFT_LEFT': -342, 'DOUBLE_ARROW_LEFT': -342, 'DOUBLE_ARROW_RIGHT': -342, 'ARROW_LEFT': -342, 'ARROW_RIGHT': -342, 'ARROW_BOTH': -342, 'SOME_CONCAT': -342, 'SOME_SUB': -342, 'FLOAT_LESS_OR_EQ': -342, 'FLOAT_LESS': -342, 'FLOAT_MORE_OR_EQ': -342, 'FLOAT_MORE': -342, '(': -342, 'NEWLINE': -342, '$end': -342, ')': -342, 'OF': -342, 'THEN': -342, ',': -342, ']': -342, 'END': -342, 'ELIF': -342, 'ELSE': -342},
+    31: {'CONCAT': -344, '+': -344, '-': -344, '/': -344, '*': -344, '<': -344, 'FLOAT_SUM': -344, 'FLOAT_SUB': -344, 'FLOAT_DIV': -344, 'FLOAT_MUL': -344, '>': -344, 'NOT_EQUAL': -344, 'EQUAL': -344, 'OR': -344, 'STRICT_OR': -344, 'AND': -344, 'STRICT_AND': -344, 'TEXT_MATCH': -344, 'LESS_OR_EQ': -344, 'MORE_OR_EQ': -344, 'ARRAY_CONCAT': -344, 'ARRAY_SUB': -344, 'POW': -344, 'FLOAT_POW': -344, 'BIT_OR': -344, 'BIT_AND': -344, 'BIT_SHIFT_LEFT': -344, 'DOUBLE_ARROW_LEFT': -344, 'DOUBLE_ARROW_RIGHT': -344, 'ARROW_LEFT': -344, 'ARROW_RIGHT': -344, 'ARROW_BOTH': -344, 'SOME_CONCAT': -344, 'SOME_SUB': -344, 'FLOAT_LESS_OR_EQ': -344, 'FLOAT_LESS': -344, 'FLOAT_MORE_OR_EQ': -344, 'FLOAT_MORE': -344, '(': -344, 'NEWLINE': -344, '$end': -344, ')': -344, 'OF': -344, 'THEN': -344, ',': -344, ']': -344, 'END': -344, 'ELIF': -344, 'ELSE': -344},
+    32: {'CONCAT': -345, '+': -345, '-': -345, '/': -345, '*': -345, '<': -345, 'FLOAT_SUM': -345, 'FLOAT_SUB': -345, 'FLOAT_DIV': -345, 'FLOAT_MUL': -345, '>': -345, 'NOT_EQUAL': -345, 'EQUAL': -345, 'OR': -345, 'STRICT_OR': -345, 'AND': -345, 'STRICT_AND': -345, 'TEXT_MATCH': -345, 'LESS_OR_EQ': -345, 'MORE_OR_EQ': -345, 'ARRAY_CONCAT': -345, 'ARRAY_SUB': -345, 'POW': -345, 'FLOAT_POW': -345, 'BIT_OR': -345, 'BIT_AND': -345, 'BIT_SHIFT_LEFT': -345, 'DOUBLE_ARROW_LEFT': -345, 'DOUBLE_ARROW_RIGHT': -345, 'ARROW_LEFT': -345, 'ARROW_RIGHT': -345, 'ARROW_BOTH': -345, 'SOME_CONCAT': -345, 'SOME_SUB': -345, 'FLOAT_LESS_OR_EQ': -345, 'FLOAT_LESS': -345, 'FLOAT_MORE_OR_EQ': -345, 'FLOAT_MORE': -345, '(': -345, 'NEWLINE': -345, '$end': -345, ')': -345, 'OF': -345, 'THEN': -345, ',': -345, ']': -345, 'END': -345, 'ELIF': -345, 'ELSE': -345},
+    33: {'CONCAT': -346, '+': -346, '-': -346, '/': -346, '*': -346, '<': -346, 'FLOAT_SUM': -346, 'FLOAT_SUB': -346, 'FLOAT_DIV': -346, 'FLOAT_MUL': -346, '>': -346, 'NOT_EQUAL': -346, 'EQUAL': -346, 'OR': -346, 'STRICT_OR': -346, 'AND': -346, 'STRICT_AND': -346, 'TEXT_MATCH': -346, 'LESS_OR_EQ': -346, 'MORE_OR_EQ': -346, 'ARRAY_CONCAT': -346, 'ARRAY_SUB': -346, 'POW': -346, 'FLOAT_POW': -346, 'BIT_OR': -346, 'BIT_AND': -346, 'BIT_SHIFT_LEFT': -346, 'DOUBLE_ARROW_LEFT': -346, 'DOUBLE_ARROW_RIGHT': -346, 'ARROW_LEFT': -346, 'ARROW_RIGHT': -346, 'ARROW_BOTH': -346, 'SOME_CONCAT': -346, 'SOME_SUB': -346, 'FLOAT_LESS_OR_EQ': -346, 'FLOAT_LESS': -346, 'FLOAT_MORE_OR_EQ': -346, 'FLOAT_MORE': -346, '(': -346, 'NEWLINE': -346, '$end': -346, ')': -346, 'OF': -346, 'THEN': -346, ',': -346, ']': -346, 'END': -346, 'ELIF': -346, 'ELSE': -346},
+    34: {'CONCAT': -348, '+': -348, '-': -348, '/': -348, '*': -348, '<': -348, 'FLOAT_SUM': -348, 'FLOAT_SUB': -348, 'FLOAT_DIV': -348, 'FLOAT_MUL': -348, '>': -348, 'NOT_EQUAL': -348, 'EQUAL': -348, 'OR': -348, 'STRICT_OR': -348, 'AND': -348, 'STRICT_AND': -348, 'TEXT_MATCH': -348, 'LESS_OR_EQ': -348, 'MORE_OR_EQ': -348, 'ARRAY_CONCAT': -348, 'ARRAY_SUB': -348, 'POW': -348, 'FLOAT_POW': -348, 'BIT_OR': -348, 'BIT_AND': -348, 'BIT_SHIFT_LEFT': -348, 'DOUBLE_ARROW_LEFT': -348, 'DOUBLE_ARROW_RIGHT': -348, 'ARROW_LEFT': -348, 'ARROW_RIGHT': -348, 'ARROW_BOTH': -348, 'SOME_CONCAT': -348, 'SOME_SUB': -348, 'FLOAT_LESS_OR_EQ': -348, 'FLOAT_LESS': -348, 'FLOAT_MORE_OR_EQ': -348, 'FLOAT_MORE': -348, '(': -348, 'NEWLINE': -348, '$end': -348, ')': -348, 'OF': -348, 'THEN': -348, ',': -348, ']': -348, 'END': -348, 'ELIF': -348, 'ELSE': -348},
+    35: {'CONCAT': -349, '+': -349, '-': -349, '/': -349, '*': -349, '<': -349, 'FLOAT_SUM': -349, 'FLOAT_SUB': -349, 'FLOAT_DIV': -349, 'FLOAT_MUL': -349, '>': -349, 'NOT_EQUAL': -349, 'EQUAL': -349, 'OR': -349, 'STRICT_OR': -349, 'AND': -349, 'STRICT_AND': -349, 'TEXT_MATCH': -349, 'LESS_OR_EQ': -349, 'MORE_OR_EQ': -349, 'ARRAY_CONCAT': -349, 'ARRAY_SUB': -349, 'POW': -349, 'FLOAT_POW': -349, 'BIT_OR': -349, 'BIT_AND': -349, 'BIT_SHIFT_LEFT': -349, 'DOUBLE_ARROW_LEFT': -349, 'DOUBLE_ARROW_RIGHT': -349, 'ARROW_LEFT': -349, 'ARROW_RIGHT': -349, 'ARROW_BOTH': -349, 'SOME_CONCAT': -349, 'SOME_SUB': -349, 'FLOAT_LESS_OR_EQ': -349, 'FLOAT_LESS': -349, 'FLOAT_MORE_OR_EQ': -349, 'FLOAT_MORE': -349, '(': -349, 'NEWLINE': -349, '$end': -349, ')': -349, 'OF': -349, 'THEN': -349, ',': -349, ']': -349, 'END': -349, 'ELIF': -349, 'ELSE': -349},
+    36: {'FLOAT_MORE': 143, 'FLOAT_MORE_OR_EQ': 144, 'FLOAT_LESS': 145, 'FLOAT_LESS_OR_EQ': 146, 'SOME_SUB': 147, 'SOME_CONCAT': 148, 'ARROW_BOTH': 149, 'ARROW_RIGHT': 150, 'ARROW_LEFT': 151, 'DOUBLE_ARROW_RIGHT': 152, 'DOUBLE_ARROW_LEFT': 153, 'BIT_SHIFT_LEFT': 154, 'BIT_AND': 155, 'BIT_OR': 156, 'FLOAT_POW': 157, 'POW': 158, 'ARRAY_SUB': 159, 'ARRAY_CONCAT': 160, 'MORE_OR_EQ': 161, 'LESS_OR_EQ': 162, 'TEXT_MATCH': 163, 'STRICT_AND': 164, 'AND': 165, 'STRICT_OR': 166, 'OR': 167, 'EQUAL': 168, 'NOT_EQUAL': 169, '>': 141, 'FLOAT_MUL': 170, 'FLOAT_DIV': 171, 'FLOAT_SUB': 172, 'FLOAT_SUM': 173, '<': 140, '*': 174, '/': 175, '-': 176, '+': 177, 'CONCAT': 178, 'IDENTIFIER': 59},
+    37: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    38: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    39: {'CONCAT': -256, '+': -256, '-': -256, '/': -256, '*': -256, '<': -256, 'FLOAT_SUM': -256, 'FLOAT_SUB': -256, 'FLOAT_DIV': -256, 'FLOAT_MUL': -256, '>': -256, 'NOT_EQUAL': -256, 'EQUAL': -256, 'OR': -256, 'STRICT_OR': -256, 'AND': -256, 'STRICT_AND': -256, 'TEXT_MATCH': -256, 'LESS_OR_EQ': -256, 'MORE_OR_EQ': -256, 'ARRAY_CONCAT': -256, 'ARRAY_SUB': -256, 'POW': -256, 'FLOAT_POW': -256, 'BIT_OR': -256, 'BIT_AND': -256, 'BIT_SHIFT_LEFT': -256, 'DOUBLE_ARROW_LEFT': -256, 'DOUBLE_ARROW_RIGHT': -256, 'ARROW_LEFT': -256, 'ARROW_RIGHT': -256, 'ARROW_BOTH': -256, 'SOME_CONCAT': -256, 'SOME_SUB': -256, 'FLOAT_LESS_OR_EQ': -256, 'FLOAT_LESS': -256, 'FLOAT_MORE_OR_EQ': -256, 'FLOAT_MORE': -256, '(': -256, 'NEWLINE': -256, '$end': -256, ')': -256, 'OF': -256, 'THEN': -256, ',': -256, ']': -256, 'END': -256, 'ELIF': -256, 'ELSE': -256},
+    40: {'CONCAT': -255, '+': -255, '-': -255, '/': -255, '*': -255, '<': -255, 'FLOAT_SUM': -255, 'FLOAT_SUB': -255, 'FLOAT_DIV': -255, 'FLOAT_MUL': -255, '>': -255, 'NOT_EQUAL': -255, 'EQUAL': -255, 'OR': -255, 'STRICT_OR': -255, 'AND': -255, 'STRICT_AND': -255, 'TEXT_MATCH': -255, 'LESS_OR_EQ': -255, 'MORE_OR_EQ': -255, 'ARRAY_CONCAT': -255, 'ARRAY_SUB': -255, 'POW': -255, 'FLOAT_POW': -255, 'BIT_OR': -255, 'BIT_AND': -255, 'BIT_SHIFT_LEFT': -255, 'DOUBLE_ARROW_LEFT': -255, 'DOUBLE_ARROW_RIGHT': -255, 'ARROW_LEFT': -255, 'ARROW_RIGHT': -255, 'ARROW_BOTH': -255, 'SOME_CONCAT': -255, 'SOME_SUB': -255, 'FLOAT_LESS_OR_EQ': -255, 'FLOAT_LESS': -255, 'FLOAT_MORE_OR_EQ': -255, 'FLOAT_MORE': -255, '(': -255, 'NEWLINE': -255, '$end': -255, ')': -255, 'OF': -255, 'THEN': -255, ',': -255, ']': -255, 'END': -255, 'ELIF': -255, 'ELSE': -255},
+    41: {'NEWLINE': 182, '(': -222, 'IDENTIFIER': -222, 'DEF': -222, '+': -222, '!': -222, 'STRICT_NOT': -222, '-': -222, 'STRING': -222, 'FLOAT': -222, 'INT': -222, '[': -222, 'TYPE_IDENTIFIER': -222, 'CASE': -222, 'IF': -222, 'DO': -222, 'EXTERNAL': -222, 'ENUM': -222, ']': -222},
+    42: {'(': 183},
+    43: {':': 184, '=': -254},
+    44: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    45: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    46: {':': 189, 'NEWLINE': -112, 'END': -112, '(': -112, 'IDENTIFIER': -112, 'DEF': -112, '+': -112, '!': -112, 'STRICT_NOT': -112, '-': -112, 'STRING': -112, 'FLOAT': -112, 'INT': -112, '[': -112, 'TYPE_IDENTIFIER': -112, 'CASE': -112, 'IF': -112, 'DO': -112, 'EXTERNAL': -112, 'ENUM': -112},
+    47: {'CONCAT': -48, '+': -48, '-': -48, '/': -48, '*': -48, '<': -48, 'FLOAT_SUM': -48, 'FLOAT_SUB': -48, 'FLOAT_DIV': -48, 'FLOAT_MUL': -48, '>': -48, 'NOT_EQUAL': -48, 'EQUAL': -48, 'OR': -48, 'STRICT_OR': -48, 'AND': -48, 'STRICT_AND': -48, 'TEXT_MATCH': -48, 'LESS_OR_EQ': -48, 'MORE_OR_EQ': -48, 'ARRAY_CONCAT': -48, 'ARRAY_SUB': -48, 'POW': -48, 'FLOAT_POW': -48, 'BIT_OR': -48, 'BIT_AND': -48, 'BIT_SHIFT_LEFT': -48, 'DOUBLE_ARROW_LEFT': -48, 'DOUBLE_ARROW_RIGHT': -48, 'ARROW_LEFT': -48, 'ARROW_RIGHT': -48, 'ARROW_BOTH': -48, 'SOME_CONCAT': -48, 'SOME_SUB': -48, 'FLOAT_LESS_OR_EQ': -48, 'FLOAT_LESS': -48, 'FLOAT_MORE_OR_EQ': -48, 'FLOAT_MORE': -48, '(': -48, 'NEWLINE': -48, '$end': -48, ')': -48, 'OF': -48, 'THEN': -48, ',': -48, ']': -48, 'END': -48, 'ELIF': -48, 'ELSE': -48},
+    48: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    49: {'$end': -6, 'IMPORT': 9, 'EXPORT': 14, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    50: {'$end': -5},
+    51: {'(': 195, 'NEWLINE': -16, '$end': -16},
+    52: {')': 196},
+    53: {'$end': -27},
+    54: {'$end': -28, 'EXPORT': 14, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    55: {'NEWLINE': -32, '$end': -32},
+    56: {'NEWLINE': -33, '$end': -33},
+    57: {'NEWLINE': -34, '$end': -34},
+    58: {'NEWLINE': -35, '$end': -35},
+    59: {':': -243, '=': -243, '(': -243, '<': -243, 'NEWLINE': -243, ')': -243, ',': -243, 'DO': -243},
+    60: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    61: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    62: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    63: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    64: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    65: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    66: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    67: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    68: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    69: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    70: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    71: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    72: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    73: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    74: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    75: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    76: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    77: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    78: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    79: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    80: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    81: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    82: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    83: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    84: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    85: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    86: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    87: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    88: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    89: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    90: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    91: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    92: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    93: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    94: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    95: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    96: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    97: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    98: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    99: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    100: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    101: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    102: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    103: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    104: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    105: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    106: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    107: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    108: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    109: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    110: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    111: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    112: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    113: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    114: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    115: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    116: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    117: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    118: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    119: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    120: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    121: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    122: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    123: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    124: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    125: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    126: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    127: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    128: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    129: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    130: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    131: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    132: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    133: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    134: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    135: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    136: {'NEWLINE': 275, '(': -227, 'IDENTIFIER': -227, 'DEF': -227, '+': -227, '!': -227, 'STRICT_NOT': -227, '-': -227, 'STRING': -227, 'FLOAT': -227, 'INT': -227, '[': -227, 'TYPE_IDENTIFIER': -227, 'CASE': -227, 'IF': -227, 'DO': -227, 'EXTERNAL': -227, 'ENUM': -227, ')': -227},
+    137: {'CONCAT': -44, '+': -44, '-': -44, '/': -44, '*': -44, '<': -44, 'FLOAT_SUM': -44, 'FLOAT_SUB': -44, 'FLOAT_DIV': -44, 'FLOAT_MUL': -44, '>': -44, 'NOT_EQUAL': -44, 'EQUAL': -44, 'OR': -44, 'STRICT_OR': -44, 'AND': -44, 'STRICT_AND': -44, 'TEXT_MATCH': -44, 'LESS_OR_EQ': -44, 'MORE_OR_EQ': -44, 'ARRAY_CONCAT': -44, 'ARRAY_SUB': -44, 'POW': -44, 'FLOAT_POW': -44, 'BIT_OR': -44, 'BIT_AND': -44, 'BIT_SHIFT_LEFT': -44, 'DOUBLE_ARROW_LEFT': -44, 'DOUBLE_ARROW_RIGHT': -44, 'ARROW_LEFT': -44, 'ARROW_RIGHT': -44, 'ARROW_BOTH': -44, 'SOME_CONCAT': -44, 'SOME_SUB': -44, 'FLOAT_LESS_OR_EQ': -44, 'FLOAT_LESS': -44, 'FLOAT_MORE_OR_EQ': -44, 'FLOAT_MORE': -44, '(': 136, 'NEWLINE': -44, '$end': -44, ')': -44, 'OF': -44, 'THEN': -44, ',': -44, ']': -44, 'END': -44, 'ELIF': -44, 'ELSE': -44},
+    138: {'CONCAT': -47, '+': -47, '-': -47, '/': -47, '*': -47, '<': -47, 'FLOAT_SUM': -47, 'FLOAT_SUB': -47, 'FLOAT_DIV': -47, 'FLOAT_MUL': -47, '>': -47, 'NOT_EQUAL': -47, 'EQUAL': -47, 'OR': -47, 'STRICT_OR': -47, 'AND': -47, 'STRICT_AND': -47, 'TEXT_MATCH': -47, 'LESS_OR_EQ': -47, 'MORE_OR_EQ': -47, 'ARRAY_CONCAT': -47, 'ARRAY_SUB': -47, 'POW': -47, 'FLOAT_POW': -47, 'BIT_OR': -47, 'BIT_AND': -47, 'BIT_SHIFT_LEFT': -47, 'DOUBLE_ARROW_LEFT': -47, 'DOUBLE_ARROW_RIGHT': -47, 'ARROW_LEFT': -47, 'ARROW_RIGHT': -47, 'ARROW_BOTH': -47, 'SOME_CONCAT': -47, 'SOME_SUB': -47, 'FLOAT_LESS_OR_EQ': -47, 'FLOAT_LESS': -47, 'FLOAT_MORE_OR_EQ': -47, 'FLOAT_MORE': -47, '(': 136, 'NEWLINE': -47, '$end': -47, ')': -47, 'OF': -47, 'THEN': -47, ',': -47, ']': -47, 'END': -47, 'ELIF': -47, 'ELSE': -47},
+    139: {'(': 276, '<': 277},
+    140: {'(': -81, '<': -81},
+    141: {'(': -76, '<': -76},
+    142: {'(': 278, '<': 279},
+    143: {'(': -49, '<': -49},
+    144: {'(': -50, '<': -50},
+    145: {'(': -51, '<': -51},
+    146: {'(': -52, '<': -52},
+    147: {'(': -53, '<': -53},
+    148: {'(': -54, '<': -54},
+    149: {'(': -55, '<': -55},
+    150: {'(': -56, '<': -56},
+    151: {'(': -57, '<': -57},
+    152: {'(': -58, '<': -58},
+    153: {'(': -59, '<': -59},
+    154: {'(': -60, '<': -60},
+    155: {'(': -61, '<': -61},
+    156: {'(': -62, '<': -62},
+    157: {'(': -63, '<': -63},
+    158: {'(': -64, '<': -64},
+    159: {'(': -65, '<': -65},
+    160: {'(': -66, '<': -66},
+    161: {'(': -67, '<': -67},
+    162: {'(': -68, '<': -68},
+    163: {'(': -69, '<': -69},
+    164: {'(': -70, '<': -70},
+    165: {'(': -71, '<': -71},
+    166: {'(': -72, '<': -72},
+    167: {'(': -73, '<': -73},
+    168: {'(': -74, '<': -74},
+    169: {'(': -75, '<': -75},
+    170: {'(': -77, '<': -77},
+    171: {'(': -78, '<': -78},
+    172: {'(': -79, '<': -79},
+    173: {'(': -80, '<': -80},
+    174: {'(': -82, '<': -82},
+    175: {'(': -83, '<': -83},
+    176: {'(': -84, '<': -84},
+    177: {'(': -85, '<': -85},
+    178: {'(': -86, '<': -86},
+    179: {'CONCAT': -45, '+': -45, '-': -45, '/': -45, '*': -45, '<': -45, 'FLOAT_SUM': -45, 'FLOAT_SUB': -45, 'FLOAT_DIV': -45, 'FLOAT_MUL': -45, '>': -45, 'NOT_EQUAL': -45, 'EQUAL': -45, 'OR': -45, 'STRICT_OR': -45, 'AND': -45, 'STRICT_AND': -45, 'TEXT_MATCH': -45, 'LESS_OR_EQ': -45, 'MORE_OR_EQ': -45, 'ARRAY_CONCAT': -45, 'ARRAY_SUB': -45, 'POW': -45, 'FLOAT_POW': -45, 'BIT_OR': -45, 'BIT_AND': -45, 'BIT_SHIFT_LEFT': -45, 'DOUBLE_ARROW_LEFT': -45, 'DOUBLE_ARROW_RIGHT': -45, 'ARROW_LEFT': -45, 'ARROW_RIGHT': -45, 'ARROW_BOTH': -45, 'SOME_CONCAT': -45, 'SOME_SUB': -45, 'FLOAT_LESS_OR_EQ': -45, 'FLOAT_LESS': -45, 'FLOAT_MORE_OR_EQ': -45, 'FLOAT_MORE': -45, '(': 136, 'NEWLINE': -45, '$end': -45, ')': -45, 'OF': -45, 'THEN': -45, ',': -45, ']': -45, 'END': -45, 'ELIF': -45, 'ELSE': -45},
+    180: {'CONCAT': -46, '+': -46, '-': -46, '/': -46, '*': -46, '<': -46, 'FLOAT_SUM': -46, 'FLOAT_SUB': -46, 'FLOAT_DIV': -46, 'FLOAT_MUL': -46, '>': -46, 'NOT_EQUAL': -46, 'EQUAL': -46, 'OR': -46, 'STRICT_OR': -46, 'AND': -46, 'STRICT_AND': -46, 'TEXT_MATCH': -46, 'LESS_OR_EQ': -46, 'MORE_OR_EQ': -46, 'ARRAY_CONCAT': -46, 'ARRAY_SUB': -46, 'POW': -46, 'FLOAT_POW': -46, 'BIT_OR': -46, 'BIT_AND': -46, 'BIT_SHIFT_LEFT': -46, 'DOUBLE_ARROW_LEFT': -46, 'DOUBLE_ARROW_RIGHT': -46, 'ARROW_LEFT': -46, 'ARROW_RIGHT': -46, 'ARROW_BOTH': -46, 'SOME_CONCAT': -46, 'SOME_SUB': -46, 'FLOAT_LESS_OR_EQ': -46, 'FLOAT_LESS': -46, 'FLOAT_MORE_OR_EQ': -46, 'FLOAT_MORE': -46, '(': 136, 'NEWLINE': -46, '$end': -46, ')': -46, 'OF': -46, 'THEN': -46, ',': -46, ']': -46, 'END': -46, 'ELIF': -46, 'ELSE': -46},
+    181: {']': -224, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    182: {'(': -221, 'IDENTIFIER': -221, 'DEF': -221, '+': -221, '!': -221, 'STRICT_NOT': -221, '-': -221, 'STRING': -221, 'FLOAT': -221, 'INT': -221, '[': -221, 'TYPE_IDENTIFIER': -221, 'CASE': -221, 'IF': -221, 'DO': -221, 'EXTERNAL': -221, 'ENUM': -221, ']': -221},
+    183: {'NEWLINE': 284, '(': -232, 'IDENTIFIER': -232, 'DEF': -232, '+': -232, '!': -232, 'STRICT_NOT': -232, '-': -232, 'STRING': -232, 'FLOAT': -232, 'INT': -232, '[': -232, 'TYPE_IDENTIFIER': -232, 'CASE': -232, 'IF': -232, 'DO': -232, 'EXTERNAL': -232, 'ENUM': -232, ')': -232},
+    184: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    185: {'=': 287},
+    186: {'OF': 288},
+    187: {'THEN': 289},
+    188: {'NEWLINE': 292, '(': -115, 'IDENTIFIER': -115, 'DEF': -115, '+': -115, '!': -115, 'STRICT_NOT': -115, '-': -115, 'STRING': -115, 'FLOAT': -115, 'INT': -115, '[': -115, 'TYPE_IDENTIFIER': -115, 'CASE': -115, 'IF': -115, 'DO': -115, 'EXTERNAL': -115, 'ENUM': -115, 'END': -115},
+    189: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    190: {'{': 295, '<': 296},
+    191: {'{': -244, '<': -244, '=': -244, 'NEWLINE': -244, 'END': -244, '(': -244, 'IDENTIFIER': -244, 'DEF': -244, '+': -244, '!': -244, 'STRICT_NOT': -244, '-': -244, 'STRING': -244, 'FLOAT': -244, 'INT': -244, '[': -244, 'TYPE_IDENTIFIER': -244, 'CASE': -244, 'IF': -244, 'DO': -244, 'EXTERNAL': -244, 'ENUM': -244, ',': -244, '>': -244, 'MORE_OR_EQ': -244, 'ELIF': -244, 'ELSE': -244, ')': -244},
+    192: {'{': -245, '<': -245, '=': -245, 'NEWLINE': -245, 'END': -245, '(': -245, 'IDENTIFIER': -245, 'DEF': -245, '+': -245, '!': -245, 'STRICT_NOT': -245, '-': -245, 'STRING': -245, 'FLOAT': -245, 'INT': -245, '[': -245, 'TYPE_IDENTIFIER': -245, 'CASE': -245, 'IF': -245, 'DO': -245, 'EXTERNAL': -245, 'ENUM': -245, ',': -245, '>': -245, 'MORE_OR_EQ': -245, 'ELIF': -245, 'ELSE': -245, ')': -245},
+    193: {'$end': -4},
+    194: {'NEWLINE': -12, '$end': -12},
+    195: {'NEWLINE': 298, 'TYPE_IDENTIFIER': -15, 'IDENTIFIER': -15},
+    196: {'CONCAT': -334, '+': -334, '-': -334, '/': -334, '*': -334, '<': -334, 'FLOAT_SUM': -334, 'FLOAT_SUB': -334, 'FLOAT_DIV': -334, 'FLOAT_MUL': -334, '>': -334, 'NOT_EQUAL': -334, 'EQUAL': -334, 'OR': -334, 'STRICT_OR': -334, 'AND': -334, 'STRICT_AND': -334, 'TEXT_MATCH': -334, 'LESS_OR_EQ': -334, 'MORE_OR_EQ': -334, 'ARRAY_CONCAT': -334, 'ARRAY_SUB': -334, 'POW': -334, 'FLOAT_POW': -334, 'BIT_OR': -334, 'BIT_AND': -334, 'BIT_SHIFT_LEFT': -334, 'DOUBLE_ARROW_LEFT': -334, 'DOUBLE_ARROW_RIGHT': -334, 'ARROW_LEFT': -334, 'ARROW_RIGHT': -334, 'ARROW_BOTH': -334, 'SOME_CONCAT': -334, 'SOME_SUB': -334, 'FLOAT_LESS_OR_EQ': -334, 'FLOAT_LESS': -334, 'FLOAT_MORE_OR_EQ': -334, 'FLOAT_MORE': -334, '(': -334, 'NEWLINE': -334, '$end': -334, ')': -334, 'OF': -334, 'THEN': -334, ',': -334, ']': -334, 'END': -334, 'ELIF': -334, 'ELSE': -334},
+    197: {'NEWLINE': -31, '$end': -31},
+    198: {'CONCAT': -258, '+': -258, '-': -258, '/': -258, '*': -258, '<': -258, 'FLOAT_SUM': -258, 'FLOAT_SUB': -258, 'FLOAT_DIV': -258, 'FLOAT_MUL': -258, '>': -258, 'NOT_EQUAL': -258, 'EQUAL': -258, 'OR': -258, 'STRICT_OR': -258, 'AND': -258, 'STRICT_AND': -258, 'TEXT_MATCH': -258, 'LESS_OR_EQ': -258, 'MORE_OR_EQ': -258, 'ARRAY_CONCAT': -258, 'ARRAY_SUB': -258, 'POW': -258, 'FLOAT_POW': -258, 'BIT_OR': -258, 'BIT_AND': -258, 'BIT_SHIFT_LEFT': -258, 'DOUBLE_ARROW_LEFT': -258, 'DOUBLE_ARROW_RIGHT': -258, 'ARROW_LEFT': -258, 'ARROW_RIGHT': -258, 'ARROW_BOTH': -258, 'SOME_CONCAT': -258, 'SOME_SUB': -258, 'FLOAT_LESS_OR_EQ': -258, 'FLOAT_LESS': -258, 'FLOAT_MORE_OR_EQ': -258, 'FLOAT_MORE': -258, 'NEWLINE': -258, '$end': -258, ')': -258, 'OF': -258, 'THEN': -258, ',': -258, ']': -258, '(': 136, 'END': -258, 'ELIF': -258, 'ELSE': -258},
+    199: {'CONCAT': -259, '+': -259, '-': -259, '/': -259, '*': -259, '<': -259, 'FLOAT_SUM': -259, 'FLOAT_SUB': -259, 'FLOAT_DIV': -259, 'FLOAT_MUL': -259, '>': -259, 'NOT_EQUAL': -259, 'EQUAL': -259, 'OR': -259, 'STRICT_OR': -259, 'AND': -259, 'STRICT_AND': -259, 'TEXT_MATCH': -259, 'LESS_OR_EQ': -259, 'MORE_OR_EQ': -259, 'ARRAY_CONCAT': -259, 'ARRAY_SUB': -259, 'POW': -259, 'FLOAT_POW': -259, 'BIT_OR': -259, 'BIT_AND': -259, 'BIT_SHIFT_LEFT': -259, 'DOUBLE_ARROW_LEFT': -259, 'DOUBLE_ARROW_RIGHT': -259, 'ARROW_LEFT': -259, 'ARROW_RIGHT': -259, 'ARROW_BOTH': -259, 'SOME_CONCAT': -259, 'SOME_SUB': -259, 'FLOAT_LESS_OR_EQ': -259, 'FLOAT_LESS': -259, 'FLOAT_MORE_OR_EQ': -259, 'FLOAT_MORE': -259, 'NEWLINE': -259, '$end': -259, ')': -259, 'OF': -259, 'THEN': -259, ',': -259, ']': -259, '(': 136, 'END': -259, 'ELIF': -259, 'ELSE': -259},
+    200: {'CONCAT': -260, '+': -260, '-': -260, '/': -260, '*': -260, '<': -260, 'FLOAT_SUM': -260, 'FLOAT_SUB': -260, 'FLOAT_DIV': -260, 'FLOAT_MUL': -260, '>': -260, 'NOT_EQUAL': -260, 'EQUAL': -260, 'OR': -260, 'STRICT_OR': -260, 'AND': -260, 'STRICT_AND': -260, 'TEXT_MATCH': -260, 'LESS_OR_EQ': -260, 'MORE_OR_EQ': -260, 'ARRAY_CONCAT': -260, 'ARRAY_SUB': -260, 'POW': -260, 'FLOAT_POW': -260, 'BIT_OR': -260, 'BIT_AND': -260, 'BIT_SHIFT_LEFT': -260, 'DOUBLE_ARROW_LEFT': -260, 'DOUBLE_ARROW_RIGHT': -260, 'ARROW_LEFT': -260, 'ARROW_RIGHT': -260, 'ARROW_BOTH': -260, 'SOME_CONCAT': -260, 'SOME_SUB': -260, 'FLOAT_LESS_OR_EQ': -260, 'FLOAT_LESS': -260, 'FLOAT_MORE_OR_EQ': -260, 'FLOAT_MORE': -260, 'NEWLINE': -260, '$end': -260, ')': -260, 'OF': -260, 'THEN': -260, ',': -260, ']': -260, '(': 136, 'END': -260, 'ELIF': -260, 'ELSE': -260},
+    201: {'CONCAT': -261, '+': -261, '-': -261, '/': -261, '*': -261, '<': -261, 'FLOAT_SUM': -261, 'FLOAT_SUB': -261, 'FLOAT_DIV': -261, 'FLOAT_MUL': -261, '>': -261, 'NOT_EQUAL': -261, 'EQUAL': -261, 'OR': -261, 'STRICT_OR': -261, 'AND': -261, 'STRICT_AND': -261, 'TEXT_MATCH': -261, 'LESS_OR_EQ': -261, 'MORE_OR_EQ': -261, 'ARRAY_CONCAT': -261, 'ARRAY_SUB': -261, 'POW': -261, 'FLOAT_POW': -261, 'BIT_OR': -261, 'BIT_AND': -261, 'BIT_SHIFT_LEFT': -261, 'DOUBLE_ARROW_LEFT': -261, 'DOUBLE_ARROW_RIGHT': -261, 'ARROW_LEFT': -261, 'ARROW_RIGHT': -261, 'ARROW_BOTH': -261, 'SOME_CONCAT': -261, 'SOME_SUB': -261, 'FLOAT_LESS_OR_EQ': -261, 'FLOAT_LESS': -261, 'FLOAT_MORE_OR_EQ': -261, 'FLOAT_MORE': -261, 'NEWLINE': -261, '$end': -261, ')': -261, 'OF': -261, 'THEN': -261, ',': -261, ']': -261, '(': 136, 'END': -261, 'ELIF': -261, 'ELSE': -261},
+    202: {'CONCAT': -262, '+': -262, '-': -262, '/': -262, '*': -262, '<': -262, 'FLOAT_SUM': -262, 'FLOAT_SUB': -262, 'FLOAT_DIV': -262, 'FLOAT_MUL': -262, '>': -262, 'NOT_EQUAL': -262, 'EQUAL': -262, 'OR': -262, 'STRICT_OR': -262, 'AND': -262, 'STRICT_AND': -262, 'TEXT_MATCH': -262, 'LESS_OR_EQ': -262, 'MORE_OR_EQ': -262, 'ARRAY_CONCAT': -262, 'ARRAY_SUB': -262, 'POW': -262, 'FLOAT_POW': -262, 'BIT_OR': -262, 'BIT_AND': -262, 'BIT_SHIFT_LEFT': -262, 'DOUBLE_ARROW_LEFT': -262, 'DOUBLE_ARROW_RIGHT': -262, 'ARROW_LEFT': -262, 'ARROW_RIGHT': -262, 'ARROW_BOTH': -262, 'SOME_CONCAT': -262, 'SOME_SUB': -262, 'FLOAT_LESS_OR_EQ': -262, 'FLOAT_LESS': -262, 'FLOAT_MORE_OR_EQ': -262, 'FLOAT_MORE': -262, 'NEWLINE': -262, '$end': -262, ')': -262, 'OF': -262, 'THEN': -262, ',': -262, ']': -262, '(': 136, 'END': -262, 'ELIF': -262, 'ELSE': -262},
+    203: {'CONCAT': -263, '+': -263, '-': -263, '/': -263, '*': -263, '<': -263, 'FLOAT_SUM': -263, 'FLOAT_SUB': -263, 'FLOAT_DIV': -263, 'FLOAT_MUL': -263, '>': -263, 'NOT_EQUAL': -263, 'EQUAL': -263, 'OR': -263, 'STRICT_OR': -263, 'AND': -263, 'STRICT_AND': -263, 'TEXT_MATCH': -263, 'LESS_OR_EQ': -263, 'MORE_OR_EQ': -263, 'ARRAY_CONCAT': -263, 'ARRAY_SUB': -263, 'POW': -263, 'FLOAT_POW': -263, 'BIT_OR': -263, 'BIT_AND': -263, 'BIT_SHIFT_LEFT': -263, 'DOUBLE_ARROW_LEFT': -263, 'DOUBLE_ARROW_RIGHT': -263, 'ARROW_LEFT': -263, 'ARROW_RIGHT': -263, 'ARROW_BOTH': -263, 'SOME_CONCAT': -263, 'SOME_SUB': -263, 'FLOAT_LESS_OR_EQ': -263, 'FLOAT_LESS': -263, 'FLOAT_MORE_OR_EQ': -263, 'FLOAT_MORE': -263, 'NEWLINE': -263, '$end': -263, ')': -263, 'OF': -263, 'THEN': -263, ',': -263, ']': -263, '(': 136, 'END': -263, 'ELIF': -263, 'ELSE': -263},
+    204: {'CONCAT': -264, '+': -264, '-': -264, '/': -264, '*': -264, '<': -264, 'FLOAT_SUM': -264, 'FLOAT_SUB': -264, 'FLOAT_DIV': -264, 'FLOAT_MUL': -264, '>': -264, 'NOT_EQUAL': -264, 'EQUAL': -264, 'OR': -264, 'STRICT_OR': -264, 'AND': -264, 'STRICT_AND': -264, 'TEXT_MATCH': -264, 'LESS_OR_EQ': -264, 'MORE_OR_EQ': -264, 'ARRAY_CONCAT': -264, 'ARRAY_SUB': -264, 'POW': -264, 'FLOAT_POW': -264, 'BIT_OR': -264, 'BIT_AND': -264, 'BIT_SHIFT_LEFT': -264, 'DOUBLE_ARROW_LEFT': -264, 'DOUBLE_ARROW_RIGHT': -264, 'ARROW_LEFT': -264, 'ARROW_RIGHT': -264, 'ARROW_BOTH': -264, 'SOME_CONCAT': -264, 'SOME_SUB': -264, 'FLOAT_LESS_OR_EQ': -264, 'FLOAT_LESS': -264, 'FLOAT_MORE_OR_EQ': -264, 'FLOAT_MORE': -264, 'NEWLINE': -264, '$end': -264, ')': -264, 'OF': -264, 'THEN': -264, ',': -264, ']': -264, '(': 136, 'END': -264, 'ELIF': -264, 'ELSE': -264},
+    205: {'CONCAT': -265, '+': -265, '-': -265, '/': -265, '*': -265, '<': -265, 'FLOAT_SUM': -265, 'FLOAT_SUB': -265, 'FLOAT_DIV': -265, 'FLOAT_MUL': -265, '>': -265, 'NOT_EQUAL': -265, 'EQUAL': -265, 'OR': -265, 'STRICT_OR': -265, 'AND': -265, 'STRICT_AND': -265, 'TEXT_MATCH': -265, 'LESS_OR_EQ': -265, 'MORE_OR_EQ': -265, 'ARRAY_CONCAT': -265, 'ARRAY_SUB': -265, 'POW': -265, 'FLOAT_POW': -265, 'BIT_OR': -265, 'BIT_AND': -265, 'BIT_SHIFT_LEFT': -265, 'DOUBLE_ARROW_LEFT': -265, 'DOUBLE_ARROW_RIGHT': -265, 'ARROW_LEFT': -265, 'ARROW_RIGHT': -265, 'ARROW_BOTH': -265, 'SOME_CONCAT': -265, 'SOME_SUB': -265, 'FLOAT_LESS_OR_EQ': -265, 'FLOAT_LESS': -265, 'FLOAT_MORE_OR_EQ': -265, 'FLOAT_MORE': -265, 'NEWLINE': -265, '$end': -265, ')': -265, 'OF': -265, 'THEN': -265, ',': -265, ']': -265, '(': 136, 'END': -265, 'ELIF': -265, 'ELSE': -265},
+    206: {'CONCAT': -266, '+': -266, '-': -266, '/': -266, '*': -266, '<': -266, 'FLOAT_SUM': -266, 'FLOAT_SUB': -266, 'FLOAT_DIV': -266, 'FLOAT_MUL': -266, '>': -266, 'NOT_EQUAL': -266, 'EQUAL': -266, 'OR': -266, 'STRICT_OR': -266, 'AND': -266, 'STRICT_AND': -266, 'TEXT_MATCH': -266, 'LESS_OR_EQ': -266, 'MORE_OR_EQ': -266, 'ARRAY_CONCAT': -266, 'ARRAY_SUB': -266, 'POW': -266, 'FLOAT_POW': -266, 'BIT_OR': -266, 'BIT_AND': -266, 'BIT_SHIFT_LEFT': -266, 'DOUBLE_ARROW_LEFT': -266, 'DOUBLE_ARROW_RIGHT': -266, 'ARROW_LEFT': -266, 'ARROW_RIGHT': -266, 'ARROW_BOTH': -266, 'SOME_CONCAT': -266, 'SOME_SUB': -266, 'FLOAT_LESS_OR_EQ': -266, 'FLOAT_LESS': -266, 'FLOAT_MORE_OR_EQ': -266, 'FLOAT_MORE': -266, 'NEWLINE': -266, '$end': -266, ')': -266, 'OF': -266, 'THEN': -266, ',': -266, ']': -266, '(': 136, 'END': -266, 'ELIF': -266, 'ELSE': -266},
+    207: {'CONCAT': -267, '+': -267, '-': -267, '/': -267, '*': -267, '<': -267, 'FLOAT_SUM': -267, 'FLOAT_SUB': -267, 'FLOAT_DIV': -267, 'FLOAT_MUL': -267, '>': -267, 'NOT_EQUAL': -267, 'EQUAL': -267, 'OR': -267, 'STRICT_OR': -267, 'AND': -267, 'STRICT_AND': -267, 'TEXT_MATCH': -267, 'LESS_OR_EQ': -267, 'MORE_OR_EQ': -267, 'ARRAY_CONCAT': -267, 'ARRAY_SUB': -267, 'POW': -267, 'FLOAT_POW': -267, 'BIT_OR': -267, 'BIT_AND': -267, 'BIT_SHIFT_LEFT': -267, 'DOUBLE_ARROW_LEFT': -267, 'DOUBLE_ARROW_RIGHT': -267, 'ARROW_LEFT': -267, 'ARROW_RIGHT': -267, 'ARROW_BOTH': -267, 'SOME_CONCAT': -267, 'SOME_SUB': -267, 'FLOAT_LESS_OR_EQ': -267, 'FLOAT_LESS': -267, 'FLOAT_MORE_OR_EQ': -267, 'FLOAT_MORE': -267, 'NEWLINE': -267, '$end': -267, ')': -267, 'OF': -267, 'THEN': -267, ',': -267, ']': -267, '(': 136, 'END': -267, 'ELIF': -267, 'ELSE': -267},
+    208: {'CONCAT': -268, '+': -268, '-': -268, '/': -268, '*': -268, '<': -268, 'FLOAT_SUM': -268, 'FLOAT_SUB': -268, 'FLOAT_DIV': -268, 'FLOAT_MUL': -268, '>': -268, 'NOT_EQUAL': -268, 'EQUAL': -268, 'OR': -268, 'STRICT_OR': -268, 'AND': -268, 'STRICT_AND': -268, 'TEXT_MATCH': -268, 'LESS_OR_EQ': -268, 'MORE_OR_EQ': -268, 'ARRAY_CONCAT': -268, 'ARRAY_SUB': -268, 'POW': -268, 'FLOAT_POW': -268, 'BIT_OR': -268, 'BIT_AND': -268, 'BIT_SHIFT_LEFT': -268, 'DOUBLE_ARROW_LEFT': -268, 'DOUBLE_ARROW_RIGHT': -268, 'ARROW_LEFT': -268, 'ARROW_RIGHT': -268, 'ARROW_BOTH': -268, 'SOME_CONCAT': -268, 'SOME_SUB': -268, 'FLOAT_LESS_OR_EQ': -268, 'FLOAT_LESS': -268, 'FLOAT_MORE_OR_EQ': -268, 'FLOAT_MORE': -268, 'NEWLINE': -268, '$end': -268, ')': -268, 'OF': -268, 'THEN': -268, ',': -268, ']': -268, '(': 136, 'END': -268, 'ELIF': -268, 'ELSE': -268},
+    209: {'CONCAT': -269, '+': -269, '-': -269, '/': -269, '*': -269, '<': -269, 'FLOAT_SUM': -269, 'FLOAT_SUB': -269, 'FLOAT_DIV': -269, 'FLOAT_MUL': -269, '>': -269, 'NOT_EQUAL': -269, 'EQUAL': -269, 'OR': -269, 'STRICT_OR': -269, 'AND': -269, 'STRICT_AND': -269, 'TEXT_MATCH': -269, 'LESS_OR_EQ': -269, 'MORE_OR_EQ': -269, 'ARRAY_CONCAT': -269, 'ARRAY_SUB': -269, 'POW': -269, 'FLOAT_POW': -269, 'BIT_OR': -269, 'BIT_AND': -269, 'BIT_SHIFT_LEFT': -269, 'DOUBLE_ARROW_LEFT': -269, 'DOUBLE_ARROW_RIGHT': -269, 'ARROW_LEFT': -269, 'ARROW_RIGHT': -269, 'ARROW_BOTH': -269, 'SOME_CONCAT': -269, 'SOME_SUB': -269, 'FLOAT_LESS_OR_EQ': -269, 'FLOAT_LESS': -269, 'FLOAT_MORE_OR_EQ': -269, 'FLOAT_MORE': -269, 'NEWLINE': -269, '$end': -269, ')': -269, 'OF': -269, 'THEN': -269, ',': -269, ']': -269, '(': 136, 'END': -269, 'ELIF': -269, 'ELSE': -269},
+    210: {'CONCAT': -270, '+': -270, '-': -270, '/': -270, '*': -270, '<': -270, 'FLOAT_SUM': -270, 'FLOAT_SUB': -270, 'FLOAT_DIV': -270, 'FLOAT_MUL': -270, '>': -270, 'NOT_EQUAL': -270, 'EQUAL': -270, 'OR': -270, 'STRICT_OR': -270, 'AND': -270, 'STRICT_AND': -270, 'TEXT_MATCH': -270, 'LESS_OR_EQ': -270, 'MORE_OR_EQ': -270, 'ARRAY_CONCAT': -270, 'ARRAY_SUB': -270, 'POW': -270, 'FLOAT_POW': -270, 'BIT_OR': -270, 'BIT_AND': -270, 'BIT_SHIFT_LEFT': -270, 'DOUBLE_ARROW_LEFT': -270, 'DOUBLE_ARROW_RIGHT': -270, 'ARROW_LEFT': -270, 'ARROW_RIGHT': -270, 'ARROW_BOTH': -270, 'SOME_CONCAT': -270, 'SOME_SUB': -270, 'FLOAT_LESS_OR_EQ': -270, 'FLOAT_LESS': -270, 'FLOAT_MORE_OR_EQ': -270, 'FLOAT_MORE': -270, 'NEWLINE': -270, '$end': -270, ')': -270, 'OF': -270, 'THEN': -270, ',': -270, ']': -270, '(': 136, 'END': -270, 'ELIF': -270, 'ELSE': -270},
+    211: {'CONCAT': -271, '+': -271, '-': -271, '/': -271, '*': -271, '<': -271, 'FLOAT_SUM': -271, 'FLOAT_SUB': -271, 'FLOAT_DIV': -271, 'FLOAT_MUL': -271, '>': -271, 'NOT_EQUAL': -271, 'EQUAL': -271, 'OR': -271, 'STRICT_OR': -271, 'AND': -271, 'STRICT_AND': -271, 'TEXT_MATCH': -271, 'LESS_OR_EQ': -271, 'MORE_OR_EQ': -271, 'ARRAY_CONCAT': -271, 'ARRAY_SUB': -271, 'POW': -271, 'FLOAT_POW': -271, 'BIT_OR': -271, 'BIT_AND': -271, 'BIT_SHIFT_LEFT': -271, 'DOUBLE_ARROW_LEFT': -271, 'DOUBLE_ARROW_RIGHT': -271, 'ARROW_LEFT': -271, 'ARROW_RIGHT': -271, 'ARROW_BOTH': -271, 'SOME_CONCAT': -271, 'SOME_SUB': -271, 'FLOAT_LESS_OR_EQ': -271, 'FLOAT_LESS': -271, 'FLOAT_MORE_OR_EQ': -271, 'FLOAT_MORE': -271, 'NEWLINE': -271, '$end': -271, ')': -271, 'OF': -271, 'THEN': -271, ',': -271, ']': -271, '(': 136, 'END': -271, 'ELIF': -271, 'ELSE': -271},
+    212: {'CONCAT': -272, '+': -272, '-': -272, '/': -272, '*': -272, '<': -272, 'FLOAT_SUM': -272, 'FLOAT_SUB': -272, 'FLOAT_DIV': -272, 'FLOAT_MUL': -272, '>': -272, 'NOT_EQUAL': -272, 'EQUAL': -272, 'OR': -272, 'STRICT_OR': -272, 'AND': -272, 'STRICT_AND': -272, 'TEXT_MATCH': -272, 'LESS_OR_EQ': -272, 'MORE_OR_EQ': -272, 'ARRAY_CONCAT': -272, 'ARRAY_SUB': -272, 'POW': -272, 'FLOAT_POW': -272, 'BIT_OR': -272, 'BIT_AND': -272, 'BIT_SHIFT_LEFT': -272, 'DOUBLE_ARROW_LEFT': -272, 'DOUBLE_ARROW_RIGHT': -272, 'ARROW_LEFT': -272, 'ARROW_RIGHT': -272, 'ARROW_BOTH': -272, 'SOME_CONCAT': -272, 'SOME_SUB': -272, 'FLOAT_LESS_OR_EQ': -272, 'FLOAT_LESS': -272, 'FLOAT_MORE_OR_EQ': -272, 'FLOAT_MORE': -272, 'NEWLINE': -272, '$end': -272, ')': -272, 'OF': -272, 'THEN': -272, ',': -272, ']': -272, '(': 136, 'END': -272, 'ELIF': -272, 'ELSE': -272},
+    213: {'CONCAT': -273, '+': -273, '-': -273, '/': -273, '*': -273, '<': -273, 'FLOAT_SUM': -273, 'FLOAT_SUB': -273, 'FLOAT_DIV': -273, 'FLOAT_MUL': -273, '>': -273, 'NOT_EQUAL': -273, 'EQUAL': -273, 'OR': -273, 'STRICT_OR': -273, 'AND': -273, 'STRICT_AND': -273, 'TEXT_MATCH': -273, 'LESS_OR_EQ': -273, 'MORE_OR_EQ': -273, 'ARRAY_CONCAT': -273, 'ARRAY_SUB': -273, 'POW': -273, 'FLOAT_POW': -273, 'BIT_OR': -273, 'BIT_AND': -273, 'BIT_SHIFT_LEFT': -273, 'DOUBLE_ARROW_LEFT': -273, 'DOUBLE_ARROW_RIGHT': -273, 'ARROW_LEFT': -273, 'ARROW_RIGHT': -273, 'ARROW_BOTH': -273, 'SOME_CONCAT': -273, 'SOME_SUB': -273, 'FLOAT_LESS_OR_EQ': -273, 'FLOAT_LESS': -273, 'FLOAT_MORE_OR_EQ': -273, 'FLOAT_MORE': -273, 'NEWLINE': -273, '$end': -273, ')': -273, 'OF': -273, 'THEN': -273, ',': -273, ']': -273, '(': 136, 'END': -273, 'ELIF': -273, 'ELSE': -273},
+    214: {'CONCAT': -274, '+': -274, '-': -274, '/': -274, '*': -274, '<': -274, 'FLOAT_SUM': -274, 'FLOAT_SUB': -274, 'FLOAT_DIV': -274, 'FLOAT_MUL': -274, '>': -274, 'NOT_EQUAL': -274, 'EQUAL': -274, 'OR': -274, 'STRICT_OR': -274, 'AND': -274, 'STRICT_AND': -274, 'TEXT_MATCH': -274, 'LESS_OR_EQ': -274, 'MORE_OR_EQ': -274, 'ARRAY_CONCAT': -274, 'ARRAY_SUB': -274, 'POW': -274, 'FLOAT_POW': -274, 'BIT_OR': -274, 'BIT_AND': -274, 'BIT_SHIFT_LEFT': -274, 'DOUBLE_ARROW_LEFT': -274, 'DOUBLE_ARROW_RIGHT': -274, 'ARROW_LEFT': -274, 'ARROW_RIGHT': -274, 'ARROW_BOTH': -274, 'SOME_CONCAT': -274, 'SOME_SUB': -274, 'FLOAT_LESS_OR_EQ': -274, 'FLOAT_LESS': -274, 'FLOAT_MORE_OR_EQ': -274, 'FLOAT_MORE': -274, 'NEWLINE': -274, '$end': -274, ')': -274, 'OF': -274, 'THEN': -274, ',': -274, ']': -274, '(': 136, 'END': -274, 'ELIF': -274, 'ELSE': -274},
+    215: {'CONCAT': -275, '+': -275, '-': -275, '/': -275, '*': -275, '<': -275, 'FLOAT_SUM': -275, 'FLOAT_SUB': -275, 'FLOAT_DIV': -275, 'FLOAT_MUL': -275, '>': -275, 'NOT_EQUAL': -275, 'EQUAL': -275, 'OR': -275, 'STRICT_OR': -275, 'AND': -275, 'STRICT_AND': -275, 'TEXT_MATCH': -275, 'LESS_OR_EQ': -275, 'MORE_OR_EQ': -275, 'ARRAY_CONCAT': -275, 'ARRAY_SUB': -275, 'POW': -275, 'FLOAT_POW': -275, 'BIT_OR': -275, 'BIT_AND': -275, 'BIT_SHIFT_LEFT': -275, 'DOUBLE_ARROW_LEFT': -275, 'DOUBLE_ARROW_RIGHT': -275, 'ARROW_LEFT': -275, 'ARROW_RIGHT': -275, 'ARROW_BOTH': -275, 'SOME_CONCAT': -275, 'SOME_SUB': -275, 'FLOAT_LESS_OR_EQ': -275, 'FLOAT_LESS': -275, 'FLOAT_MORE_OR_EQ': -275, 'FLOAT_MORE': -275, 'NEWLINE': -275, '$end': -275, ')': -275, 'OF': -275, 'THEN': -275, ',': -275, ']': -275, '(': 136, 'END': -275, 'ELIF': -275, 'ELSE': -275},
+    216: {'CONCAT': -276, '+': -276, '-': -276, '/': -276, '*': -276, '<': -276, 'FLOAT_SUM': -276, 'FLOAT_SUB': -276, 'FLOAT_DIV': -276, 'FLOAT_MUL': -276, '>': -276, 'NOT_EQUAL': -276, 'EQUAL': -276, 'OR': -276, 'STRICT_OR': -276, 'AND': -276, 'STRICT_AND': -276, 'TEXT_MATCH': -276, 'LESS_OR_EQ': -276, 'MORE_OR_EQ': -276, 'ARRAY_CONCAT': -276, 'ARRAY_SUB': -276, 'POW': -276, 'FLOAT_POW': -276, 'BIT_OR': -276, 'BIT_AND': -276, 'BIT_SHIFT_LEFT': -276, 'DOUBLE_ARROW_LEFT': -276, 'DOUBLE_ARROW_RIGHT': -276, 'ARROW_LEFT': -276, 'ARROW_RIGHT': -276, 'ARROW_BOTH': -276, 'SOME_CONCAT': -276, 'SOME_SUB': -276, 'FLOAT_LESS_OR_EQ': -276, 'FLOAT_LESS': -276, 'FLOAT_MORE_OR_EQ': -276, 'FLOAT_MORE': -276, 'NEWLINE': -276, '$end': -276, ')': -276, 'OF': -276, 'THEN': -276, ',': -276, ']': -276, '(': 136, 'END': -276, 'ELIF': -276, 'ELSE': -276},
+    217: {'CONCAT': -277, '+': -277, '-': -277, '/': -277, '*': -277, '<': -277, 'FLOAT_SUM': -277, 'FLOAT_SUB': -277, 'FLOAT_DIV': -277, 'FLOAT_MUL': -277, '>': -277, 'NOT_EQUAL': -277, 'EQUAL': -277, 'OR': -277, 'STRICT_OR': -277, 'AND': -277, 'STRICT_AND': -277, 'TEXT_MATCH': -277, 'LESS_OR_EQ': -277, 'MORE_OR_EQ': -277, 'ARRAY_CONCAT': -277, 'ARRAY_SUB': -277, 'POW': -277, 'FLOAT_POW': -277, 'BIT_OR': -277, 'BIT_AND': -277, 'BIT_SHIFT_LEFT': -277, 'DOUBLE_ARROW_LEFT': -277, 'DOUBLE_ARROW_RIGHT': -277, 'ARROW_LEFT': -277, 'ARROW_RIGHT': -277, 'ARROW_BOTH': -277, 'SOME_CONCAT': -277, 'SOME_SUB': -277, 'FLOAT_LESS_OR_EQ': -277, 'FLOAT_LESS': -277, 'FLOAT_MORE_OR_EQ': -277, 'FLOAT_MORE': -277, 'NEWLINE': -277, '$end': -277, ')': -277, 'OF': -277, 'THEN': -277, ',': -277, ']': -277, '(': 136, 'END': -277, 'ELIF': -277, 'ELSE': -277},
+    218: {'CONCAT': -278, '+': -278, '-': -278, '/': -278, '*': -278, '<': -278, 'FLOAT_SUM': -278, 'FLOAT_SUB': -278, 'FLOAT_DIV': -278, 'FLOAT_MUL': -278, '>': -278, 'NOT_EQUAL': -278, 'EQUAL': -278, 'OR': -278, 'STRICT_OR': -278, 'AND': -278, 'STRICT_AND': -278, 'TEXT_MATCH': -278, 'LESS_OR_EQ': -278, 'MORE_OR_EQ': -278, 'ARRAY_CONCAT': -278, 'ARRAY_SUB': -278, 'POW': -278, 'FLOAT_POW': -278, 'BIT_OR': -278, 'BIT_AND': -278, 'BIT_SHIFT_LEFT': -278, 'DOUBLE_ARROW_LEFT': -278, 'DOUBLE_ARROW_RIGHT': -278, 'ARROW_LEFT': -278, 'ARROW_RIGHT': -278, 'ARROW_BOTH': -278, 'SOME_CONCAT': -278, 'SOME_SUB': -278, 'FLOAT_LESS_OR_EQ': -278, 'FLOAT_LESS': -278, 'FLOAT_MORE_OR_EQ': -278, 'FLOAT_MORE': -278, 'NEWLINE': -278, '$end': -278, ')': -278, 'OF': -278, 'THEN': -278, ',': -278, ']': -278, '(': 136, 'END': -278, 'ELIF': -278, 'ELSE': -278},
+    219: {'CONCAT': -279, '+': -279, '-': -279, '/': -279, '*': -279, '<': -279, 'FLOAT_SUM': -279, 'FLOAT_SUB': -279, 'FLOAT_DIV': -279, 'FLOAT_MUL': -279, '>': -279, 'NOT_EQUAL': -279, 'EQUAL': -279, 'OR': -279, 'STRICT_OR': -279, 'AND': -279, 'STRICT_AND': -279, 'TEXT_MATCH': -279, 'LESS_OR_EQ': -279, 'MORE_OR_EQ': -279, 'ARRAY_CONCAT': -279, 'ARRAY_SUB': -279, 'POW': -279, 'FLOAT_POW': -279, 'BIT_OR': -279, 'BIT_AND': -279, 'BIT_SHIFT_LEFT': -279, 'DOUBLE_ARROW_LEFT': -279, 'DOUBLE_ARROW_RIGHT': -279, 'ARROW_LEFT': -279, 'ARROW_RIGHT': -279, 'ARROW_BOTH': -279, 'SOME_CONCAT': -279, 'SOME_SUB': -279, 'FLOAT_LESS_OR_EQ': -279, 'FLOAT_LESS': -279, 'FLOAT_MORE_OR_EQ': -279, 'FLOAT_MORE': -279, 'NEWLINE': -279, '$end': -279, ')': -279, 'OF': -279, 'THEN': -279, ',': -279, ']': -279, '(': 136, 'END': -279, 'ELIF': -279, 'ELSE': -279},
+    220: {'CONCAT': -280, '+': -280, '-': -280, '/': -280, '*': -280, '<': -280, 'FLOAT_SUM': -280, 'FLOAT_SUB': -280, 'FLOAT_DIV': -280, 'FLOAT_MUL': -280, '>': -280, 'NOT_EQUAL': -280, 'EQUAL': -280, 'OR': -280, 'STRICT_OR': -280, 'AND': -280, 'STRICT_AND': -280, 'TEXT_MATCH': -280, 'LESS_OR_EQ': -280, 'MORE_OR_EQ': -280, 'ARRAY_CONCAT': -280, 'ARRAY_SUB': -280, 'POW': -280, 'FLOAT_POW': -280, 'BIT_OR': -280, 'BIT_AND': -280, 'BIT_SHIFT_LEFT': -280, 'DOUBLE_ARROW_LEFT': -280, 'DOUBLE_ARROW_RIGHT': -280, 'ARROW_LEFT': -280, 'ARROW_RIGHT': -280, 'ARROW_BOTH': -280, 'SOME_CONCAT': -280, 'SOME_SUB': -280, 'FLOAT_LESS_OR_EQ': -280, 'FLOAT_LESS': -280, 'FLOAT_MORE_OR_EQ': -280, 'FLOAT_MORE': -280, 'NEWLINE': -280, '$end': -280, ')': -280, 'OF': -280, 'THEN': -280, ',': -280, ']': -280, '(': 136, 'END': -280, 'ELIF': -280, 'ELSE': -280},
+    221: {'CONCAT': -281, '+': -281, '-': -281, '/': -281, '*': -281, '<': -281, 'FLOAT_SUM': -281, 'FLOAT_SUB': -281, 'FLOAT_DIV': -281, 'FLOAT_MUL': -281, '>': -281, 'NOT_EQUAL': -281, 'EQUAL': -281, 'OR': -281, 'STRICT_OR': -281, 'AND': -281, 'STRICT_AND': -281, 'TEXT_MATCH': -281, 'LESS_OR_EQ': -281, 'MORE_OR_EQ': -281, 'ARRAY_CONCAT': -281, 'ARRAY_SUB': -281, 'POW': -281, 'FLOAT_POW': -281, 'BIT_OR': -281, 'BIT_AND': -281, 'BIT_SHIFT_LEFT': -281, 'DOUBLE_ARROW_LEFT': -281, 'DOUBLE_ARROW_RIGHT': -281, 'ARROW_LEFT': -281, 'ARROW_RIGHT': -281, 'ARROW_BOTH': -281, 'SOME_CONCAT': -281, 'SOME_SUB': -281, 'FLOAT_LESS_OR_EQ': -281, 'FLOAT_LESS': -281, 'FLOAT_MORE_OR_EQ': -281, 'FLOAT_MORE': -281, 'NEWLINE': -281, '$end': -281, ')': -281, 'OF': -281, 'THEN': -281, ',': -281, ']': -281, '(': 136, 'END': -281, 'ELIF': -281, 'ELSE': -281},
+    222: {'CONCAT': -282, '+': -282, '-': -282, '/': -282, '*': -282, '<': -282, 'FLOAT_SUM': -282, 'FLOAT_SUB': -282, 'FLOAT_DIV': -282, 'FLOAT_MUL': -282, '>': -282, 'NOT_EQUAL': -282, 'EQUAL': -282, 'OR': -282, 'STRICT_OR': -282, 'AND': -282, 'STRICT_AND': -282, 'TEXT_MATCH': -282, 'LESS_OR_EQ': -282, 'MORE_OR_EQ': -282, 'ARRAY_CONCAT': -282, 'ARRAY_SUB': -282, 'POW': -282, 'FLOAT_POW': -282, 'BIT_OR': -282, 'BIT_AND': -282, 'BIT_SHIFT_LEFT': -282, 'DOUBLE_ARROW_LEFT': -282, 'DOUBLE_ARROW_RIGHT': -282, 'ARROW_LEFT': -282, 'ARROW_RIGHT': -282, 'ARROW_BOTH': -282, 'SOME_CONCAT': -282, 'SOME_SUB': -282, 'FLOAT_LESS_OR_EQ': -282, 'FLOAT_LESS': -282, 'FLOAT_MORE_OR_EQ': -282, 'FLOAT_MORE': -282, 'NEWLINE': -282, '$end': -282, ')': -282, 'OF': -282, 'THEN': -282, ',': -282, ']': -282, '(': 136, 'END': -282, 'ELIF': -282, 'ELSE': -282},
+    223: {'CONCAT': -283, '+': -283, '-': -283, '/': -283, '*': -283, '<': -283, 'FLOAT_SUM': -283, 'FLOAT_SUB': -283, 'FLOAT_DIV': -283, 'FLOAT_MUL': -283, '>': -283, 'NOT_EQUAL': -283, 'EQUAL': -283, 'OR': -283, 'STRICT_OR': -283, 'AND': -283, 'STRICT_AND': -283, 'TEXT_MATCH': -283, 'LESS_OR_EQ': -283, 'MORE_OR_EQ': -283, 'ARRAY_CONCAT': -283, 'ARRAY_SUB': -283, 'POW': -283, 'FLOAT_POW': -283, 'BIT_OR': -283, 'BIT_AND': -283, 'BIT_SHIFT_LEFT': -283, 'DOUBLE_ARROW_LEFT': -283, 'DOUBLE_ARROW_RIGHT': -283, 'ARROW_LEFT': -283, 'ARROW_RIGHT': -283, 'ARROW_BOTH': -283, 'SOME_CONCAT': -283, 'SOME_SUB': -283, 'FLOAT_LESS_OR_EQ': -283, 'FLOAT_LESS': -283, 'FLOAT_MORE_OR_EQ': -283, 'FLOAT_MORE': -283, 'NEWLINE': -283, '$end': -283, ')': -283, 'OF': -283, 'THEN': -283, ',': -283, ']': -283, '(': 136, 'END': -283, 'ELIF': -283, 'ELSE': -283},
+    224: {'CONCAT': -284, '+': -284, '-': -284, '/': -284, '*': -284, '<': -284, 'FLOAT_SUM': -284, 'FLOAT_SUB': -284, 'FLOAT_DIV': -284, 'FLOAT_MUL': -284, '>': -284, 'NOT_EQUAL': -284, 'EQUAL': -284, 'OR': -284, 'STRICT_OR': -284, 'AND': -284, 'STRICT_AND': -284, 'TEXT_MATCH': -284, 'LESS_OR_EQ': -284, 'MORE_OR_EQ': -284, 'ARRAY_CONCAT': -284, 'ARRAY_SUB': -284, 'POW': -284, 'FLOAT_POW': -284, 'BIT_OR': -284, 'BIT_AND': -284, 'BIT_SHIFT_LEFT': -284, 'DOUBLE_ARROW_LEFT': -284, 'DOUBLE_ARROW_RIGHT': -284, 'ARROW_LEFT': -284, 'ARROW_RIGHT': -284, 'ARROW_BOTH': -284, 'SOME_CONCAT': -284, 'SOME_SUB': -284, 'FLOAT_LESS_OR_EQ': -284, 'FLOAT_LESS': -284, 'FLOAT_MORE_OR_EQ': -284, 'FLOAT_MORE': -284, 'NEWLINE': -284, '$end': -284, ')': -284, 'OF': -284, 'THEN': -284, ',': -284, ']': -284, '(': 136, 'END': -284, 'ELIF': -284, 'ELSE': -284},
+    225: {'CONCAT': -285, '+': -285, '-': -285, '/': -285, '*': -285, '<': -285, 'FLOAT_SUM': -285, 'FLOAT_SUB': -285, 'FLOAT_DIV': -285, 'FLOAT_MUL': -285, '>': -285, 'NOT_EQUAL': -285, 'EQUAL': -285, 'OR': -285, 'STRICT_OR': -285, 'AND': -285, 'STRICT_AND': -285, 'TEXT_MATCH': -285, 'LESS_OR_EQ': -285, 'MORE_OR_EQ': -285, 'ARRAY_CONCAT': -285, 'ARRAY_SUB': -285, 'POW': -285, 'FLOAT_POW': -285, 'BIT_OR': -285, 'BIT_AND': -285, 'BIT_SHIFT_LEFT': -285, 'DOUBLE_ARROW_LEFT': -285, 'DOUBLE_ARROW_RIGHT': -285, 'ARROW_LEFT': -285, 'ARROW_RIGHT': -285, 'ARROW_BOTH': -285, 'SOME_CONCAT': -285, 'SOME_SUB': -285, 'FLOAT_LESS_OR_EQ': -285, 'FLOAT_LESS': -285, 'FLOAT_MORE_OR_EQ': -285, 'FLOAT_MORE': -285, 'NEWLINE': -285, '$end': -285, ')': -285, 'OF': -285, 'THEN': -285, ',': -285, ']': -285, '(': 136, 'END': -285, 'ELIF': -285, 'ELSE': -285},
+    226: {'CONCAT': -286, '+': -286, '-': -286, '/': -286, '*': -286, '<': -286, 'FLOAT_SUM': -286, 'FLOAT_SUB': -286, 'FLOAT_DIV': -286, 'FLOAT_MUL': -286, '>': -286, 'NOT_EQUAL': -286, 'EQUAL': -286, 'OR': -286, 'STRICT_OR': -286, 'AND': -286, 'STRICT_AND': -286, 'TEXT_MATCH': -286, 'LESS_OR_EQ': -286, 'MORE_OR_EQ': -286, 'ARRAY_CONCAT': -286, 'ARRAY_SUB': -286, 'POW': -286, 'FLOAT_POW': -286, 'BIT_OR': -286, 'BIT_AND': -286, 'BIT_SHIFT_LEFT': -286, 'DOUBLE_ARROW_LEFT': -286, 'DOUBLE_ARROW_RIGHT': -286, 'ARROW_LEFT': -286, 'ARROW_RIGHT': -286, 'ARROW_BOTH': -286, 'SOME_CONCAT': -286, 'SOME_SUB': -286, 'FLOAT_LESS_OR_EQ': -286, 'FLOAT_LESS': -286, 'FLOAT_MORE_OR_EQ': -286, 'FLOAT_MORE': -286, 'NEWLINE': -286, '$end': -286, ')': -286, 'OF': -286, 'THEN': -286, ',': -286, ']': -286, '(': 136, 'END': -286, 'ELIF': -286, 'ELSE': -286},
+    227: {'CONCAT': -287, '+': -287, '-': -287, '/': -287, '*': -287, '<': -287, 'FLOAT_SUM': -287, 'FLOAT_SUB': -287, 'FLOAT_DIV': -287, 'FLOAT_MUL': -287, '>': -287, 'NOT_EQUAL': -287, 'EQUAL': -287, 'OR': -287, 'STRICT_OR': -287, 'AND': -287, 'STRICT_AND': -287, 'TEXT_MATCH': -287, 'LESS_OR_EQ': -287, 'MORE_OR_EQ': -287, 'ARRAY_CONCAT': -287, 'ARRAY_SUB': -287, 'POW': -287, 'FLOAT_POW': -287, 'BIT_OR': -287, 'BIT_AND': -287, 'BIT_SHIFT_LEFT': -287, 'DOUBLE_ARROW_LEFT': -287, 'DOUBLE_ARROW_RIGHT': -287, 'ARROW_LEFT': -287, 'ARROW_RIGHT': -287, 'ARROW_BOTH': -287, 'SOME_CONCAT': -287, 'SOME_SUB': -287, 'FLOAT_LESS_OR_EQ': -287, 'FLOAT_LESS': -287, 'FLOAT_MORE_OR_EQ': -287, 'FLOAT_MORE': -287, 'NEWLINE': -287, '$end': -287, ')': -287, 'OF': -287, 'THEN': -287, ',': -287, ']': -287, '(': 136, 'END': -287, 'ELIF': -287, 'ELSE': -287},
+    228: {'CONCAT': -288, '+': -288, '-': -288, '/': -288, '*': -288, '<': -288, 'FLOAT_SUM': -288, 'FLOAT_SUB': -288, 'FLOAT_DIV': -288, 'FLOAT_MUL': -288, '>': -288, 'NOT_EQUAL': -288, 'EQUAL': -288, 'OR': -288, 'STRICT_OR': -288, 'AND': -288, 'STRICT_AND': -288, 'TEXT_MATCH': -288, 'LESS_OR_EQ': -288, 'MORE_OR_EQ': -288, 'ARRAY_CONCAT': -288, 'ARRAY_SUB': -288, 'POW': -288, 'FLOAT_POW': -288, 'BIT_OR': -288, 'BIT_AND': -288, 'BIT_SHIFT_LEFT': -288, 'DOUBLE_ARROW_LEFT': -288, 'DOUBLE_ARROW_RIGHT': -288, 'ARROW_LEFT': -288, 'ARROW_RIGHT': -288, 'ARROW_BOTH': -288, 'SOME_CONCAT': -288, 'SOME_SUB': -288, 'FLOAT_LESS_OR_EQ': -288, 'FLOAT_LESS': -288, 'FLOAT_MORE_OR_EQ': -288, 'FLOAT_MORE': -288, 'NEWLINE': -288, '$end': -288, ')': -288, 'OF': -288, 'THEN': -288, ',': -288, ']': -288, '(': 136, 'END': -288, 'ELIF': -288, 'ELSE': -288},
+    229: {'CONCAT': -289, '+': -289, '-': -289, '/': -289, '*': -289, '<': -289, 'FLOAT_SUM': -289, 'FLOAT_SUB': -289, 'FLOAT_DIV': -289, 'FLOAT_MUL': -289, '>': -289, 'NOT_EQUAL': -289, 'EQUAL': -289, 'OR': -289, 'STRICT_OR': -289, 'AND': -289, 'STRICT_AND': -289, 'TEXT_MATCH': -289, 'LESS_OR_EQ': -289, 'MORE_OR_EQ': -289, 'ARRAY_CONCAT': -289, 'ARRAY_SUB': -289, 'POW': -289, 'FLOAT_POW': -289, 'BIT_OR': -289, 'BIT_AND': -289, 'BIT_SHIFT_LEFT': -289, 'DOUBLE_ARROW_LEFT': -289, 'DOUBLE_ARROW_RIGHT': -289, 'ARROW_LEFT': -289, 'ARROW_RIGHT': -289, 'ARROW_BOTH': -289, 'SOME_CONCAT': -289, 'SOME_SUB': -289, 'FLOAT_LESS_OR_EQ': -289, 'FLOAT_LESS': -289, 'FLOAT_MORE_OR_EQ': -289, 'FLOAT_MORE': -289, 'NEWLINE': -289, '$end': -289, ')': -289, 'OF': -289, 'THEN': -289, ',': -289, ']': -289, '(': 136, 'END': -289, 'ELIF': -289, 'ELSE': -289},
+    230: {'CONCAT': -290, '+': -290, '-': -290, '/': -290, '*': -290, '<': -290, 'FLOAT_SUM': -290, 'FLOAT_SUB': -290, 'FLOAT_DIV': -290, 'FLOAT_MUL': -290, '>': -290, 'NOT_EQUAL': -290, 'EQUAL': -290, 'OR': -290, 'STRICT_OR': -290, 'AND': -290, 'STRICT_AND': -290, 'TEXT_MATCH': -290, 'LESS_OR_EQ': -290, 'MORE_OR_EQ': -290, 'ARRAY_CONCAT': -290, 'ARRAY_SUB': -290, 'POW': -290, 'FLOAT_POW': -290, 'BIT_OR': -290, 'BIT_AND': -290, 'BIT_SHIFT_LEFT': -290, 'DOUBLE_ARROW_LEFT': -290, 'DOUBLE_ARROW_RIGHT': -290, 'ARROW_LEFT': -290, 'ARROW_RIGHT': -290, 'ARROW_BOTH': -290, 'SOME_CONCAT': -290, 'SOME_SUB': -290, 'FLOAT_LESS_OR_EQ': -290, 'FLOAT_LESS': -290, 'FLOAT_MORE_OR_EQ': -290, 'FLOAT_MORE': -290, 'NEWLINE': -290, '$end': -290, ')': -290, 'OF': -290, 'THEN': -290, ',': -290, ']': -290, '(': 136, 'END': -290, 'ELIF': -290, 'ELSE': -290},
+    231: {'CONCAT': -291, '+': -291, '-': -291, '/': -291, '*': -291, '<': -291, 'FLOAT_SUM': -291, 'FLOAT_SUB': -291, 'FLOAT_DIV': -291, 'FLOAT_MUL': -291, '>': -291, 'NOT_EQUAL': -291, 'EQUAL': -291, 'OR': -291, 'STRICT_OR': -291, 'AND': -291, 'STRICT_AND': -291, 'TEXT_MATCH': -291, 'LESS_OR_EQ': -291, 'MORE_OR_EQ': -291, 'ARRAY_CONCAT': -291, 'ARRAY_SUB': -291, 'POW': -291, 'FLOAT_POW': -291, 'BIT_OR': -291, 'BIT_AND': -291, 'BIT_SHIFT_LEFT': -291, 'DOUBLE_ARROW_LEFT': -291, 'DOUBLE_ARROW_RIGHT': -291, 'ARROW_LEFT': -291, 'ARROW_RIGHT': -291, 'ARROW_BOTH': -291, 'SOME_CONCAT': -291, 'SOME_SUB': -291, 'FLOAT_LESS_OR_EQ': -291, 'FLOAT_LESS': -291, 'FLOAT_MORE_OR_EQ': -291, 'FLOAT_MORE': -291, 'NEWLINE': -291, '$end': -291, ')': -291, 'OF': -291, 'THEN': -291, ',': -291, ']': -291, '(': 136, 'END': -291, 'ELIF': -291, 'ELSE': -291},
+    232: {'CONCAT': -292, '+': -292, '-': -292, '/': -292, '*': -292, '<': -292, 'FLOAT_SUM': -292, 'FLOAT_SUB': -292, 'FLOAT_DIV': -292, 'FLOAT_MUL': -292, '>': -292, 'NOT_EQUAL': -292, 'EQUAL': -292, 'OR': -292, 'STRICT_OR': -292, 'AND': -292, 'STRICT_AND': -292, 'TEXT_MATCH': -292, 'LESS_OR_EQ': -292, 'MORE_OR_EQ': -292, 'ARRAY_CONCAT': -292, 'ARRAY_SUB': -292, 'POW': -292, 'FLOAT_POW': -292, 'BIT_OR': -292, 'BIT_AND': -292, 'BIT_SHIFT_LEFT': -292, 'DOUBLE_ARROW_LEFT': -292, 'DOUBLE_ARROW_RIGHT': -292, 'ARROW_LEFT': -292, 'ARROW_RIGHT': -292, 'ARROW_BOTH': -292, 'SOME_CONCAT': -292, 'SOME_SUB': -292, 'FLOAT_LESS_OR_EQ': -292, 'FLOAT_LESS': -292, 'FLOAT_MORE_OR_EQ': -292, 'FLOAT_MORE': -292, 'NEWLINE': -292, '$end': -292, ')': -292, 'OF': -292, 'THEN': -292, ',': -292, ']': -292, '(': 136, 'END': -292, 'ELIF': -292, 'ELSE': -292},
+    233: {'CONCAT': -293, '+': -293, '-': -293, '/': -293, '*': -293, '<': -293, 'FLOAT_SUM': -293, 'FLOAT_SUB': -293, 'FLOAT_DIV': -293, 'FLOAT_MUL': -293, '>': -293, 'NOT_EQUAL': -293, 'EQUAL': -293, 'OR': -293, 'STRICT_OR': -293, 'AND': -293, 'STRICT_AND': -293, 'TEXT_MATCH': -293, 'LESS_OR_EQ': -293, 'MORE_OR_EQ': -293, 'ARRAY_CONCAT': -293, 'ARRAY_SUB': -293, 'POW': -293, 'FLOAT_POW': -293, 'BIT_OR': -293, 'BIT_AND': -293, 'BIT_SHIFT_LEFT': -293, 'DOUBLE_ARROW_LEFT': -293, 'DOUBLE_ARROW_RIGHT': -293, 'ARROW_LEFT': -293, 'ARROW_RIGHT': -293, 'ARROW_BOTH': -293, 'SOME_CONCAT': -293, 'SOME_SUB': -293, 'FLOAT_LESS_OR_EQ': -293, 'FLOAT_LESS': -293, 'FLOAT_MORE_OR_EQ': -293, 'FLOAT_MORE': -293, 'NEWLINE': -293, '$end': -293, ')': -293, 'OF': -293, 'THEN': -293, ',': -293, ']': -293, '(': 136, 'END': -293, 'ELIF': -293, 'ELSE': -293},
+    234: {'CONCAT': -294, '+': -294, '-': -294, '/': -294, '*': -294, '<': -294, 'FLOAT_SUM': -294, 'FLOAT_SUB': -294, 'FLOAT_DIV': -294, 'FLOAT_MUL': -294, '>': -294, 'NOT_EQUAL': -294, 'EQUAL': -294, 'OR': -294, 'STRICT_OR': -294, 'AND': -294, 'STRICT_AND': -294, 'TEXT_MATCH': -294, 'LESS_OR_EQ': -294, 'MORE_OR_EQ': -294, 'ARRAY_CONCAT': -294, 'ARRAY_SUB': -294, 'POW': -294, 'FLOAT_POW': -294, 'BIT_OR': -294, 'BIT_AND': -294, 'BIT_SHIFT_LEFT': -294, 'DOUBLE_ARROW_LEFT': -294, 'DOUBLE_ARROW_RIGHT': -294, 'ARROW_LEFT': -294, 'ARROW_RIGHT': -294, 'ARROW_BOTH': -294, 'SOME_CONCAT': -294, 'SOME_SUB': -294, 'FLOAT_LESS_OR_EQ': -294, 'FLOAT_LESS': -294, 'FLOAT_MORE_OR_EQ': -294, 'FLOAT_MORE': -294, 'NEWLINE': -294, '$end': -294, ')': -294, 'OF': -294, 'THEN': -294, ',': -294, ']': -294, '(': 136, 'END': -294, 'ELIF': -294, 'ELSE': -294},
+    235: {'CONCAT': -295, '+': -295, '-': -295, '/': -295, '*': -295, '<': -295, 'FLOAT_SUM': -295, 'FLOAT_SUB': -295, 'FLOAT_DIV': -295, 'FLOAT_MUL': -295, '>': -295, 'NOT_EQUAL': -295, 'EQUAL': -295, 'OR': -295, 'STRICT_OR': -295, 'AND': -295, 'STRICT_AND': -295, 'TEXT_MATCH': -295, 'LESS_OR_EQ': -295, 'MORE_OR_EQ': -295, 'ARRAY_CONCAT': -295, 'ARRAY_SUB': -295, 'POW': -295, 'FLOAT_POW': -295, 'BIT_OR': -295, 'BIT_AND': -295, 'BIT_SHIFT_LEFT': -295, 'DOUBLE_ARROW_LEFT': -295, 'DOUBLE_ARROW_RIGHT': -295, 'ARROW_LEFT': -295, 'ARROW_RIGHT': -295, 'ARROW_BOTH': -295, 'SOME_CONCAT': -295, 'SOME_SUB': -295, 'FLOAT_LESS_OR_EQ': -295, 'FLOAT_LESS': -295, 'FLOAT_MORE_OR_EQ': -295, 'FLOAT_MORE': -295, 'NEWLINE': -295, '$end': -295, ')': -295, 'OF': -295, 'THEN': -295, ',': -295, ']': -295, '(': 136, 'END': -295, 'ELIF': -295, 'ELSE': -295},
+    236: {'CONCAT': -296, '+': -296, '-': -296, '/': -296, '*': -296, '<': -296, 'FLOAT_SUM': -296, 'FLOAT_SUB': -296, 'FLOAT_DIV': -296, 'FLOAT_MUL': -296, '>': -296, 'NOT_EQUAL': -296, 'EQUAL': -296, 'OR': -296, 'STRICT_OR': -296, 'AND': -296, 'STRICT_AND': -296, 'TEXT_MATCH': -296, 'LESS_OR_EQ': -296, 'MORE_OR_EQ': -296, 'ARRAY_CONCAT': -296, 'ARRAY_SUB': -296, 'POW': -296, 'FLOAT_POW': -296, 'BIT_OR': -296, 'BIT_AND': -296, 'BIT_SHIFT_LEFT': -296, 'DOUBLE_ARROW_LEFT': -296, 'DOUBLE_ARROW_RIGHT': -296, 'ARROW_LEFT': -296, 'ARROW_RIGHT': -296, 'ARROW_BOTH': -296, 'SOME_CONCAT': -296, 'SOME_SUB': -296, 'FLOAT_LESS_OR_EQ': -296, 'FLOAT_LESS': -296, 'FLOAT_MORE_OR_EQ': -296, 'FLOAT_MORE': -296, 'NEWLINE': -296, '$end': -296, ')': -296, 'OF': -296, 'THEN': -296, ',': -296, ']': -296, '(': 136, 'END': -296, 'ELIF': -296, 'ELSE': -296},
+    237: {'CONCAT': -297, '+': -297, '-': -297, '/': -297, '*': -297, '<': -297, 'FLOAT_SUM': -297, 'FLOAT_SUB': -297, 'FLOAT_DIV': -297, 'FLOAT_MUL': -297, '>': -297, 'NOT_EQUAL': -297, 'EQUAL': -297, 'OR': -297, 'STRICT_OR': -297, 'AND': -297, 'STRICT_AND': -297, 'TEXT_MATCH': -297, 'LESS_OR_EQ': -297, 'MORE_OR_EQ': -297, 'ARRAY_CONCAT': -297, 'ARRAY_SUB': -297, 'POW': -297, 'FLOAT_POW': -297, 'BIT_OR': -297, 'BIT_AND': -297, 'BIT_SHIFT_LEFT': -297, 'DOUBLE_ARROW_LEFT': -297, 'DOUBLE_ARROW_RIGHT': -297, 'ARROW_LEFT': -297, 'ARROW_RIGHT': -297, 'ARROW_BOTH': -297, 'SOME_CONCAT': -297, 'SOME_SUB': -297, 'FLOAT_LESS_OR_EQ': -297, 'FLOAT_LESS': -297, 'FLOAT_MORE_OR_EQ': -297, 'FLOAT_MORE': -297, 'NEWLINE': -297, '$end': -297, ')': -297, 'OF': -297, 'THEN': -297, ',': -297, ']': -297, '(': 136, 'END': -297, 'ELIF': -297, 'ELSE': -297},
+    238: {'CONCAT': -298, '+': -298, '-': -298, '/': -298, '*': -298, '<': -298, 'FLOAT_SUM': -298, 'FLOAT_SUB': -298, 'FLOAT_DIV': -298, 'FLOAT_MUL': -298, '>': -298, 'NOT_EQUAL': -298, 'EQUAL': -298, 'OR': -298, 'STRICT_OR': -298, 'AND': -298, 'STRICT_AND': -298, 'TEXT_MATCH': -298, 'LESS_OR_EQ': -298, 'MORE_OR_EQ': -298, 'ARRAY_CONCAT': -298, 'ARRAY_SUB': -298, 'POW': -298, 'FLOAT_POW': -298, 'BIT_OR': -298, 'BIT_AND': -298, 'BIT_SHIFT_LEFT': -298, 'DOUBLE_ARROW_LEFT': -298, 'DOUBLE_ARROW_RIGHT': -298, 'ARROW_LEFT': -298, 'ARROW_RIGHT': -298, 'ARROW_BOTH': -298, 'SOME_CONCAT': -298, 'SOME_SUB': -298, 'FLOAT_LESS_OR_EQ': -298, 'FLOAT_LESS': -298, 'FLOAT_MORE_OR_EQ': -298, 'FLOAT_MORE': -298, 'NEWLINE': -298, '$end': -298, ')': -298, 'OF': -298, 'THEN': -298, ',': -298, ']': -298, '(': 136, 'END': -298, 'ELIF': -298, 'ELSE': -298},
+    239: {'CONCAT': -299, '+': -299, '-': -299, '/': -299, '*': -299, '<': -299, 'FLOAT_SUM': -299, 'FLOAT_SUB': -299, 'FLOAT_DIV': -299, 'FLOAT_MUL': -299, '>': -299, 'NOT_EQUAL': -299, 'EQUAL': -299, 'OR': -299, 'STRICT_OR': -299, 'AND': -299, 'STRICT_AND': -299, 'TEXT_MATCH': -299, 'LESS_OR_EQ': -299, 'MORE_OR_EQ': -299, 'ARRAY_CONCAT': -299, 'ARRAY_SUB': -299, 'POW': -299, 'FLOAT_POW': -299, 'BIT_OR': -299, 'BIT_AND': -299, 'BIT_SHIFT_LEFT': -299, 'DOUBLE_ARROW_LEFT': -299, 'DOUBLE_ARROW_RIGHT': -299, 'ARROW_LEFT': -299, 'ARROW_RIGHT': -299, 'ARROW_BOTH': -299, 'SOME_CONCAT': -299, 'SOME_SUB': -299, 'FLOAT_LESS_OR_EQ': -299, 'FLOAT_LESS': -299, 'FLOAT_MORE_OR_EQ': -299, 'FLOAT_MORE': -299, 'NEWLINE': -299, '$end': -299, ')': -299, 'OF': -299, 'THEN': -299, ',': -299, ']': -299, '(': 136, 'END': -299, 'ELIF': -299, 'ELSE': -299},
+    240: {'CONCAT': -300, '+': -300, '-': -300, '/': -300, '*': -300, '<': -300, 'FLOAT_SUM': -300, 'FLOAT_SUB': -300, 'FLOAT_DIV': -300, 'FLOAT_MUL': -300, '>': -300, 'NOT_EQUAL': -300, 'EQUAL': -300, 'OR': -300, 'STRICT_OR': -300, 'AND': -300, 'STRICT_AND': -300, 'TEXT_MATCH': -300, 'LESS_OR_EQ': -300, 'MORE_OR_EQ': -300, 'ARRAY_CONCAT': -300, 'ARRAY_SUB': -300, 'POW': -300, 'FLOAT_POW': -300, 'BIT_OR': -300, 'BIT_AND': -300, 'BIT_SHIFT_LEFT': -300, 'DOUBLE_ARROW_LEFT': -300, 'DOUBLE_ARROW_RIGHT': -300, 'ARROW_LEFT': -300, 'ARROW_RIGHT': -300, 'ARROW_BOTH': -300, 'SOME_CONCAT': -300, 'SOME_SUB': -300, 'FLOAT_LESS_OR_EQ': -300, 'FLOAT_LESS': -300, 'FLOAT_MORE_OR_EQ': -300, 'FLOAT_MORE': -300, 'NEWLINE': -300, '$end': -300, ')': -300, 'OF': -300, 'THEN': -300, ',': -300, ']': -300, '(': 136, 'END': -300, 'ELIF': -300, 'ELSE': -300},
+    241: {'CONCAT': -301, '+': -301, '-': -301, '/': -301, '*': -301, '<': -301, 'FLOAT_SUM': -301, 'FLOAT_SUB': -301, 'FLOAT_DIV': -301, 'FLOAT_MUL': -301, '>': -301, 'NOT_EQUAL': -301, 'EQUAL': -301, 'OR': -301, 'STRICT_OR': -301, 'AND': -301, 'STRICT_AND': -301, 'TEXT_MATCH': -301, 'LESS_OR_EQ': -301, 'MORE_OR_EQ': -301, 'ARRAY_CONCAT': -301, 'ARRAY_SUB': -301, 'POW': -301, 'FLOAT_POW': -301, 'BIT_OR': -301, 'BIT_AND': -301, 'BIT_SHIFT_LEFT': -301, 'DOUBLE_ARROW_LEFT': -301, 'DOUBLE_ARROW_RIGHT': -301, 'ARROW_LEFT': -301, 'ARROW_RIGHT': -301, 'ARROW_BOTH': -301, 'SOME_CONCAT': -301, 'SOME_SUB': -301, 'FLOAT_LESS_OR_EQ': -301, 'FLOAT_LESS': -301, 'FLOAT_MORE_OR_EQ': -301, 'FLOAT_MORE': -301, 'NEWLINE': -301, '$end': -301, ')': -301, 'OF': -301, 'THEN': -301, ',': -301, ']': -301, '(': 136, 'END': -301, 'ELIF': -301, 'ELSE': -301},
+    242: {'CONCAT': -302, '+': -302, '-': -302, '/': -302, '*': -302, '<': -302, 'FLOAT_SUM': -302, 'FLOAT_SUB': -302, 'FLOAT_DIV': -302, 'FLOAT_MUL': -302, '>': -302, 'NOT_EQUAL': -302, 'EQUAL': -302, 'OR': -302, 'STRICT_OR': -302, 'AND': -302, 'STRICT_AND': -302, 'TEXT_MATCH': -302, 'LESS_OR_EQ': -302, 'MORE_OR_EQ': -302, 'ARRAY_CONCAT': -302, 'ARRAY_SUB': -302, 'POW': -302, 'FLOAT_POW': -302, 'BIT_OR': -302, 'BIT_AND': -302, 'BIT_SHIFT_LEFT': -302, 'DOUBLE_ARROW_LEFT': -302, 'DOUBLE_ARROW_RIGHT': -302, 'ARROW_LEFT': -302, 'ARROW_RIGHT': -302, 'ARROW_BOTH': -302, 'SOME_CONCAT': -302, 'SOME_SUB': -302, 'FLOAT_LESS_OR_EQ': -302, 'FLOAT_LESS': -302, 'FLOAT_MORE_OR_EQ': -302, 'FLOAT_MORE': -302, 'NEWLINE': -302, '$end': -302, ')': -302, 'OF': -302, 'THEN': -302, ',': -302, ']': -302, '(': 136, 'END': -302, 'ELIF': -302, 'ELSE': -302},
+    243: {'CONCAT': -303, '+': -303, '-': -303, '/': -303, '*': -303, '<': -303, 'FLOAT_SUM': -303, 'FLOAT_SUB': -303, 'FLOAT_DIV': -303, 'FLOAT_MUL': -303, '>': -303, 'NOT_EQUAL': -303, 'EQUAL': -303, 'OR': -303, 'STRICT_OR': -303, 'AND': -303, 'STRICT_AND': -303, 'TEXT_MATCH': -303, 'LESS_OR_EQ': -303, 'MORE_OR_EQ': -303, 'ARRAY_CONCAT': -303, 'ARRAY_SUB': -303, 'POW': -303, 'FLOAT_POW': -303, 'BIT_OR': -303, 'BIT_AND': -303, 'BIT_SHIFT_LEFT': -303, 'DOUBLE_ARROW_LEFT': -303, 'DOUBLE_ARROW_RIGHT': -303, 'ARROW_LEFT': -303, 'ARROW_RIGHT': -303, 'ARROW_BOTH': -303, 'SOME_CONCAT': -303, 'SOME_SUB': -303, 'FLOAT_LESS_OR_EQ': -303, 'FLOAT_LESS': -303, 'FLOAT_MORE_OR_EQ': -303, 'FLOAT_MORE': -303, 'NEWLINE': -303, '$end': -303, ')': -303, 'OF': -303, 'THEN': -303, ',': -303, ']': -303, '(': 136, 'END': -303, 'ELIF': -303, 'ELSE': -303},
+    244: {'CONCAT': -304, '+': -304, '-': -304, '/': -304, '*': -304, '<': -304, 'FLOAT_SUM': -304, 'FLOAT_SUB': -304, 'FLOAT_DIV': -304, 'FLOAT_MUL': -304, '>': -304, 'NOT_EQUAL': -304, 'EQUAL': -304, 'OR': -304, 'STRICT_OR': -304, 'AND': -304, 'STRICT_AND': -304, 'TEXT_MATCH': -304, 'LESS_OR_EQ': -304, 'MORE_OR_EQ': -304, 'ARRAY_CONCAT': -304, 'ARRAY_SUB': -304, 'POW': -304, 'FLOAT_POW': -304, 'BIT_OR': -304, 'BIT_AND': -304, 'BIT_SHIFT_LEFT': -304, 'DOUBLE_ARROW_LEFT': -304, 'DOUBLE_ARROW_RIGHT': -304, 'ARROW_LEFT': -304, 'ARROW_RIGHT': -304, 'ARROW_BOTH': -304, 'SOME_CONCAT': -304, 'SOME_SUB': -304, 'FLOAT_LESS_OR_EQ': -304, 'FLOAT_LESS': -304, 'FLOAT_MORE_OR_EQ': -304, 'FLOAT_MORE': -304, 'NEWLINE': -304, '$end': -304, ')': -304, 'OF': -304, 'THEN': -304, ',': -304, ']': -304, '(': 136, 'END': -304, 'ELIF': -304, 'ELSE': -304},
+    245: {'CONCAT': -305, '+': -305, '-': -305, '/': -305, '*': -305, '<': -305, 'FLOAT_SUM': -305, 'FLOAT_SUB': -305, 'FLOAT_DIV': -305, 'FLOAT_MUL': -305, '>': -305, 'NOT_EQUAL': -305, 'EQUAL': -305, 'OR': -305, 'STRICT_OR': -305, 'AND': -305, 'STRICT_AND': -305, 'TEXT_MATCH': -305, 'LESS_OR_EQ': -305, 'MORE_OR_EQ': -305, 'ARRAY_CONCAT': -305, 'ARRAY_SUB': -305, 'POW': -305, 'FLOAT_POW': -305, 'BIT_OR': -305, 'BIT_AND': -305, 'BIT_SHIFT_LEFT': -305, 'DOUBLE_ARROW_LEFT': -305, 'DOUBLE_ARROW_RIGHT': -305, 'ARROW_LEFT': -305, 'ARROW_RIGHT': -305, 'ARROW_BOTH': -305, 'SOME_CONCAT': -305, 'SOME_SUB': -305, 'FLOAT_LESS_OR_EQ': -305, 'FLOAT_LESS': -305, 'FLOAT_MORE_OR_EQ': -305, 'FLOAT_MORE': -305, 'NEWLINE': -305, '$end': -305, ')': -305, 'OF': -305, 'THEN': -305, ',': -305, ']': -305, '(': 136, 'END': -305, 'ELIF': -305, 'ELSE': -305},
+    246: {'CONCAT': -306, '+': -306, '-': -306, '/': -306, '*': -306, '<': -306, 'FLOAT_SUM': -306, 'FLOAT_SUB': -306, 'FLOAT_DIV': -306, 'FLOAT_MUL': -306, '>': -306, 'NOT_EQUAL': -306, 'EQUAL': -306, 'OR': -306, 'STRICT_OR': -306, 'AND': -306, 'STRICT_AND': -306, 'TEXT_MATCH': -306, 'LESS_OR_EQ': -306, 'MORE_OR_EQ': -306, 'ARRAY_CONCAT': -306, 'ARRAY_SUB': -306, 'POW': -306, 'FLOAT_POW': -306, 'BIT_OR': -306, 'BIT_AND': -306, 'BIT_SHIFT_LEFT': -306, 'DOUBLE_ARROW_LEFT': -306, 'DOUBLE_ARROW_RIGHT': -306, 'ARROW_LEFT': -306, 'ARROW_RIGHT': -306, 'ARROW_BOTH': -306, 'SOME_CONCAT': -306, 'SOME_SUB': -306, 'FLOAT_LESS_OR_EQ': -306, 'FLOAT_LESS': -306, 'FLOAT_MORE_OR_EQ': -306, 'FLOAT_MORE': -306, 'NEWLINE': -306, '$end': -306, ')': -306, 'OF': -306, 'THEN': -306, ',': -306, ']': -306, '(': 136, 'END': -306, 'ELIF': -306, 'ELSE': -306},
+    247: {'CONCAT': -307, '+': -307, '-': -307, '/': -307, '*': -307, '<': -307, 'FLOAT_SUM': -307, 'FLOAT_SUB': -307, 'FLOAT_DIV': -307, 'FLOAT_MUL': -307, '>': -307, 'NOT_EQUAL': -307, 'EQUAL': -307, 'OR': -307, 'STRICT_OR': -307, 'AND': -307, 'STRICT_AND': -307, 'TEXT_MATCH': -307, 'LESS_OR_EQ': -307, 'MORE_OR_EQ': -307, 'ARRAY_CONCAT': -307, 'ARRAY_SUB': -307, 'POW': -307, 'FLOAT_POW': -307, 'BIT_OR': -307, 'BIT_AND': -307, 'BIT_SHIFT_LEFT': -307, 'DOUBLE_ARROW_LEFT': -307, 'DOUBLE_ARROW_RIGHT': -307, 'ARROW_LEFT': -307, 'ARROW_RIGHT': -307, 'ARROW_BOTH': -307, 'SOME_CONCAT': -307, 'SOME_SUB': -307, 'FLOAT_LESS_OR_EQ': -307, 'FLOAT_LESS': -307, 'FLOAT_MORE_OR_EQ': -307, 'FLOAT_MORE': -307, 'NEWLINE': -307, '$end': -307, ')': -307, 'OF': -307, 'THEN': -307, ',': -307, ']': -307, '(': 136, 'END': -307, 'ELIF': -307, 'ELSE': -307},
+    248: {'CONCAT': -308, '+': -308, '-': -308, '/': -308, '*': -308, '<': -308, 'FLOAT_SUM': -308, 'FLOAT_SUB': -308, 'FLOAT_DIV': -308, 'FLOAT_MUL': -308, '>': -308, 'NOT_EQUAL': -308, 'EQUAL': -308, 'OR': -308, 'STRICT_OR': -308, 'AND': -308, 'STRICT_AND': -308, 'TEXT_MATCH': -308, 'LESS_OR_EQ': -308, 'MORE_OR_EQ': -308, 'ARRAY_CONCAT': -308, 'ARRAY_SUB': -308, 'POW': -308, 'FLOAT_POW': -308, 'BIT_OR': -308, 'BIT_AND': -308, 'BIT_SHIFT_LEFT': -308, 'DOUBLE_ARROW_LEFT': -308, 'DOUBLE_ARROW_RIGHT': -308, 'ARROW_LEFT': -308, 'ARROW_RIGHT': -308, 'ARROW_BOTH': -308, 'SOME_CONCAT': -308, 'SOME_SUB': -308, 'FLOAT_LESS_OR_EQ': -308, 'FLOAT_LESS': -308, 'FLOAT_MORE_OR_EQ': -308, 'FLOAT_MORE': -308, 'NEWLINE': -308, '$end': -308, ')': -308, 'OF': -308, 'THEN': -308, ',': -308, ']': -308, '(': 136, 'END': -308, 'ELIF': -308, 'ELSE': -308},
+    249: {'CONCAT': -309, '+': -309, '-': -309, '/': -309, '*': -309, '<': -309, 'FLOAT_SUM': -309, 'FLOAT_SUB': -309, 'FLOAT_DIV': -309, 'FLOAT_MUL': -309, '>': -309, 'NOT_EQUAL': -309, 'EQUAL': -309, 'OR': -309, 'STRICT_OR': -309, 'AND': -309, 'STRICT_AND': -309, 'TEXT_MATCH': -309, 'LESS_OR_EQ': -309, 'MORE_OR_EQ': -309, 'ARRAY_CONCAT': -309, 'ARRAY_SUB': -309, 'POW': -309, 'FLOAT_POW': -309, 'BIT_OR': -309, 'BIT_AND': -309, 'BIT_SHIFT_LEFT': -309, 'DOUBLE_ARROW_LEFT': -309, 'DOUBLE_ARROW_RIGHT': -309, 'ARROW_LEFT': -309, 'ARROW_RIGHT': -309, 'ARROW_BOTH': -309, 'SOME_CONCAT': -309, 'SOME_SUB': -309, 'FLOAT_LESS_OR_EQ': -309, 'FLOAT_LESS': -309, 'FLOAT_MORE_OR_EQ': -309, 'FLOAT_MORE': -309, 'NEWLINE': -309, '$end': -309, ')': -309, 'OF': -309, 'THEN': -309, ',': -309, ']': -309, '(': 136, 'END': -309, 'ELIF': -309, 'ELSE': -309},
+    250: {'CONCAT': -310, '+': -310, '-': -310, '/': -310, '*': -310, '<': -310, 'FLOAT_SUM': -310, 'FLOAT_SUB': -310, 'FLOAT_DIV': -310, 'FLOAT_MUL': -310, '>': -310, 'NOT_EQUAL': -310, 'EQUAL': -310, 'OR': -310, 'STRICT_OR': -310, 'AND': -310, 'STRICT_AND': -310, 'TEXT_MATCH': -310, 'LESS_OR_EQ': -310, 'MORE_OR_EQ': -310, 'ARRAY_CONCAT': -310, 'ARRAY_SUB': -310, 'POW': -310, 'FLOAT_POW': -310, 'BIT_OR': -310, 'BIT_AND': -310, 'BIT_SHIFT_LEFT': -310, 'DOUBLE_ARROW_LEFT': -310, 'DOUBLE_ARROW_RIGHT': -310, 'ARROW_LEFT': -310, 'ARROW_RIGHT': -310, 'ARROW_BOTH': -310, 'SOME_CONCAT': -310, 'SOME_SUB': -310, 'FLOAT_LESS_OR_EQ': -310, 'FLOAT_LESS': -310, 'FLOAT_MORE_OR_EQ': -310, 'FLOAT_MORE': -310, 'NEWLINE': -310, '$end': -310, ')': -310, 'OF': -310, 'THEN': -310, ',': -310, ']': -310, '(': 136, 'END': -310, 'ELIF': -310, 'ELSE': -310},
+    251: {'CONCAT': -311, '+': -311, '-': -311, '/': -311, '*': -311, '<': -311, 'FLOAT_SUM': -311, 'FLOAT_SUB': -311, 'FLOAT_DIV': -311, 'FLOAT_MUL': -311, '>': -311, 'NOT_EQUAL': -311, 'EQUAL': -311, 'OR': -311, 'STRICT_OR': -311, 'AND': -311, 'STRICT_AND': -311, 'TEXT_MATCH': -311, 'LESS_OR_EQ': -311, 'MORE_OR_EQ': -311, 'ARRAY_CONCAT': -311, 'ARRAY_SUB': -311, 'POW': -311, 'FLOAT_POW': -311, 'BIT_OR': -311, 'BIT_AND': -311, 'BIT_SHIFT_LEFT': -311, 'DOUBLE_ARROW_LEFT': -311, 'DOUBLE_ARROW_RIGHT': -311, 'ARROW_LEFT': -311, 'ARROW_RIGHT': -311, 'ARROW_BOTH': -311, 'SOME_CONCAT': -311, 'SOME_SUB': -311, 'FLOAT_LESS_OR_EQ': -311, 'FLOAT_LESS': -311, 'FLOAT_MORE_OR_EQ': -311, 'FLOAT_MORE': -311, 'NEWLINE': -311, '$end': -311, ')': -311, 'OF': -311, 'THEN': -311, ',': -311, ']': -311, '(': 136, 'END': -311, 'ELIF': -311, 'ELSE': -311},
+    252: {'CONCAT': -312, '+': -312, '-': -312, '/': -312, '*': -312, '<': -312, 'FLOAT_SUM': -312, 'FLOAT_SUB': -312, 'FLOAT_DIV': -312, 'FLOAT_MUL': -312, '>': -312, 'NOT_EQUAL': -312, 'EQUAL': -312, 'OR': -312, 'STRICT_OR': -312, 'AND': -312, 'STRICT_AND': -312, 'TEXT_MATCH': -312, 'LESS_OR_EQ': -312, 'MORE_OR_EQ': -312, 'ARRAY_CONCAT': -312, 'ARRAY_SUB': -312, 'POW': -312, 'FLOAT_POW': -312, 'BIT_OR': -312, 'BIT_AND': -312, 'BIT_SHIFT_LEFT': -312, 'DOUBLE_ARROW_LEFT': -312, 'DOUBLE_ARROW_RIGHT': -312, 'ARROW_LEFT': -312, 'ARROW_RIGHT': -312, 'ARROW_BOTH': -312, 'SOME_CONCAT': -312, 'SOME_SUB': -312, 'FLOAT_LESS_OR_EQ': -312, 'FLOAT_LESS': -312, 'FLOAT_MORE_OR_EQ': -312, 'FLOAT_MORE': -312, 'NEWLINE': -312, '$end': -312, ')': -312, 'OF': -312, 'THEN': -312, ',': -312, ']': -312, '(': 136, 'END': -312, 'ELIF': -312, 'ELSE': -312},
+    253: {'CONCAT': -313, '+': -313, '-': -313, '/': -313, '*': -313, '<': -313, 'FLOAT_SUM': -313, 'FLOAT_SUB': -313, 'FLOAT_DIV': -313, 'FLOAT_MUL': -313, '>': -313, 'NOT_EQUAL': -313, 'EQUAL': -313, 'OR': -313, 'STRICT_OR': -313, 'AND': -313, 'STRICT_AND': -313, 'TEXT_MATCH': -313, 'LESS_OR_EQ': -313, 'MORE_OR_EQ': -313, 'ARRAY_CONCAT': -313, 'ARRAY_SUB': -313, 'POW': -313, 'FLOAT_POW': -313, 'BIT_OR': -313, 'BIT_AND': -313, 'BIT_SHIFT_LEFT': -313, 'DOUBLE_ARROW_LEFT': -313, 'DOUBLE_ARROW_RIGHT': -313, 'ARROW_LEFT': -313, 'ARROW_RIGHT': -313, 'ARROW_BOTH': -313, 'SOME_CONCAT': -313, 'SOME_SUB': -313, 'FLOAT_LESS_OR_EQ': -313, 'FLOAT_LESS': -313, 'FLOAT_MORE_OR_EQ': -313, 'FLOAT_MORE': -313, 'NEWLINE': -313, '$end': -313, ')': -313, 'OF': -313, 'THEN': -313, ',': -313, ']': -313, '(': 136, 'END': -313, 'ELIF': -313, 'ELSE': -313},
+    254: {'CONCAT': -314, '+': -314, '-': -314, '/': -314, '*': -314, '<': -314, 'FLOAT_SUM': -314, 'FLOAT_SUB': -314, 'FLOAT_DIV': -314, 'FLOAT_MUL': -314, '>': -314, 'NOT_EQUAL': -314, 'EQUAL': -314, 'OR': -314, 'STRICT_OR': -314, 'AND': -314, 'STRICT_AND': -314, 'TEXT_MATCH': -314, 'LESS_OR_EQ': -314, 'MORE_OR_EQ': -314, 'ARRAY_CONCAT': -314, 'ARRAY_SUB': -314, 'POW': -314, 'FLOAT_POW': -314, 'BIT_OR': -314, 'BIT_AND': -314, 'BIT_SHIFT_LEFT': -314, 'DOUBLE_ARROW_LEFT': -314, 'DOUBLE_ARROW_RIGHT': -314, 'ARROW_LEFT': -314, 'ARROW_RIGHT': -314, 'ARROW_BOTH': -314, 'SOME_CONCAT': -314, 'SOME_SUB': -314, 'FLOAT_LESS_OR_EQ': -314, 'FLOAT_LESS': -314, 'FLOAT_MORE_OR_EQ': -314, 'FLOAT_MORE': -314, 'NEWLINE': -314, '$end': -314, ')': -314, 'OF': -314, 'THEN': -314, ',': -314, ']': -314, '(': 136, 'END': -314, 'ELIF': -314, 'ELSE': -314},
+    255: {'CONCAT': -315, '+': -315, '-': -315, '/': -315, '*': -315, '<': -315, 'FLOAT_SUM': -315, 'FLOAT_SUB': -315, 'FLOAT_DIV': -315, 'FLOAT_MUL': -315, '>': -315, 'NOT_EQUAL': -315, 'EQUAL': -315, 'OR': -315, 'STRICT_OR': -315, 'AND': -315, 'STRICT_AND': -315, 'TEXT_MATCH': -315, 'LESS_OR_EQ': -315, 'MORE_OR_EQ': -315, 'ARRAY_CONCAT': -315, 'ARRAY_SUB': -315, 'POW': -315, 'FLOAT_POW': -315, 'BIT_OR': -315, 'BIT_AND': -315, 'BIT_SHIFT_LEFT': -315, 'DOUBLE_ARROW_LEFT': -315, 'DOUBLE_ARROW_RIGHT': -315, 'ARROW_LEFT': -315, 'ARROW_RIGHT': -315, 'ARROW_BOTH': -315, 'SOME_CONCAT': -315, 'SOME_SUB': -315, 'FLOAT_LESS_OR_EQ': -315, 'FLOAT_LESS': -315, 'FLOAT_MORE_OR_EQ': -315, 'FLOAT_MORE': -315, 'NEWLINE': -315, '$end': -315, ')': -315, 'OF': -315, 'THEN': -315, ',': -315, ']': -315, '(': 136, 'END': -315, 'ELIF': -315, 'ELSE': -315},
+    256: {'CONCAT': -316, '+': -316, '-': -316, '/': -316, '*': -316, '<': -316, 'FLOAT_SUM': -316, 'FLOAT_SUB': -316, 'FLOAT_DIV': -316, 'FLOAT_MUL': -316, '>': -316, 'NOT_EQUAL': -316, 'EQUAL': -316, 'OR': -316, 'STRICT_OR': -316, 'AND': -316, 'STRICT_AND': -316, 'TEXT_MATCH': -316, 'LESS_OR_EQ': -316, 'MORE_OR_EQ': -316, 'ARRAY_CONCAT': -316, 'ARRAY_SUB': -316, 'POW': -316, 'FLOAT_POW': -316, 'BIT_OR': -316, 'BIT_AND': -316, 'BIT_SHIFT_LEFT': -316, 'DOUBLE_ARROW_LEFT': -316, 'DOUBLE_ARROW_RIGHT': -316, 'ARROW_LEFT': -316, 'ARROW_RIGHT': -316, 'ARROW_BOTH': -316, 'SOME_CONCAT': -316, 'SOME_SUB': -316, 'FLOAT_LESS_OR_EQ': -316, 'FLOAT_LESS': -316, 'FLOAT_MORE_OR_EQ': -316, 'FLOAT_MORE': -316, 'NEWLINE': -316, '$end': -316, ')': -316, 'OF': -316, 'THEN': -316, ',': -316, ']': -316, '(': 136, 'END': -316, 'ELIF': -316, 'ELSE': -316},
+    257: {'CONCAT': -317, '+': -317, '-': -317, '/': -317, '*': -317, '<': -317, 'FLOAT_SUM': -317, 'FLOAT_SUB': -317, 'FLOAT_DIV': -317, 'FLOAT_MUL': -317, '>': -317, 'NOT_EQUAL': -317, 'EQUAL': -317, 'OR': -317, 'STRICT_OR': -317, 'AND': -317, 'STRICT_AND': -317, 'TEXT_MATCH': -317, 'LESS_OR_EQ': -317, 'MORE_OR_EQ': -317, 'ARRAY_CONCAT': -317, 'ARRAY_SUB': -317, 'POW': -317, 'FLOAT_POW': -317, 'BIT_OR': -317, 'BIT_AND': -317, 'BIT_SHIFT_LEFT': -317, 'DOUBLE_ARROW_LEFT': -317, 'DOUBLE_ARROW_RIGHT': -317, 'ARROW_LEFT': -317, 'ARROW_RIGHT': -317, 'ARROW_BOTH': -317, 'SOME_CONCAT': -317, 'SOME_SUB': -317, 'FLOAT_LESS_OR_EQ': -317, 'FLOAT_LESS': -317, 'FLOAT_MORE_OR_EQ': -317, 'FLOAT_MORE': -317, 'NEWLINE': -317, '$end': -317, ')': -317, 'OF': -317, 'THEN': -317, ',': -317, ']': -317, '(': 136, 'END': -317, 'ELIF': -317, 'ELSE': -317},
+    258: {'CONCAT': -318, '+': -318, '-': -318, '/': -318, '*': -318, '<': -318, 'FLOAT_SUM': -318, 'FLOAT_SUB': -318, 'FLOAT_DIV': -318, 'FLOAT_MUL': -318, '>': -318, 'NOT_EQUAL': -318, 'EQUAL': -318, 'OR': -318, 'STRICT_OR': -318, 'AND': -318, 'STRICT_AND': -318, 'TEXT_MATCH': -318, 'LESS_OR_EQ': -318, 'MORE_OR_EQ': -318, 'ARRAY_CONCAT': -318, 'ARRAY_SUB': -318, 'POW': -318, 'FLOAT_POW': -318, 'BIT_OR': -318, 'BIT_AND': -318, 'BIT_SHIFT_LEFT': -318, 'DOUBLE_ARROW_LEFT': -318, 'DOUBLE_ARROW_RIGHT': -318, 'ARROW_LEFT': -318, 'ARROW_RIGHT': -318, 'ARROW_BOTH': -318, 'SOME_CONCAT': -318, 'SOME_SUB': -318, 'FLOAT_LESS_OR_EQ': -318, 'FLOAT_LESS': -318, 'FLOAT_MORE_OR_EQ': -318, 'FLOAT_MORE': -318, 'NEWLINE': -318, '$end': -318, ')': -318, 'OF': -318, 'THEN': -318, ',': -318, ']': -318, '(': 136, 'END': -318, 'ELIF': -318, 'ELSE': -318},
+    259: {'CONCAT': -319, '+': -319, '-': -319, '/': -319, '*': -319, '<': -319, 'FLOAT_SUM': -319, 'FLOAT_SUB': -319, 'FLOAT_DIV': -319, 'FLOAT_MUL': -319, '>': -319, 'NOT_EQUAL': -319, 'EQUAL': -319, 'OR': -319, 'STRICT_OR': -319, 'AND': -319, 'STRICT_AND': -319, 'TEXT_MATCH': -319, 'LESS_OR_EQ': -319, 'MORE_OR_EQ': -319, 'ARRAY_CONCAT': -319, 'ARRAY_SUB': -319, 'POW': -319, 'FLOAT_POW': -319, 'BIT_OR': -319, 'BIT_AND': -319, 'BIT_SHIFT_LEFT': -319, 'DOUBLE_ARROW_LEFT': -319, 'DOUBLE_ARROW_RIGHT': -319, 'ARROW_LEFT': -319, 'ARROW_RIGHT': -319, 'ARROW_BOTH': -319, 'SOME_CONCAT': -319, 'SOME_SUB': -319, 'FLOAT_LESS_OR_EQ': -319, 'FLOAT_LESS': -319, 'FLOAT_MORE_OR_EQ': -319, 'FLOAT_MORE': -319, 'NEWLINE': -319, '$end': -319, ')': -319, 'OF': -319, 'THEN': -319, ',': -319, ']': -319, '(': 136, 'END': -319, 'ELIF': -319, 'ELSE': -319},
+    260: {'CONCAT': -320, '+': -320, '-': -320, '/': -320, '*': -320, '<': -320, 'FLOAT_SUM': -320, 'FLOAT_SUB': -320, 'FLOAT_DIV': -320, 'FLOAT_MUL': -320, '>': -320, 'NOT_EQUAL': -320, 'EQUAL': -320, 'OR': -320, 'STRICT_OR': -320, 'AND': -320, 'STRICT_AND': -320, 'TEXT_MATCH': -320, 'LESS_OR_EQ': -320, 'MORE_OR_EQ': -320, 'ARRAY_CONCAT': -320, 'ARRAY_SUB': -320, 'POW': -320, 'FLOAT_POW': -320, 'BIT_OR': -320, 'BIT_AND': -320, 'BIT_SHIFT_LEFT': -320, 'DOUBLE_ARROW_LEFT': -320, 'DOUBLE_ARROW_RIGHT': -320, 'ARROW_LEFT': -320, 'ARROW_RIGHT': -320, 'ARROW_BOTH': -320, 'SOME_CONCAT': -320, 'SOME_SUB': -320, 'FLOAT_LESS_OR_EQ': -320, 'FLOAT_LESS': -320, 'FLOAT_MORE_OR_EQ': -320, 'FLOAT_MORE': -320, 'NEWLINE': -320, '$end': -320, ')': -320, 'OF': -320, 'THEN': -320, ',': -320, ']': -320, '(': 136, 'END': -320, 'ELIF': -320, 'ELSE': -320},
+    261: {'CONCAT': -321, '+': -321, '-': -321, '/': -321, '*': -321, '<': -321, 'FLOAT_SUM': -321, 'FLOAT_SUB': -321, 'FLOAT_DIV': -321, 'FLOAT_MUL': -321, '>': -321, 'NOT_EQUAL': -321, 'EQUAL': -321, 'OR': -321, 'STRICT_OR': -321, 'AND': -321, 'STRICT_AND': -321, 'TEXT_MATCH': -321, 'LESS_OR_EQ': -321, 'MORE_OR_EQ': -321, 'ARRAY_CONCAT': -321, 'ARRAY_SUB': -321, 'POW': -321, 'FLOAT_POW': -321, 'BIT_OR': -321, 'BIT_AND': -321, 'BIT_SHIFT_LEFT': -321, 'DOUBLE_ARROW_LEFT': -321, 'DOUBLE_ARROW_RIGHT': -321, 'ARROW_LEFT': -321, 'ARROW_RIGHT': -321, 'ARROW_BOTH': -321, 'SOME_CONCAT': -321, 'SOME_SUB': -321, 'FLOAT_LESS_OR_EQ': -321, 'FLOAT_LESS': -321, 'FLOAT_MORE_OR_EQ': -321, 'FLOAT_MORE': -321, 'NEWLINE': -321, '$end': -321, ')': -321, 'OF': -321, 'THEN': -321, ',': -321, ']': -321, '(': 136, 'END': -321, 'ELIF': -321, 'ELSE': -321},
+    262: {'CONCAT': -322, '+': -322, '-': -322, '/': -322, '*': -322, '<': -322, 'FLOAT_SUM': -322, 'FLOAT_SUB': -322, 'FLOAT_DIV': -322, 'FLOAT_MUL': -322, '>': -322, 'NOT_EQUAL': -322, 'EQUAL': -322, 'OR': -322, 'STRICT_OR': -322, 'AND': -322, 'STRICT_AND': -322, 'TEXT_MATCH': -322, 'LESS_OR_EQ': -322, 'MORE_OR_EQ': -322, 'ARRAY_CONCAT': -322, 'ARRAY_SUB': -322, 'POW': -322, 'FLOAT_POW': -322, 'BIT_OR': -322, 'BIT_AND': -322, 'BIT_SHIFT_LEFT': -322, 'DOUBLE_ARROW_LEFT': -322, 'DOUBLE_ARROW_RIGHT': -322, 'ARROW_LEFT': -322, 'ARROW_RIGHT': -322, 'ARROW_BOTH': -322, 'SOME_CONCAT': -322, 'SOME_SUB': -322, 'FLOAT_LESS_OR_EQ': -322, 'FLOAT_LESS': -322, 'FLOAT_MORE_OR_EQ': -322, 'FLOAT_MORE': -322, 'NEWLINE': -322, '$end': -322, ')': -322, 'OF': -322, 'THEN': -322, ',': -322, ']': -322, '(': 136, 'END': -322, 'ELIF': -322, 'ELSE': -322},
+    263: {'CONCAT': -323, '+': -323, '-': -323, '/': -323, '*': -323, '<': -323, 'FLOAT_SUM': -323, 'FLOAT_SUB': -323, 'FLOAT_DIV': -323, 'FLOAT_MUL': -323, '>': -323, 'NOT_EQUAL': -323, 'EQUAL': -323, 'OR': -323, 'STRICT_OR': -323, 'AND': -323, 'STRICT_AND': -323, 'TEXT_MATCH': -323, 'LESS_OR_EQ': -323, 'MORE_OR_EQ': -323, 'ARRAY_CONCAT': -323, 'ARRAY_SUB': -323, 'POW': -323, 'FLOAT_POW': -323, 'BIT_OR': -323, 'BIT_AND': -323, 'BIT_SHIFT_LEFT': -323, 'DOUBLE_ARROW_LEFT': -323, 'DOUBLE_ARROW_RIGHT': -323, 'ARROW_LEFT': -323, 'ARROW_RIGHT': -323, 'ARROW_BOTH': -323, 'SOME_CONCAT': -323, 'SOME_SUB': -323, 'FLOAT_LESS_OR_EQ': -323, 'FLOAT_LESS': -323, 'FLOAT_MORE_OR_EQ': -323, 'FLOAT_MORE': -323, 'NEWLINE': -323, '$end': -323, ')': -323, 'OF': -323, 'THEN': -323, ',': -323, ']': -323, '(': 136, 'END': -323, 'ELIF': -323, 'ELSE': -323},
+    264: {'CONCAT': -324, '+': -324, '-': -324, '/': -324, '*': -324, '<': -324, 'FLOAT_SUM': -324, 'FLOAT_SUB': -324, 'FLOAT_DIV': -324, 'FLOAT_MUL': -324, '>': -324, 'NOT_EQUAL': -324, 'EQUAL': -324, 'OR': -324, 'STRICT_OR': -324, 'AND': -324, 'STRICT_AND': -324, 'TEXT_MATCH': -324, 'LESS_OR_EQ': -324, 'MORE_OR_EQ': -324, 'ARRAY_CONCAT': -324, 'ARRAY_SUB': -324, 'POW': -324, 'FLOAT_POW': -324, 'BIT_OR': -324, 'BIT_AND': -324, 'BIT_SHIFT_LEFT': -324, 'DOUBLE_ARROW_LEFT': -324, 'DOUBLE_ARROW_RIGHT': -324, 'ARROW_LEFT': -324, 'ARROW_RIGHT': -324, 'ARROW_BOTH': -324, 'SOME_CONCAT': -324, 'SOME_SUB': -324, 'FLOAT_LESS_OR_EQ': -324, 'FLOAT_LESS': -324, 'FLOAT_MORE_OR_EQ': -324, 'FLOAT_MORE': -324, 'NEWLINE': -324, '$end': -324, ')': -324, 'OF': -324, 'THEN': -324, ',': -324, ']': -324, '(': 136, 'END': -324, 'ELIF': -324, 'ELSE': -324},
+    265: {'CONCAT': -325, '+': -325, '-': -325, '/': -325, '*': -325, '<': -325, 'FLOAT_SUM': -325, 'FLOAT_SUB': -325, 'FLOAT_DIV': -325, 'FLOAT_MUL': -325, '>': -325, 'NOT_EQUAL': -325, 'EQUAL': -325, 'OR': -325, 'STRICT_OR': -325, 'AND': -325, 'STRICT_AND': -325, 'TEXT_MATCH': -325, 'LESS_OR_EQ': -325, 'MORE_OR_EQ': -325, 'ARRAY_CONCAT': -325, 'ARRAY_SUB': -325, 'POW': -325, 'FLOAT_POW': -325, 'BIT_OR': -325, 'BIT_AND': -325, 'BIT_SHIFT_LEFT': -325, 'DOUBLE_ARROW_LEFT': -325, 'DOUBLE_ARROW_RIGHT': -325, 'ARROW_LEFT': -325, 'ARROW_RIGHT': -325, 'ARROW_BOTH': -325, 'SOME_CONCAT': -325, 'SOME_SUB': -325, 'FLOAT_LESS_OR_EQ': -325, 'FLOAT_LESS': -325, 'FLOAT_MORE_OR_EQ': -325, 'FLOAT_MORE': -325, 'NEWLINE': -325, '$end': -325, ')': -325, 'OF': -325, 'THEN': -325, ',': -325, ']': -325, '(': 136, 'END': -325, 'ELIF': -325, 'ELSE': -325},
+    266: {'CONCAT': -326, '+': -326, '-': -326, '/': -326, '*': -326, '<': -326, 'FLOAT_SUM': -326, 'FLOAT_SUB': -326, 'FLOAT_DIV': -326, 'FLOAT_MUL': -326, '>': -326, 'NOT_EQUAL': -326, 'EQUAL': -326, 'OR': -326, 'STRICT_OR': -326, 'AND': -326, 'STRICT_AND': -326, 'TEXT_MATCH': -326, 'LESS_OR_EQ': -326, 'MORE_OR_EQ': -326, 'ARRAY_CONCAT': -326, 'ARRAY_SUB': -326, 'POW': -326, 'FLOAT_POW': -326, 'BIT_OR': -326, 'BIT_AND': -326, 'BIT_SHIFT_LEFT': -326, 'DOUBLE_ARROW_LEFT': -326, 'DOUBLE_ARROW_RIGHT': -326, 'ARROW_LEFT': -326, 'ARROW_RIGHT': -326, 'ARROW_BOTH': -326, 'SOME_CONCAT': -326, 'SOME_SUB': -326, 'FLOAT_LESS_OR_EQ': -326, 'FLOAT_LESS': -326, 'FLOAT_MORE_OR_EQ': -326, 'FLOAT_MORE': -326, 'NEWLINE': -326, '$end': -326, ')': -326, 'OF': -326, 'THEN': -326, ',': -326, ']': -326, '(': 136, 'END': -326, 'ELIF': -326, 'ELSE': -326},
+    267: {'CONCAT': -327, '+': -327, '-': -327, '/': -327, '*': -327, '<': -327, 'FLOAT_SUM': -327, 'FLOAT_SUB': -327, 'FLOAT_DIV': -327, 'FLOAT_MUL': -327, '>': -327, 'NOT_EQUAL': -327, 'EQUAL': -327, 'OR': -327, 'STRICT_OR': -327, 'AND': -327, 'STRICT_AND': -327, 'TEXT_MATCH': -327, 'LESS_OR_EQ': -327, 'MORE_OR_EQ': -327, 'ARRAY_CONCAT': -327, 'ARRAY_SUB': -327, 'POW': -327, 'FLOAT_POW': -327, 'BIT_OR': -327, 'BIT_AND': -327, 'BIT_SHIFT_LEFT': -327, 'DOUBLE_ARROW_LEFT': -327, 'DOUBLE_ARROW_RIGHT': -327, 'ARROW_LEFT': -327, 'ARROW_RIGHT': -327, 'ARROW_BOTH': -327, 'SOME_CONCAT': -327, 'SOME_SUB': -327, 'FLOAT_LESS_OR_EQ': -327, 'FLOAT_LESS': -327, 'FLOAT_MORE_OR_EQ': -327, 'FLOAT_MORE': -327, 'NEWLINE': -327, '$end': -327, ')': -327, 'OF': -327, 'THEN': -327, ',': -327, ']': -327, '(': 136, 'END': -327, 'ELIF': -327, 'ELSE': -327},
+    268: {'CONCAT': -328, '+': -328, '-': -328, '/': -328, '*': -328, '<': -328, 'FLOAT_SUM': -328, 'FLOAT_SUB': -328, 'FLOAT_DIV': -328, 'FLOAT_MUL': -328, '>': -328, 'NOT_EQUAL': -328, 'EQUAL': -328, 'OR': -328, 'STRICT_OR': -328, 'AND': -328, 'STRICT_AND': -328, 'TEXT_MATCH': -328, 'LESS_OR_EQ': -328, 'MORE_OR_EQ': -328, 'ARRAY_CONCAT': -328, 'ARRAY_SUB': -328, 'POW': -328, 'FLOAT_POW': -328, 'BIT_OR': -328, 'BIT_AND': -328, 'BIT_SHIFT_LEFT': -328, 'DOUBLE_ARROW_LEFT': -328, 'DOUBLE_ARROW_RIGHT': -328, 'ARROW_LEFT': -328, 'ARROW_RIGHT': -328, 'ARROW_BOTH': -328, 'SOME_CONCAT': -328, 'SOME_SUB': -328, 'FLOAT_LESS_OR_EQ': -328, 'FLOAT_LESS': -328, 'FLOAT_MORE_OR_EQ': -328, 'FLOAT_MORE': -328, 'NEWLINE': -328, '$end': -328, ')': -328, 'OF': -328, 'THEN': -328, ',': -328, ']': -328, '(': 136, 'END': -328, 'ELIF': -328, 'ELSE': -328},
+    269: {'CONCAT': -329, '+': -329, '-': -329, '/': -329, '*': -329, '<': -329, 'FLOAT_SUM': -329, 'FLOAT_SUB': -329, 'FLOAT_DIV': -329, 'FLOAT_MUL': -329, '>': -329, 'NOT_EQUAL': -329, 'EQUAL': -329, 'OR': -329, 'STRICT_OR': -329, 'AND': -329, 'STRICT_AND': -329, 'TEXT_MATCH': -329, 'LESS_OR_EQ': -329, 'MORE_OR_EQ': -329, 'ARRAY_CONCAT': -329, 'ARRAY_SUB': -329, 'POW': -329, 'FLOAT_POW': -329, 'BIT_OR': -329, 'BIT_AND': -329, 'BIT_SHIFT_LEFT': -329, 'DOUBLE_ARROW_LEFT': -329, 'DOUBLE_ARROW_RIGHT': -329, 'ARROW_LEFT': -329, 'ARROW_RIGHT': -329, 'ARROW_BOTH': -329, 'SOME_CONCAT': -329, 'SOME_SUB': -329, 'FLOAT_LESS_OR_EQ': -329, 'FLOAT_LESS': -329, 'FLOAT_MORE_OR_EQ': -329, 'FLOAT_MORE': -329, 'NEWLINE': -329, '$end': -329, ')': -329, 'OF': -329, 'THEN': -329, ',': -329, ']': -329, '(': 136, 'END': -329, 'ELIF': -329, 'ELSE': -329},
+    270: {'CONCAT': -330, '+': -330, '-': -330, '/': -330, '*': -330, '<': -330, 'FLOAT_SUM': -330, 'FLOAT_SUB': -330, 'FLOAT_DIV': -330, 'FLOAT_MUL': -330, '>': -330, 'NOT_EQUAL': -330, 'EQUAL': -330, 'OR': -330, 'STRICT_OR': -330, 'AND': -330, 'STRICT_AND': -330, 'TEXT_MATCH': -330, 'LESS_OR_EQ': -330, 'MORE_OR_EQ': -330, 'ARRAY_CONCAT': -330, 'ARRAY_SUB': -330, 'POW': -330, 'FLOAT_POW': -330, 'BIT_OR': -330, 'BIT_AND': -330, 'BIT_SHIFT_LEFT': -330, 'DOUBLE_ARROW_LEFT': -330, 'DOUBLE_ARROW_RIGHT': -330, 'ARROW_LEFT': -330, 'ARROW_RIGHT': -330, 'ARROW_BOTH': -330, 'SOME_CONCAT': -330, 'SOME_SUB': -330, 'FLOAT_LESS_OR_EQ': -330, 'FLOAT_LESS': -330, 'FLOAT_MORE_OR_EQ': -330, 'FLOAT_MORE': -330, 'NEWLINE': -330, '$end': -330, ')': -330, 'OF': -330, 'THEN': -330, ',': -330, ']': -330, '(': 136, 'END': -330, 'ELIF': -330, 'ELSE': -330},
+    271: {'CONCAT': -331, '+': -331, '-': -331, '/': -331, '*': -331, '<': -331, 'FLOAT_SUM': -331, 'FLOAT_SUB': -331, 'FLOAT_DIV': -331, 'FLOAT_MUL': -331, '>': -331, 'NOT_EQUAL': -331, 'EQUAL': -331, 'OR': -331, 'STRICT_OR': -331, 'AND': -331, 'STRICT_AND': -331, 'TEXT_MATCH': -331, 'LESS_OR_EQ': -331, 'MORE_OR_EQ': -331, 'ARRAY_CONCAT': -331, 'ARRAY_SUB': -331, 'POW': -331, 'FLOAT_POW': -331, 'BIT_OR': -331, 'BIT_AND': -331, 'BIT_SHIFT_LEFT': -331, 'DOUBLE_ARROW_LEFT': -331, 'DOUBLE_ARROW_RIGHT': -331, 'ARROW_LEFT': -331, 'ARROW_RIGHT': -331, 'ARROW_BOTH': -331, 'SOME_CONCAT': -331, 'SOME_SUB': -331, 'FLOAT_LESS_OR_EQ': -331, 'FLOAT_LESS': -331, 'FLOAT_MORE_OR_EQ': -331, 'FLOAT_MORE': -331, 'NEWLINE': -331, '$end': -331, ')': -331, 'OF': -331, 'THEN': -331, ',': -331, ']': -331, '(': 136, 'END': -331, 'ELIF': -331, 'ELSE': -331},
+    272: {'CONCAT': -332, '+': -332, '-': -332, '/': -332, '*': -332, '<': -332, 'FLOAT_SUM': -332, 'FLOAT_SUB': -332, 'FLOAT_DIV': -332, 'FLOAT_MUL': -332, '>': -332, 'NOT_EQUAL': -332, 'EQUAL': -332, 'OR': -332, 'STRICT_OR': -332, 'AND': -332, 'STRICT_AND': -332, 'TEXT_MATCH': -332, 'LESS_OR_EQ': -332, 'MORE_OR_EQ': -332, 'ARRAY_CONCAT': -332, 'ARRAY_SUB': -332, 'POW': -332, 'FLOAT_POW': -332, 'BIT_OR': -332, 'BIT_AND': -332, 'BIT_SHIFT_LEFT': -332, 'DOUBLE_ARROW_LEFT': -332, 'DOUBLE_ARROW_RIGHT': -332, 'ARROW_LEFT': -332, 'ARROW_RIGHT': -332, 'ARROW_BOTH': -332, 'SOME_CONCAT': -332, 'SOME_SUB': -332, 'FLOAT_LESS_OR_EQ': -332, 'FLOAT_LESS': -332, 'FLOAT_MORE_OR_EQ': -332, 'FLOAT_MORE': -332, 'NEWLINE': -332, '$end': -332, ')': -332, 'OF': -332, 'THEN': -332, ',': -332, ']': -332, '(': 136, 'END': -332, 'ELIF': -332, 'ELSE': -332},
+    273: {'CONCAT': -333, '+': -333, '-': -333, '/': -333, '*': -333, '<': -333, 'FLOAT_SUM': -333, 'FLOAT_SUB': -333, 'FLOAT_DIV': -333, 'FLOAT_MUL': -333, '>': -333, 'NOT_EQUAL': -333, 'EQUAL': -333, 'OR': -333, 'STRICT_OR': -333, 'AND': -333, 'STRICT_AND': -333, 'TEXT_MATCH': -333, 'LESS_OR_EQ': -333, 'MORE_OR_EQ': -333, 'ARRAY_CONCAT': -333, 'ARRAY_SUB': -333, 'POW': -333, 'FLOAT_POW': -333, 'BIT_OR': -333, 'BIT_AND': -333, 'BIT_SHIFT_LEFT': -333, 'DOUBLE_ARROW_LEFT': -333, 'DOUBLE_ARROW_RIGHT': -333, 'ARROW_LEFT': -333, 'ARROW_RIGHT': -333, 'ARROW_BOTH': -333, 'SOME_CONCAT': -333, 'SOME_SUB': -333, 'FLOAT_LESS_OR_EQ': -333, 'FLOAT_LESS': -333, 'FLOAT_MORE_OR_EQ': -333, 'FLOAT_MORE': -333, 'NEWLINE': -333, '$end': -333, ')': -333, 'OF': -333, 'THEN': -333, ',': -333, ']': -333, '(': 136, 'END': -333, 'ELIF': -333, 'ELSE': -333},
+    274: {')': -229, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    275: {'(': -226, 'IDENTIFIER': -226, 'DEF': -226, '+': -226, '!': -226, 'STRICT_NOT': -226, '-': -226, 'STRING': -226, 'FLOAT': -226, 'INT': -226, '[': -226, 'TYPE_IDENTIFIER': -226, 'CASE': -226, 'IF': -226, 'DO': -226, 'EXTERNAL': -226, 'ENUM': -226, ')': -226},
+    276: {'NEWLINE': 302, 'IDENTIFIER': -89},
+    277: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    278: {'NEWLINE': 305, 'IDENTIFIER': -120, ')': -120},
+    279: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    280: {']': 307},
+    281: {']': -223, ',': 308},
+    282: {'NEWLINE': 310, ',': -237, ']': -237, ')': -237},
+    283: {')': -234, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    284: {'(': -231, 'IDENTIFIER': -231, 'DEF': -231, '+': -231, '!': -231, 'STRICT_NOT': -231, '-': -231, 'STRING': -231, 'FLOAT': -231, 'INT': -231, '[': -231, 'TYPE_IDENTIFIER': -231, 'CASE': -231, 'IF': -231, 'DO': -231, 'EXTERNAL': -231, 'ENUM': -231, ')': -231},
+    285: {'<': 313, '=': -151},
+    286: {'=': -253},
+    287: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    288: {'NEWLINE': 316, 'TYPE_IDENTIFIER': -194, 'IDENTIFIER': -194, 'END': -194},
+    289: {':': 318, 'NEWLINE': -185, 'ELIF': -185, 'ELSE': -185, 'END': -185, '(': -185, 'IDENTIFIER': -185, 'DEF': -185, '+': -185, '!': -185, 'STRICT_NOT': -185, '-': -185, 'STRING': -185, 'FLOAT': -185, 'INT': -185, '[': -185, 'TYPE_IDENTIFIER': -185, 'CASE': -185, 'IF': -185, 'DO': -185, 'EXTERNAL': -185, 'ENUM': -185},
+    290: {'END': 319},
+    291: {'END': -117, 'ELIF': -117, 'ELSE': -117, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    292: {'(': -114, 'IDENTIFIER': -114, 'DEF': -114, '+': -114, '!': -114, 'STRICT_NOT': -114, '-': -114, 'STRING': -114, 'FLOAT': -114, 'INT': -114, '[': -114, 'TYPE_IDENTIFIER': -114, 'CASE': -114, 'IF': -114, 'DO': -114, 'EXTERNAL': -114, 'ENUM': -114, 'END': -114, 'ELIF': -114, 'ELSE': -114},
+    293: {'NEWLINE': -111, 'END': -111, '(': -111, 'IDENTIFIER': -111, 'DEF': -111, '+': -111, '!': -111, 'STRICT_NOT': -111, '-': -111, 'STRING': -111, 'FLOAT': -111, 'INT': -111, '[': -111, 'TYPE_IDENTIFIER': -111, 'CASE': -111, 'IF': -111, 'DO': -111, 'EXTERNAL': -111, 'ENUM': -111},
+    294: {'<': 324, 'NEWLINE': -151, 'END': -151, '(': -151, 'IDENTIFIER': -151, 'DEF': -151, '+': -151, '!': -151, 'STRICT_NOT': -151, '-': -151, 'STRING': -151, 'FLOAT': -151, 'INT': -151, '[': -151, 'TYPE_IDENTIFIER': -151, 'CASE': -151, 'IF': -151, 'DO': -151, 'EXTERNAL': -151, 'ENUM': -151, ',': -151, 'MORE_OR_EQ': -151, '>': -151, 'ELIF': -151, 'ELSE': -151, ')': -151},
+    295: {'NEWLINE': 326, 'TYPE_IDENTIFIER': -154, '}': -154},
+    296: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    297: {'TYPE_IDENTIFIER': 330, 'IDENTIFIER': 59},
+    298: {'TYPE_IDENTIFIER': -14, 'IDENTIFIER': -14},
+    299: {')': 332},
+    300: {')': -228, ',': 308},
+    301: {'IDENTIFIER': 59},
+    302: {'IDENTIFIER': -88},
+    303: {'>': -98, ',': 336},
+    304: {')': -122, 'IDENTIFIER': 59},
+    305: {'IDENTIFIER': -119, ')': -119},
+    306: {'>': -127, ',': 345},
+    307: {'CONCAT': -220, '+': -220, '-': -220, '/': -220, '*': -220, '<': -220, 'FLOAT_SUM': -220, 'FLOAT_SUB': -220, 'FLOAT_DIV': -220, 'FLOAT_MUL': -220, '>': -220, 'NOT_EQUAL': -220, 'EQUAL': -220, 'OR': -220, 'STRICT_OR': -220, 'AND': -220, 'STRICT_AND': -220, 'TEXT_MATCH': -220, 'LESS_OR_EQ': -220, 'MORE_OR_EQ': -220, 'ARRAY_CONCAT': -220, 'ARRAY_SUB': -220, 'POW': -220, 'FLOAT_POW': -220, 'BIT_OR': -220, 'BIT_AND': -220, 'BIT_SHIFT_LEFT': -220, 'DOUBLE_ARROW_LEFT': -220, 'DOUBLE_ARROW_RIGHT': -220, 'ARROW_LEFT': -220, 'ARROW_RIGHT': -220, 'ARROW_BOTH': -220, 'SOME_CONCAT': -220, 'SOME_SUB': -220, 'FLOAT_LESS_OR_EQ': -220, 'FLOAT_LESS': -220, 'FLOAT_MORE_OR_EQ': -220, 'FLOAT_MORE': -220, '(': -220, 'NEWLINE': -220, '$end': -220, ')': -220, 'OF': -220, 'THEN': -220, ',': -220, ']': -220, 'END': -220, 'ELIF': -220, 'ELSE': -220},
+    308: {'NEWLINE': 347, '(': -240, 'IDENTIFIER': -240, 'DEF': -240, '+': -240, '!': -240, 'STRICT_NOT': -240, '-': -240, 'STRING': -240, 'FLOAT': -240, 'INT': -240, '[': -240, 'TYPE_IDENTIFIER': -240, 'CASE': -240, 'IF': -240, 'DO': -240, 'EXTERNAL': -240, 'ENUM': -240},
+    309: {',': -235, ']': -235, ')': -235},
+    310: {',': -236, ']': -236, ')': -236},
+    311: {')': 348},
+    312: {')': -233, ',': 308},
+    313: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    314: {'CONCAT': -252, '+': -252, '-': -252, '/': -252, '*': -252, '<': -252, 'FLOAT_SUM': -252, 'FLOAT_SUB': -252, 'FLOAT_DIV': -252, 'FLOAT_MUL': -252, '>': -252, 'NOT_EQUAL': -252, 'EQUAL': -252, 'OR': -252, 'STRICT_OR': -252, 'AND': -252, 'STRICT_AND': -252, 'TEXT_MATCH': -252, 'LESS_OR_EQ': -252, 'MORE_OR_EQ': -252, 'ARRAY_CONCAT': -252, 'ARRAY_SUB': -252, 'POW': -252, 'FLOAT_POW': -252, 'BIT_OR': -252, 'BIT_AND': -252, 'BIT_SHIFT_LEFT': -252, 'DOUBLE_ARROW_LEFT': -252, 'DOUBLE_ARROW_RIGHT': -252, 'ARROW_LEFT': -252, 'ARROW_RIGHT': -252, 'ARROW_BOTH': -252, 'SOME_CONCAT': -252, 'SOME_SUB': -252, 'FLOAT_LESS_OR_EQ': -252, 'FLOAT_LESS': -252, 'FLOAT_MORE_OR_EQ': -252, 'FLOAT_MORE': -252, '(': -252, 'NEWLINE': -252, '$end': -252, ')': -252, 'OF': -252, 'THEN': -252, ',': -252, ']': -252, 'END': -252, 'ELIF': -252, 'ELSE': -252},
+    315: {'END': -196, 'TYPE_IDENTIFIER': 355, 'IDENTIFIER': 59},
+    316: {'TYPE_IDENTIFIER': -193, 'IDENTIFIER': -193, 'END': -193},
+    317: {'NEWLINE': 292, '(': -115, 'IDENTIFIER': -115, 'DEF': -115, '+': -115, '!': -115, 'STRICT_NOT': -115, '-': -115, 'STRING': -115, 'FLOAT': -115, 'INT': -115, '[': -115, 'TYPE_IDENTIFIER': -115, 'CASE': -115, 'IF': -115, 'DO': -115, 'EXTERNAL': -115, 'ENUM': -115, 'ELIF': -115, 'ELSE': -115, 'END': -115},
+    318: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    319: {'CONCAT': -110, '+': -110, '-': -110, '/': -110, '*': -110, '<': -110, 'FLOAT_SUM': -110, 'FLOAT_SUB': -110, 'FLOAT_DIV': -110, 'FLOAT_MUL': -110, '>': -110, 'NOT_EQUAL': -110, 'EQUAL': -110, 'OR': -110, 'STRICT_OR': -110, 'AND': -110, 'STRICT_AND': -110, 'TEXT_MATCH': -110, 'LESS_OR_EQ': -110, 'MORE_OR_EQ': -110, 'ARRAY_CONCAT': -110, 'ARRAY_SUB': -110, 'POW': -110, 'FLOAT_POW': -110, 'BIT_OR': -110, 'BIT_AND': -110, 'BIT_SHIFT_LEFT': -110, 'DOUBLE_ARROW_LEFT': -110, 'DOUBLE_ARROW_RIGHT': -110, 'ARROW_LEFT': -110, 'ARROW_RIGHT': -110, 'ARROW_BOTH': -110, 'SOME_CONCAT': -110, 'SOME_SUB': -110, 'FLOAT_LESS_OR_EQ': -110, 'FLOAT_LESS': -110, 'FLOAT_MORE_OR_EQ': -110, 'FLOAT_MORE': -110, '(': -110, 'NEWLINE': -110, '$end': -110, ')': -110, 'OF': -110, 'THEN': -110, ',': -110, ']': -110, 'END': -110, 'ELIF': -110, 'ELSE': -110, 'TYPE_IDENTIFIER': -110, 'IDENTIFIER': -110},
+    320: {'END': -113, 'ELIF': -113, 'ELSE': -113},
+    321: {'END': -116, 'ELIF': -116, 'ELSE': -116},
+    322: {'NEWLINE': 360, 'END': -39, 'ELIF': -39, 'ELSE': -39},
+    323: {'NEWLINE': -40, 'END': -40, 'ELIF': -40, 'ELSE': -40},
+    324: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    325: {'}': -156, 'TYPE_IDENTIFIER': 365},
+    326: {'TYPE_IDENTIFIER': -153, '}': -153},
+    327: {'>': -159, ',': 369},
+    328: {')': 370, ',': 371},
+    329: {'NEWLINE': 373, ')': -19, ',': -19},
+    330: {'NEWLINE': -25, ')': -25, ',': -25},
+    331: {'NEWLINE': -26, ')': -26, ',': -26},
+    332: {'CONCAT': -225, '+': -225, '-': -225, '/': -225, '*': -225, '<': -225, 'FLOAT_SUM': -225, 'FLOAT_SUB': -225, 'FLOAT_DIV': -225, 'FLOAT_MUL': -225, '>': -225, 'NOT_EQUAL': -225, 'EQUAL': -225, 'OR': -225, 'STRICT_OR': -225, 'AND': -225, 'STRICT_AND': -225, 'TEXT_MATCH': -225, 'LESS_OR_EQ': -225, 'MORE_OR_EQ': -225, 'ARRAY_CONCAT': -225, 'ARRAY_SUB': -225, 'POW': -225, 'FLOAT_POW': -225, 'BIT_OR': -225, 'BIT_AND': -225, 'BIT_SHIFT_LEFT': -225, 'DOUBLE_ARROW_LEFT': -225, 'DOUBLE_ARROW_RIGHT': -225, 'ARROW_LEFT': -225, 'ARROW_RIGHT': -225, 'ARROW_BOTH': -225, 'SOME_CONCAT': -225, 'SOME_SUB': -225, 'FLOAT_LESS_OR_EQ': -225, 'FLOAT_LESS': -225, 'FLOAT_MORE_OR_EQ': -225, 'FLOAT_MORE': -225, '(': -225, 'NEWLINE': -225, '$end': -225, ')': -225, 'OF': -225, 'THEN': -225, ',': -225, ']': -225, 'END': -225, 'ELIF': -225, 'ELSE': -225},
+    333: {',': 374},
+    334: {':': 376, ',': -182, 'NEWLINE': -182, ')': -182},
+    335: {'>': 377},
+    336: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    337: {'>': -97, ',': 336},
+    338: {',': -100, '>': -100},
+    339: {')': 380},
+    340: {')': -121, ',': 381},
+    341: {'NEWLINE': 383, ',': -139, ')': -139},
+    342: {'>': 384},
+    343: {'>': -126, ',': 345},
+    344: {',': -129, '>': -129},
+    345: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    346: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    347: {'(': -239, 'IDENTIFIER': -239, 'DEF': -239, '+': -239, '!': -239, 'STRICT_NOT': -239, '-': -239, 'STRING': -239, 'FLOAT': -239, 'INT': -239, '[': -239, 'TYPE_IDENTIFIER': -239, 'CASE': -239, 'IF': -239, 'DO': -239, 'EXTERNAL': -239, 'ENUM': -239},
+    348: {'CONCAT': -230, '+': -230, '-': -230, '/': -230, '*': -230, '<': -230, 'FLOAT_SUM': -230, 'FLOAT_SUB': -230, 'FLOAT_DIV': -230, 'FLOAT_MUL': -230, '>': -230, 'NOT_EQUAL': -230, 'EQUAL': -230, 'OR': -230, 'STRICT_OR': -230, 'AND': -230, 'STRICT_AND': -230, 'TEXT_MATCH': -230, 'LESS_OR_EQ': -230, 'MORE_OR_EQ': -230, 'ARRAY_CONCAT': -230, 'ARRAY_SUB': -230, 'POW': -230, 'FLOAT_POW': -230, 'BIT_OR': -230, 'BIT_AND': -230, 'BIT_SHIFT_LEFT': -230, 'DOUBLE_ARROW_LEFT': -230, 'DOUBLE_ARROW_RIGHT': -230, 'ARROW_LEFT': -230, 'ARROW_RIGHT': -230, 'ARROW_BOTH': -230, 'SOME_CONCAT': -230, 'SOME_SUB': -230, 'FLOAT_LESS_OR_EQ': -230, 'FLOAT_LESS': -230, 'FLOAT_MORE_OR_EQ': -230, 'FLOAT_MORE': -230, '(': -230, 'NEWLINE': -230, '$end': -230, ')': -230, 'OF': -230, 'THEN': -230, ',': -230, ']': -230, 'END': -230, 'ELIF': -230, 'ELSE': -230},
+    349: {'MORE_OR_EQ': -248, '>': -147, ',': 394},
+    350: {'END': 395},
+    351: {'END': -195, 'TYPE_IDENTIFIER': 355, 'IDENTIFIER': 59},
+    352: {'DO': 46},
+    353: {'DO': -203, 'NEWLINE': -203, ',': -203, ')': -203},
+    354: {'DO': -204, 'NEWLINE': -204, ',': -204, ')': -204},
+    355: {'DO': -206, 'NEWLINE': -206, ',': -206, ')': -206, '(': 398},
+    356: {'DO': -205, 'NEWLINE': -205, ',': -205, ')': -205},
+    357: {'END': -187, 'ELIF': 401, 'ELSE': 402},
+    358: {'NEWLINE': -184, 'ELIF': -184, 'ELSE': -184, 'END': -184, '(': -184, 'IDENTIFIER': -184, 'DEF': -184, '+': -184, '!': -184, 'STRICT_NOT': -184, '-': -184, 'STRING': -184, 'FLOAT': -184, 'INT': -184, '[': -184, 'TYPE_IDENTIFIER': -184, 'CASE': -184, 'IF': -184, 'DO': -184, 'EXTERNAL': -184, 'ENUM': -184},
+    359: {'END': -37, 'ELIF': -37, 'ELSE': -37},
+    360: {'END': -38, 'ELIF': -38, 'ELSE': -38, '(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    361: {'>': -147, ',': 404},
+    362: {'}': 405},
+    363: {'}': -155, 'TYPE_IDENTIFIER': 365},
+    364: {'NEWLINE': 408, 'TYPE_IDENTIFIER': -169, '}': -169},
+    365: {'NEWLINE': -173, 'TYPE_IDENTIFIER': -173, '}': -173, '(': 409},
+    366: {'>': 410},
+    367: {'>': -158, ',': 369},
+    368: {',': -161, '>': -161},
+    369: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    370: {'NEWLINE': -13, '$end': -13},
+    371: {'NEWLINE': 414, 'TYPE_IDENTIFIER': -22, 'IDENTIFIER': -22},
+    372: {')': -17, ',': -17},
+    373: {')': -18, ',': -18},
+    374: {'NEWLINE': 416, 'IDENTIFIER': -91},
+    375: {',': -180, 'NEWLINE': -180, ')': -180},
+    376: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    377: {'(': 418},
+    378: {',': -101, '>': -101},
+    379: {',': -99, '>': -99},
+    380: {':': 420, 'DO': -124},
+    381: {'NEWLINE': 422, 'IDENTIFIER': -142},
+    382: {',': -137, ')': -137},
+    383: {',': -138, ')': -138},
+    384: {'(': 423},
+    385: {',': -128, '>': -128},
+    386: {',': -130, '>': -130},
+    387: {'NEWLINE': 425, ',': -242, ']': -242, ')': -242},
+    388: {'MORE_OR_EQ': 426},
+    389: {'>': 427},
+    390: {'MORE_OR_EQ': -247, ',': 429},
+    391: {'>': -146, ',': 404},
+    392: {',': -250, 'MORE_OR_EQ': -250},
+    393: {',': -149, '>': -149},
+    394: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    395: {'CONCAT': -192, '+': -192, '-': -192, '/': -192, '*': -192, '<': -192, 'FLOAT_SUM': -192, 'FLOAT_SUB': -192, 'FLOAT_DIV': -192, 'FLOAT_MUL': -192, '>': -192, 'NOT_EQUAL': -192, 'EQUAL': -192, 'OR': -192, 'STRICT_OR': -192, 'AND': -192, 'STRICT_AND': -192, 'TEXT_MATCH': -192, 'LESS_OR_EQ': -192, 'MORE_OR_EQ': -192, 'ARRAY_CONCAT': -192, 'ARRAY_SUB': -192, 'POW': -192, 'FLOAT_POW': -192, 'BIT_OR': -192, 'BIT_AND': -192, 'BIT_SHIFT_LEFT': -192, 'DOUBLE_ARROW_LEFT': -192, 'DOUBLE_ARROW_RIGHT': -192, 'ARROW_LEFT': -192, 'ARROW_RIGHT': -192, 'ARROW_BOTH': -192, 'SOME_CONCAT': -192, 'SOME_SUB': -192, 'FLOAT_LESS_OR_EQ': -192, 'FLOAT_LESS': -192, 'FLOAT_MORE_OR_EQ': -192, 'FLOAT_MORE': -192, '(': -192, 'NEWLINE': -192, '$end': -192, ')': -192, 'OF': -192, 'THEN': -192, ',': -192, ']': -192, 'END': -192, 'ELIF': -192, 'ELSE': -192},
+    396: {'DO': 46},
+    397: {'NEWLINE': 434, 'TYPE_IDENTIFIER': -199, 'IDENTIFIER': -199, 'END': -199},
+    398: {'NEWLINE': 436, 'TYPE_IDENTIFIER': -209, 'IDENTIFIER': -209, ')': -209},
+    399: {'END': 437},
+    400: {'END': -186},
+    401: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    402: {'NEWLINE': 292, '(': -115, 'IDENTIFIER': -115, 'DEF': -115, '+': -115, '!': -115, 'STRICT_NOT': -115, '-': -115, 'STRING': -115, 'FLOAT': -115, 'INT': -115, '[': -115, 'TYPE_IDENTIFIER': -115, 'CASE': -115, 'IF': -115, 'DO': -115, 'EXTERNAL': -115, 'ENUM': -115, 'END': -115},
+    403: {'NEWLINE': -41, 'END': -41, 'ELIF': -41, 'ELSE': -41},
+    404: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    405: {'CONCAT': -152, '+': -152, '-': -152, '/': -152, '*': -152, '<': -152, 'FLOAT_SUM': -152, 'FLOAT_SUB': -152, 'FLOAT_DIV': -152, 'FLOAT_MUL': -152, '>': -152, 'NOT_EQUAL': -152, 'EQUAL': -152, 'OR': -152, 'STRICT_OR': -152, 'AND': -152, 'STRICT_AND': -152, 'TEXT_MATCH': -152, 'LESS_OR_EQ': -152, 'MORE_OR_EQ': -152, 'ARRAY_CONCAT': -152, 'ARRAY_SUB': -152, 'POW': -152, 'FLOAT_POW': -152, 'BIT_OR': -152, 'BIT_AND': -152, 'BIT_SHIFT_LEFT': -152, 'DOUBLE_ARROW_LEFT': -152, 'DOUBLE_ARROW_RIGHT': -152, 'ARROW_LEFT': -152, 'ARROW_RIGHT': -152, 'ARROW_BOTH': -152, 'SOME_CONCAT': -152, 'SOME_SUB': -152, 'FLOAT_LESS_OR_EQ': -152, 'FLOAT_LESS': -152, 'FLOAT_MORE_OR_EQ': -152, 'FLOAT_MORE': -152, '(': -152, 'NEWLINE': -152, '$end': -152, ')': -152, 'OF': -152, 'THEN': -152, ',': -152, ']': -152, 'END': -152, 'ELIF': -152, 'ELSE': -152},
+    406: {'NEWLINE': 442, 'TYPE_IDENTIFIER': -172, '}': -172},
+    407: {'TYPE_IDENTIFIER': -167, '}': -167},
+    408: {'TYPE_IDENTIFIER': -168, '}': -168},
+    409: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    410: {'{': 444},
+    411: {',': -160, '>': -160},
+    412: {',': -162, '>': -162},
+    413: {'TYPE_IDENTIFIER': 330, 'IDENTIFIER': 59},
+    414: {'TYPE_IDENTIFIER': -21, 'IDENTIFIER': -21},
+    415: {'IDENTIFIER': 59},
+    416: {'IDENTIFIER': -90},
+    417: {',': -181, 'NEWLINE': -181, ')': -181},
+    418: {'NEWLINE': 448, 'IDENTIFIER': -103},
+    419: {'DO': 46},
+    420: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    421: {'IDENTIFIER': 59},
+    422: {'IDENTIFIER': -141},
+    423: {'NEWLINE': 453, 'IDENTIFIER': -132, ')': -132},
+    424: {',': -238, ']': -238, ')': -238},
+    425: {',': -241, ']': -241, ')': -241},
+    426: {'(': 11, 'IDENTIFIER': 24, 'DEF': 36, '+': 22, '!': 37, 'STRICT_NOT': 38, '-': 23, 'STRING': 10, 'FLOAT': 39, 'INT': 40, '[': 41, 'TYPE_IDENTIFIER': 42, 'CASE': 44, 'IF': 45, 'DO': 46, 'EXTERNAL': 47, 'ENUM': 48},
+    427: {'=': -145, 'NEWLINE': -145, 'END': -145, '(': -145, 'IDENTIFIER': -145, 'DEF': -145, '+': -145, '!': -145, 'STRICT_NOT': -145, '-': -145, 'STRING': -145, 'FLOAT': -145, 'INT': -145, '[': -145, 'TYPE_IDENTIFIER': -145, 'CASE': -145, 'IF': -145, 'DO': -145, 'EXTERNAL': -145, 'ENUM': -145, ',': -145, 'MORE_OR_EQ': -145, '>': -145, 'ELIF': -145, 'ELSE': -145, ')': -145},
+    428: {',': -249, 'MORE_OR_EQ': -249},
+    429: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    430: {',': -148, '>': -148},
+    431: {',': -251, 'MORE_OR_EQ': -251, '>': -150},
+    432: {'NEWLINE': 457, 'TYPE_IDENTIFIER': -202, 'IDENTIFIER': -202, 'END': -202},
+    433: {'TYPE_IDENTIFIER': -197, 'IDENTIFIER': -197, 'END': -197},
+    434: {'TYPE_IDENTIFIER': -198, 'IDENTIFIER': -198, 'END': -198},
+    435: {')': -211, 'TYPE_IDENTIFIER': 355, 'IDENTIFIER': 59},
+    436: {'TYPE_IDENTIFIER': -208, 'IDENTIFIER': -208, ')': -208},
+    437: {'CONCAT': -183, '+': -183, '-': -183, '/': -183, '*': -183, '<': -183, 'FLOAT_SUM': -183, 'FLOAT_SUB': -183, 'FLOAT_DIV': -183, 'FLOAT_MUL': -183, '>': -183, 'NOT_EQUAL': -183, 'EQUAL': -183, 'OR': -183, 'STRICT_OR': -183, 'AND': -183, 'STRICT_AND': -183, 'TEXT_MATCH': -183, 'LESS_OR_EQ': -183, 'MORE_OR_EQ': -183, 'ARRAY_CONCAT': -183, 'ARRAY_SUB': -183, 'POW': -183, 'FLOAT_POW': -183, 'BIT_OR': -183, 'BIT_AND': -183, 'BIT_SHIFT_LEFT': -183, 'DOUBLE_ARROW_LEFT': -183, 'DOUBLE_ARROW_RIGHT': -183, 'ARROW_LEFT': -183, 'ARROW_RIGHT': -183, 'ARROW_BOTH': -183, 'SOME_CONCAT': -183, 'SOME_SUB': -183, 'FLOAT_LESS_OR_EQ': -183, 'FLOAT_LESS': -183, 'FLOAT_MORE_OR_EQ': -183, 'FLOAT_MORE': -183, '(': -183, 'NEWLINE': -183, '$end': -183, ')': -183, 'OF': -183, 'THEN': -183, ',': -183, ']': -183, 'END': -183, 'ELIF': -183, 'ELSE': -183},
+    438: {'THEN': 461},
+    439: {'END': -191},
+    440: {',': -150, '>': -150},
+    441: {'TYPE_IDENTIFIER': -170, '}': -170},
+    442: {'TYPE_IDENTIFIER': -171, '}': -171},
+    443: {')': -176, ',': 465},
+    444: {'NEWLINE': 467, 'TYPE_IDENTIFIER': -164, '}': -164},
+    445: {'NEWLINE': 469, ')': -24, ',': -24},
+    446: {'NEWLINE': 471, ')': -93},
+    447: {'IDENTIFIER': 59},
+    448: {'IDENTIFIER': -102},
+    449: {'CONCAT': -118, '+': -118, '-': -118, '/': -118, '*': -118, '<': -118, 'FLOAT_SUM': -118, 'FLOAT_SUB': -118, 'FLOAT_DIV': -118, 'FLOAT_MUL': -118, '>': -118, 'NOT_EQUAL': -118, 'EQUAL': -118, 'OR': -118, 'STRICT_OR': -118, 'AND': -118, 'STRICT_AND': -118, 'TEXT_MATCH': -118, 'LESS_OR_EQ': -118, 'MORE_OR_EQ': -118, 'ARRAY_CONCAT': -118, 'ARRAY_SUB': -118, 'POW': -118, 'FLOAT_POW': -118, 'BIT_OR': -118, 'BIT_AND': -118, 'BIT_SHIFT_LEFT': -118, 'DOUBLE_ARROW_LEFT': -118, 'DOUBLE_ARROW_RIGHT': -118, 'ARROW_LEFT': -118, 'ARROW_RIGHT': -118, 'ARROW_BOTH': -118, 'SOME_CONCAT': -118, 'SOME_SUB': -118, 'FLOAT_LESS_OR_EQ': -118, 'FLOAT_LESS': -118, 'FLOAT_MORE_OR_EQ': -118, 'FLOAT_MORE': -118, '(': -118, 'NEWLINE': -118, '$end': -118, ')': -118, 'OF': -118, 'THEN': -118, ',': -118, ']': -118, 'END': -118, 'ELIF': -118, 'ELSE': -118},
+    450: {'DO': -123},
+    451: {'NEWLINE': 474, ',': -144, ')': -144},
+    452: {')': -134, 'IDENTIFIER': 59},
+    453: {'IDENTIFIER': -131, ')': -131},
+    454: {'CONCAT': -246, '+': -246, '-': -246, '/': -246, '*': -246, '<': -246, 'FLOAT_SUM': -246, 'FLOAT_SUB': -246, 'FLOAT_DIV': -246, 'FLOAT_MUL': -246, '>': -246, 'NOT_EQUAL': -246, 'EQUAL': -246, 'OR': -246, 'STRICT_OR': -246, 'AND': -246, 'STRICT_AND': -246, 'TEXT_MATCH': -246, 'LESS_OR_EQ': -246, 'MORE_OR_EQ': -246, 'ARRAY_CONCAT': -246, 'ARRAY_SUB': -246, 'POW': -246, 'FLOAT_POW': -246, 'BIT_OR': -246, 'BIT_AND': -246, 'BIT_SHIFT_LEFT': -246, 'DOUBLE_ARROW_LEFT': -246, 'DOUBLE_ARROW_RIGHT': -246, 'ARROW_LEFT': -246, 'ARROW_RIGHT': -246, 'ARROW_BOTH': -246, 'SOME_CONCAT': -246, 'SOME_SUB': -246, 'FLOAT_LESS_OR_EQ': -246, 'FLOAT_LESS': -246, 'FLOAT_MORE_OR_EQ': -246, 'FLOAT_MORE': -246, '(': -246, 'NEWLINE': -246, '$end': -246, ')': -246, 'OF': -246, 'THEN': -246, ',': -246, ']': -246, 'END': -246, 'ELIF': -246, 'ELSE': -246},
+    455: {',': -251, 'MORE_OR_EQ': -251},
+    456: {'TYPE_IDENTIFIER': -200, 'IDENTIFIER': -200, 'END': -200},
+    457: {'TYPE_IDENTIFIER': -201, 'IDENTIFIER': -201, 'END': -201},
+    458: {')': 477},
+    459: {')': -210, ',': 478},
+    460: {'NEWLINE': 480, ',': -214, ')': -214},
+    461: {'NEWLINE': 292, '(': -115, 'IDENTIFIER': -115, 'DEF': -115, '+': -115, '!': -115, 'STRICT_NOT': -115, '-': -115, 'STRING': -115, 'FLOAT': -115, 'INT': -115, '[': -115, 'TYPE_IDENTIFIER': -115, 'CASE': -115, 'IF': -115, 'DO': -115, 'EXTERNAL': -115, 'ENUM': -115, 'ELIF': -115, 'ELSE': -115, 'END': -115},
+    462: {')': 482},
+    463: {')': -175, ',': 465},
+    464: {',': -178, ')': -178},
+    465: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    466: {'}': -166, 'TYPE_IDENTIFIER': 365},
+    467: {'TYPE_IDENTIFIER': -163, '}': -163},
+    468: {')': -20, ',': -20},
+    469: {')': -23, ',': -23},
+    470: {')': 487},
+    471: {')': -92},
+    472: {',': 488},
+    473: {',': -140, ')': -140},
+    474: {',': -143, ')': -143},
+    475: {')': 489},
+    476: {')': -133, ',': 381},
+    477: {'DO': -207, 'NEWLINE': -207, ',': -207, ')': -207},
+    478: {'NEWLINE': 491, 'TYPE_IDENTIFIER': -217, 'IDENTIFIER': -217},
+    479: {',': -212, ')': -212},
+    480: {',': -213, ')': -213},
+    481: {'END': -190, 'ELIF': 401, 'ELSE': 402},
+    482: {'NEWLINE': -174, 'TYPE_IDENTIFIER': -174, '}': -174},
+    483: {',': -177, ')': -177},
+    484: {',': -179, ')': -179},
+    485: {'}': 494},
+    486: {'}': -165, 'TYPE_IDENTIFIER': 365},
+    487: {':': 496, 'DO': -95},
+    488: {'NEWLINE': 498, 'IDENTIFIER': -105},
+    489: {':': 500, 'DO': -136},
+    490: {'TYPE_IDENTIFIER': 355, 'IDENTIFIER': 59},
+    491: {'TYPE_IDENTIFIER': -216, 'IDENTIFIER': -216},
+    492: {'END': -188},
+    493: {'END': -189},
+    494: {'CONCAT': -157, '+': -157, '-': -157, '/': -157, '*': -157, '<': -157, 'FLOAT_SUM': -157, 'FLOAT_SUB': -157, 'FLOAT_DIV': -157, 'FLOAT_MUL': -157, '>': -157, 'NOT_EQUAL': -157, 'EQUAL': -157, 'OR': -157, 'STRICT_OR': -157, 'AND': -157, 'STRICT_AND': -157, 'TEXT_MATCH': -157, 'LESS_OR_EQ': -157, 'MORE_OR_EQ': -157, 'ARRAY_CONCAT': -157, 'ARRAY_SUB': -157, 'POW': -157, 'FLOAT_POW': -157, 'BIT_OR': -157, 'BIT_AND': -157, 'BIT_SHIFT_LEFT': -157, 'DOUBLE_ARROW_LEFT': -157, 'DOUBLE_ARROW_RIGHT': -157, 'ARROW_LEFT': -157, 'ARROW_RIGHT': -157, 'ARROW_BOTH': -157, 'SOME_CONCAT': -157, 'SOME_SUB': -157, 'FLOAT_LESS_OR_EQ': -157, 'FLOAT_LESS': -157, 'FLOAT_MORE_OR_EQ': -157, 'FLOAT_MORE': -157, '(': -157, 'NEWLINE': -157, '$end': -157, ')': -157, 'OF': -157, 'THEN': -157, ',': -157, ']': -157, 'END': -157, 'ELIF': -157, 'ELSE': -157},
+    495: {'DO': 46},
+    496: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    497: {'IDENTIFIER': 59},
+    498: {'IDENTIFIER': -104},
+    499: {'DO': 46},
+    500: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    501: {'NEWLINE': 508, ',': -219, ')': -219},
+    502: {'CONCAT': -87, '+': -87, '-': -87, '/': -87, '*': -87, '<': -87, 'FLOAT_SUM': -87, 'FLOAT_SUB': -87, 'FLOAT_DIV': -87, 'FLOAT_MUL': -87, '>': -87, 'NOT_EQUAL': -87, 'EQUAL': -87, 'OR': -87, 'STRICT_OR': -87, 'AND': -87, 'STRICT_AND': -87, 'TEXT_MATCH': -87, 'LESS_OR_EQ': -87, 'MORE_OR_EQ': -87, 'ARRAY_CONCAT': -87, 'ARRAY_SUB': -87, 'POW': -87, 'FLOAT_POW': -87, 'BIT_OR': -87, 'BIT_AND': -87, 'BIT_SHIFT_LEFT': -87, 'DOUBLE_ARROW_LEFT': -87, 'DOUBLE_ARROW_RIGHT': -87, 'ARROW_LEFT': -87, 'ARROW_RIGHT': -87, 'ARROW_BOTH': -87, 'SOME_CONCAT': -87, 'SOME_SUB': -87, 'FLOAT_LESS_OR_EQ': -87, 'FLOAT_LESS': -87, 'FLOAT_MORE_OR_EQ': -87, 'FLOAT_MORE': -87, '(': -87, 'NEWLINE': -87, '$end': -87, ')': -87, 'OF': -87, 'THEN': -87, ',': -87, ']': -87, 'END': -87, 'ELIF': -87, 'ELSE': -87},
+    503: {'DO': -94},
+    504: {'NEWLINE': 510, ')': -107},
+    505: {'CONCAT': -125, '+': -125, '-': -125, '/': -125, '*': -125, '<': -125, 'FLOAT_SUM': -125, 'FLOAT_SUB': -125, 'FLOAT_DIV': -125, 'FLOAT_MUL': -125, '>': -125, 'NOT_EQUAL': -125, 'EQUAL': -125, 'OR': -125, 'STRICT_OR': -125, 'AND': -125, 'STRICT_AND': -125, 'TEXT_MATCH': -125, 'LESS_OR_EQ': -125, 'MORE_OR_EQ': -125, 'ARRAY_CONCAT': -125, 'ARRAY_SUB': -125, 'POW': -125, 'FLOAT_POW': -125, 'BIT_OR': -125, 'BIT_AND': -125, 'BIT_SHIFT_LEFT': -125, 'DOUBLE_ARROW_LEFT': -125, 'DOUBLE_ARROW_RIGHT': -125, 'ARROW_LEFT': -125, 'ARROW_RIGHT': -125, 'ARROW_BOTH': -125, 'SOME_CONCAT': -125, 'SOME_SUB': -125, 'FLOAT_LESS_OR_EQ': -125, 'FLOAT_LESS': -125, 'FLOAT_MORE_OR_EQ': -125, 'FLOAT_MORE': -125, '(': -125, 'NEWLINE': -125, '$end': -125, ')': -125, 'OF': -125, 'THEN': -125, ',': -125, ']': -125, 'END': -125, 'ELIF': -125, 'ELSE': -125},
+    506: {'DO': -135},
+    507: {',': -215, ')': -215},
+    508: {',': -218, ')': -218},
+    509: {')': 511},
+    510: {')': -106},
+    511: {':': 513, 'DO': -109},
+    512: {'DO': 46},
+    513: {'IDENTIFIER': 191, 'TYPE_IDENTIFIER': 192},
+    514: {'CONCAT': -96, '+': -96, '-': -96, '/': -96, '*': -96, '<': -96, 'FLOAT_SUM': -96, 'FLOAT_SUB': -96, 'FLOAT_DIV': -96, 'FLOAT_MUL': -96, '>': -96, 'NOT_EQUAL': -96, 'EQUAL': -96, 'OR': -96, 'STRICT_OR': -96, 'AND': -96, 'STRICT_AND': -96, 'TEXT_MATCH': -96, 'LESS_OR_EQ': -96, 'MORE_OR_EQ': -96, 'ARRAY_CONCAT': -96, 'ARRAY_SUB': -96, 'POW': -96, 'FLOAT_POW': -96, 'BIT_OR': -96, 'BIT_AND': -96, 'BIT_SHIFT_LEFT': -96, 'DOUBLE_ARROW_LEFT': -96, 'DOUBLE_ARROW_RIGHT': -96, 'ARROW_LEFT': -96, 'ARROW_RIGHT': -96, 'ARROW_BOTH': -96, 'SOME_CONCAT': -96, 'SOME_SUB': -96, 'FLOAT_LESS_OR_EQ': -96, 'FLOAT_LESS': -96, 'FLOAT_MORE_OR_EQ': -96, 'FLOAT_MORE': -96, '(': -96, 'NEWLINE': -96, '$end': -96, ')': -96, 'OF': -96, 'THEN': -96, ',': -96, ']': -96, 'END': -96, 'ELIF': -96, 'ELSE': -96},
+    515: {'DO': -108},
+}
+lr_goto = {
+    0: {'program': 1, '_65_optional': 2},
+    1: {},
+    2: {'module': 4, 'imports': 5, 'top_items': 6, '_67_optional': 7, 'import_': 8, 'top_exprs': 12, 'top_expr': 13, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'chain': 20, 'operand': 21, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'call': 31, 'case_of': 32, 'if_expr': 33, 'do': 34, 'external': 35, 'identifier': 43},
+    3: {},
+    4: {},
+    5: {'_66_optional': 50},
+    6: {},
+    7: {},
+    8: {},
+    9: {},
+    10: {},
+    11: {'expr': 52, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    12: {'_72_optional': 53},
+    13: {},
+    14: {'enum': 55, 'let': 56, 'binary_op_def': 57, 'def_expr': 58, 'identifier': 43},
+    15: {},
+    16: {},
+    17: {},
+    18: {},
+    19: {},
+    20: {},
+    21: {},
+    22: {'operand': 137, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    23: {'operand': 138, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    24: {},
+    25: {},
+    26: {},
+    27: {},
+    28: {},
+    29: {},
+    30: {},
+    31: {},
+    32: {},
+    33: {},
+    34: {},
+    35: {},
+    36: {'binary_op': 139, 'identifier': 142},
+    37: {'operand': 179, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    38: {'operand': 180, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    39: {},
+    40: {},
+    41: {'_118_optional': 181},
+    42: {},
+    43: {'_128_optional': 185},
+    44: {'expr': 186, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    45: {'expr': 187, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    46: {'_83_optional': 188},
+    47: {},
+    48: {'type_identifier': 190},
+    49: {'top_items': 193, 'import_': 194, 'top_exprs': 12, 'top_expr': 13, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'chain': 20, 'operand': 21, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'call': 31, 'case_of': 32, 'if_expr': 33, 'do': 34, 'external': 35, 'identifier': 43},
+    50: {},
+    51: {},
+    52: {},
+    53: {},
+    54: {'top_expr': 197, 'enum': 15, 'let': 16, 'binary_op_def': 17, 'def_expr': 18, 'expr': 19, 'chain': 20, 'operand': 21, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'call': 31, 'case_of': 32, 'if_expr': 33, 'do': 34, 'external': 35, 'identifier': 43},
+    55: {},
+    56: {},
+    57: {},
+    58: {},
+    59: {},
+    60: {'operand': 198, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    61: {'operand': 199, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    62: {'operand': 200, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    63: {'operand': 201, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    64: {'operand': 202, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    65: {'operand': 203, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    66: {'operand': 204, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    67: {'operand': 205, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    68: {'operand': 206, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    69: {'operand': 207, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    70: {'operand': 208, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    71: {'operand': 209, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    72: {'operand': 210, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    73: {'operand': 211, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    74: {'operand': 212, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    75: {'operand': 213, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    76: {'operand': 214, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    77: {'operand': 215, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    78: {'operand': 216, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    79: {'operand': 217, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    80: {'operand': 218, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    81: {'operand': 219, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    82: {'operand': 220, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    83: {'operand': 221, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    84: {'operand': 222, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    85: {'operand': 223, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    86: {'operand': 224, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    87: {'operand': 225, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    88: {'operand': 226, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    89: {'operand': 227, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    90: {'operand': 228, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    91: {'operand': 229, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    92: {'operand': 230, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    93: {'operand': 231, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    94: {'operand': 232, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    95: {'operand': 233, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    96: {'operand': 234, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    97: {'operand': 235, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    98: {'operand': 236, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    99: {'operand': 237, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    100: {'operand': 238, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    101: {'operand': 239, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    102: {'operand': 240, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    103: {'operand': 241, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    104: {'operand': 242, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    105: {'operand': 243, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    106: {'operand': 244, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    107: {'operand': 245, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    108: {'operand': 246, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    109: {'operand': 247, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    110: {'operand': 248, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    111: {'operand': 249, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    112: {'operand': 250, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    113: {'operand': 251, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    114: {'operand': 252, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    115: {'operand': 253, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    116: {'operand': 254, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    117: {'operand': 255, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    118: {'operand': 256, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    119: {'operand': 257, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    120: {'operand': 258, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    121: {'operand': 259, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    122: {'operand': 260, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    123: {'operand': 261, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    124: {'operand': 262, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    125: {'operand': 263, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    126: {'operand': 264, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    127: {'operand': 265, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    128: {'operand': 266, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    129: {'operand': 267, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    130: {'operand': 268, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    131: {'operand': 269, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    132: {'operand': 270, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    133: {'operand': 271, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    134: {'operand': 272, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    135: {'operand': 273, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    136: {'_120_optional': 274},
+    137: {},
+    138: {},
+    139: {},
+    140: {},
+    141: {},
+    142: {},
+    143: {},
+    144: {},
+    145: {},
+    146: {},
+    147: {},
+    148: {},
+    149: {},
+    150: {},
+    151: {},
+    152: {},
+    153: {},
+    154: {},
+    155: {},
+    156: {},
+    157: {},
+    158: {},
+    159: {},
+    160: {},
+    161: {},
+    162: {},
+    163: {},
+    164: {},
+    165: {},
+    166: {},
+    167: {},
+    168: {},
+    169: {},
+    170: {},
+    171: {},
+    172: {},
+    173: {},
+    174: {},
+    175: {},
+    176: {},
+    177: {},
+    178: {},
+    179: {},
+    180: {},
+    181: {'_119_optional': 280, 'exprs': 281, 'expr': 282, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    182: {},
+    183: {'_122_optional': 283},
+    184: {'type_identifier': 285, 'type': 286},
+    185: {},
+    186: {},
+    187: {},
+    188: {'block_statement': 290, '_84_optional': 291},
+    189: {'type': 293, 'type_identifier': 294},
+    190: {},
+    191: {},
+    192: {},
+    193: {},
+    194: {},
+    195: {'_68_optional': 297},
+    196: {},
+    197: {},
+    198: {},
+    199: {},
+    200: {},
+    201: {},
+    202: {},
+    203: {},
+    204: {},
+    205: {},
+    206: {},
+    207: {},
+    208: {},
+    209: {},
+    210: {},
+    211: {},
+    212: {},
+    213: {},
+    214: {},
+    215: {},
+    216: {},
+    217: {},
+    218: {},
+    219: {},
+    220: {},
+    221: {},
+    222: {},
+    223: {},
+    224: {},
+    225: {},
+    226: {},
+    227: {},
+    228: {},
+    229: {},
+    230: {},
+    231: {},
+    232: {},
+    233: {},
+    234: {},
+    235: {},
+    236: {},
+    237: {},
+    238: {},
+    239: {},
+    240: {},
+    241: {},
+    242: {},
+    243: {},
+    244: {},
+    245: {},
+    246: {},
+    247: {},
+    248: {},
+    249: {},
+    250: {},
+    251: {},
+    252: {},
+    253: {},
+    254: {},
+    255: {},
+    256: {},
+    257: {},
+    258: {},
+    259: {},
+    260: {},
+    261: {},
+    262: {},
+    263: {},
+    264: {},
+    265: {},
+    266: {},
+    267: {},
+    268: {},
+    269: {},
+    270: {},
+    271: {},
+    272: {},
+    273: {},
+    274: {'operand': 21, '_121_optional': 299, 'exprs': 300, 'expr': 282, 'chain': 20, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    275: {},
+    276: {'_74_optional': 301},
+    277: {'type_identifier': 303},
+    278: {'_86_optional': 304},
+    279: {'type_identifier': 306},
+    280: {},
+    281: {},
+    282: {'_124_optional': 309},
+    283: {'_123_optional': 311, 'exprs': 312, 'expr': 282, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    284: {},
+    285: {},
+    286: {},
+    287: {'identifier': 43, 'expr': 314, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15},
+    288: {'_109_optional': 315},
+    289: {'_106_optional': 317},
+    290: {},
+    291: {'_85_optional': 320, 'block_exprs': 321, 'do_exprs': 322, 'expr': 323, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    292: {},
+    293: {},
+    294: {},
+    295: {'_97_optional': 325},
+    296: {'type_identifier': 327},
+    297: {'import_names': 328, 'import_name': 329, 'identifier': 331},
+    298: {},
+    299: {},
+    300: {},
+    301: {'param': 333, 'identifier': 334},
+    302: {},
+    303: {'_78_repeat': 335, '_78_items': 337, '_78_item': 338},
+    304: {'identifier': 334, '_87_optional': 339, 'params': 340, 'param': 341},
+    305: {},
+    306: {'_89_repeat': 342, '_89_items': 343, '_89_item': 344},
+    307: {},
+    308: {'_125_optional': 346},
+    309: {},
+    310: {},
+    311: {},
+    312: {},
+    313: {'type_identifier': 294, 'type': 349},
+    314: {},
+    315: {'_110_optional': 350, 'cases': 351, 'pattern': 352, 'match_variant': 353, 'match_as': 354, 'identifier': 356},
+    316: {},
+    317: {'block_statement': 357, '_84_optional': 291},
+    318: {'type': 358, 'type_identifier': 294},
+    319: {},
+    320: {},
+    321: {},
+    322: {'_73_optional': 359},
+    323: {},
+    324: {'type_identifier': 294, 'type': 361},
+    325: {'_98_optional': 362, 'variants': 363, 'variant': 364},
+    326: {},
+    327: {'_99_repeat': 366, '_99_items': 367, '_99_item': 368},
+    328: {},
+    329: {'_69_optional': 372},
+    330: {},
+    331: {},
+    332: {},
+    333: {},
+    334: {'_105_optional': 375},
+    335: {},
+    336: {'type_identifier': 378},
+    337: {'_78_item': 379},
+    338: {},
+    339: {},
+    340: {},
+    341: {'_93_optional': 382},
+    342: {},
+    343: {'_89_item': 385},
+    344: {},
+    345: {'type_identifier': 386},
+    346: {'expr': 387, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    347: {},
+    348: {},
+    349: {'_127_repeat': 388, '_96_repeat': 389, '_127_items': 390, '_96_items': 391, '_127_item': 392, '_96_item': 393},
+    350: {},
+    351: {'pattern': 396, 'match_variant': 353, 'match_as': 354, 'identifier': 356},
+    352: {'do': 397},
+    353: {},
+    354: {},
+    355: {},
+    356: {},
+    357: {'_107_optional': 399, 'or_else': 400},
+    358: {},
+    359: {},
+    360: {'expr': 403, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    361: {'_96_repeat': 389, '_96_items': 391, '_96_item': 393},
+    362: {},
+    363: {'variant': 406},
+    364: {'_102_optional': 407},
+    365: {},
+    366: {},
+    367: {'_99_item': 411},
+    368: {},
+    369: {'type_identifier': 412},
+    370: {},
+    371: {'_70_optional': 413},
+    372: {},
+    373: {},
+    374: {'_75_optional': 415},
+    375: {},
+    376: {'type': 417, 'type_identifier': 294},
+    377: {},
+    378: {},
+    379: {},
+    380: {'_88_optional': 419},
+    381: {'_94_optional': 421},
+    382: {},
+    383: {},
+    384: {},
+    385: {},
+    386: {},
+    387: {'_126_optional': 424},
+    388: {},
+    389: {},
+    390: {'_127_item': 428},
+    391: {'_96_item': 430},
+    392: {},
+    393: {},
+    394: {'type': 431, 'type_identifier': 294},
+    395: {},
+    396: {'do': 432},
+    397: {'_111_optional': 433},
+    398: {'_113_optional': 435},
+    399: {},
+    400: {},
+    401: {'expr': 438, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15, 'identifier': 43},
+    402: {'block_statement': 439, '_84_optional': 291},
+    403: {},
+    404: {'type': 440, 'type_identifier': 294},
+    405: {},
+    406: {'_103_optional': 441},
+    407: {},
+    408: {},
+    409: {'type': 443, 'type_identifier': 294},
+    410: {},
+    411: {},
+    412: {},
+    413: {'import_name': 445, 'identifier': 331},
+    414: {},
+    415: {'param': 446, 'identifier': 334},
+    416: {},
+    417: {},
+    418: {'_79_optional': 447},
+    419: {'do': 449},
+    420: {'type': 450, 'type_identifier': 294},
+    421: {'param': 451, 'identifier': 334},
+    422: {},
+    423: {'_90_optional': 452},
+    424: {},
+    425: {},
+    426: {'identifier': 43, 'expr': 454, 'chain': 20, 'operand': 21, 'binary_op_def': 17, 'unary_expr': 25, 'str_literal': 26, 'float_literal': 27, 'int_literal': 28, 'array': 29, 'variant_call': 30, 'let': 16, 'call': 31, 'case_of': 32, 'if_expr': 33, 'def_expr': 18, 'do': 34, 'external': 35, 'enum': 15},
+    427: {},
+    428: {},
+    429: {'type': 455, 'type_identifier': 294},
+    430: {},
+    431: {},
+    432: {'_112_optional': 456},
+    433: {},
+    434: {},
+    435: {'_114_optional': 458, 'patterns': 459, 'pattern': 460, 'match_variant': 353, 'match_as': 354, 'identifier': 356},
+    436: {},
+    437: {},
+    438: {},
+    439: {},
+    440: {},
+    441: {},
+    442: {},
+    443: {'_104_repeat': 462, '_104_items': 463, '_104_item': 464},
+    444: {'_100_optional': 466},
+    445: {'_71_optional': 468},
+    446: {'_76_optional': 470},
+    447: {'param': 472, 'identifier': 334},
+    448: {},
+    449: {},
+    450: {},
+    451: {'_95_optional': 473},
+    452: {'identifier': 334, '_91_optional': 475, 'params': 476, 'param': 341},
+    453: {},
+    454: {},
+    455: {},
+    456: {},
+    457: {},
+    458: {},
+    459: {},
+    460: {'_115_optional': 479},
+    461: {'block_statement': 481, '_84_optional': 291},
+    462: {},
+    463: {'_104_item': 483},
+    464: {},
+    465: {'type': 484, 'type_identifier': 294},
+    466: {'_101_optional': 485, 'variants': 486, 'variant': 364},
+    467: {},
+    468: {},
+    469: {},
+    470: {},
+    471: {},
+    472: {},
+    473: {},
+    474: {},
+    475: {},
+    476: {},
+    477: {},
+    478: {'_116_optional': 490},
+    479: {},
+    480: {},
+    481: {'_108_optional': 492, 'or_else': 493},
+    482: {},
+    483: {},
+    484: {},
+    485: {},
+    486: {'variant': 406},
+    487: {'_77_optional': 495},
+    488: {'_80_optional': 497},
+    489: {'_92_optional': 499},
+    490: {'pattern': 501, 'match_variant': 353, 'match_as': 354, 'identifier': 356},
+    491: {},
+    492: {},
+    493: {},
+    494: {},
+    495: {'do': 502},
+    496: {'type': 503, 'type_identifier': 294},
+    497: {'param': 504, 'identifier': 334},
+    498: {},
+    499: {'do': 505},
+    500: {'type': 506, 'type_identifier': 294},
+    501: {'_117_optional': 507},
+    502: {},
+    503: {},
+    504: {'_81_optional': 509},
+    505: {},
+    506: {},
+    507: {},
+    508: {},
+    509: {},
+    510: {},
+    511: {'_82_optional': 512},
+    512: {'do': 514},
+    513: {'type': 515, 'type_identifier': 294},
+    514: {},
+    515: {},
+}
+defaulted_states = {
+    4: -1,
+    6: -9,
+    7: -8,
+    50: -5,
+    53: -27,
+    193: -4,
+    286: -253,
+    302: -88,
+    400: -186,
+    416: -90,
+    422: -141,
+    439: -191,
+    448: -102,
+    450: -123,
+    471: -92,
+    492: -188,
+    493: -189,
+    498: -104,
+    503: -94,
+    506: -135,
+    510: -106,
+    515: -108,
+}
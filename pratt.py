@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import typing
+from parser import UwuParser, _
+
+import sly  # type: ignore[import]
+
+import terms
+
+# binding powers from the precedence table of UwuParser, an operator binds its
+# left operand with twice its level and its right operand one less when it is
+# right associative, so equal levels group to the left unless it is
+BINARY = {
+    production.prod[1]: production.prec
+    for production in UwuParser._grammar.Productions
+    if production and production.name == "binary_expr"
+}
+LEFT_POWER = {kind: 2 * level for kind, (assoc, level) in BINARY.items()}
+RIGHT_POWER = {
+    kind: 2 * level - (assoc == "right") for kind, (assoc, level) in BINARY.items()
+}
+
+Token: typing.TypeAlias = typing.Any
+Chain = tuple[list[terms.EExpr], list[Token]]
+
+
+def climb(operands: list[terms.EExpr], ops: list[Token]) -> terms.EExpr:
+    """
+    groups operands and the operator tokens between them into binary
+    expressions by precedence, with a stack instead of recursion so a long
+    chain of a right associative operator is no deeper to parse than any other
+    """
+    stack = [operands[0]]
+    pending = list[Token]()
+    for op, operand in zip(ops, operands[1:]):
+        power = LEFT_POWER[op.type]
+        while pending and RIGHT_POWER[pending[-1].type] >= power:
+            right = stack.pop()
+            stack[-1] = terms.EExpr(
+                terms.EBinaryExpr(pending.pop().value, stack[-1], right)
+            )
+        pending.append(op)
+        stack.append(operand)
+    while pending:
+        right = stack.pop()
+        stack[-1] = terms.EExpr(
+            terms.EBinaryExpr(pending.pop().value, stack[-1], right)
+        )
+    return stack[0]
+
+
+class PrattParser(UwuParser):
+    """
+    the grammar of UwuParser with its operator tower flattened, an expression
+    is a chain of operands between binary operators that climb groups by
+    precedence, instead of a production and automaton states per operator
+
+    builds the same trees as UwuParser for every program it accepts, the rest
+    of the grammar is the one of UwuParser
+    """
+
+    parsetab = "parsetab_pratt"
+
+    @classmethod
+    def _build(cls, definitions):
+        # the rules of UwuParser, with the ones here in place of theirs
+        rules = {**vars(UwuParser), **dict(definitions)}
+        del rules["binary_expr"]
+        super()._build(list(rules.items()))
+
+    # an expression ends where no operator or call follows, the precedence
+    # of operators is left to climb, so every rule here binds looser than any
+    @_("operand %prec '='")
+    def expr(self, p: sly.yacc.YaccProduction) -> terms.EExpr:
+        return p[0]
+
+    @_("chain %prec '='")  # type: ignore[no-redef]
+    def expr(self, p: sly.yacc.YaccProduction) -> terms.EExpr:
+        return climb(*p[0])
+
+    @_(*[f"operand {op} operand %prec '='" for op in UwuParser.binary_op.rules])
+    def chain(self, p: sly.yacc.YaccProduction) -> Chain:
+        # the token rather than its value, as its kind gives its precedence
+        return [p[0], p[2]], [p._slice[1]]
+
+    @_(*[f"chain {op} operand %prec '='" for op in UwuParser.binary_op.rules])  # type: ignore[no-redef]
+    def chain(self, p: sly.yacc.YaccProduction) -> Chain:
+        operands, ops = p[0]
+        operands.append(p[2])
+        ops.append(p._slice[1])
+        return p[0]
+
+    @_(
+        "enum",
+        "external",
+        "do",
+        "def_expr",
+        "if_expr",
+        "case_of",
+        "call",
+        "let",
+        "variant_call",
+        "array",
+        "int_literal",
+        "float_literal",
+        "str_literal",
+        "unary_expr",
+        "binary_op_def",
+    )
+    def operand(self, p: sly.yacc.YaccProduction) -> terms.EExpr:
+        return terms.EExpr(p[0])
+
+    # an identifier is its own operand rather than going through identifier,
+    # as that is a reduction less for most operands
+    @_("IDENTIFIER")  # type: ignore[no-redef]
+    def operand(self, p: sly.yacc.YaccProduction) -> terms.EExpr:
+        return terms.EExpr(terms.EIdentifier(p[0]))
+
+    @_("'(' expr ')'")  # type: ignore[no-redef]
+    def operand(self, p: sly.yacc.YaccProduction) -> terms.EExpr:
+        return p.expr
+
+    @_(
+        "'-' operand %prec UNARY",
+        "STRICT_NOT operand %prec UNARY",
+        "'!' operand %prec UNARY",
+        "'+' operand %prec UNARY",
+    )
+    def unary_expr(self, p: sly.yacc.YaccProduction) -> terms.EUnaryExpr:
+        return terms.EUnaryExpr(p[0], p.operand)
+
+    @_("operand '(' [ NEWLINE ] [ exprs ] ')'")
+    def call(self, p: sly.yacc.YaccProduction) -> terms.ECall:
+        return terms.ECall(p.operand, p.exprs or [])
+
+
+if __name__ == "__main__":
+    # regenerates parsetab_pratt.py, sly numbers the rules it generates in
+    # build order, so this has to build after UwuParser like an import does
+    PrattParser.build_tables()
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+import typing
+
+import algorithm_j
+import compile
+import terms
+import typed
+from algorithm_j import Context, Scheme, fresh_ty_var, type_infer
+
+
+def SimpleBinaryOpDef(
+    op: terms.BinaryOp, ext: str, a: str, b: str, ret: str, generics: list[str] = []
+):
+    return BinaryOpDef(
+        op, ext, terms.EHint(a), terms.EHint(b), terms.EHint(ret), generics=generics
+    )
+
+
+def BinaryOpDef(
+    op: terms.BinaryOp,
+    ext: str,
+    a: terms.EHint,
+    b: terms.EHint,
+    ret: terms.EHint,
+    generics: list[str] = [],
+):
+    return terms.EExpr(
+        terms.EBinaryOpDef(
+            op,
+            [
+                terms.EParam("a", hint=terms.MaybeEHint((a))),
+                terms.EParam("b", hint=terms.MaybeEHint((b))),
+            ],
+            terms.EDo(terms.EBlock([terms.EExpr(terms.EExternal(ext))])),
+            terms.MaybeEHint((ret)),
+            generics=list(map(terms.EIdentifier, generics)),
+        )
+    )
+
+
+BUILTINS: list[terms.EExpr] = [
+    terms.EExpr
+    ** terms.EDef(
+        "id",
+        [terms.EParam("x")],
+        terms.EDo ** terms.EBlock([terms.EExpr ** terms.EIdentifier("x")]),
+    ),
+    terms.EExpr
+    ** terms.ELet(
+        "unit",
+        terms.EExpr ** terms.EExternal("undefined"),
+        terms.MaybeEHint ** terms.EHint("Unit"),
+    ),
+    # int
+    SimpleBinaryOpDef("+", "a+b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
+    SimpleBinaryOpDef(
+        "/", "Math.floor(a/b)", typed.TNum.id, typed.TNum.id, typed.TNum.id
+    ),
+    SimpleBinaryOpDef("*", "a*b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
+    SimpleBinaryOpDef("**", "a**b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
+    SimpleBinaryOpDef("-", "a-b", typed.TNum.id, typed.TNum.id, typed.TNum.id),
+    # int eq
+    SimpleBinaryOpDef("<", "a<b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
+    SimpleBinaryOpDef(">", "a>b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
+    SimpleBinaryOpDef(">=", "a>=b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
+    SimpleBinaryOpDef("<=", "a<=b", typed.TNum.id, typed.TNum.id, typed.TBool.id),
+    # float
+    SimpleBinaryOpDef("+.", "a+b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
+    SimpleBinaryOpDef("/.", "a/b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
+    SimpleBinaryOpDef("*.", "a*b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
+    SimpleBinaryOpDef("**.", "a**b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
+    SimpleBinaryOpDef("-.", "a-b", typed.TFloat.id, typed.TFloat.id, typed.TFloat.id),
+    # float eq
+    SimpleBinaryOpDef("<.", "a<b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
+    SimpleBinaryOpDef(">.", "a>b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
+    SimpleBinaryOpDef(">=.", "a>=b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
+    SimpleBinaryOpDef("<=.", "a<=b", typed.TFloat.id, typed.TFloat.id, typed.TBool.id),
+    # str
+    SimpleBinaryOpDef("<>", "a+b", typed.TStr.id, typed.TStr.id, typed.TStr.id),
+    SimpleBinaryOpDef(
+        "=~", "b.test(a)", typed.TStr.id, typed.TRegex.id, typed.TBool.id
+    ),
+    # eq
+    SimpleBinaryOpDef(
+        "==",
+        "Object.is(a,b)",
+        ("A"),
+        ("A"),
+        (typed.TBool.id),
+        generics=[("A")],
+    ),
+    SimpleBinaryOpDef(
+        "!=",
+        "!Object.is(a,b)",
+        ("A"),
+        ("A"),
+        (typed.TBool.id),
+        generics=[("A")],
+    ),
+    # array
+    BinaryOpDef(
+        "++",
+        "a.concat(b)",
+        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
+        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
+        terms.EHint(typed.TArrayCon.id, [terms.EHint("A")]),
+        generics=[("A")],
+    ),
+    # bool
+    SimpleBinaryOpDef(
+        "&&",
+        "a&&b",
+        generics=["A"],
+        a="A",
+        b="A",
+        ret="A",
+    ),
+    SimpleBinaryOpDef("and", "a&&b", typed.TBool.id, typed.TBool.id, typed.TBool.id),
+    SimpleBinaryOpDef(
+        "||",
+        "a||b",
+        generics=["A"],
+        a="A",
+        b="A",
+        ret="A",
+    ),
+    SimpleBinaryOpDef("or", "a||b", typed.TBool.id, typed.TBool.id, typed.TBool.id),
+]
+
+
+def infer_prelude() -> Context:
+    v = fresh_ty_var()
+
+    ctx = Context(
+        {},
+        {
+            typed.TStr.id: Scheme([], typed.TStr),
+            typed.TNum.id: Scheme([], typed.TNum),
+            "Int": Scheme([], typed.TNum),
+            typed.TFloat.id: Scheme([], typed.TFloat),
+            typed.TUnit.id: Scheme([], typed.TUnit),
+            typed.TRegex.id: Scheme([], typed.TRegex),
+            typed.TCallableCon.id: Scheme([], typed.TCallableCon),
+            typed.TArrayCon.id: Scheme([], typed.TArrayCon),
+            # Bool
+            typed.TBool.id: Scheme([], typed.TBool),
+            f"${typed.TrueCon.id}": Scheme([], typed.TrueCon),
+            f"${typed.FalseCon.id}": Scheme([], typed.FalseCon),
+            f"{typed.TrueCon.id}": Scheme([], typed.TDef(typed.TrueCon, typed.TBool)),
+            f"{typed.FalseCon.id}": Scheme([], typed.TDef(typed.FalseCon, typed.TBool)),
+            # Option
+            typed.TOptionCon.id: Scheme([], typed.TOptionCon),
+            f"${typed.SomeCon.id}": Scheme([], typed.SomeCon),
+            f"${typed.NoneCon.id}": Scheme([], typed.NoneCon),
+            typed.SomeCon.id: Scheme(
+                [v.id], typed.TDef(typed.TAp(typed.SomeCon, v), typed.TOption(v))
+            ),
+            typed.NoneCon.id: Scheme(
+                [v.id], typed.TDef(typed.NoneCon, typed.TOption(v))
+            ),
+        },
+    )
+
+    for builtin in BUILTINS:
+        type_infer(ctx, builtin)
+
+    return ctx
+
+
+PRELUDE_PATH = os.path.join(os.path.dirname(__file__), "__pycache__", "prelude.pickle")
+
+PRELUDE_SOURCES = ["prelude", "terms", "typed", "algorithm_j"]
+
+TYPE_CONSTANTS = {
+    name: value for name, value in vars(typed).items() if isinstance(value, typed.TCon)
+}
+
+
+def fingerprint() -> str:
+    h = hashlib.sha256()
+    for name in PRELUDE_SOURCES:
+        with open(os.path.join(os.path.dirname(__file__), name + ".py"), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class TypePickler(pickle.Pickler):
+    """pickles the type constants of typed by name so unify can keep comparing them with is"""
+
+    names = {id(value): name for name, value in TYPE_CONSTANTS.items()}
+
+    def persistent_id(self, obj: typing.Any) -> str | None:
+        if isinstance(obj, typed.TCon):
+            return self.names.get(id(obj))
+        return None
+
+
+class TypeUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: str) -> typed.TCon:
+        return TYPE_CONSTANTS[pid]
+
+
+def dump_types(obj: typing.Any) -> bytes:
+    f = io.BytesIO()
+    TypePickler(f).dump(obj)
+    return f.getvalue()
+
+
+def load_types(data: bytes) -> typing.Any:
+    return TypeUnpickler(io.BytesIO(data)).load()
+
+
+def save_prelude(ctx: Context, path: str = PRELUDE_PATH) -> None:
+    data = dump_types(
+        {"fingerprint": fingerprint(), "counter": algorithm_j.counter, "ctx": ctx}
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # a file of its own per writer, so workers saving at once never mix theirs up
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# the prelude load_prelude had to infer again and the path to save it at,
+# saved by save_unsaved once a program starts instead of on import
+unsaved: tuple[Context, str] | None = None
+
+
+def load_prelude(path: str = PRELUDE_PATH) -> Context:
+    """
+    loads the inferred prelude, inferring it again when it is missing or
+    stale, which is saved later by save_unsaved
+    """
+    global unsaved
+    try:
+        with open(path, "rb") as f:
+            saved = load_types(f.read())
+        if saved["fingerprint"] == fingerprint():
+            algorithm_j.counter = max(algorithm_j.counter, saved["counter"])
+            return saved["ctx"]
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+        pass
+
+    ctx = infer_prelude()
+    unsaved = ctx, path
+    return ctx
+
+
+def save_unsaved() -> None:
+    """saves the prelude load_prelude inferred again, if it could not load it"""
+    global unsaved
+    if unsaved is None:
+        return
+    ctx, path = unsaved
+    unsaved = None
+    try:
+        save_prelude(ctx, path)
+    except OSError:
+        pass
+
+
+DEFAULT_CTX = load_prelude()
+
+
+def builtin_name(builtin: terms.EExpr) -> str:
+    match builtin.expr:
+        case terms.ELet(id=name) | terms.EDef(identifier=name):
+            return name
+        case terms.EBinaryOpDef(identifier=op):
+            return op
+    raise TypeError(f"not a builtin definition: {builtin}")
+
+
+BUILTIN_DEFS = {builtin_name(builtin): builtin for builtin in BUILTINS}
+
+
+def prelude_for(program: terms.EProgram) -> list[terms.EExpr]:
+    """the builtin definitions program refers to, in prelude order"""
+    getter = compile.IdGetter()
+    program.fold_with(getter)
+
+    # an imported name shadows the builtin
+    imported = {name.name for node in program.imports for name in node.names}
+    return builtins_for(getter.ids, imported)
+
+
+def builtins_for(ids: set[str], imported: set[str] = set()) -> list[terms.EExpr]:
+    """the builtin definitions code using ids needs, in prelude order"""
+    used = set[str]()
+    todo = (ids & BUILTIN_DEFS.keys()) - imported
+    while todo:
+        used |= todo
+        getter = compile.IdGetter()
+        for id in todo:
+            BUILTIN_DEFS[id].fold_with(getter)
+        todo = (getter.ids & BUILTIN_DEFS.keys()) - used - imported
+
+    return [builtin for id, builtin in BUILTIN_DEFS.items() if id in used]
+
+
+def runtime_import(builtins: list[terms.EExpr], path: str) -> terms.EImport:
+    """imports builtins from the runtime at path instead of defining them"""
+    names: list[terms.EIdentifier | terms.ETypeIdentifier] = [
+        terms.EIdentifier(builtin_name(builtin)) for builtin in builtins
+    ]
+    return terms.EImport(path, names)
+
+
+def runtime() -> str:
+    """the module bundles share, defining and exporting every builtin"""
+    program = terms.EProgram(
+        BUILTINS, exports=[terms.EIdentifier(id) for id in BUILTIN_DEFS]
+    )
+    stable_ops, compile.stable_ops = compile.stable_ops, True
+    try:
+        return compile.compile(program.fold_with(compile.Hoister()))
+    finally:
+        compile.stable_ops = stable_ops
+
+
+if __name__ == "__main__":
+    save_prelude(infer_prelude())
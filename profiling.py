@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import dataclasses
+import json
+import os
+import pstats
+import time
+import tracemalloc
+import typing
+
+PHASES = ["lex", "parse", "imports", "infer", "hoist", "clean", "codegen"]
+
+cprofile_enabled = False
+memory_enabled = False
+
+# how many allocation sites are kept per phase
+TOP_SITES = 5
+
+RawStats: typing.TypeAlias = dict[typing.Any, typing.Any]
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    """calls is only counted under cProfile, None when it was not"""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    runs: int = 0
+    calls: int | None = None
+
+    def __iadd__(self, other: PhaseStats) -> PhaseStats:
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.runs += other.runs
+        if other.calls is not None:
+            self.calls = (self.calls or 0) + other.calls
+        return self
+
+
+@dataclasses.dataclass
+class MemoryStats:
+    """bytes allocated by a phase, peak counts what was freed before it ended"""
+
+    peak: int = 0
+    retained: int = 0
+    top: list[tuple[str, int]] = dataclasses.field(default_factory=list)
+
+    def __ior__(self, other: MemoryStats) -> MemoryStats:
+        self.peak = max(self.peak, other.peak)
+        self.retained = max(self.retained, other.retained)
+        sites = dict(self.top)
+        for site, size in other.top:
+            sites[site] = sites.get(site, 0) + size
+        self.top = sorted(sites.items(), key=lambda site: -site[1])[:TOP_SITES]
+        return self
+
+
+@contextlib.contextmanager
+def measure(
+    phases: dict[str, PhaseStats],
+    raw_stats: dict[str, RawStats],
+    name: str,
+    memory: dict[str, MemoryStats] | None = None,
+) -> typing.Iterator[None]:
+    """
+    adds the wall and cpu time spent in the block to phases[name]
+
+    when cprofile_enabled the block also runs under cProfile, its function
+    call count is added and the raw profile is kept in raw_stats[name]
+
+    when memory_enabled allocations are traced and memory[name] gets the
+    peak and retained bytes of the block with the sites that retained most
+    """
+    profile = cProfile.Profile() if cprofile_enabled else None
+    snapshot = start_tracing() if memory is not None and memory_enabled else None
+    wall = time.perf_counter()
+    cpu = time.process_time()
+
+    if profile:
+        profile.enable()
+    try:
+        yield
+    finally:
+        if profile:
+            profile.disable()
+
+        stats = phases.setdefault(name, PhaseStats())
+        stats += PhaseStats(
+            time.perf_counter() - wall, time.process_time() - cpu, runs=1
+        )
+
+        if profile:
+            profile.create_stats()
+            stats += PhaseStats(
+                calls=sum(calls for _, calls, *_ in profile.stats.values())
+            )
+            merge_raw(raw_stats, name, profile.stats)
+
+        if snapshot is not None and memory is not None:
+            memory.setdefault(name, MemoryStats())
+            memory[name] |= stop_tracing(*snapshot)
+
+
+IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def start_tracing() -> tuple[tracemalloc.Snapshot, int]:
+    """
+    tracing is left running once started, so memory a phase retains stays
+    traced while the later ones run
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_FRAMES)
+    tracemalloc.reset_peak()
+    return snapshot, tracemalloc.get_traced_memory()[0]
+
+
+def stop_tracing(before: tracemalloc.Snapshot, base: int) -> MemoryStats:
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(IGNORED_FRAMES)
+    top = [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff)
+        for stat in after.compare_to(before, "lineno")
+        if stat.size_diff > 0
+    ]
+    top.sort(key=lambda site: -site[1])
+    return MemoryStats(peak - base, current - base, top[:TOP_SITES])
+
+
+def merge_raw(raw_stats: dict[str, RawStats], name: str, stats: RawStats) -> None:
+    if not raw_stats.get(name) or not stats:
+        raw_stats[name] = raw_stats.get(name) or dict(stats)
+        return
+
+    merged = load_raw(raw_stats[name])
+    merged.add(load_raw(stats))
+    raw_stats[name] = merged.stats  # type: ignore[attr-defined]
+
+
+class Raw:
+    """lets pstats.Stats load a stats dict that came back from another process"""
+
+    def __init__(self, stats: RawStats) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+def load_raw(stats: RawStats) -> pstats.Stats:
+    # pstats only reads stats and create_stats of a profile, all Raw has
+    return pstats.Stats(typing.cast(cProfile.Profile, Raw(stats)))
+
+
+class Report:
+    def __init__(self) -> None:
+        self.files = dict[str, dict[str, PhaseStats]]()
+        self.total = dict[str, PhaseStats]()
+        self.raw_stats = dict[str, RawStats]()
+        self.memory_files = dict[str, dict[str, MemoryStats]]()
+        self.memory_total = dict[str, MemoryStats]()
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+
+    def add(
+        self,
+        path: str,
+        phases: dict[str, PhaseStats],
+        raw_stats: dict[str, RawStats],
+        memory: dict[str, MemoryStats] | None = None,
+    ) -> None:
+        self.files[path] = phases
+        for name, stats in phases.items():
+            self.total.setdefault(name, PhaseStats())
+            self.total[name] += stats
+        for name, raw in raw_stats.items():
+            merge_raw(self.raw_stats, name, raw)
+        if memory:
+            self.memory_files[path] = memory
+            for name, memory_stats in memory.items():
+                self.memory_total.setdefault(name, MemoryStats())
+                self.memory_total[name] |= memory_stats
+
+    def to_json(self) -> dict[str, typing.Any]:
+        return {
+            "run": {
+                "wall": time.perf_counter() - self.wall,
+                "cpu": time.process_time() - self.cpu,
+                "files": len(self.files),
+            },
+            "total": phases_to_json(self.total),
+            "files": {
+                path: phases_to_json(phases) for path, phases in self.files.items()
+            },
+        }
+
+    def memory_to_json(self) -> dict[str, typing.Any]:
+        """the total has the largest peak and retained bytes of any file"""
+        return {
+            "total": phases_to_json(self.memory_total),
+            "files": {
+                path: phases_to_json(memory)
+                for path, memory in self.memory_files.items()
+            },
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def write_memory(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.memory_to_json(), f, indent=2)
+
+    def dump_pstats(self, directory: str) -> list[str]:
+        """writes one pstats file per phase, readable with python -m pstats"""
+        os.makedirs(directory, exist_ok=True)
+        paths = list[str]()
+        for name, stats in self.raw_stats.items():
+            path = os.path.join(directory, f"{name}.pstats")
+            load_raw(stats).dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+def phases_to_json(
+    phases: dict[str, PhaseStats] | dict[str, MemoryStats]
+) -> dict[str, typing.Any]:
+    """leaves out what was not measured"""
+    order = {name: i for i, name in enumerate(PHASES)}
+    return {
+        name: {
+            key: value
+            for key, value in dataclasses.asdict(phases[name]).items()
+            if value is not None
+        }
+        for name in sorted(phases, key=lambda name: order.get(name, len(order)))
+    }
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import typing
+
+import main
+import profiling
+from prelude import save_unsaved
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+COMPILE_ERROR = 1
+
+Message: typing.TypeAlias = dict[str, typing.Any]
+
+
+def response(id: typing.Any, result: typing.Any) -> Message:
+    return {"jsonrpc": "2.0", "id": id, "result": result}
+
+
+def error_response(
+    id: typing.Any, code: int, message: str, data: typing.Any = None
+) -> Message:
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": id, "error": error}
+
+
+def run(source: str, path: str, codegen: bool) -> main.FileResult:
+    result = main.compile_source(source, path, codegen)
+    result.messages.clear()
+    return result
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.counters = collections.Counter[str](
+            {"requests": 0, "cache_hits": 0, "errors": 0}
+        )
+        self.phases = dict[str, list[float]]()
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self.lock:
+            self.counters[name] += n
+
+    def record(self, phases: dict[str, profiling.PhaseStats]) -> None:
+        with self.lock:
+            for phase, stats in phases.items():
+                count, total, worst = self.phases.get(phase, [0, 0.0, 0.0])
+                self.phases[phase] = [
+                    count + 1,
+                    total + stats.wall,
+                    max(worst, stats.wall),
+                ]
+
+    def report(self) -> Message:
+        with self.lock:
+            return {
+                "uptime": time.monotonic() - self.started,
+                **self.counters,
+                "phases": {
+                    phase: {"count": count, "mean": total / count, "max": worst}
+                    for phase, (count, total, worst) in self.phases.items()
+                },
+            }
+
+
+class CompileServer:
+    """
+    keeps the lexer, parser and DEFAULT_CTX resident in a pool of workers
+    and answers JSON-RPC requests with it
+
+    methods:
+        compile(source, path?) -> {js, type, warnings}
+        typecheck(source, path?) -> {type, warnings}
+        stats() -> counters and per phase latency
+    """
+
+    def __init__(self, jobs: int = 1, cache_size: int = 1024) -> None:
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            jobs, initializer=main.init_worker
+        )
+        self.stats = Stats()
+        self.cache_size = cache_size
+        self.cache = collections.OrderedDict[str, main.FileResult]()
+        self.cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+    def handle(self, line: str) -> concurrent.futures.Future[Message | None]:
+        """
+        answers one request, the returned future resolves to None for
+        notifications
+        """
+        self.stats.count("requests")
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return done(error_response(None, PARSE_ERROR, str(e)))
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return done(error_response(None, INVALID_REQUEST, "Invalid Request"))
+
+        id = request.get("id")
+        params = request.get("params") or {}
+        future: concurrent.futures.Future[Message]
+
+        match request["method"]:
+            case _ if not isinstance(params, dict):
+                future = done(
+                    error_response(id, INVALID_PARAMS, "params must be an object")
+                )
+            case "compile" | "typecheck" as method if isinstance(
+                params.get("source"), str
+            ):
+                future = self.compile(
+                    id,
+                    params["source"],
+                    params.get("path", "<source>"),
+                    codegen=method == "compile",
+                )
+            case "compile" | "typecheck":
+                future = done(error_response(id, INVALID_PARAMS, "source is required"))
+            case "stats":
+                future = done(response(id, self.stats.report()))
+            case method:
+                future = done(
+                    error_response(id, METHOD_NOT_FOUND, f"Method not found: {method}")
+                )
+
+        if "id" not in request:
+            return chain(future, lambda _: None)
+        return typing.cast(concurrent.futures.Future[Message | None], future)
+
+    def compile(
+        self, id: typing.Any, source: str, path: str, codegen: bool
+    ) -> concurrent.futures.Future[Message]:
+        key = hashlib.sha256(f"{codegen}\0{path}\0{source}".encode()).hexdigest()
+
+        with self.cache_lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+
+        if cached is not None:
+            self.stats.count("cache_hits")
+            return done(self.respond(id, cached))
+
+        def finish(result: main.FileResult) -> Message:
+            self.stats.record(result.phases)
+            if result.ok:
+                with self.cache_lock:
+                    self.cache[key] = result
+                    while len(self.cache) > self.cache_size:
+                        self.cache.popitem(last=False)
+            return self.respond(id, result)
+
+        def fail(e: BaseException) -> Message:
+            # what compile_source lets through, or a worker that died
+            self.stats.count("errors")
+            return error_response(id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+
+        return chain(self.executor.submit(run, source, path, codegen), finish, fail)
+
+    def respond(self, id: typing.Any, result: main.FileResult) -> Message:
+        if not result.ok:
+            self.stats.count("errors")
+            assert result.error is not None
+            return error_response(
+                id,
+                COMPILE_ERROR,
+                result.error.message,
+                dataclasses.asdict(result.error),
+            )
+
+        body = {"type": result.type, "warnings": result.warnings}
+        if result.js:
+            body["js"] = result.js
+        return response(id, body)
+
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
+
+def done(value: T) -> concurrent.futures.Future[T]:
+    future = concurrent.futures.Future[T]()
+    future.set_result(value)
+    return future
+
+
+def chain(
+    future: concurrent.futures.Future[T],
+    fn: typing.Callable[[T], U],
+    on_error: typing.Callable[[BaseException], U] | None = None,
+) -> concurrent.futures.Future[U]:
+    """
+    a future resolving to fn applied to the result of future, or to on_error
+    applied to the exception future failed with
+    """
+    next_future = concurrent.futures.Future[U]()
+
+    def callback(future: concurrent.futures.Future[T]) -> None:
+        try:
+            error = future.exception()
+            if error is None:
+                next_future.set_result(fn(future.result()))
+            elif on_error is None:
+                next_future.set_exception(error)
+            else:
+                next_future.set_result(on_error(error))
+        except Exception as e:
+            next_future.set_exception(e)
+
+    future.add_done_callback(callback)
+    return next_future
+
+
+def serve_lines(
+    server: CompileServer,
+    lines: typing.Iterable[str],
+    write: typing.Callable[[str], None],
+) -> None:
+    """answers every request in lines, writing each response as soon as it is ready"""
+    lock = threading.Lock()
+    pending = list[concurrent.futures.Future[Message | None]]()
+
+    def send(future: concurrent.futures.Future[Message | None]) -> None:
+        try:
+            message = future.result()
+        except Exception as e:
+            message = error_response(None, COMPILE_ERROR, str(e))
+        if message is None:
+            return
+        with lock:
+            write(json.dumps(message) + "\n")
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            future = server.handle(line)
+        except Exception as e:
+            future = done(error_response(None, INTERNAL_ERROR, str(e)))
+        future.add_done_callback(send)
+        pending.append(future)
+
+    concurrent.futures.wait(pending)
+
+
+def serve_stdio(server: CompileServer) -> None:
+    def write(s: str) -> None:
+        sys.stdout.write(s)
+        sys.stdout.flush()
+
+    serve_lines(server, sys.stdin, write)
+
+
+def serve_unix(server: CompileServer, path: str) -> None:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            def write(s: str) -> None:
+                self.wfile.write(s.encode())
+                self.wfile.flush()
+
+            serve_lines(server, (line.decode() for line in self.rfile), write)
+
+    if os.path.exists(path):
+        os.unlink(path)
+
+    with socketserver.ThreadingUnixStreamServer(path, Handler) as unix_server:
+        try:
+            unix_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    arg_parser = argparse.ArgumentParser(
+        prog="server.py",
+        description="compile server speaking newline delimited JSON-RPC 2.0",
+    )
+    arg_parser.add_argument(
+        "--socket", help="listen on this unix socket instead of stdin/stdout"
+    )
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="number of worker processes, 0 uses every core",
+    )
+    return arg_parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    # before any worker starts, so they load the prelude instead of inferring it
+    save_unsaved()
+    server = CompileServer(args.jobs or os.cpu_count() or 1)
+    try:
+        if args.socket:
+            serve_unix(server, args.socket)
+        else:
+            serve_stdio(server)
+    finally:
+        server.close()
@@ -13,30 +13,58 @@ TFoldWith = typing.TypeVar("TFoldWith", bound="FoldWith")
 
 
 class FoldWith(typing.Protocol):
-    def fold_children_with(self: TFoldWith, v: FoldAll) -> TFoldWith:
-        self_items = (
-            (field.name, getattr(self, field.name))
-            for field in dataclasses.fields(self)
-        )
-
-        return dataclasses.replace(
-            self,
-            **{
-                key: [value2.fold_with(v) for value2 in value]
-                if isinstance(value, list)
-                else value.fold_with(v)
-                for key, value in self_items
-                if dataclasses.is_dataclass(value) or isinstance(value, list)
-            },
-        )
-
-    def fold_with(self: TFoldWith, v: FoldAll) -> TFoldWith:
-        # result = re.sub("([A-Z])", r"_\1", self.__class__.__name__).lower()
-        # result2 = f"fold{result}"
-        result2 = self.__class__.__name__
-        if not hasattr(v, result2):
-            raise ValueError(f"{v.__class__.__name__} does not have a {result2} method")
-        return typing.cast(TFoldWith, getattr(v, result2)(self))
+    __slots__ = ()
+
+    def fold_children_with(self: TFoldWith, v: Visitor) -> TFoldWith:
+        """self with its children folded, or self itself when none of them changed"""
+        changes = dict[str, typing.Any]()
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, list):
+                value2 = fold_list(value, v)
+            elif dataclasses.is_dataclass(value):
+                value2 = value.fold_with(v)
+            else:
+                continue
+            if value2 is not value:
+                changes[field.name] = value2
+
+        return dataclasses.replace(self, **changes) if changes else self
+
+    def visit_children_with(self, v: Visitor) -> None:
+        """passes the children to v and drops what it gives back"""
+        for field in dataclasses.fields(self):  # type: ignore[arg-type]
+            value = getattr(self, field.name)
+            if isinstance(value, list):
+                for item in value:
+                    item.fold_with(v)
+            elif isinstance(value, Node):
+                value.fold_with(v)
+
+    def fold_with(self: TFoldWith, v: Visitor) -> TFoldWith:
+        try:
+            method = _dispatch[v.__class__, self.__class__]
+        except KeyError:
+            method = _find_method(v, self)
+        return typing.cast(TFoldWith, method(v, self))
+
+
+# the method of a visitor class that folds a node class, found by name once
+_dispatch = dict[
+    tuple[type, type], typing.Callable[[typing.Any, typing.Any], typing.Any]
+]()
+
+
+def _find_method(v: Visitor, node: FoldWith) -> typing.Callable[..., typing.Any]:
+    # result = re.sub("([A-Z])", r"_\1", self.__class__.__name__).lower()
+    # result2 = f"fold{result}"
+    name = node.__class__.__name__
+    if not hasattr(v, name):
+        raise ValueError(f"{v.__class__.__name__} does not have a {name} method")
+    if name in getattr(v, "__dict__", {}):
+        return lambda v, node: getattr(v, name)(node)
+    method = _dispatch[v.__class__, node.__class__] = getattr(v.__class__, name)
+    return method
 
 
 TPipable = typing.TypeVar("TPipable", bound="Pipable")
@@ -45,6 +73,8 @@ R = typing.TypeVar("R")
 
 
 class Pipable:
+    __slots__ = ()
+
     def __rshift__(self: TPipable, other: typing.Callable[[TPipable], R]) -> R:
         return other(self)
 
@@ -53,46 +83,56 @@ class Pipable:
 
 
 class Node(Pipable, FoldWith):
-    pass
+    __slots__ = ()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EBlock(Node):
     body: list[EExpr] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EHint(Node):
     id: str
     args: list[EHint] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MaybeEHintNothing(Node):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MaybeEHint(Node):
     value: MaybeEHintNothing | EHint = MaybeEHintNothing()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ELet(Node):
     id: str
     init: EExpr
     hint: MaybeEHint = MaybeEHint()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EDo(Node):
     block: EBlock = EBlock()
     hint: MaybeEHint = MaybeEHint()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EProgram(Node):
     body: list[EExpr] = dataclasses.field(default_factory=list)
+    imports: list[EImport] = dataclasses.field(default_factory=list)
+    exports: list[EIdentifier | ETypeIdentifier] = dataclasses.field(
+        default_factory=list
+    )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class EImport(Node):
+    path: str
+    names: list[EIdentifier | ETypeIdentifier] = dataclasses.field(default_factory=list)
 
 
 BinaryOp = typing.Literal[
@@ -135,14 +175,14 @@ BinaryOp = typing.Literal[
 ]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EBinaryExpr(Node):
     op: BinaryOp
     left: EExpr
     right: EExpr
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EBinaryOpDef(Node):
     identifier: BinaryOp
     params: list[EParam]
@@ -151,36 +191,37 @@ class EBinaryOpDef(Node):
     generics: list[EIdentifier] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EIdentifier(Node):
     name: str
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ETypeIdentifier(Node):
     name: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ENumLiteral(Node):
     value: float
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EFloatLiteral(Node):
     value: float
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EStrLiteral(Node):
     value: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EExternal(Node):
     value: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EDef(Node):
     identifier: str
     params: list[EParam]
@@ -189,59 +230,59 @@ class EDef(Node):
     generics: list[EIdentifier] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EParam(Node):
     identifier: str
     hint: MaybeEHint = MaybeEHint()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EUnaryExpr(Node):
     op: typing.Literal["-", "+", "!", "not"]
     expr: EExpr
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EMatchAs(Node):
     identifier: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ECaseOf(Node):
     expr: EExpr
     cases: list[ECase] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ECase(Node):
     pattern: EPattern
     body: EDo = dataclasses.field(default_factory=EDo)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EMatchVariant(Node):
     id: str
     patterns: list[EPattern] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ECall(Node):
     callee: EExpr
     args: list[EExpr] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EVariantCall(Node):
     callee: str
     args: list[EExpr] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EArray(Node):
     args: list[EExpr] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EIf(Node):
     test: EExpr
     then: EBlock
@@ -249,18 +290,18 @@ class EIf(Node):
     hint: MaybeEHint = MaybeEHint()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MaybeOrElseNothing(Node):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class MaybeOrElse(Node):
 
     value: EBlock | EIf | MaybeOrElseNothing = MaybeOrElseNothing()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EEnumDeclaration(Node):
     id: str
     _: dataclasses.KW_ONLY
@@ -268,18 +309,18 @@ class EEnumDeclaration(Node):
     generics: list[ETypeIdentifier] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EVariant(Node):
     id: str
     fields: list[EHint] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EFieldsUnnamed:
     unnamed: list[EIdentifier]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EPattern(Node):
     pattern: EMatchAs | EMatchVariant
 
@@ -298,7 +339,7 @@ def compose(
     return h
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class EExpr(Node):
     expr: (
         EDo
@@ -339,6 +380,7 @@ class NodeFold(metaclass=FoldMeta):
         EExpr.__name__,
         EBlock.__name__,
         EProgram.__name__,
+        EImport.__name__,
         EBinaryExpr.__name__,
         EDo.__name__,
         ENumLiteral.__name__,
@@ -368,7 +410,7 @@ class NodeFold(metaclass=FoldMeta):
         EStrLiteral.__name__,
         ENumLiteral.__name__,
         EBinaryOpDef.__name__,
-ETypeIdentifier.__name__,
+        ETypeIdentifier.__name__,
         EFloatLiteral.__name__,
     }
 
@@ -381,3 +423,156 @@ class Fold(NodeFold):
 class FoldAll(NodeFold):
     def fold(self, n: K) -> K:
         return n.fold_children_with(self)
+
+
+class VisitAll(NodeFold):
+    """
+    walks every node without building anything, for passes that only look
+    at the tree, what its methods return is thrown away
+    """
+
+    def fold(self, n: K) -> K:
+        n.visit_children_with(self)
+        return n
+
+
+# what a node is folded with, a FoldAll builds the tree again, a VisitAll only walks it
+Visitor: typing.TypeAlias = FoldAll | VisitAll
+
+
+_field_names = dict[type, list[str]]()
+
+
+class Interner(FoldAll):
+    """
+    folds a tree into one where structurally equal nodes are the same
+    object, the table outlives the fold so every tree folded with one
+    interner shares its nodes with the others
+
+    a node is looked up by its class and fields once its children are
+    interned, so the key holds their identities and is hashed in a step
+    per field rather than per node below it
+    """
+
+    def __init__(self) -> None:
+        self.table = dict[tuple[typing.Any, ...], Node]()
+        super().__init__()
+
+    def fold(self, n: K) -> K:
+        n = n.fold_children_with(self)
+        names = _field_names.get(n.__class__)
+        if names is None:
+            names = _field_names[n.__class__] = [
+                field.name for field in dataclasses.fields(n)  # type: ignore[arg-type]
+            ]
+        key: list[typing.Any] = [n.__class__]
+        for name in names:
+            value = getattr(n, name)
+            if isinstance(value, list):
+                key.append(tuple(map(id, value)))
+            elif isinstance(value, Node):
+                key.append(id(value))
+            else:
+                # 1 == 1.0 == True, so a number is told apart by its type too
+                key.append((value.__class__, value))
+        return typing.cast(K, self.table.setdefault(tuple(key), n))  # type: ignore[arg-type]
+
+
+def fold_list(items: list[K], v: Visitor) -> list[K]:
+    """items folded, or items itself when none of them changed"""
+    for i, item in enumerate(items):
+        item2 = item.fold_with(v)
+        if item2 is not item:
+            folded = items[:i]
+            folded.append(item2)
+            folded.extend(rest.fold_with(v) for rest in items[i + 1 :])
+            return folded
+    return items
+
+
+# field annotations whose values are never nodes or lists of nodes
+SCALARS = {"str", "int", "float", "bool", "BinaryOp"}
+
+FieldKind: typing.TypeAlias = typing.Literal["scalar", "list", "node"]
+
+
+def field_plan(cls: type) -> list[tuple[str, FieldKind]]:
+    """
+    every field of a node dataclass and what it holds, a scalar, a list of
+    nodes or a node, which may be None
+    """
+    plan = list[tuple[str, FieldKind]]()
+    for field in dataclasses.fields(cls):
+        annotation = field.type if isinstance(field.type, str) else ""
+        if annotation in SCALARS or annotation.startswith("typing.Literal["):
+            plan.append((field.name, "scalar"))
+        elif annotation.startswith("list["):
+            plan.append((field.name, "list"))
+        else:
+            # a missing else is kept as MaybeOrElse(None)
+            plan.append((field.name, "node"))
+    return plan
+
+
+def specialize_fold(cls: type) -> None:
+    """
+    replaces the fold_children_with and visit_children_with of a node
+    dataclass with ones written out for its fields, that skip the fields
+    holding scalars and call the constructor directly instead of going
+    through dataclasses.replace
+    """
+    if any(not field.init for field in dataclasses.fields(cls)):
+        return
+
+    fold = ["def fold_children_with(self, v):"]
+    visit = ["def visit_children_with(self, v):"]
+    args = list[str]()
+    same = list[str]()
+    for name, kind in field_plan(cls):
+        if kind == "scalar":
+            args.append(f"{name}=self.{name}")
+            continue
+
+        fold.append(f"    {name} = self.{name}")
+        args.append(f"{name}={name}2")
+        same.append(f"{name}2 is {name}")
+        if kind == "list":
+            fold.append(f"    {name}2 = fold_list({name}, v)")
+            visit.append(f"    for item in self.{name}: item.fold_with(v)")
+        else:
+            fold.append(
+                f"    {name}2 = {name} if {name} is None else {name}.fold_with(v)"
+            )
+            visit.append(f"    if self.{name} is not None: self.{name}.fold_with(v)")
+
+    if same:
+        fold.append(f"    if {' and '.join(same)}: return self")
+        fold.append(f"    return cls({', '.join(args)})")
+    else:
+        fold.append("    return self")
+    visit.append("    pass")
+
+    namespace: dict[str, typing.Any] = {"cls": cls, "fold_list": fold_list}
+    exec("\n".join(fold) + "\n" + "\n".join(visit), namespace)
+    for method in ("fold_children_with", "visit_children_with"):
+        namespace[method].__qualname__ = f"{cls.__name__}.{method}"
+        setattr(cls, method, namespace[method])
+
+
+def _node_classes(cls: type) -> typing.Iterator[type]:
+    sub: type
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _node_classes(sub)
+
+
+# slots=True makes a new class, the one it replaced is still a subclass
+NODE_CLASSES = [
+    node_class
+    for node_class in _node_classes(Node)
+    if dataclasses.is_dataclass(node_class)
+    and globals().get(node_class.__name__) is node_class
+]
+
+for node_class in NODE_CLASSES:
+    specialize_fold(node_class)
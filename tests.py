@@ -1,17 +1,41 @@
 from __future__ import annotations
 
+import concurrent.futures
+import dataclasses
+import gc
+import glob
 import json
+import os
+import pathlib
+import pickle
+import random
+import subprocess
+import tracemalloc
 from dataclasses import dataclass
+from parser import UwuScanner, grammar_checksum, load_tables, missing_sly_privates
 from pathlib import WindowsPath
-from subprocess import check_output
 from typing import Generic
 
 import pytest
+import sly  # type: ignore[import]
 
 import algorithm_j
+import arena
+import bench
+import compile as codegen
+import main
+import modules
+import prelude
+import profiling
+import server
+import terms
 import typed
-from compile import DefCleaner, Hoister, compile
+from cache import BuildCache, write_if_changed
+from compile import DefCleaner, Hoister, IdGetter, compile, reset_hash_ids
+from incremental import Document
 from main import BUILTINS, DEFAULT_CTX, AstEncoder, UwuLexer, UwuParser
+from pratt import BINARY, PrattParser
+from prelude import builtin_name, prelude_for
 from terms import *
 
 
@@ -25,6 +49,85 @@ def lexer():
     return UwuLexer()
 
 
+@pytest.fixture
+def write(tmp_path):
+    """writes a file under tmp_path, with the directories it is in, and gives its path"""
+
+    def write(name: str, text: str) -> pathlib.Path:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        return path
+
+    return write
+
+
+# reads one {path, code} request per line and answers with the output of
+# running code in a fresh vm context, so globals never leak between programs
+NODE_RUNNER = r"""
+const readline = require("readline");
+const util = require("util");
+const vm = require("vm");
+
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  const { path, code } = JSON.parse(line);
+  let stdout = "";
+  const log = (...args) => {
+    stdout += util.format(...args) + "\n";
+  };
+  const module = { exports: {} };
+  const context = vm.createContext({
+    console: { log, info: log, warn: log, error: log },
+    module,
+    exports: module.exports,
+    require,
+  });
+
+  let error = null;
+  try {
+    vm.runInContext(code, context, { filename: path });
+  } catch (e) {
+    error = String((e && e.stack) || e);
+  }
+  process.stdout.write(JSON.stringify({ stdout, error }) + "\n");
+});
+"""
+
+
+class NodeRunner:
+    """one long lived node process running compiled programs one at a time"""
+
+    def __init__(self) -> None:
+        self.process = subprocess.Popen(
+            ["node", "-e", NODE_RUNNER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def run(self, code: str, path: str = "<program>") -> str:
+        """the stdout of code, raises if it threw"""
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.process.stdin.write(json.dumps({"path": path, "code": code}) + "\n")
+        self.process.stdin.flush()
+        response = json.loads(self.process.stdout.readline())
+        if response["error"] is not None:
+            raise RuntimeError(response["error"])
+        return response["stdout"]
+
+    def close(self) -> None:
+        assert self.process.stdin is not None
+        self.process.stdin.close()
+        self.process.wait()
+
+
+@pytest.fixture(scope="session")
+def node():
+    runner = NodeRunner()
+    yield runner
+    runner.close()
+
+
 @pytest.mark.parametrize(
     "program, ast",
     (
@@ -832,7 +935,8 @@ def test_parser(program, ast, parser, lexer):
                         "tuple",
                         typed.KFun(
                             typed.KStar(), typed.KFun(typed.KStar(), typed.KStar())
-                        ),alts=['Tuple']
+                        ),
+                        alts=["Tuple"],
                     ),
                     typed.TNum,
                 ),
@@ -988,17 +1092,24 @@ def test_infer(program, expected_type, parser, lexer):
     ),
 )
 def test_compile_with_snapshot(
-    id, program, expected_output, snapshot, parser, lexer
+    id, program, expected_output, snapshot, parser, lexer, node
 ) -> None:
     id = id + ".js"
     program = parser.parse(lexer.tokenize(program))
     snapshot.snapshot_dir = "snapshots"
     ast = EProgram([*BUILTINS, *program.body])
-    snapshot.assert_match(compile(ast.fold_with(Hoister()).fold_with(DefCleaner())), id)
+    js = compile(ast.fold_with(Hoister()).fold_with(DefCleaner()))
+    snapshot.assert_match(js, id)
     # path: WindowsPath = snapshot.snapshot_dir
-    assert check_output(
-        ["node", snapshot.snapshot_dir / id]
-    ) == f"{expected_output}\n".encode("UTF-8")
+    assert node.run(js, id) == f"{expected_output}\n"
+
+
+def test_node_runner(node):
+    assert node.run("const x = 1; console.log(x, [1, 2])") == "1 [ 1, 2 ]\n"
+    assert node.run("const x = 2; console.log(typeof unit)") == "undefined\n"
+    with pytest.raises(RuntimeError, match="ReferenceError"):
+        node.run("missing()")
+    assert node.run("console.log('still running')") == "still running\n"
 
 
 @pytest.mark.parametrize(
@@ -1078,3 +1189,725 @@ def test_do_expection(program, parser, lexer, exception):
     program = parser.parse(lexer.tokenize(program))
     with pytest.raises(exception):
         algorithm_j.type_infer(DEFAULT_CTX, program)
+
+
+def test_build_jobs(tmp_path, write):
+    src_paths = [
+        str(write(f"{i}.uwu", program))
+        for i, program in enumerate(
+            ["`console.log`(1 + 2)", "def add(a, b) do a + b end\nadd(1, 2) * 3"]
+        )
+    ]
+
+    def outputs():
+        return [(tmp_path / f"{i}.uwu.js").read_text() for i in range(len(src_paths))]
+
+    assert main.build(src_paths, jobs=1, build_cache=None)
+    serial = outputs()
+    for i in range(len(src_paths)):
+        (tmp_path / f"{i}.uwu.js").unlink()
+
+    assert main.build(src_paths, jobs=2, build_cache=None)
+    assert outputs() == serial
+
+
+def test_build_jobs_output_order(write, capsys):
+    # the first module takes longest, so the others finish before it
+    src_paths = [
+        str(write(f"{i}.uwu", bench.gen_defs(200) if i == 0 else f"{i} + 1"))
+        for i in range(4)
+    ]
+    _, order = modules.build_order(src_paths)
+
+    report = profiling.Report()
+    assert main.build(src_paths, jobs=4, build_cache=None, report=report)
+    out = capsys.readouterr().out
+    compiled = [line.split()[1] for line in out.split("\n") if "Compiled" in line]
+    assert compiled == order
+    assert list(report.files) == order
+
+
+def test_build_survives_failing_file(tmp_path, write):
+    deep = write("deep.uwu", " <> ".join(["'a'"] * 300))
+    fine = write("fine.uwu", "1 + 1")
+
+    result = main.compile_file(str(deep))
+    assert not result.ok and result.error.kind == "RecursionError"
+    assert not main.build([str(deep), str(fine)], 1, None)
+    assert not main.build([str(deep), str(fine)], 2, None)
+    assert (tmp_path / "fine.uwu.js").exists()
+
+
+def test_build_cache(tmp_path, write):
+    src_path = str(write("a.uwu", "1"))
+    out_path = src_path + ".js"
+
+    build_cache = BuildCache(str(tmp_path / "cache"))
+    assert not build_cache.restore(src_path, out_path)
+    assert write_if_changed(out_path, "console.log(1)")
+    build_cache.store(src_path, out_path, "console.log(1)")
+    build_cache.save()
+
+    assert not write_if_changed(out_path, "console.log(1)")
+    (tmp_path / "a.uwu.js").unlink()
+
+    build_cache = BuildCache(str(tmp_path / "cache"))
+    assert build_cache.restore(src_path, out_path)
+    assert (tmp_path / "a.uwu.js").read_text() == "console.log(1)"
+
+    write("a.uwu", "2")
+    assert not build_cache.restore(src_path, out_path)
+
+
+def test_prelude(tmp_path, parser, lexer):
+    path = str(tmp_path / "prelude.pickle")
+    prelude.save_prelude(prelude.infer_prelude(), path)
+    ctx = prelude.load_prelude(path)
+
+    assert ctx.vars.keys() == DEFAULT_CTX.vars.keys()
+    assert ctx.types[typed.TBool.id].ty is typed.TBool
+
+    program = parser.parse(lexer.tokenize("x = 1 + 2\nid(x)"))
+    assert [builtin.expr.identifier for builtin in prelude.prelude_for(program)] == [
+        "id",
+        "+",
+    ]
+    assert algorithm_j.type_infer(ctx, program) == typed.TNum
+
+
+def test_prelude_saved_lazily(tmp_path, parser, lexer, monkeypatch):
+    monkeypatch.setattr(prelude, "unsaved", None)
+    path = tmp_path / "cache" / "prelude.pickle"
+    prelude.load_prelude(str(path))
+    assert not path.exists()
+
+    prelude.prelude_for(parser.parse(lexer.tokenize("1")))
+    assert not path.exists()
+
+    prelude.save_unsaved()
+    assert prelude.load_types(path.read_bytes())["fingerprint"] == prelude.fingerprint()
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_parsetab_is_up_to_date():
+    for cls in [UwuParser, PrattParser]:
+        checksum = grammar_checksum(cls._grammar)
+        assert (
+            load_tables(checksum, cls.parsetab) is not None
+        ), "run python parser.py and python pratt.py"
+
+
+def test_sly_privates(monkeypatch):
+    # UwuParser._build breaks when sly changes these, see the pin in requirements.txt
+    missing = missing_sly_privates()
+    assert not missing, f"sly {sly.__version__} no longer has {missing}"
+
+    monkeypatch.delattr(sly.yacc.Parser, "_Parser__build_grammar")
+    with pytest.raises(sly.yacc.YaccError, match="_Parser__build_grammar"):
+
+        class Broken(UwuParser):
+            pass
+
+
+def test_compile_server():
+    compile_server = server.CompileServer(jobs=1)
+    try:
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "compile",
+            "params": {"source": "def f(a) do a + 1 end\nf(1)"},
+        }
+        compiled = compile_server.handle(json.dumps(request)).result()
+        cached = compile_server.handle(json.dumps(request)).result()
+        failed = compile_server.handle(
+            json.dumps(request | {"params": {"source": "x: Str = 1"}})
+        ).result()
+        stats = compile_server.handle('{"id": 2, "method": "stats"}').result()
+    finally:
+        compile_server.close()
+
+    assert compiled == cached
+    assert compiled["result"]["type"] == "Num"
+    assert "const f=(a)=>" in compiled["result"]["js"]
+    assert failed["error"]["data"]["kind"] == "UnifyException"
+    assert stats["result"]["requests"] == 4
+    assert stats["result"]["cache_hits"] == 1
+    assert stats["result"]["phases"]["infer"]["count"] == 2
+
+
+def test_compile_server_bad_requests():
+    class Failing(server.CompileServer):
+        def handle(self, line):
+            if "boom" in line:
+                raise RuntimeError("boom")
+            return super().handle(line)
+
+    compile_server = Failing(jobs=1)
+    written = []
+    lines = [
+        '{"id": 1, "method": "compile", "params": ["1 + 1"]}',
+        '{"id": 2, "method": "boom"}',
+        '{"id": 3, "method": "stats"}',
+    ]
+    try:
+        server.serve_lines(compile_server, lines, written.append)
+    finally:
+        compile_server.close()
+
+    responses = sorted(map(json.loads, written), key=lambda r: r["id"] or 0)
+    assert [r["id"] for r in responses] == [None, 1, 3]
+    assert responses[0]["error"]["code"] == server.INTERNAL_ERROR
+    assert responses[1]["error"]["code"] == server.INVALID_PARAMS
+    assert "result" in responses[2]
+
+
+def test_compile_server_worker_error(monkeypatch):
+    def run(source, path, codegen):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    compile_server = server.CompileServer(jobs=1)
+    compile_server.executor.shutdown()
+    compile_server.executor = concurrent.futures.ThreadPoolExecutor(1)
+    monkeypatch.setattr(server, "run", run)
+    try:
+        failed = compile_server.handle(
+            '{"id": 7, "method": "compile", "params": {"source": "1"}}'
+        ).result()
+        stats = compile_server.handle('{"id": 8, "method": "stats"}').result()
+    finally:
+        compile_server.close()
+
+    assert failed["id"] == 7
+    assert failed["error"]["code"] == server.INTERNAL_ERROR
+    assert "RecursionError" in failed["error"]["message"]
+    assert stats["result"]["errors"] == 1
+
+
+def test_compile_many():
+    results = main.compile_many(
+        {
+            "a.uwu": "def add(a, b) do a + b end\nx = add(1, 2)\n`console.log`(x)",
+            "b.uwu": "enum AB {A B}\ny: Str = 1",
+        }
+    )
+
+    assert [result.src_path for result in results] == ["a.uwu", "b.uwu"]
+    assert results[0].ok
+    assert results[0].bindings == {"add": "Num -> Num -> Num", "x": "Num"}
+    assert "console.log(x)" in results[0].js
+    assert not results[1].ok
+    assert results[1].error == main.Diagnostic(
+        "infer", "UnifyException", "Cannot unify a=Num and b=Str"
+    )
+
+
+def test_profile_report(tmp_path):
+    profiling.cprofile_enabled = True
+    try:
+        result = main.compile_source("`console.log`(1 + 2)")
+    finally:
+        profiling.cprofile_enabled = False
+
+    assert list(result.phases) == profiling.PHASES
+    assert all(stats.runs == 1 and stats.calls > 0 for stats in result.phases.values())
+
+    report = profiling.Report()
+    report.add(result.src_path, result.phases, result.raw_stats)
+    report.add(result.src_path + "2", result.phases, result.raw_stats)
+    assert report.to_json()["total"]["infer"]["runs"] == 2
+    assert report.to_json()["total"]["infer"]["calls"] > 0
+    assert len(report.dump_pstats(str(tmp_path))) == len(profiling.PHASES)
+
+    # calls are only counted under cProfile, and left out otherwise
+    result = main.compile_source("`console.log`(1 + 2)")
+    report = profiling.Report()
+    report.add(result.src_path, result.phases, result.raw_stats)
+    assert "calls" not in report.to_json()["total"]["infer"]
+
+
+@pytest.mark.parametrize("shape", ["defs", "block", "nested", "elif", "enum", "case"])
+def test_bench_programs(shape):
+    source = bench.GENERATORS[shape](4)
+    assert main.compile_source(source).ok
+    assert set(bench.run_phases(source, memory=True)["infer"]) == {"time", "peak"}
+
+
+def test_memory_report():
+    profiling.memory_enabled = True
+    try:
+        result = main.compile_source("def f(a) do a + 1 end\n`console.log`(f(2))")
+    finally:
+        profiling.memory_enabled = False
+        tracemalloc.stop()
+
+    assert list(result.memory) == profiling.PHASES
+    lex = result.memory["lex"]
+    assert lex.peak >= lex.retained > 0
+    assert any(site.startswith(main.sly.lex.__file__) for site, _ in lex.top)
+
+    report = profiling.Report()
+    report.add(result.src_path, result.phases, result.raw_stats, result.memory)
+    assert (
+        report.memory_to_json()["total"]["infer"]["peak"] == result.memory["infer"].peak
+    )
+
+
+def test_modules(tmp_path, write, parser, lexer):
+    program = parser.parse(
+        lexer.tokenize("import 'lib' (area, Shape)\nexport x = area(Circle(1))")
+    )
+    assert program == EProgram(
+        [
+            EExpr
+            ** ELet(
+                "x",
+                EExpr
+                ** ECall(
+                    EExpr ** EIdentifier("area"),
+                    [EExpr ** EVariantCall("Circle", [EExpr ** ENumLiteral(1)])],
+                ),
+            )
+        ],
+        [EImport("lib", [EIdentifier("area"), ETypeIdentifier("Shape")])],
+        [EIdentifier("x")],
+    )
+
+    lib = write(
+        "lib.uwu",
+        "export enum Shape {Circle(Num) Square(Num)}\n"
+        "export def area(s) do case s of Circle(r) do r * r end Square(a) do a end end end",
+    )
+    app = write(
+        "app.uwu",
+        "import 'lib'\nexport def double(s: Shape) do area(s) * 2 end\n"
+        "`console.log`(double(Square(3)))",
+    )
+    src_paths = [str(app), str(lib)]
+
+    build_cache = BuildCache(str(tmp_path / "cache"))
+    assert main.build(src_paths, 1, build_cache)
+    assert 'require("./lib.uwu.js")' in (tmp_path / "app.uwu.js").read_text()
+    interface = modules.load_interface(modules.interface_path(str(app)))
+    assert repr(interface.vars["double"].ty) == "Shape -> Num"
+    assert build_cache.restore(str(app), str(app) + ".js")
+
+    lib.write_text(lib.read_text().replace("do a end", "do a + 0 end"))
+    assert main.build([str(lib)], 1, build_cache)
+    assert build_cache.restore(str(app), str(app) + ".js")
+
+    lib.write_text(lib.read_text().replace("Square(Num)", "Square(Str)"))
+    assert not main.build([str(lib)], 1, build_cache)
+    lib.write_text(lib.read_text().replace("do a + 0 end", "do 0 end"))
+    assert main.build([str(lib)], 1, build_cache)
+    assert not build_cache.restore(str(app), str(app) + ".js")
+
+    lib.write_text("import 'app'\n" + lib.read_text())
+    with pytest.raises(modules.ModuleError, match="Import cycle"):
+        modules.build_order(src_paths)
+
+
+def test_broken_interface(tmp_path, write, parser, lexer):
+    lib = write("lib.uwu", "export x = 1")
+    program = parser.parse(lexer.tokenize("import 'lib'\nx"))
+    interfaces = {str(lib): b""}
+    with pytest.raises(modules.ModuleError, match="Cannot read the interface"):
+        modules.link(program, str(tmp_path / "app.uwu"), {}, interfaces)
+
+
+def test_import_non_exhaustive(write):
+    lib = write("lib.uwu", "export def get(o) do case o of Some(a) do a end end end")
+    app = write("app.uwu", "import 'lib'\nget(Some(1)) + 1")
+
+    result = main.compile_file(str(lib))
+    assert result.ok and result.warnings == ["Non-exhaustive case, missing None"]
+    interface = modules.loads_interface(result.interface)
+    assert repr(interface.vars["get"].ty) == "(Option<@1>) -> @1"
+    assert main.build([str(app)], 1, None)
+
+    streamed = main.compile_file(str(lib), stream=True)
+    assert streamed.warnings == result.warnings
+    assert streamed.interface == result.interface
+
+
+def test_project_build(tmp_path, write):
+    write("base.uwu", "export def one() do 1 end")
+    for name in ["left", "right"]:
+        write(
+            f"sub/{name}.uwu", f"import '../base'\nexport def {name}() do one() + 1 end"
+        )
+    app = write(
+        "app.uwu",
+        "import 'sub/left'\nimport 'sub/right'\n`console.log`(left() + right())",
+    )
+
+    graph, order = modules.build_order([str(app)])
+    assert len(graph) == 4
+    assert order[0] == str(tmp_path / "base.uwu") and order[-1] == str(app)
+    assert modules.components({"a": ["b"], "b": ["a"], "c": ["a"]}) == [
+        ["a", "b"],
+        ["c"],
+    ]
+    assert modules.components(
+        {"a": ["b", "c"], "b": ["a"], "c": ["c", "d"], "d": []}
+    ) == [
+        ["d"],
+        ["c"],
+        ["a", "b"],
+    ]
+    # deeper than the recursion limit
+    chain = {str(i): [str(i + 1)] for i in range(5000)} | {"5000": ["0"]}
+    assert [sorted(component) for component in modules.components(chain)] == [
+        sorted(chain)
+    ]
+
+    with concurrent.futures.ProcessPoolExecutor(2, initializer=main.init_worker) as ex:
+        assert main.build([str(app)], 2, None, ex)
+    assert 'require("./sub/left.uwu.js")' in (tmp_path / "app.uwu.js").read_text()
+
+    dumped = dict[str, bytes]()
+    for name in ["left", "right"]:
+        path = str(tmp_path / "sub" / f"{name}.uwu")
+        dumped[path] = pathlib.Path(modules.interface_path(path)).read_bytes()
+        os.remove(modules.interface_path(path))
+    assert not main.compile_source(app.read_text(), str(app)).ok
+    result = main.compile_source(app.read_text(), str(app), interfaces=dumped)
+    assert result.ok and set(result.deps) == set(dumped)
+
+
+def test_bundle(tmp_path, write):
+    write("lib.uwu", "export def ~>> (a: Num, b: Num): Num do a * 10 + b end")
+    app = write("app/app.uwu", "import '../lib'\n`console.log`(1 + 2 ~>> 3)")
+    runtime_path = str(tmp_path / "dist" / "runtime.js")
+
+    assert main.build([str(app)], 1, None, runtime_path=runtime_path)
+    js = app.with_suffix(".uwu.js").read_text()
+    assert js.startswith('const {"+":op_plus}=require("../dist/runtime.js");')
+    assert "op_tilde_gt_gt(op_plus(1.0)" in js
+    assert subprocess.check_output(["node", str(app) + ".js"]) == b"33\n"
+
+    assert (tmp_path / "dist" / "runtime.js").read_text() == prelude.runtime()
+    assert not codegen.stable_ops
+    assert "op1" in main.compile_source("`console.log`(1 + 2)").js
+
+
+def test_bundle_cache_per_directory(tmp_path, write):
+    runtime_path = str(tmp_path / "dist" / "rt.js")
+    sources = [write(name, "`console.log`(1 + 2)") for name in ["x/a.uwu", "y/z/a.uwu"]]
+
+    build_cache = BuildCache(str(tmp_path / "cache"), runtime_path=runtime_path)
+    for source in sources:
+        assert main.build([str(source)], 1, build_cache, runtime_path=runtime_path)
+    for source in sources:
+        source.with_suffix(".uwu.js").unlink()
+        assert build_cache.restore(str(source), str(source) + ".js")
+
+    x, y = (source.with_suffix(".uwu.js").read_text() for source in sources)
+    assert 'require("../dist/rt.js")' in x
+    assert 'require("../../dist/rt.js")' in y
+
+
+def test_scanner_matches_sly_lexer():
+    def tokens(lexer, source):
+        result = list[tuple]()
+        try:
+            for tok in lexer.tokenize(source):
+                result.append((tok.type, tok.value, tok.lineno, tok.index))
+        except Exception as e:
+            result.append((type(e).__name__, str(e)))
+        return result
+
+    sources = [bench.GENERATORS[shape](8) for shape in bench.GENERATORS]
+    for path in glob.glob("examples/**/*.uwu", recursive=True) + ["test.uwu"]:
+        with open(path) as f:
+            sources.append(f.read())
+
+    rng = random.Random(0)
+    alphabet = "abzAZ09_ \t\n\r#'`.,=<>~+-*/!&|()[]{}:?$é٣"
+    sources += [
+        "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+        for _ in range(5000)
+    ]
+
+    for source in sources:
+        assert tokens(UwuScanner(), source) == tokens(UwuLexer(), source), source
+
+
+@pytest.mark.parametrize("backend", ["sly", "scanner"])
+def test_token_stream(backend, parser):
+    source = bench.gen_defs(32)
+    lexer = main.LEXERS[backend]()
+    tokens = list(lexer.tokenize(source))
+    stream = lexer.scan(source)
+
+    assert len(stream) == len(tokens)
+    assert [(t.type, t.value, t.lineno, t.index) for t in stream] == [
+        (t.type, t.value, t.lineno, t.index) for t in tokens
+    ]
+    assert stream[3].value == tokens[3].value
+    assert stream.nbytes() == 13 * len(stream)
+    assert parser.parse(iter(stream)) == parser.parse(iter(tokens))
+
+    with pytest.raises(main.sly.lex.LexError, match="Illegal character '\\$'"):
+        lexer.scan("a $")
+
+
+def test_compile_stream(tmp_path, write, node):
+    lib = write("lib.uwu", "export def twice(a: Num): Num do a * 2 end")
+    src = write(
+        "app.uwu",
+        "import 'lib'\n"
+        + bench.gen_defs(40)
+        + bench.gen_enum(6)
+        + "export def last(a: Num): Num do twice(f39(a, 1)) end\n",
+    )
+    assert main.build([str(lib)], 1, None)
+    expected = main.compile_source(src.read_text(), str(src))
+
+    result = main.compile_stream(str(src), chunk_size=16)
+    assert result.ok and result.streamed and not result.js
+    assert result.bindings.keys() == expected.bindings.keys()
+    assert result.bindings["last"] == expected.bindings["last"] == "Num -> Num"
+    js = (tmp_path / "app.uwu.js").read_text()
+    assert js.startswith('const {twice}=require("./lib.uwu.js");')
+    assert js.endswith("module.exports={last}")
+    assert node.run(js.replace("require(", "(() => ({}))("), "stream") == node.run(
+        expected.js.replace("require(", "(() => ({}))("), "whole"
+    )
+
+    src.write_text("x = 1\nimport 'lib'\n")
+    assert main.compile_stream(str(src), chunk_size=1).error.phase == "parse"
+    src.write_text("x = 1\ny = $\n")
+    assert main.compile_stream(str(src)).error.kind == "LexError"
+
+
+def test_incremental_document(parser, capsys):
+    source = bench.gen_defs(20) + bench.gen_enum(4)
+    document = Document(source, parser=parser)
+    assert document.program == parser.parse(iter(document.lexer.scan(source)))
+
+    body = document.program.body
+    start = source.index("* 10 end")
+    program = document.edit(start + 2, start + 4, "11")
+    assert program.body[10] != body[10]
+    assert program.body[:10] + program.body[11:] == body[:10] + body[11:]
+    assert all(a is b for a, b in zip(program.body[:10], body))
+
+    rng = random.Random(0)
+    text = document.text
+    for _ in range(200):
+        start = rng.randrange(len(text) + 1)
+        end = min(len(text), start + rng.choice([0, 1, 3]))
+        insert = rng.choice(["", "\n", " ", "do ", " end", "(", ")", "# c\n"])
+        text = text[:start] + insert + text[end:]
+        program = document.edit(start, end, insert)
+        assert document.text == text
+
+        try:
+            tokens = document.lexer.scan(text)
+        except sly.lex.LexError:
+            assert program is None
+            continue
+        assert [(t.type, t.index, t.lineno) for t in document.tokens()] == [
+            (t.type, t.index, t.lineno) for t in tokens
+        ]
+        capsys.readouterr()
+        expected = parser.parse(iter(tokens))
+        if "Syntax error" not in capsys.readouterr().err:
+            assert program == expected
+
+    assert Document("import 'a'\nx = 1\nimport 'b'\n").program is None
+
+
+def test_long_sequences(parser):
+    ast = parser.parse(UwuLexer().tokenize(bench.gen_block(3000)))
+    block = ast.body[0].expr.init.expr.block.body
+    assert len(ast.body) == 2 and len(block) == 3001
+    assert [expr.expr.id for expr in block[:3]] == ["x0", "x1", "x2"]
+
+    ast = parser.parse(UwuLexer().tokenize(bench.gen_defs(3000)))
+    assert len(ast.body) == 3001
+    assert ast.body[-2].expr.identifier == "f2999"
+
+
+def test_pratt_matches_lalr_parser(parser, capsys):
+    sources = [bench.GENERATORS[shape](8) for shape in bench.GENERATORS]
+    for path in glob.glob("examples/**/*.uwu", recursive=True):
+        with open(path) as f:
+            sources.append(f.read())
+
+    ops = ["+", "-", "*", "/", "++", "==", "!=", "<", "<=", ">", ">=", "&&", "||"]
+    ops += ["+.", "*.", "<~", "~>", "<<~", "~>>", "<<<", "=~"]
+    rng = random.Random(0)
+
+    def expr(depth: int) -> str:
+        r = rng.random()
+        if depth == 0 or r < 0.2:
+            return rng.choice(["a", "b", "1", "2.5", "'s'", "`x`"])
+        if r < 0.55:
+            return f"{expr(depth - 1)} {rng.choice(ops)} {expr(depth - 1)}"
+        if r < 0.65:
+            return rng.choice(["-", "+", "!", "not "]) + expr(depth - 1)
+        if r < 0.72:
+            return f"({expr(depth - 1)})"
+        if r < 0.78:
+            return f"{expr(depth - 1)}({expr(depth - 1)}, {expr(depth - 1)})"
+        if r < 0.84:
+            return f"x = {expr(depth - 1)}"
+        if r < 0.9:
+            return f"if {expr(depth - 1)} then {expr(depth - 1)} else {expr(depth - 1)} end"
+        if r < 0.95:
+            return f"do\n{expr(depth - 1)}\n{expr(depth - 1)}\nend"
+        return f"Some({expr(depth - 1)}, [{expr(depth - 1)}])"
+
+    sources += ["\n".join(expr(5) for _ in range(3)) for _ in range(1000)]
+
+    pratt = PrattParser()
+    compared = 0
+    for source in sources:
+        tokens = UwuScanner().scan(source)
+        expected = parser.parse(iter(tokens))
+        if capsys.readouterr().err:
+            continue
+        compared += 1
+        assert pratt.parse(iter(tokens)) == expected, source
+    assert compared > 900
+
+    precedence = UwuParser._grammar.Precedence
+    assert {"+", "EQUAL", "AND", "ARROW_BOTH", "POW"} <= set(BINARY)
+    assert all(precedence[kind] == prec for kind, prec in BINARY.items())
+    # a syntax error is reported and recovered from like UwuParser does
+    tokens = UwuScanner().scan("1 + * 2")
+    assert pratt.parse(iter(tokens)) == parser.parse(iter(tokens))
+    assert capsys.readouterr().err.count("Syntax error at line 1, token=*") == 2
+
+    # climbing is not recursive, a long chain of a right associative operator
+    # parses like with UwuParser
+    source = " <> ".join(["'a'"] * 3000)
+    node = pratt.parse(iter(UwuScanner().scan(source))).body[0].expr
+    for _ in range(2999):
+        assert node.op == "<>" and node.left.expr == EStrLiteral("a")
+        node = node.right.expr
+    assert node == EStrLiteral("a")
+
+
+def test_specialized_folds(parser):
+    class Reflective(FoldAll):
+        def fold(self, n):
+            return terms.FoldWith.fold_children_with(n, self)
+
+    for shape in bench.GENERATORS:
+        ast = parser.parse(UwuLexer().tokenize(bench.GENERATORS[shape](8)))
+        assert ast.fold_with(FoldAll()) == ast.fold_with(Reflective()) == ast
+
+    if_ = EIf(EExpr(EIdentifier("a")), EBlock(), MaybeOrElse(None))  # type: ignore[arg-type]
+    assert if_.fold_with(FoldAll()) == if_
+    qualname = EBinaryExpr.fold_children_with.__qualname__
+    assert qualname == "EBinaryExpr.fold_children_with"
+
+    class Empty:
+        pass
+
+    with pytest.raises(ValueError, match="Empty does not have a EIdentifier method"):
+        EIdentifier("a").fold_with(Empty())  # type: ignore[arg-type]
+
+
+def test_folds_share_unchanged_nodes(parser):
+    ast = parser.parse(UwuLexer().tokenize(bench.gen_defs(8)))
+    assert ast.fold_with(FoldAll()) is ast
+    assert ast.fold_with(Hoister()).fold_with(DefCleaner()) is ast
+
+    getter = IdGetter()
+    assert ast.fold_with(getter) is ast and "f7" in getter.ids
+
+    ast = parser.parse(UwuLexer().tokenize("f = do\n  x = 1 + (y = 2)\nend\nf(1)"))
+    hoisted = ast.fold_with(Hoister())
+    let = ast.body[0].expr.init.expr.block.body[0].expr
+    let2 = hoisted.body[0].expr.init.expr.block.body[1].expr
+    assert let2.init.expr.left is let.init.expr.left
+    assert hoisted.body[1] is ast.body[1]
+
+
+def test_slotted_nodes(parser):
+    ast = parser.parse(UwuLexer().tokenize(bench.gen_defs(8)))
+    node = ast.body[0].expr
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.identifier = "g"  # type: ignore[misc]
+    match node:
+        case EDef("f0", [EParam("a"), EParam("b")]):
+            pass
+        case _:
+            assert False, node
+    assert pickle.loads(pickle.dumps(ast)) == ast
+
+    nodes, size = bench.node_bytes(ast)
+    assert nodes > 100 and size < 64
+
+
+def test_interning(parser):
+    ast = parser.parse(UwuLexer().tokenize(bench.gen_defs(8)))
+    interner = terms.Interner()
+    shared = ast.fold_with(interner)
+    assert shared == ast
+    params = [param for expr in shared.body[:-1] for param in expr.expr.params]
+    assert len({id(param.hint) for param in params}) == 1
+    assert {id(param) for param in params} == {id(params[0]), id(params[1])}
+    again = parser.parse(UwuLexer().tokenize(bench.gen_defs(8)))
+    assert again.fold_with(interner) is shared
+    one = ENumLiteral(1).fold_with(interner)
+    assert ENumLiteral(1.0).fold_with(interner) is not one
+
+    types = typed.TypeInterner()
+    ty = types(typed.TDef(typed.TCon("Num", typed.KStar()), typed.TArray(typed.TNum)))
+    assert ty is types(typed.TDef(typed.TNum, typed.TArray(typed.TNum)))
+    assert ty.con.arg is typed.TNum and ty.arg.arg is typed.TNum
+
+    source = bench.gen_enum(4)
+    try:
+        main.init_worker(interning=True)
+        interned = main.compile_source(source)
+    finally:
+        main.init_worker(interning=False)
+    result = main.compile_source(source)
+    assert interned.ok
+    assert (interned.js, interned.bindings) == (result.js, result.bindings)
+
+
+def test_arena(parser):
+    for source in [bench.gen_defs(16), bench.gen_enum(4), bench.gen_case(4)]:
+        ast = parser.parse(UwuLexer().tokenize(source))
+        flat = arena.parse(source.encode(), chunk_size=32)
+        assert flat is not None and flat.program() == ast
+
+        getter = IdGetter()
+        ast.fold_with(getter)
+        assert flat.ids() == getter.ids
+        prelude = prelude_for(ast)
+        assert arena.prelude_for(flat) == prelude
+        reset_hash_ids()
+        program = EProgram([*prelude, *ast.body], ast.imports, ast.exports)
+        js = compile(program.fold_with(Hoister()).fold_with(DefCleaner()))
+        reset_hash_ids()
+        assert arena.compile(flat, prelude) == js
+
+        counter = algorithm_j.counter
+        ty, bound = algorithm_j.infer_program(DEFAULT_CTX, ast)
+        algorithm_j.counter = counter
+        assert (ty, bound) == arena.infer(DEFAULT_CTX, flat)
+
+    source = "import 'lib' (id, Option)\nexport x = id(1) + 2\n"
+    ast = parser.parse(UwuLexer().tokenize(source))
+    flat = arena.parse(source.encode())
+    assert flat is not None and arena.prelude_for(flat) == prelude_for(ast)
+    assert [builtin_name(builtin) for builtin in prelude_for(ast)] == ["+"]
+    assert arena.compile(flat) == compile(ast.fold_with(Hoister()))
+
+    source = bench.gen_defs(256)
+    gc.collect()
+    before = len(gc.get_objects())
+    flat = arena.parse(source.encode())
+    gc.collect()
+    assert len(flat) > 5000 and len(gc.get_objects()) - before < 20
+    assert flat.nbytes() < 16 * len(flat)
+    assert arena.parse(b"1 +", parser=PrattParser()) is None
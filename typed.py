@@ -123,6 +123,56 @@ def kind(t: Type) -> Kind:
     raise TypeError(f"kind of {t}")
 
 
+class TypeInterner:
+    """
+    gives the same object for structurally equal types and kinds, starting
+    from the constants here so unify can still compare interned types with
+    them by is
+    """
+
+    def __init__(self) -> None:
+        self.table = dict[tuple[typing.Any, ...], typing.Any]()
+        for value in list(globals().values()):
+            if isinstance(value, TCon):
+                key = (TCon, value.id, id(self(value.kind)), tuple(value.alts))
+                self.table.setdefault(key, value)
+
+    @typing.overload
+    def __call__(self, t: Type) -> Type:
+        ...
+
+    @typing.overload
+    def __call__(self, t: Kind) -> Kind:
+        ...
+
+    def __call__(self, t: Type | Kind) -> Type | Kind:
+        # children are interned first, so the key tells them apart by identity
+        key: tuple[typing.Any, ...]
+        match t:
+            case TCon(name, k, alts):
+                k2 = self(k)
+                key = (TCon, name, id(k2), tuple(alts))
+                t2: Type | Kind = t if k2 is k else TCon(name, k2, alts)
+            case TVar(number, k):
+                k2 = self(k)
+                key = (TVar, number, id(k2))
+                t2 = t if k2 is k else TVar(number, k2)
+            case TAp(con, arg):
+                con2, arg2 = self(con), self(arg)
+                key = (TAp, id(con2), id(arg2))
+                t2 = t if con2 is con and arg2 is arg else TAp(con2, arg2)
+            case KStar():
+                key, t2 = (KStar,), t
+            case KFun(arg_kind, ret_kind):
+                arg_kind2, ret_kind2 = self(arg_kind), self(ret_kind)
+                key = (KFun, id(arg_kind2), id(ret_kind2))
+                same = arg_kind2 is arg_kind and ret_kind2 is ret_kind
+                t2 = t if same else KFun(arg_kind2, ret_kind2)
+            case _:
+                raise TypeError(f"cannot intern {t!r}")
+        return self.table.setdefault(key, t2)
+
+
 def assert_never(value: typing.NoReturn) -> typing.NoReturn:
     # This also works at runtime as well
     assert False, f"This code should never be reached, got: {value}"